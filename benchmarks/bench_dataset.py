@@ -0,0 +1,293 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for element conversion, JSON conversion and the memory use of
+datasets.
+"""
+
+from io import BytesIO
+import tracemalloc
+
+from pydicom import DataElement, Dataset, config, dcmread, dcmwrite
+
+from .synthetic import (
+    CHARSET_VALUES,
+    VR_VALUES,
+    create_header_dataset,
+    create_vr_dataset,
+    raw_dataset,
+    to_bytes,
+)
+
+
+class TimeConvertRawElement:
+    """Time tests for converting raw elements with Dataset.__getitem__()."""
+
+    params = list(VR_VALUES)
+    param_names = ["vr"]
+
+    def setup(self, vr):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        self.ds = raw_dataset(create_vr_dataset(vr))
+        self.raw = dict(self.ds._dict)
+        self.tags = [tag for tag in self.raw if tag.element >= 0x1000]
+
+    def time_getitem(self, vr):
+        """Time converting every element in the dataset."""
+        ds, tags = self.ds, self.tags
+        for ii in range(self.no_runs):
+            ds._dict.update(self.raw)
+            for tag in tags:
+                ds[tag]
+
+
+class TimeCharsetDecode:
+    """Time tests for decoding values using multi-byte character sets."""
+
+    params = list(CHARSET_VALUES)
+    param_names = ["charset"]
+
+    def setup(self, charset):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        encodings, value = CHARSET_VALUES[charset]
+        ds = Dataset()
+        ds.SpecificCharacterSet = encodings
+        ds.PatientName = value
+        ds.ReferencedPatientPhotoSequence = [Dataset() for _ in range(250)]
+        for item in ds.ReferencedPatientPhotoSequence:
+            item.SpecificCharacterSet = encodings
+            item.PatientName = value
+            item.PatientComments = value.split("=")[1]
+
+        self.ds = raw_dataset(ds)
+        self.items = list(self.ds.ReferencedPatientPhotoSequence)
+        self.raw = [dict(item._dict) for item in self.items]
+
+    def time_decode(self, charset):
+        """Time decoding the character set encoded values."""
+        for ii in range(self.no_runs):
+            for item, raw in zip(self.items, self.raw):
+                item._dict.update(raw)
+                item.PatientName
+                item.PatientComments
+
+
+class TimeCharsetEncode:
+    """Time tests for writing values using multi-byte character sets."""
+
+    params = list(CHARSET_VALUES)
+    param_names = ["charset"]
+
+    def setup(self, charset):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        encodings, value = CHARSET_VALUES[charset]
+        self.ds = Dataset()
+        self.ds.SpecificCharacterSet = encodings
+        self.ds.ReferencedPatientPhotoSequence = [Dataset() for _ in range(250)]
+        for item in self.ds.ReferencedPatientPhotoSequence:
+            item.PatientComments = value.split("=")[1]
+            item.ImageComments = value.replace("=", " ")
+
+    def time_write(self, charset):
+        """Time writing the character set encoded values."""
+        for ii in range(self.no_runs):
+            dcmwrite(BytesIO(), self.ds, implicit_vr=False)
+
+
+class TimeCreateDataset:
+    """Time tests for creating a dataset with many validated values."""
+
+    params = [False, True]
+    param_names = ["deferred_validation"]
+
+    def setup(self, deferred_validation):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.original = config.settings.deferred_validation
+        config.settings.deferred_validation = deferred_validation
+
+    def teardown(self, deferred_validation):
+        """Cleanup the benchmark."""
+        config.settings.deferred_validation = self.original
+
+    def create(self):
+        """Return a dataset with 1000 frames of functional groups."""
+        ds = Dataset()
+        ds.PerFrameFunctionalGroupsSequence = []
+        for idx in range(1000):
+            content = Dataset()
+            content.FrameAcquisitionDateTime = "20240101120000.000000"
+            content.StackID = "1"
+            content.InStackPositionNumber = idx + 1
+            content.DimensionIndexValues = [1, idx + 1]
+
+            measures = Dataset()
+            measures.SliceThickness = "1.5"
+            measures.PixelSpacing = ["0.5", "0.5"]
+
+            position = Dataset()
+            position.ImagePositionPatient = ["-125.0", "-125.0", f"{idx * 1.5:.1f}"]
+
+            item = Dataset()
+            item.FrameContentSequence = [content]
+            item.PixelMeasuresSequence = [measures]
+            item.PlanePositionSequence = [position]
+            ds.PerFrameFunctionalGroupsSequence.append(item)
+
+        return ds
+
+    def time_create(self, deferred_validation):
+        """Time creating the dataset."""
+        for ii in range(self.no_runs):
+            self.create()
+
+    def time_create_and_write(self, deferred_validation):
+        """Time creating and writing the dataset."""
+        for ii in range(self.no_runs):
+            dcmwrite(BytesIO(), self.create(), implicit_vr=True)
+
+
+class TimeDateTimeConversion:
+    """Time tests for reading DA, DT and TM values as datetime objects."""
+
+    params = [False, True]
+    param_names = ["datetime_conversion"]
+
+    def setup(self, datetime_conversion):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        self.original = config.datetime_conversion
+        config.datetime_conversion = datetime_conversion
+
+        ds = create_header_dataset(nr_items=1)
+        ds.SeriesDate = ds.AcquisitionDate = ds.ContentDate = "20240101"
+        ds.SeriesTime = "120000"
+        ds.AcquisitionTime = "120001.5"
+        ds.ContentTime = "120002.123456"
+        ds.AcquisitionDateTime = "20240101120000.123456+1000"
+        ds.PerFrameFunctionalGroupsSequence = [Dataset() for _ in range(250)]
+        for idx, item in enumerate(ds.PerFrameFunctionalGroupsSequence):
+            value = f"20240101120000.{idx:06}"
+            item.FrameContentSequence = [Dataset()]
+            item.FrameContentSequence[0].FrameAcquisitionDateTime = value
+            item.FrameContentSequence[0].FrameReferenceDateTime = value
+
+        self.data = to_bytes(ds, implicit_vr=False)
+
+    def teardown(self, datetime_conversion):
+        """Cleanup the benchmark."""
+        config.datetime_conversion = self.original
+
+    def time_read(self, datetime_conversion):
+        """Time reading and converting every element."""
+        for ii in range(self.no_runs):
+            ds = dcmread(BytesIO(self.data), force=True)
+            ds.convert_all()
+
+
+class TimeKeywordAccess:
+    """Time tests for getting and setting element values using keywords."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.datasets = [create_header_dataset(nr_items=1) for _ in range(1000)]
+        self.keywords = ["SeriesInstanceUID", "InstanceNumber", "ImagePositionPatient"]
+
+    def time_getattr(self):
+        """Time getting values with Dataset.__getattr__()."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.SeriesInstanceUID
+                ds.InstanceNumber
+                ds.ImagePositionPatient
+
+    def time_get_many(self):
+        """Time getting values with Dataset.get_many()."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.get_many(self.keywords)
+
+    def time_setattr(self):
+        """Time setting values with Dataset.__setattr__()."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.InstanceNumber = 2
+                ds.SeriesNumber = 3
+
+
+class TimeJSON:
+    """Time and memory tests for the JSON round trip."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        self.ds = create_header_dataset(nr_items=250)
+        self.json = self.ds.to_json()
+
+    def time_to_json(self):
+        """Time converting a dataset to JSON."""
+        for ii in range(self.no_runs):
+            self.ds.to_json()
+
+    def time_from_json(self):
+        """Time creating a dataset from JSON."""
+        for ii in range(self.no_runs):
+            Dataset.from_json(self.json)
+
+    def time_round_trip(self):
+        """Time converting a dataset to JSON and back."""
+        for ii in range(self.no_runs):
+            Dataset.from_json(self.ds.to_json())
+
+    def peakmem_round_trip(self):
+        """Peak memory when converting a dataset to JSON and back."""
+        Dataset.from_json(self.ds.to_json())
+
+
+def traced_memory(func):
+    """Return the memory allocated by `func` that's still in use on return."""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = func()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+
+class TrackMemory:
+    """Memory used by elements and datasets, as measured by tracemalloc."""
+
+    unit = "bytes"
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.nr_instances = 10000
+        ds = create_header_dataset(nr_items=250)
+        self.nr_elements = len(list(ds.iterall()))
+        self.data = to_bytes(ds, implicit_vr=False)
+
+    def track_element(self):
+        """Bytes per DataElement instance."""
+        nr_instances = self.nr_instances
+        total = traced_memory(
+            lambda: [DataElement(0x00100020, "LO", "") for _ in range(nr_instances)]
+        )
+        return total / self.nr_instances
+
+    def track_dataset(self):
+        """Bytes per empty Dataset instance."""
+        total = traced_memory(lambda: [Dataset() for _ in range(self.nr_instances)])
+        return total / self.nr_instances
+
+    def track_converted_dataset(self):
+        """Bytes per element after reading and converting every element."""
+
+        def read():
+            ds = dcmread(BytesIO(self.data), force=True)
+            ds.convert_all()
+            return ds
+
+        return traced_memory(read) / self.nr_elements
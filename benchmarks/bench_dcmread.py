@@ -0,0 +1,103 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for reading datasets with dcmread()."""
+
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pydicom import dcmread
+from pydicom.uid import DeflatedExplicitVRLittleEndian
+
+from .synthetic import create_image_dataset, to_bytes
+
+
+class TimeDcmread:
+    """Time and memory tests for dcmread()."""
+
+    params = ["buffer", "path"]
+    param_names = ["source"]
+
+    def setup(self, source):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        # 10 frames of 512 x 512 x 16-bit pixel data and ~250 header elements
+        ds = create_image_dataset(nr_frames=10)
+        self.data = to_bytes(ds, enforce_file_format=True)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "image.dcm"
+        self.path.write_bytes(self.data)
+
+    def teardown(self, source):
+        """Cleanup the benchmark."""
+        self.tdir.cleanup()
+
+    def _source(self, source):
+        return BytesIO(self.data) if source == "buffer" else self.path
+
+    def time_full(self, source):
+        """Time reading the entire dataset."""
+        for ii in range(self.no_runs):
+            dcmread(self._source(source))
+
+    def time_headers_only(self, source):
+        """Time reading the dataset without the pixel data."""
+        for ii in range(self.no_runs):
+            dcmread(self._source(source), stop_before_pixels=True)
+
+    def time_specific_tags(self, source):
+        """Time reading a few specific elements."""
+        tags = ["PatientName", "StudyInstanceUID", "Rows", "Columns"]
+        for ii in range(self.no_runs):
+            dcmread(self._source(source), specific_tags=tags)
+
+    def time_defer_size(self, source):
+        """Time reading the dataset with large values deferred."""
+        for ii in range(self.no_runs):
+            dcmread(self._source(source), defer_size=1024)
+
+    def peakmem_full(self, source):
+        """Peak memory when reading the entire dataset."""
+        dcmread(self._source(source))
+
+    def peakmem_headers_only(self, source):
+        """Peak memory when reading the dataset without the pixel data."""
+        dcmread(self._source(source), stop_before_pixels=True)
+
+    def peakmem_defer_size(self, source):
+        """Peak memory when reading the dataset with large values deferred."""
+        dcmread(self._source(source), defer_size=1024)
+
+
+class TimeDcmreadDeflated:
+    """Time and memory tests for dcmread() with a deflated dataset."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        ds = create_image_dataset(nr_frames=10)
+        ds.file_meta.TransferSyntaxUID = DeflatedExplicitVRLittleEndian
+        self.data = to_bytes(ds, enforce_file_format=True)
+
+    def time_full(self):
+        """Time reading the entire dataset."""
+        for ii in range(self.no_runs):
+            dcmread(BytesIO(self.data))
+
+    def time_headers_only(self):
+        """Time reading the dataset without the pixel data."""
+        for ii in range(self.no_runs):
+            dcmread(BytesIO(self.data), stop_before_pixels=True)
+
+    def time_specific_tags(self):
+        """Time reading a few specific elements."""
+        tags = ["PatientName", "StudyInstanceUID"]
+        for ii in range(self.no_runs):
+            dcmread(BytesIO(self.data), specific_tags=tags)
+
+    def peakmem_full(self):
+        """Peak memory when reading the entire dataset."""
+        dcmread(BytesIO(self.data))
+
+    def peakmem_headers_only(self):
+        """Peak memory when reading the dataset without the pixel data."""
+        dcmread(BytesIO(self.data), stop_before_pixels=True)
@@ -0,0 +1,64 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for writing datasets with dcmwrite()."""
+
+from io import BytesIO
+
+from pydicom import dcmwrite
+from pydicom.uid import (
+    DeflatedExplicitVRLittleEndian,
+    ExplicitVRBigEndian,
+    ExplicitVRLittleEndian,
+    ImplicitVRLittleEndian,
+)
+
+from .synthetic import (
+    add_file_meta,
+    create_header_dataset,
+    create_image_dataset,
+    raw_dataset,
+)
+
+
+TRANSFER_SYNTAXES = {
+    "implicit": ImplicitVRLittleEndian,
+    "explicit": ExplicitVRLittleEndian,
+    "big endian": ExplicitVRBigEndian,
+    "deflated": DeflatedExplicitVRLittleEndian,
+}
+
+
+class TimeDcmwrite:
+    """Time and memory tests for dcmwrite()."""
+
+    params = list(TRANSFER_SYNTAXES)
+    param_names = ["transfer_syntax"]
+
+    def setup(self, tsyntax):
+        """Setup the benchmark."""
+        self.no_runs = 20
+        self.header = create_header_dataset(nr_items=250)
+        add_file_meta(self.header, TRANSFER_SYNTAXES[tsyntax])
+        # Raw elements written in the same encoding they were read with
+        self.raw = raw_dataset(self.header)
+
+        self.image = create_image_dataset(nr_frames=10)
+        self.image.file_meta.TransferSyntaxUID = TRANSFER_SYNTAXES[tsyntax]
+
+    def time_header(self, tsyntax):
+        """Time writing a dataset with many elements."""
+        for ii in range(self.no_runs):
+            dcmwrite(BytesIO(), self.header, enforce_file_format=True)
+
+    def time_raw_header(self, tsyntax):
+        """Time writing a dataset with unconverted elements."""
+        for ii in range(self.no_runs):
+            dcmwrite(BytesIO(), self.raw, enforce_file_format=True)
+
+    def time_image(self, tsyntax):
+        """Time writing a dataset with multi-frame pixel data."""
+        for ii in range(self.no_runs):
+            dcmwrite(BytesIO(), self.image, enforce_file_format=True)
+
+    def peakmem_image(self, tsyntax):
+        """Peak memory when writing a dataset with multi-frame pixel data."""
+        dcmwrite(BytesIO(), self.image, enforce_file_format=True)
@@ -0,0 +1,79 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for parsing element headers in the filereader module."""
+
+from io import BytesIO
+from pathlib import Path
+from struct import pack
+from tempfile import TemporaryDirectory
+
+from pydicom.filereader import (
+    data_element_generator,
+    read_dataset,
+    _little_endian_element_generator,
+)
+
+
+def create_header_test_data(nr_elements: int, implicit: bool) -> bytes:
+    """Return little endian encoded data with many short elements."""
+    data = []
+    for idx in range(nr_elements):
+        group, elem = 0x0009 + 2 * (idx // 0xFF00), 0x0100 + idx % 0xFF00
+        value = f"{idx:08d}".encode()
+        if implicit:
+            data.append(pack("<HHL", group, elem, len(value)))
+        else:
+            data.append(pack("<HH2sH", group, elem, b"LO", len(value)))
+
+        data.append(value)
+
+    return b"".join(data)
+
+
+class TimeHeaderParse:
+    """Time tests for parsing little endian element headers."""
+
+    params = [True, False]
+    param_names = ["implicit"]
+
+    def setup(self, implicit):
+        """Setup the tests."""
+        self.no_runs = 5
+        self.data = create_header_test_data(50000, implicit)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "headers.bin"
+        self.path.write_bytes(self.data)
+
+    def teardown(self, implicit):
+        """Cleanup the tests."""
+        self.tdir.cleanup()
+
+    def time_data_element_generator(self, implicit):
+        """Time parsing with the general element generator."""
+        for ii in range(self.no_runs):
+            for elem in data_element_generator(BytesIO(self.data), implicit, True):
+                pass
+
+    def time_fast_path(self, implicit):
+        """Time parsing with the little endian fast path."""
+        for ii in range(self.no_runs):
+            for elem in _little_endian_element_generator(BytesIO(self.data), implicit):
+                pass
+
+    def time_data_element_generator_file(self, implicit):
+        """Time parsing a file with the general element generator."""
+        for ii in range(self.no_runs):
+            with open(self.path, "rb") as f:
+                for elem in data_element_generator(f, implicit, True):
+                    pass
+
+    def time_fast_path_file(self, implicit):
+        """Time parsing a file with the little endian fast path."""
+        for ii in range(self.no_runs):
+            with open(self.path, "rb") as f:
+                for elem in _little_endian_element_generator(f, implicit):
+                    pass
+
+    def time_read_dataset(self, implicit):
+        """Time reading a dataset."""
+        for ii in range(self.no_runs):
+            read_dataset(BytesIO(self.data), implicit, True)
@@ -0,0 +1,81 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the FileSet class."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pydicom.fileset import FileSet
+from pydicom.uid import CTImageStorage, generate_uid
+
+from .synthetic import add_file_meta, create_header_dataset
+
+
+def create_instances(nr_patients, nr_instances):
+    """Return a list of CT Image instances for `nr_patients` patients."""
+    instances = []
+    for patient in range(nr_patients):
+        study_uid = generate_uid()
+        series_uid = generate_uid()
+        for idx in range(nr_instances):
+            ds = create_header_dataset(nr_items=1)
+            ds.PatientID = f"PAT{patient:05d}"
+            ds.StudyInstanceUID = study_uid
+            ds.SeriesInstanceUID = series_uid
+            ds.InstanceNumber = idx + 1
+            ds.SOPClassUID = CTImageStorage
+            add_file_meta(ds)
+            instances.append(ds)
+
+    return instances
+
+
+class TimeFileSet:
+    """Time and memory tests for FileSet."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.instances = create_instances(20, 25)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name)
+
+        fs = FileSet()
+        for ds in self.instances:
+            fs.add(ds)
+
+        fs.write(self.path / "fileset")
+        self.fs = FileSet(self.path / "fileset" / "DICOMDIR")
+
+    def teardown(self):
+        """Cleanup the benchmark."""
+        self.tdir.cleanup()
+
+    def time_load(self):
+        """Time loading an existing File-set."""
+        for ii in range(self.no_runs):
+            FileSet(self.path / "fileset" / "DICOMDIR")
+
+    def time_find(self):
+        """Time finding instances using the directory records."""
+        for ii in range(self.no_runs):
+            self.fs.find(PatientID="PAT00010")
+            self.fs.find(InstanceNumber=5)
+
+    def time_find_values(self):
+        """Time finding the unique element values."""
+        for ii in range(self.no_runs):
+            self.fs.find_values(["PatientID", "SeriesInstanceUID"])
+
+    def time_write(self):
+        """Time writing a new File-set."""
+        for ii in range(self.no_runs):
+            fs = FileSet()
+            for ds in self.instances:
+                fs.add(ds)
+
+            with TemporaryDirectory() as tdir:
+                fs.write(tdir)
+
+    def peakmem_load(self):
+        """Peak memory when loading an existing File-set."""
+        FileSet(self.path / "fileset" / "DICOMDIR")
@@ -0,0 +1,423 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for decoding, encoding and processing pixel data."""
+
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from pydicom import Dataset
+from pydicom.encaps import encapsulate
+from pydicom.pixels import (
+    apply_color_lut,
+    apply_modality_lut,
+    apply_presentation_lut,
+    apply_voi_lut,
+    compress,
+    concatenate_packed_frames,
+    convert_color_space,
+    get_decoder,
+    get_encoder,
+    iter_pixels,
+    pack_bits,
+    pixel_array,
+    unpack_frames,
+)
+from pydicom.pixels.utils import pixel_cache
+from pydicom.uid import (
+    DeflatedImageFrameCompression,
+    ExplicitVRLittleEndian,
+    JPEG2000Lossless,
+    JPEGBaseline8Bit,
+    JPEGLSLossless,
+    RLELossless,
+)
+
+from .synthetic import create_image_dataset
+
+
+# Well-known SOP Instance UID of the PET color palette
+PET = "1.2.840.10008.1.5.2"
+
+# {label: (transfer syntax, plugin)}
+DECODERS = {
+    "native": (ExplicitVRLittleEndian, ""),
+    "RLE/pydicom": (RLELossless, "pydicom"),
+    "RLE/pylibjpeg": (RLELossless, "pylibjpeg"),
+    "RLE/gdcm": (RLELossless, "gdcm"),
+    "JPEG/pillow": (JPEGBaseline8Bit, "pillow"),
+    "JPEG/pylibjpeg": (JPEGBaseline8Bit, "pylibjpeg"),
+    "JPEG/gdcm": (JPEGBaseline8Bit, "gdcm"),
+    "JPEG-LS/pyjpegls": (JPEGLSLossless, "pyjpegls"),
+    "JPEG-LS/pylibjpeg": (JPEGLSLossless, "pylibjpeg"),
+    "JPEG-LS/gdcm": (JPEGLSLossless, "gdcm"),
+    "J2K/pylibjpeg": (JPEG2000Lossless, "pylibjpeg"),
+    "J2K/pillow": (JPEG2000Lossless, "pillow"),
+    "J2K/gdcm": (JPEG2000Lossless, "gdcm"),
+    "Deflate/pydicom": (DeflatedImageFrameCompression, "pydicom"),
+}
+
+ENCODERS = {
+    "RLE/pydicom": (RLELossless, "pydicom"),
+    "RLE/pylibjpeg": (RLELossless, "pylibjpeg"),
+    "RLE/gdcm": (RLELossless, "gdcm"),
+    "JPEG-LS/pyjpegls": (JPEGLSLossless, "pyjpegls"),
+    "J2K/pylibjpeg": (JPEG2000Lossless, "pylibjpeg"),
+    "Deflate/pydicom": (DeflatedImageFrameCompression, "pydicom"),
+}
+
+
+def _encode_jpeg_baseline(ds):
+    """Return `ds` with its pixel data encoded as JPEG Baseline by Pillow."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise NotImplementedError("Pillow is required to create JPEG data")
+
+    frames = []
+    for arr in iter_pixels(ds):
+        fp = BytesIO()
+        Image.fromarray(arr).save(fp, format="JPEG", quality=95)
+        frames.append(fp.getvalue())
+
+    ds.PixelData = encapsulate(frames)
+    ds["PixelData"].VR = "OB"
+    ds.file_meta.TransferSyntaxUID = JPEGBaseline8Bit
+
+    return ds
+
+
+def create_encoded_dataset(tsyntax):
+    """Return a 10 frame dataset encoded with `tsyntax`.
+
+    Raises NotImplementedError if no plugin is available to create the data.
+    """
+    # 8-bit data so the dataset can be used with every transfer syntax
+    ds = create_image_dataset(256, 256, nr_frames=10, bits_stored=8)
+    if tsyntax == ExplicitVRLittleEndian:
+        return ds
+
+    if tsyntax == JPEGBaseline8Bit:
+        return _encode_jpeg_baseline(ds)
+
+    if not get_encoder(tsyntax).is_available:
+        raise NotImplementedError(f"No encoder available for '{tsyntax.name}'")
+
+    return compress(ds, tsyntax)
+
+
+class TimeDecode:
+    """Time and memory tests for decoding pixel data with each plugin."""
+
+    params = list(DECODERS)
+    param_names = ["decoder"]
+
+    def setup(self, label):
+        """Setup the benchmark."""
+        tsyntax, self.plugin = DECODERS[label]
+        if self.plugin and self.plugin not in get_decoder(tsyntax).available_plugins:
+            raise NotImplementedError(f"The '{self.plugin}' plugin is unavailable")
+
+        self.no_runs = 5
+        self.ds = create_encoded_dataset(tsyntax)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "image.dcm"
+        self.ds.save_as(self.path, enforce_file_format=True)
+
+    def teardown(self, label):
+        """Cleanup the benchmark."""
+        self.tdir.cleanup()
+
+    def time_pixel_array(self, label):
+        """Time decoding all frames from a file."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path, decoding_plugin=self.plugin)
+
+    def time_pixel_array_dataset(self, label):
+        """Time decoding all frames from a dataset."""
+        for ii in range(self.no_runs):
+            pixel_array(self.ds, decoding_plugin=self.plugin)
+
+    def time_iter_pixels(self, label):
+        """Time iterating over the frames in a file."""
+        for ii in range(self.no_runs):
+            for arr in iter_pixels(self.path, decoding_plugin=self.plugin):
+                pass
+
+    def peakmem_pixel_array(self, label):
+        """Peak memory when decoding all frames from a file."""
+        pixel_array(self.path, decoding_plugin=self.plugin)
+
+    def peakmem_iter_pixels(self, label):
+        """Peak memory when iterating over the frames in a file."""
+        for arr in iter_pixels(self.path, decoding_plugin=self.plugin):
+            pass
+
+
+class TimeCompress:
+    """Time and memory tests for compressing pixel data with each plugin."""
+
+    params = list(ENCODERS)
+    param_names = ["encoder"]
+
+    def setup(self, label):
+        """Setup the benchmark."""
+        self.tsyntax, self.plugin = ENCODERS[label]
+        if self.plugin not in get_encoder(self.tsyntax).available_plugins:
+            raise NotImplementedError(f"The '{self.plugin}' plugin is unavailable")
+
+        self.no_runs = 5
+        self.ds = create_image_dataset(256, 256, nr_frames=10, bits_stored=8)
+        self.arr = self.ds.pixel_array
+
+    def time_compress(self, label):
+        """Time compressing all frames."""
+        for ii in range(self.no_runs):
+            compress(
+                self.ds,
+                self.tsyntax,
+                self.arr,
+                encoding_plugin=self.plugin,
+                generate_instance_uid=False,
+            )
+
+    def peakmem_compress(self, label):
+        """Peak memory when compressing all frames."""
+        compress(
+            self.ds,
+            self.tsyntax,
+            self.arr,
+            encoding_plugin=self.plugin,
+            generate_instance_uid=False,
+        )
+
+
+class TimeColorSpace:
+    """Time tests for convert_color_space() with synthetic data."""
+
+    params = [True, False]
+    param_names = ["per_frame"]
+
+    def setup(self, per_frame):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        ds = create_image_dataset(512, 512, 5, samples_per_pixel=3, bits_stored=8)
+        self.arr = ds.pixel_array
+
+    def time_rgb_ybr(self, per_frame):
+        """Time converting from RGB to YBR_FULL."""
+        for ii in range(self.no_runs):
+            convert_color_space(self.arr, "RGB", "YBR_FULL", per_frame=per_frame)
+
+    def time_ybr_rgb(self, per_frame):
+        """Time converting from YBR_FULL to RGB."""
+        for ii in range(self.no_runs):
+            convert_color_space(self.arr, "YBR_FULL", "RGB", per_frame=per_frame)
+
+    def peakmem_ybr_rgb(self, per_frame):
+        """Peak memory when converting from YBR_FULL to RGB."""
+        convert_color_space(self.arr, "YBR_FULL", "RGB", per_frame=per_frame)
+
+
+class TimeLUT:
+    """Time tests for the LUT functions with synthetic data."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        ds = create_image_dataset(512, 512, nr_frames=5, bits_stored=12)
+        self.arr = ds.pixel_array
+        self.arr8 = (self.arr >> 4).astype(np.uint8)
+
+        lut = Dataset()
+        lut.LUTDescriptor = [4096, 0, 16]
+        lut.LUTData = list(range(0, 65536, 16))
+
+        self.rescale = Dataset()
+        self.rescale.RescaleSlope = 2
+        self.rescale.RescaleIntercept = -1024
+
+        self.modality = Dataset()
+        self.modality.ModalityLUTSequence = [lut]
+        self.modality.ModalityLUTSequence[0].ModalityLUTType = "US"
+
+        self.windowing = Dataset()
+        self.windowing.BitsStored = 12
+        self.windowing.PhotometricInterpretation = "MONOCHROME2"
+        self.windowing.PixelRepresentation = 0
+        self.windowing.WindowCenter = 2048
+        self.windowing.WindowWidth = 1024
+
+        self.voi = Dataset()
+        self.voi.BitsStored = 12
+        self.voi.PhotometricInterpretation = "MONOCHROME2"
+        self.voi.PixelRepresentation = 0
+        self.voi.VOILUTSequence = [lut]
+
+        self.presentation = Dataset()
+        self.presentation.BitsStored = 12
+        self.presentation.PhotometricInterpretation = "MONOCHROME2"
+        self.presentation.PresentationLUTShape = "INVERSE"
+
+    def time_rescale(self):
+        """Time applying a rescale operation."""
+        for ii in range(self.no_runs):
+            apply_modality_lut(self.arr, self.rescale)
+
+    def time_modality_lut(self):
+        """Time applying a Modality LUT."""
+        for ii in range(self.no_runs):
+            apply_modality_lut(self.arr, self.modality)
+
+    def time_windowing(self):
+        """Time applying a windowing operation."""
+        for ii in range(self.no_runs):
+            apply_voi_lut(self.arr, self.windowing)
+
+    def time_voi_lut(self):
+        """Time applying a VOI LUT."""
+        for ii in range(self.no_runs):
+            apply_voi_lut(self.arr, self.voi)
+
+    def time_presentation_lut(self):
+        """Time applying an INVERSE presentation LUT."""
+        for ii in range(self.no_runs):
+            apply_presentation_lut(self.arr, self.presentation)
+
+    def time_color_lut(self):
+        """Time applying the well-known PET color palette."""
+        for ii in range(self.no_runs):
+            apply_color_lut(self.arr8, palette=PET)
+
+
+class TimeBitPacking:
+    """Time tests for packing and unpacking multi-frame 1-bit pixel data."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        # Frames that don't start on byte boundaries
+        self.frame_length = 127 * 127
+        rng = np.random.default_rng(0)
+        self.arr = rng.integers(0, 2, (2000, 127, 127), dtype="u1")
+        self.packed = pack_bits(self.arr)
+        self.frames = [pack_bits(arr, pad=False) for arr in self.arr]
+
+    def time_pack_bits(self):
+        """Time packing all frames."""
+        for ii in range(self.no_runs):
+            pack_bits(self.arr)
+
+    def time_unpack_frames(self):
+        """Time unpacking all frames."""
+        for ii in range(self.no_runs):
+            unpack_frames(self.packed, self.frame_length)
+
+    def time_concatenate_packed_frames(self):
+        """Time concatenating individually packed frames."""
+        for ii in range(self.no_runs):
+            concatenate_packed_frames(self.frames, self.frame_length)
+
+
+class TimeRegionOfInterest:
+    """Time and memory tests for decoding a region of each frame from a file."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.roi = (slice(256, 512), slice(256, 512))
+        ds = create_image_dataset(1024, 1024, 5, samples_per_pixel=3, bits_stored=8)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "image.dcm"
+        ds.save_as(self.path, enforce_file_format=True)
+
+    def teardown(self):
+        """Cleanup the benchmark."""
+        self.tdir.cleanup()
+
+    def time_pixel_array(self):
+        """Time decoding all frames then cropping them."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path)[:, self.roi[0], self.roi[1]]
+
+    def time_pixel_array_roi(self):
+        """Time decoding only the region of each frame."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path, roi=self.roi)
+
+    def peakmem_pixel_array_roi(self):
+        """Peak memory when decoding only the region of each frame."""
+        pixel_array(self.path, roi=self.roi)
+
+
+class TimeMemoryMap:
+    """Time and memory tests for returning views on a mapped file."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        ds = create_image_dataset(512, 512, 50, bits_stored=16)
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "image.dcm"
+        ds.save_as(self.path, enforce_file_format=True)
+
+    def teardown(self):
+        """Cleanup the benchmark."""
+        self.tdir.cleanup()
+
+    def time_pixel_array(self):
+        """Time reading all frames into a new array."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path)
+
+    def time_pixel_array_view_only(self):
+        """Time returning a view on the mapped frames."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path, view_only=True)
+
+    def time_iter_pixels_view_only(self):
+        """Time yielding views on each of the mapped frames."""
+        for ii in range(self.no_runs):
+            for arr in iter_pixels(self.path, view_only=True):
+                pass
+
+    def peakmem_pixel_array(self):
+        """Peak memory when reading all frames into a new array."""
+        pixel_array(self.path)
+
+    def peakmem_pixel_array_view_only(self):
+        """Peak memory when returning a view on the mapped frames."""
+        pixel_array(self.path, view_only=True)
+
+
+class TimePixelCache:
+    """Time tests for decoding compressed pixel data with the pixel cache."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        ds = create_image_dataset(512, 512, 10, bits_stored=16)
+        ds.compress(RLELossless, encoding_plugin="pydicom")
+        self.tdir = TemporaryDirectory()
+        self.path = Path(self.tdir.name) / "image.dcm"
+        ds.save_as(self.path, enforce_file_format=True)
+        pixel_cache.max_bytes = 2**30
+        pixel_array(self.path)
+
+    def teardown(self):
+        """Cleanup the benchmark."""
+        pixel_cache.max_bytes = 0
+        pixel_cache.clear()
+        self.tdir.cleanup()
+
+    def time_pixel_array_uncached(self):
+        """Time decoding and caching the pixel data."""
+        for ii in range(self.no_runs):
+            pixel_cache.clear()
+            pixel_array(self.path)
+
+    def time_pixel_array_cached(self):
+        """Time returning cached pixel data."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path)
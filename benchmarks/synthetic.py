@@ -0,0 +1,194 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Synthetic datasets used by the benchmarks, so no downloads are needed."""
+
+from io import BytesIO
+
+import numpy as np
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.pixels import set_pixel_data
+from pydicom.sequence import Sequence
+from pydicom.uid import (
+    CTImageStorage,
+    ExplicitVRLittleEndian,
+    PYDICOM_IMPLEMENTATION_UID,
+    SecondaryCaptureImageStorage,
+    generate_uid,
+)
+
+
+# An example value for each VR, as used when setting an element value
+VR_VALUES = {
+    "AE": "STORESCP",
+    "AS": "035Y",
+    "AT": 0x00100010,
+    "CS": ["ORIGINAL", "PRIMARY", "AXIAL"],
+    "DA": "20240101",
+    "DS": ["1.2345", "-6.789E-01", "100"],
+    "DT": "20240101120000.123456+1000",
+    "FD": [1.5, -2.25, 3.125],
+    "FL": [1.5, -2.25, 3.125],
+    "IS": ["123", "-456", "7890"],
+    "LO": "A Long String value",
+    "LT": "Long text " * 10,
+    "OB": b"\x00\x01\x02\x03" * 16,
+    "OD": b"\x00" * 64,
+    "OF": b"\x00" * 64,
+    "OL": b"\x00" * 64,
+    "OV": b"\x00" * 64,
+    "OW": b"\x00\x01" * 32,
+    "PN": "Citizen^Jan^J^Dr^Jr",
+    "SH": "Short",
+    "SL": [-1, 2, -3],
+    "SQ": None,
+    "SS": [-1, 2, -3],
+    "ST": "Short text " * 5,
+    "SV": [-1, 2, -3],
+    "TM": "120000.123456",
+    "UC": "Unlimited characters",
+    "UI": "1.2.826.0.1.3680043.8.498.1234567890",
+    "UL": [1, 2, 3],
+    "UN": b"\x00\x01\x02\x03" * 4,
+    "UR": "http://example.com/some/path",
+    "US": [1, 2, 3],
+    "UT": "Unlimited text " * 10,
+    "UV": [1, 2, 3],
+}
+
+# Person Name values and their Specific Character Set for multi-byte charsets
+CHARSET_VALUES = {
+    "ISO_IR 192": (
+        "ISO_IR 192",
+        "Wang^XiaoDong=王^小東=",
+    ),
+    "ISO 2022 IR 87": (
+        ["", "ISO 2022 IR 87"],
+        "Yamada^Tarou=山田^太郎=やまだ^たろう",
+    ),
+    "ISO 2022 IR 149": (
+        ["", "ISO 2022 IR 149"],
+        "Hong^Gildong=洪^吉洞=홍^길동",
+    ),
+    "GB18030": (
+        "GB18030",
+        "Wang^XiaoDong=王^小东=",
+    ),
+}
+
+
+def add_file_meta(ds: Dataset, tsyntax: str = ExplicitVRLittleEndian) -> None:
+    """Add File Meta Information and the SOP Common elements to `ds`."""
+    ds.SOPClassUID = ds.get("SOPClassUID", SecondaryCaptureImageStorage)
+    ds.SOPInstanceUID = ds.get("SOPInstanceUID", generate_uid())
+
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+    ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+    ds.file_meta.TransferSyntaxUID = tsyntax
+    ds.file_meta.ImplementationClassUID = PYDICOM_IMPLEMENTATION_UID
+
+
+def create_header_dataset(nr_items: int = 50) -> Dataset:
+    """Return a dataset with patient, study and series elements, a private
+    block with one element for each VR and a sequence with `nr_items` items.
+    """
+    ds = Dataset()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+    ds.PatientBirthDate = "19700101"
+    ds.PatientSex = "O"
+    ds.StudyInstanceUID = generate_uid()
+    ds.StudyDate = "20240101"
+    ds.StudyTime = "120000"
+    ds.StudyID = "1"
+    ds.StudyDescription = "Synthetic study"
+    ds.AccessionNumber = "A1234"
+    ds.SeriesInstanceUID = generate_uid()
+    ds.SeriesNumber = 1
+    ds.Modality = "OT"
+    ds.InstanceNumber = 1
+    ds.ImageType = ["ORIGINAL", "PRIMARY"]
+    ds.ImagePositionPatient = [-125.0, -125.0, 50.5]
+    ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    ds.PixelSpacing = [0.488281, 0.488281]
+    ds.WindowCenter = 40
+    ds.WindowWidth = 400
+
+    block = ds.private_block(0x0011, "PYDICOM BENCHMARK", create=True)
+    for offset, (vr, value) in enumerate(VR_VALUES.items()):
+        if vr == "SQ":
+            value = Sequence([Dataset()])
+
+        block.add_new(offset, vr, value)
+
+    ds.ReferencedImageSequence = [Dataset() for _ in range(nr_items)]
+    for idx, item in enumerate(ds.ReferencedImageSequence):
+        item.ReferencedSOPClassUID = CTImageStorage
+        item.ReferencedSOPInstanceUID = generate_uid()
+        item.ReferencedFrameNumber = idx + 1
+
+    return ds
+
+
+def create_vr_dataset(vr: str, nr_elements: int = 250) -> Dataset:
+    """Return a dataset with `nr_elements` private elements using `vr`."""
+    ds = Dataset()
+    value = Sequence([Dataset()]) if vr == "SQ" else VR_VALUES[vr]
+    for idx in range(nr_elements):
+        group = 0x0011 + 2 * (idx // 0x100)
+        block = ds.private_block(group, "PYDICOM BENCHMARK", create=True)
+        block.add_new(idx % 0x100, vr, value)
+
+    return ds
+
+
+def create_image_dataset(
+    rows: int = 512,
+    columns: int = 512,
+    nr_frames: int = 1,
+    samples_per_pixel: int = 1,
+    bits_stored: int = 16,
+) -> Dataset:
+    """Return a dataset with native *Pixel Data* of gradients plus noise."""
+    if samples_per_pixel == 1:
+        photometric = "MONOCHROME2"
+        shape: tuple[int, ...] = (rows, columns)
+    else:
+        photometric = "RGB"
+        shape = (rows, columns, samples_per_pixel)
+
+    if nr_frames > 1:
+        shape = (nr_frames, *shape)
+
+    dtype = np.uint8 if bits_stored <= 8 else np.uint16
+    # Noise on a gradient so the compression ratios are realistic
+    rng = np.random.default_rng(0)
+    arr = np.indices(shape).sum(axis=0) % (2**bits_stored)
+    arr = (arr + rng.integers(0, 4, size=shape)) % (2**bits_stored)
+
+    ds = create_header_dataset(nr_items=1)
+    set_pixel_data(ds, arr.astype(dtype), photometric, bits_stored)
+    add_file_meta(ds)
+
+    return ds
+
+
+def to_bytes(ds: Dataset, **kwargs) -> bytes:
+    """Return `ds` encoded using :meth:`Dataset.save_as`."""
+    fp = BytesIO()
+    ds.save_as(fp, **kwargs)
+
+    return fp.getvalue()
+
+
+def raw_dataset(ds: Dataset) -> Dataset:
+    """Return a copy of `ds` with the elements still in their raw form.
+
+    If `ds` has File Meta Information then its transfer syntax is used,
+    otherwise the elements are encoded as explicit VR little endian.
+    """
+    if "TransferSyntaxUID" in ds.get("file_meta", {}):
+        return dcmread(BytesIO(to_bytes(ds, enforce_file_format=True)))
+
+    return dcmread(BytesIO(to_bytes(ds, implicit_vr=False)), force=True)
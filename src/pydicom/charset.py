@@ -2,12 +2,13 @@
 """Handle alternate character sets for character strings."""
 
 import codecs
+from functools import lru_cache
 import re
 from typing import (
     TYPE_CHECKING,
     cast,
 )
-from collections.abc import MutableSequence, Sequence
+from collections.abc import Iterable, MutableSequence, Sequence
 
 from pydicom import config
 from pydicom.misc import warn_and_log
@@ -99,6 +100,10 @@ ENCODINGS_TO_CODES["shift_jis"] = ESC + b")I"
 # string, and will be removed during decoding by Python.
 handled_encodings = ("iso2022_jp", "iso2022_jp_2", "iso_ir_58")
 
+# Only values up to this length are cached when decoding and encoding values
+# that use code extensions
+_MAX_CACHED_LENGTH = 1024
+
 
 def _encode_to_jis_x_0201(value: str, errors: str = "strict") -> bytes:
     """Convert a unicode string into JIS X 0201 byte string using shift_jis
@@ -354,28 +359,168 @@ def decode_bytes(value: bytes, encodings: Sequence[str], delimiters: set[int]) -
             )
             return value.decode(first_encoding, errors="replace")
 
+    # Values that decode without any problems are cached, otherwise decode
+    # again fragment by fragment to issue the appropriate warnings
+    decode = _decode_escaped
+    if len(value) > _MAX_CACHED_LENGTH:
+        decode = _decode_escaped.__wrapped__
+
+    try:
+        return decode(value, tuple(encodings), frozenset(delimiters))
+    except (ValueError, LookupError):
+        pass
+
     # Each part of the value that starts with an escape sequence is decoded
     # separately. If it starts with an escape sequence, the
     # corresponding encoding is used, otherwise (e.g. the first part if it
     # does not start with an escape sequence) the first encoding.
     # See PS3.5, 6.1.2.4 and 6.1.2.5 for the use of code extensions.
-    #
-    # The following regex splits the value into these parts, by matching
-    # the substring until the first escape character, and subsequent
-    # substrings starting with an escape character.
-    regex = b"(^[^\x1b]+|[\x1b][^\x1b]*)"
-    fragments: list[bytes] = re.findall(regex, value)
-
-    # decode each byte string fragment with it's corresponding encoding
-    # and join them all together
+    # Each fragment is decoded with it's corresponding encoding and then
+    # they're all joined together
     return "".join(
-        [_decode_fragment(fragment, encodings, delimiters) for fragment in fragments]
+        [
+            _decode_fragment(fragment, encodings, delimiters)
+            for fragment in _split_fragments(value)
+        ]
     )
 
 
 decode_string = decode_bytes
 
 
+def decode_values(
+    values: Iterable[bytes], encodings: Sequence[str], delimiters: set[int]
+) -> list[str]:
+    """Decode multiple encoded byte values into unicode strings.
+
+    .. versionadded:: 3.1
+
+    Equivalent to calling :func:`decode_bytes` for each value, except that
+    values that occur more than once are only decoded once.
+
+    Parameters
+    ----------
+    values : Iterable[bytes]
+        The encoded byte strings to decode.
+    encodings : list of str
+        The encodings needed to decode the strings as a list of Python
+        encodings, converted from the encodings in (0008,0005) *Specific
+        Character Set*.
+    delimiters : set of int
+        A set of characters or character codes, each of which resets the
+        encoding in the values.
+
+    Returns
+    -------
+    list[str]
+        The decoded unicode strings, in the same order as `values`.
+    """
+    decoded: dict[bytes, str] = {}
+    strings = []
+    for value in values:
+        string = decoded.get(value)
+        if string is None:
+            string = decoded[value] = decode_bytes(value, encodings, delimiters)
+
+        strings.append(string)
+
+    return strings
+
+
+def _split_fragments(value: bytes) -> list[bytes]:
+    """Return `value` split into the part before the first escape character
+    and the parts starting with an escape character.
+    """
+    fragments = value.split(ESC)
+    parts = [ESC + fragment for fragment in fragments[1:]]
+    if fragments[0]:
+        parts.insert(0, fragments[0])
+
+    return parts
+
+
+def _find_delimiter(byte_str: bytes, delimiters: frozenset[int]) -> int | None:
+    """Return the index of the first delimiter in `byte_str`, or ``None`` if
+    it doesn't contain any.
+    """
+    if not delimiters:
+        return None
+
+    # Replace every delimiter with the smallest so only one search is needed
+    table, delimiter = _delimiter_table(delimiters)
+    index = byte_str.translate(table).find(delimiter)
+    return None if index == -1 else index
+
+
+@lru_cache(maxsize=16)
+def _delimiter_table(delimiters: frozenset[int]) -> tuple[bytes, int]:
+    """Return a translation table that replaces each of `delimiters` with the
+    smallest delimiter, and the smallest delimiter.
+    """
+    delimiter = min(delimiters)
+    table = bytearray(range(256))
+    for value in delimiters:
+        table[value] = delimiter
+
+    return bytes(table), delimiter
+
+
+@lru_cache(maxsize=64)
+def _escape_table(encodings: tuple[str, ...]) -> dict[bytes, str]:
+    """Return the escape sequences that may be used with `encodings`, without
+    the leading escape character, and the encoding each switches to.
+    """
+    return {
+        code[1:]: encoding
+        for code, encoding in CODES_TO_ENCODINGS.items()
+        if encoding in encodings or encoding == default_encoding
+    }
+
+
+@lru_cache(maxsize=4096)
+def _decode_escaped(
+    value: bytes, encodings: tuple[str, ...], delimiters: frozenset[int]
+) -> str:
+    """Return `value`, which contains escape sequences, decoded using
+    `encodings`.
+
+    Unlike :func:`decode_bytes` no replacement characters are used, an
+    exception is raised instead.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If a fragment of `value` can't be decoded.
+    ValueError
+        If `value` contains an escape sequence that's unknown or not
+        usable with `encodings`.
+    """
+    table = _escape_table(encodings)
+    first, *fragments = value.split(ESC)
+    parts = [first.decode(encodings[0])] if first else []
+    for fragment in fragments:
+        # all 4-character escape codes start with one of two character sets
+        seq_length = 3 if fragment.startswith((b"$(", b"$)")) else 2
+        encoding = table.get(fragment[:seq_length])
+        if encoding is None:
+            raise ValueError("Found unknown escape sequence in encoded string value")
+
+        if encoding in handled_encodings:
+            # Python strips the escape sequence for this encoding
+            parts.append((ESC + fragment).decode(encoding))
+            continue
+
+        fragment = fragment[seq_length:]
+        index = _find_delimiter(fragment, delimiters)
+        if index is None:
+            parts.append(fragment.decode(encoding))
+        else:
+            parts.append(fragment[:index].decode(encoding))
+            parts.append(fragment[index:].decode(encodings[0]))
+
+    return "".join(parts)
+
+
 def _decode_fragment(
     byte_str: bytes, encodings: Sequence[str], delimiters: set[int]
 ) -> str:
@@ -459,9 +604,7 @@ def _decode_escaped_fragment(
         byte_str = byte_str[seq_length:]
 
         # If a delimiter occurs in the string, it resets the encoding.
-        # The following returns the first occurrence of a delimiter in
-        # the byte string, or None if it does not contain any.
-        index = next((idx for idx, ch in enumerate(byte_str) if ch in delimiters), None)
+        index = _find_delimiter(byte_str, frozenset(delimiters))
         if index is not None:
             # the part of the string after the first delimiter
             # is decoded with the first encoding
@@ -509,6 +652,46 @@ def encode_string(value: str, encodings: Sequence[str]) -> bytes:
         is set to ``RAISE`` and `value` could not be encoded with the
         supplied encodings.
     """
+    # shortcut for the common case - the first encoding is able to encode
+    # the value without needing any escape sequences
+    if encodings[0] not in custom_encoders:
+        try:
+            return value.encode(encodings[0])
+        except UnicodeError:
+            pass
+
+    encode = _encode_escaped
+    if len(value) > _MAX_CACHED_LENGTH:
+        encode = _encode_escaped.__wrapped__
+
+    try:
+        return encode(value, tuple(encodings))
+    except ValueError:
+        pass
+
+    # all attempts failed - raise or warn and encode with replacement
+    # characters
+    if config.settings.writing_validation_mode == config.RAISE:
+        # force raising a valid UnicodeEncodeError
+        value.encode(encodings[0])
+
+    warn_and_log(
+        f"Failed to encode value with encodings: {', '.join(encodings)} "
+        "- using replacement characters in encoded string"
+    )
+    return _encode_string_impl(value, encodings[0], errors="replace")
+
+
+@lru_cache(maxsize=4096)
+def _encode_escaped(value: str, encodings: tuple[str, ...]) -> bytes:
+    """Return `value` encoded using `encodings`, including any escape
+    sequences needed to switch between them.
+
+    Raises
+    ------
+    ValueError
+        If `value` could not be encoded with the given encodings.
+    """
     for i, encoding in enumerate(encodings):
         try:
             encoded = _encode_string_impl(value, encoding)
@@ -527,21 +710,9 @@ def encode_string(value: str, encodings: Sequence[str]) -> bytes:
     # if we have more than one encoding, we retry encoding by splitting
     # `value` into chunks that can be encoded with one of the encodings
     if len(encodings) > 1:
-        try:
-            return _encode_string_parts(value, encodings)
-        except ValueError:
-            pass
-    # all attempts failed - raise or warn and encode with replacement
-    # characters
-    if config.settings.writing_validation_mode == config.RAISE:
-        # force raising a valid UnicodeEncodeError
-        value.encode(encodings[0])
+        return _encode_string_parts(value, encodings)
 
-    warn_and_log(
-        f"Failed to encode value with encodings: {', '.join(encodings)} "
-        "- using replacement characters in encoded string"
-    )
-    return _encode_string_impl(value, encodings[0], errors="replace")
+    raise ValueError(f"Unable to encode the value with '{encodings[0]}'")
 
 
 def _encode_string_parts(value: str, encodings: Sequence[str]) -> bytes:
@@ -808,33 +979,66 @@ def decode_element(
     if elem.is_empty:
         return
 
+    decode_elements([elem], dicom_character_set)
+
+
+def decode_elements(
+    elements: Iterable["DataElement"], dicom_character_set: str | list[str] | None
+) -> None:
+    """Apply the DICOM character encoding to multiple data elements.
+
+    .. versionadded:: 3.1
+
+    Equivalent to calling :func:`decode_element` for each element, except
+    that the character set is only converted once and the encoded text
+    values are decoded together using :func:`decode_values`.
+
+    Parameters
+    ----------
+    elements : Iterable[dataelem.DataElement]
+        The :class:`DataElement<pydicom.dataelem.DataElement>` instances
+        containing encoded byte string values to decode.
+    dicom_character_set : str or list of str or None
+        The value of (0008,0005) *Specific Character Set*, which may be a
+        single value, a multiple value (code extension), or may also be ``''``
+        or ``None``, in which case ``'ISO_IR 6'`` will be used.
+    """
+    elements = [elem for elem in elements if not elem.is_empty]
+    if not elements:
+        return
+
     if not dicom_character_set:
         dicom_character_set = ["ISO_IR 6"]
 
     encodings = convert_encodings(dicom_character_set)
 
-    # decode the string value to unicode
-    # PN is special case as may have 3 components with different chr sets
-    if elem.VR == VR.PN:
-        if elem.VM == 1:
-            # elem.value: PersonName |  bytes
-            elem.value = cast(PersonName, elem.value).decode(encodings)
-        else:
-            # elem.value: Iterable[PersonName |  bytes]
-            elem.value = [cast(PersonName, vv).decode(encodings) for vv in elem.value]
-    elif elem.VR in CUSTOMIZABLE_CHARSET_VR:
-        # You can't re-decode unicode (string literals in py3)
-        if elem.VM == 1:
-            if isinstance(elem.value, str):
-                # already decoded
-                return
-            elem.value = decode_bytes(elem.value, encodings, TEXT_VR_DELIMS)
-        else:
-            output = list()
-            for value in elem.value:
-                if isinstance(value, str):
-                    output.append(value)
-                else:
-                    output.append(decode_bytes(value, encodings, TEXT_VR_DELIMS))
-
-            elem.value = output
+    # The text elements and their values, with the encoded values
+    #   decoded together afterwards
+    text_elements: list[tuple["DataElement", list[str | bytes]]] = []
+    encoded: list[bytes] = []
+    for elem in elements:
+        # decode the string value to unicode
+        # PN is special case as may have 3 components with different chr sets
+        if elem.VR == VR.PN:
+            if elem.VM == 1:
+                # elem.value: PersonName |  bytes
+                elem.value = cast(PersonName, elem.value).decode(encodings)
+            else:
+                # elem.value: Iterable[PersonName |  bytes]
+                elem.value = [
+                    cast(PersonName, vv).decode(encodings) for vv in elem.value
+                ]
+        elif elem.VR in CUSTOMIZABLE_CHARSET_VR:
+            values = [elem.value] if elem.VM == 1 else list(elem.value)
+            # You can't re-decode unicode (string literals in py3)
+            pending = [value for value in values if not isinstance(value, str)]
+            if pending:
+                text_elements.append((elem, values))
+                encoded.extend(pending)
+
+    decoded = iter(decode_values(encoded, encodings, TEXT_VR_DELIMS))
+    for elem, values in text_elements:
+        output = [
+            value if isinstance(value, str) else next(decoded) for value in values
+        ]
+        elem.value = output[0] if elem.VM == 1 else output
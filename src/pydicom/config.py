@@ -254,6 +254,12 @@ class Settings:
         # Chunk size to use when reading from buffered DataElement values
         self._buffered_read_size = 8192
 
+        # Maximum block size to use when reading ahead from files
+        self._read_ahead_size = 0
+
+        # Validate the values set for elements when writing the dataset
+        self._deferred_validation = False
+
     @property
     def buffered_read_size(self) -> int:
         """Get or set the chunk size when reading from buffered
@@ -273,6 +279,63 @@ class Settings:
 
         self._buffered_read_size = size
 
+    @property
+    def read_ahead_size(self) -> int:
+        """Get or set the maximum block size used when reading ahead from
+        files opened by pydicom.
+
+        If greater than 0 then files opened by :func:`~pydicom.filereader.dcmread`,
+        :func:`~pydicom.pixels.iter_pixels` and when reading deferred elements
+        are wrapped by a :class:`~pydicom.filebase.DicomReadAheadIO`, which
+        reads in blocks of :attr:`buffered_read_size` bytes, increasing up to
+        `size` bytes for sequential reads. This can reduce the number of reads
+        made when the files are on slow storage such as network filesystems.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        size : int
+            The maximum block size to use, or ``0`` to disable read-ahead
+            (default).
+        """
+        return self._read_ahead_size
+
+    @read_ahead_size.setter
+    def read_ahead_size(self, size: int) -> None:
+        if size < 0:
+            raise ValueError("The read ahead size must be greater than or equal to 0")
+
+        self._read_ahead_size = size
+
+    @property
+    def deferred_validation(self) -> bool:
+        """Get or set whether validation of new element values is deferred
+        until the dataset is written.
+
+        If ``True`` then values set for :class:`~pydicom.dataelem.DataElement`
+        instances aren't validated when set. Instead they're validated in bulk
+        when the dataset is written using :func:`~pydicom.filewriter.dcmwrite`
+        or when :meth:`Dataset.validate_deferred()
+        <pydicom.dataset.Dataset.validate_deferred>` is called, in accordance
+        with each element's :attr:`~pydicom.dataelem.DataElement.validation_mode`.
+        Elements read from a file that haven't been changed aren't validated
+        again.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        value : bool
+            ``True`` to defer validation, ``False`` to validate values when
+            they're set (default).
+        """
+        return self._deferred_validation
+
+    @deferred_validation.setter
+    def deferred_validation(self, value: bool) -> None:
+        self._deferred_validation = value
+
     @property
     def reading_validation_mode(self) -> int:
         """Defines behavior of validation while reading values, compared with
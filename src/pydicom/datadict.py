@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Access dicom dictionary information"""
 
+from functools import lru_cache
+
 # the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
 # those with tags like "(50xx,0005)"
 from pydicom._dicom_dict import DicomDictionary, RepeatersDictionary
@@ -146,6 +148,7 @@ def add_dict_entries(
 
     # Update the reverse mapping from name to tag
     keyword_dict.update({val[4]: tag for tag, val in new_entries_dict.items()})
+    _keyword_tag_vr.cache_clear()
 
 
 def add_private_dict_entry(
@@ -477,6 +480,22 @@ def tag_for_keyword(keyword: str) -> int | None:
     return keyword_dict.get(keyword)
 
 
+@lru_cache(maxsize=4096)
+def _keyword_tag_vr(keyword: str) -> tuple[BaseTag, str] | None:
+    """Return the tag and VR of the element corresponding to `keyword`, or
+    ``None`` if `keyword` isn't in the DICOM data dictionary.
+
+    Used by :class:`~pydicom.dataset.Dataset` when getting and setting
+    elements using their keywords, the cached results are cleared by
+    :func:`add_dict_entries`.
+    """
+    tag = keyword_dict.get(keyword)
+    if tag is None:
+        return None
+
+    return BaseTag(tag), _dictionary_vr_fast(tag)
+
+
 def repeater_has_tag(tag: int) -> bool:
     """Return ``True`` if `tag` is in the DICOM repeaters data dictionary.
 
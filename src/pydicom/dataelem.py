@@ -9,13 +9,16 @@ A DataElement has a tag,
 
 import base64
 import math
-from collections.abc import Callable, MutableSequence
+from collections.abc import Callable, Iterable, MutableSequence
 import copy
 from io import BufferedIOBase
+from itertools import count
 import json
+from time import perf_counter
 from typing import Any, TYPE_CHECKING, NamedTuple
 
 from pydicom import config  # don't import datetime_conversion directly
+from pydicom import instrumentation
 from pydicom.config import logger
 from pydicom.datadict import (
     dictionary_has_tag,
@@ -26,7 +29,11 @@ from pydicom.datadict import (
     dictionary_VR,
     repeater_has_tag,
 )
-from pydicom.hooks import hooks
+from pydicom.hooks import (
+    hooks,
+    raw_element_value as _raw_element_value,
+    raw_element_vr as _raw_element_vr,
+)
 from pydicom.jsonrep import JsonDataElementConverter, BulkDataType
 from pydicom.misc import warn_and_log
 from pydicom.multival import MultiValue
@@ -40,6 +47,7 @@ from pydicom.valuerep import (
     PersonName,
     BYTES_VR,
     AMBIGUOUS_VR,
+    CUSTOMIZABLE_CHARSET_VR,
     STR_VR,
     ALLOW_BACKSLASH,
     DEFAULT_CHARSET_VR,
@@ -55,6 +63,36 @@ if TYPE_CHECKING:  # pragma: no cover
     from pydicom.dataset import Dataset
 
 
+# The elements whose values affect the decoding of the pixel data
+_PIXEL_TAGS = frozenset(
+    {
+        0x00280002,  # SamplesPerPixel
+        0x00280004,  # PhotometricInterpretation
+        0x00280006,  # PlanarConfiguration
+        0x00280008,  # NumberOfFrames
+        0x00280010,  # Rows
+        0x00280011,  # Columns
+        0x00280100,  # BitsAllocated
+        0x00280101,  # BitsStored
+        0x00280103,  # PixelRepresentation
+        0x7FE00008,  # FloatPixelData
+        0x7FE00009,  # DoubleFloatPixelData
+        0x7FE00010,  # PixelData
+    }
+)
+# Changed whenever the value of an existing element in _PIXEL_TAGS is set so
+#   datasets can tell if their stored pixel array may be stale, the values
+#   come from a counter so they're never reused
+_PIXEL_GENERATIONS = count(1)
+_pixel_value_generation = 0
+
+
+def _pixel_value_changed() -> None:
+    """Record a change to the value of an element in ``_PIXEL_TAGS``."""
+    global _pixel_value_generation
+    _pixel_value_generation = next(_PIXEL_GENERATIONS)
+
+
 def empty_value_for_VR(
     VR: str | None, raw: bool = False
 ) -> bytes | list[str] | str | None | PersonName:
@@ -167,6 +205,20 @@ class DataElement:  # noqa: PLW1641
         The element's Value Representation.
     """
 
+    # The per-instance state is kept in slots to reduce memory use, with
+    #   `__dict__` only created if other attributes such as `showVR` are set
+    __slots__ = (
+        "VR",
+        "_pending_validation",
+        "_value",
+        "file_tell",
+        "is_undefined_length",
+        "private_creator",
+        "tag",
+        "validation_mode",
+        "__dict__",
+    )
+
     descripWidth = 35
     maxBytesToDisplay = 16
     showVR = True
@@ -237,6 +289,8 @@ class DataElement:  # noqa: PLW1641
 
         self.VR = VR  # Note: you must set VR before setting value
         self.validation_mode = validation_mode
+        # True if validation of the value has been deferred until writing
+        self._pending_validation = False
 
         if already_converted:
             self._value = value
@@ -469,6 +523,9 @@ class DataElement:  # noqa: PLW1641
 
     @value.setter
     def value(self, val: Any) -> None:
+        # Changes to the values of new elements don't need to be tracked
+        is_pixel_change = self.tag in _PIXEL_TAGS and hasattr(self, "_value")
+
         # O* elements set using a buffer object
         if isinstance(val, BufferedIOBase):
             if self.VR not in BUFFERABLE_VRS:
@@ -486,6 +543,9 @@ class DataElement:  # noqa: PLW1641
                 raise type(exc)(f"Invalid buffer for {self.tag} '{self.name}': {exc}")
 
             self._value = val
+            if is_pixel_change:
+                _pixel_value_changed()
+
             return
 
         # Check if is multiple values separated by backslash
@@ -501,6 +561,8 @@ class DataElement:  # noqa: PLW1641
                 val = val.split(b"\\") if b"\\" in val else val
 
         self._value = self._convert_value(val)
+        if is_pixel_change:
+            _pixel_value_changed()
 
     @property
     def VM(self) -> int:
@@ -603,14 +665,59 @@ class DataElement:  # noqa: PLW1641
         # e.g. LUT Descriptor is 'US or SS' and VM 3, but the first and
         #   third values are always US (the third should be <= 16, so SS is OK)
         if self.tag in _LUT_DESCRIPTOR_TAGS and val:
-            validate_value(VR_.US, val[0], self.validation_mode)
+            validation_mode = self._validation_mode()
+            validate_value(VR_.US, val[0], validation_mode)
             for value in val[1:]:
-                validate_value(self.VR, value, self.validation_mode)
+                validate_value(self.VR, value, validation_mode)
 
             return MultiValue(_pass_through, val)
 
         return MultiValue(self._convert, val)
 
+    def _validation_mode(self) -> int:
+        """Return the validation mode to use when setting a new value.
+
+        If :attr:`~pydicom.config.Settings.deferred_validation` is ``True`` then
+        the element is flagged for validation when written and validation is
+        skipped now.
+        """
+        if (
+            config.settings._deferred_validation
+            and self.validation_mode != config.IGNORE
+        ):
+            self._pending_validation = True
+            return config.IGNORE
+
+        return self.validation_mode
+
+    def _validate_pending(self) -> None:
+        """Validate a value whose validation was deferred when it was set."""
+        values = self._value
+        if not isinstance(values, MultiValue):
+            values = [values]
+
+        is_lut_descriptor = self.tag in _LUT_DESCRIPTOR_TAGS and len(values) > 1
+        for idx, value in enumerate(values):
+            # Validate the same form of the value that's validated when set
+            if isinstance(
+                value,
+                pydicom.valuerep.IS
+                | pydicom.valuerep.ISfloat
+                | pydicom.valuerep.DSfloat
+                | pydicom.valuerep.DSdecimal,
+            ):
+                value = str(value)
+            elif isinstance(value, PersonName):
+                value = value.original_string or str(value)
+
+            vr = VR_.US if idx == 0 and is_lut_descriptor else self.VR
+            try:
+                validate_value(vr, value, self.validation_mode)
+            except ValueError as exc:
+                raise ValueError(f"Invalid value for {self.tag} '{self.name}': {exc}")
+
+        self._pending_validation = False
+
     def _convert(self, val: Any) -> Any:
         """Convert `val` to an appropriate type for the element's VR."""
         # If the value is bytes and has a VR that can only be encoded
@@ -618,31 +725,35 @@ class DataElement:  # noqa: PLW1641
         if self.VR in DEFAULT_CHARSET_VR and isinstance(val, bytes):
             val = val.decode()
 
+        validation_mode = self._validation_mode()
+
         if self.VR == VR_.IS:
-            return pydicom.valuerep.IS(val, self.validation_mode)
+            return pydicom.valuerep.IS(val, validation_mode)
 
         if self.VR == VR_.DA and config.datetime_conversion:
-            return pydicom.valuerep.DA(val, validation_mode=self.validation_mode)
+            return pydicom.valuerep.DA(val, validation_mode=validation_mode)
 
         if self.VR == VR_.DS:
-            return pydicom.valuerep.DS(val, False, self.validation_mode)
+            return pydicom.valuerep.DS(val, False, validation_mode)
 
         if self.VR == VR_.DT and config.datetime_conversion:
-            return pydicom.valuerep.DT(val, validation_mode=self.validation_mode)
+            return pydicom.valuerep.DT(val, validation_mode=validation_mode)
 
         if self.VR == VR_.TM and config.datetime_conversion:
-            return pydicom.valuerep.TM(val, validation_mode=self.validation_mode)
+            return pydicom.valuerep.TM(val, validation_mode=validation_mode)
 
         if self.VR == VR_.UI:
-            return UID(val, self.validation_mode) if val is not None else None
+            return UID(val, validation_mode) if val is not None else None
 
         if self.VR == VR_.PN:
-            return PersonName(val, validation_mode=self.validation_mode)
+            return PersonName(val, validation_mode=validation_mode)
 
         if self.VR == VR_.AT and (val == 0 or val):
             return val if isinstance(val, BaseTag) else Tag(val)
 
-        self.validate(val)
+        if validation_mode != config.IGNORE:
+            self.validate(val)
+
         return val
 
     def __deepcopy__(self, memo: dict[int, Any]) -> "DataElement":
@@ -651,7 +762,7 @@ class DataElement:  # noqa: PLW1641
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
+        for k, v in self.__getstate__().items():
             if self.is_buffered and k == "_value":
                 try:
                     setattr(result, k, copy.deepcopy(v, memo))
@@ -665,6 +776,21 @@ class DataElement:  # noqa: PLW1641
 
         return result
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the element's state as a :class:`dict` for pickling."""
+        state = dict(getattr(self, "__dict__", {}))
+        for name in DataElement.__slots__:
+            if name != "__dict__" and hasattr(self, name):
+                state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the element's state from `state`."""
+        self._pending_validation = False
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other: Any) -> Any:
         """Compare `self` and `other` for equality.
 
@@ -907,6 +1033,7 @@ def convert_raw_data_element(
     pydicom.dataelem.DataElement
         A :class:`~pydicom.dataelem.DataElement` instance created from `raw`.
     """
+    start = perf_counter() if instrumentation.enabled else 0.0
     data: dict[str, Any] = {}
     if config.data_element_callback:
         raw = config.data_element_callback(raw, **config.data_element_callback_kwargs)
@@ -923,7 +1050,7 @@ def convert_raw_data_element(
         hooks.raw_element_vr(raw, data, encoding=encoding, ds=ds)
         hooks.raw_element_value(raw, data, encoding=encoding, ds=ds)
 
-    return DataElement(
+    elem = DataElement(
         raw.tag,
         data["VR"],
         data["value"],
@@ -931,6 +1058,129 @@ def convert_raw_data_element(
         raw.length == 0xFFFFFFFF,
         already_converted=True,
     )
+    if start:
+        instrumentation.record(f"convert.{elem.VR}", perf_counter() - start)
+
+    return elem
+
+
+# VRs that always use convert_raw_data_element()
+_SLOW_CONVERSION_VRS = {VR_.SQ, VR_.UN} | AMBIGUOUS_VR
+
+
+def convert_raw_data_elements(
+    raws: Iterable[RawDataElement],
+    *,
+    encoding: str | MutableSequence[str] | None = None,
+    ds: "Dataset | None" = None,
+) -> list[DataElement]:
+    """Return :class:`DataElement` instances created from `raws`.
+
+    .. versionadded:: 3.1
+
+    Produces the same elements as calling :func:`convert_raw_data_element` for
+    each raw element but with less overhead per element. The raw elements are
+    grouped by VR so the value converter for each VR is looked up once, and the
+    elements are created without repeating the checks already made when the
+    raw elements were read. Elements with a VR of **SQ**, **UN** or an ambiguous
+    VR and elements that fail conversion are passed to
+    :func:`convert_raw_data_element` instead, as are all the elements if
+    either of the :mod:`~pydicom.hooks` callbacks has been changed,
+    :attr:`~pydicom.config.data_element_callback` is set or
+    :mod:`~pydicom.instrumentation` is enabled.
+
+    Parameters
+    ----------
+    raws : Iterable[pydicom.dataelem.RawDataElement]
+        The raw data elements to convert.
+    encoding : str | MutableSequence[str] | None
+        The character set encodings for the raw data elements.
+    ds : pydicom.dataset.Dataset | None
+        The parent dataset of `raws`.
+
+    Returns
+    -------
+    list[pydicom.dataelem.DataElement]
+        The converted elements, in the same order as `raws`.
+    """
+    raws = list(raws)
+    if (
+        config.data_element_callback
+        or hooks.raw_element_kwargs
+        or hooks.raw_element_vr is not _raw_element_vr
+        or hooks.raw_element_value is not _raw_element_value
+        or instrumentation.enabled
+    ):
+        return [convert_raw_data_element(raw, encoding=encoding, ds=ds) for raw in raws]
+
+    from pydicom.charset import default_encoding
+    from pydicom.values import converters
+
+    # Group the raw elements by VR, {VR: [indices into `raws`]}
+    groups: dict[str, list[int]] = {}
+    elements: list[Any] = [None] * len(raws)
+    for idx, raw in enumerate(raws):
+        vr = raw.VR
+        if vr is None or vr == VR_.UN:
+            data: dict[str, Any] = {}
+            _raw_element_vr(raw, data, encoding=encoding, ds=ds)
+            vr = data["VR"]
+
+        if (
+            vr in _SLOW_CONVERSION_VRS
+            or vr not in converters
+            or raw.tag in _LUT_DESCRIPTOR_TAGS
+        ):
+            elements[idx] = convert_raw_data_element(raw, encoding=encoding, ds=ds)
+        elif vr in groups:
+            groups[vr].append(idx)
+        else:
+            groups[vr] = [idx]
+
+    encodings = encoding or [default_encoding]
+    if isinstance(encodings, str):
+        encodings = [encodings]
+
+    validation_mode = config.settings.reading_validation_mode
+    new_element = DataElement.__new__
+    for vr, indices in groups.items():
+        converter = converters[vr]
+        num_format = None
+        if isinstance(converter, tuple):
+            converter, num_format = converter
+
+        for idx in indices:
+            raw = raws[idx]
+            if raw.length == 0:
+                value = empty_value_for_VR(vr)
+            else:
+                try:
+                    if vr == VR_.PN:
+                        value = converter(raw.value, encodings)
+                    elif vr in CUSTOMIZABLE_CHARSET_VR:
+                        value = converter(raw.value, encodings, vr)
+                    else:
+                        value = converter(raw.value, raw.is_little_endian, num_format)
+                except Exception:
+                    # Let the usual conversion handle any errors or retries
+                    elements[idx] = convert_raw_data_element(
+                        raw, encoding=encoding, ds=ds
+                    )
+                    continue
+
+            # Equivalent to DataElement(..., already_converted=True)
+            elem = new_element(DataElement)
+            elem.tag = raw.tag if isinstance(raw.tag, BaseTag) else Tag(raw.tag)
+            elem.VR = vr
+            elem.validation_mode = validation_mode
+            elem._pending_validation = False
+            elem._value = value
+            elem.file_tell = raw.value_tell
+            elem.is_undefined_length = raw.length == 0xFFFFFFFF
+            elem.private_creator = None
+            elements[idx] = elem
+
+    return elements
 
 
 def _DataElement_from_raw(
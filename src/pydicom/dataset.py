@@ -25,8 +25,10 @@ import re
 from bisect import bisect_left
 from collections.abc import (
     ValuesView,
+    Iterable,
     Iterator,
     Callable,
+    Mapping,
     MutableSequence,
     MutableMapping,
     Set,
@@ -36,7 +38,7 @@ from importlib.util import find_spec as have_package
 from itertools import chain, takewhile
 import sys
 import traceback
-from types import SimpleNamespace, TracebackType
+from types import MappingProxyType, SimpleNamespace, TracebackType
 from typing import (
     TypeAlias,
     Any,
@@ -58,6 +60,7 @@ from pydicom._version import __version_info__
 from pydicom.charset import default_encoding, convert_encodings
 from pydicom.config import logger
 from pydicom.datadict import (
+    _keyword_tag_vr,
     dictionary_description,
     dictionary_VR,
     tag_for_keyword,
@@ -65,16 +68,19 @@ from pydicom.datadict import (
     repeater_has_keyword,
     get_private_entry,
 )
-from pydicom.dataelem import DataElement, convert_raw_data_element, RawDataElement
-from pydicom.filebase import ReadableBuffer, WriteableBuffer
+import pydicom.dataelem
+from pydicom.dataelem import (
+    DataElement,
+    convert_raw_data_element,
+    convert_raw_data_elements,
+    RawDataElement,
+    _PIXEL_TAGS,
+)
+from pydicom.filebase import DicomReadAheadIO, ReadableBuffer, WriteableBuffer
 from pydicom.fileutil import path_from_pathlike, PathType
 from pydicom.misc import warn_and_log, find_keyword_candidates
 from pydicom.pixels import compress, convert_color_space, decompress, pixel_array
-from pydicom.pixels.utils import (
-    reshape_pixel_array,
-    get_image_pixel_ids,
-    set_pixel_data,
-)
+from pydicom.pixels.utils import reshape_pixel_array, set_pixel_data
 from pydicom.tag import Tag, BaseTag, TagType, TAG_PIXREP
 from pydicom.uid import PYDICOM_IMPLEMENTATION_UID, UID
 from pydicom.valuerep import VR as VR_, AMBIGUOUS_VR
@@ -373,8 +379,33 @@ class Dataset:  # noqa: PLW1641
         Default is ``"   "``.
     """
 
+    # The commonly used per-instance state is kept in slots to reduce memory
+    #   use, with `__dict__` for any other attributes
+    __slots__ = (
+        "_dict",
+        "_is_implicit_VR",
+        "_is_little_endian",
+        "_parent_encoding",
+        "_pixel_rep",
+        "_read_charset",
+        "_read_implicit",
+        "_read_little",
+        "is_undefined_length_sequence_item",
+        "__dict__",
+        "__weakref__",
+    )
+
     indent_chars = "   "
 
+    # Rarely used state, which is only added to the instance when changed
+    _pixel_array: "numpy.ndarray | None" = None
+    _pixel_array_opts: Mapping[str, Any] = MappingProxyType({"use_pdh": False})
+    # Incremented when elements affecting the pixel data are added or removed
+    _pixel_generation: int = 0
+    # The pixel generations that `_pixel_array` was decoded from
+    _pixel_id: Mapping[str, int] | tuple[int, int] = MappingProxyType({})
+    _private_blocks: Mapping[tuple[int, str], PrivateBlock] = MappingProxyType({})
+
     def __init__(self, *args: _DatasetType, **kwargs: Any) -> None:
         """Create a new :class:`Dataset` instance."""
         self._parent_encoding: str | list[str] = kwargs.get(
@@ -407,13 +438,6 @@ class Dataset:  # noqa: PLW1641
         # True if the dataset is a sequence item with undefined length
         self.is_undefined_length_sequence_item = False
 
-        # known private creator blocks
-        self._private_blocks: dict[tuple[int, str], PrivateBlock] = {}
-
-        self._pixel_array: numpy.ndarray | None = None
-        self._pixel_array_opts: dict[str, Any] = {"use_pdh": False}
-        self._pixel_id: dict[str, int] = {}
-
         self.file_meta: FileMetaDataset
 
         # Used after reading an implicit dataset to help determine the VR of
@@ -436,6 +460,23 @@ class Dataset:  # noqa: PLW1641
         """Method invoked on exit from a with statement."""
         return _trace_from(self, exc_type, exc_val, exc_tb)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the dataset's state as a :class:`dict` for pickling."""
+        state = dict(self.__dict__)
+        for name in Dataset.__slots__[:-2]:
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the dataset's state from `state`."""
+        for name, value in state.items():
+            if name in Dataset.__slots__:
+                object.__setattr__(self, name, value)
+            else:
+                self.__dict__[name] = value
+
     def __deepcopy__(self, memo: dict[int, Any]) -> "Dataset":
         """Return a deep copy of the dataset.
 
@@ -449,7 +490,7 @@ class Dataset:  # noqa: PLW1641
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
+        for k, v in self.__getstate__().items():
             if k == "_private_blocks":
                 private_blocks: dict[tuple[int, str], PrivateBlock] = {}
                 for key, block in self._private_blocks.items():
@@ -622,11 +663,11 @@ class Dataset:  # noqa: PLW1641
         # May be multi-valued, but let pydicom.charset handle all logic on that
         dicom_character_set = self._character_set
 
-        # Shortcut to the decode function in pydicom.charset
-        decode_data_element = pydicom.charset.decode_element
+        # The non-sequence elements, decoded together afterwards by
+        # the pydicom.charset.decode_elements function
+        elements: list[DataElement] = []
 
         # Callback for walk(), to decode the chr strings if necessary
-        # This simply calls the pydicom.charset.decode_element function
         def decode_callback(ds: "Dataset", data_element: DataElement) -> None:
             """Callback to decode `data_element`."""
             if data_element.VR == VR_.SQ:
@@ -634,9 +675,10 @@ class Dataset:  # noqa: PLW1641
                     dset._parent_encoding = dicom_character_set
                     dset.decode()
             else:
-                decode_data_element(data_element, dicom_character_set)
+                elements.append(data_element)
 
         self.walk(decode_callback, recursive=False)
+        pydicom.charset.decode_elements(elements, dicom_character_set)
 
     def copy(self) -> "Dataset":
         """Return a shallow copy of the dataset."""
@@ -674,15 +716,13 @@ class Dataset:  # noqa: PLW1641
         tag = cast(BaseTag, tag_for_keyword(name))
         if tag is not None and tag in self._dict:
             del self._dict[tag]
-
-            # Deleting pixel data resets the stored array
-            if tag in PIXEL_KEYWORDS:
-                self._pixel_array = None
-                self._pixel_id = {}
+            self._pixel_changed(tag)
         # If not a DICOM name in this dataset, check for regular instance name
         #   can't do delete directly, that will call __delattr__ again
         elif name in self.__dict__:
             del self.__dict__[name]
+        elif name in Dataset.__slots__ and hasattr(self, name):
+            object.__delattr__(self, name)
         # Not found, raise an error in same style as python does
         else:
             raise AttributeError(name)
@@ -726,18 +766,13 @@ class Dataset:  # noqa: PLW1641
                 if self._private_blocks and BaseTag(tag).is_private_creator:
                     self._private_blocks = {}
 
-                if tag in PIXEL_KEYWORDS:
-                    self._pixel_array = None
-                    self._pixel_id = {}
+                self._pixel_changed(tag)
         elif isinstance(key, BaseTag):
             del self._dict[key]
             if self._private_blocks and key.is_private_creator:
                 self._private_blocks = {}
 
-            # Deleting pixel data resets the stored array
-            if key in PIXEL_KEYWORDS:
-                self._pixel_array = None
-                self._pixel_id = {}
+            self._pixel_changed(key)
         else:
             # If not a standard tag, than convert to Tag and try again
             tag = Tag(key)
@@ -745,10 +780,7 @@ class Dataset:  # noqa: PLW1641
             if self._private_blocks and tag.is_private_creator:
                 self._private_blocks = {}
 
-            # Deleting pixel data resets the stored array
-            if tag in PIXEL_KEYWORDS:
-                self._pixel_array = None
-                self._pixel_id = {}
+            self._pixel_changed(tag)
 
     def __dir__(self) -> list[str]:
         """Return a list of methods, properties, attributes and element
@@ -871,6 +903,71 @@ class Dataset:  # noqa: PLW1641
         except KeyError:
             return default
 
+    def get_many(
+        self, keywords: Iterable[str], default: Any | None = None
+    ) -> list[Any]:
+        """Return the values of the elements corresponding to `keywords`.
+
+        .. versionadded:: 3.1
+
+        Equivalent to calling :meth:`get` with each keyword, but faster when
+        getting the values of many elements as any raw elements are
+        converted together.
+
+        Examples
+        --------
+
+        >>> ds = Dataset()
+        >>> ds.PatientName = "CITIZEN^Jan"
+        >>> ds.PatientID = "12345"
+        >>> ds.get_many(["PatientID", "PatientName", "PatientSex"])
+        ['12345', 'CITIZEN^Jan', None]
+
+        Parameters
+        ----------
+        keywords : Iterable[str]
+            The element keywords or class attribute names to get the values
+            for.
+        default : obj or None, optional
+            The value to use for elements or class attributes that aren't
+            present (default ``None``).
+
+        Returns
+        -------
+        list[Any]
+            The values for each of `keywords`, in the same order.
+        """
+        keywords = list(keywords)
+        entries = [_keyword_tag_vr(keyword) for keyword in keywords]
+
+        raws = [
+            elem
+            for entry in entries
+            if entry is not None
+            and isinstance(elem := self._dict.get(entry[0]), RawDataElement)
+        ]
+        if raws:
+            tags = list({raw.tag: None for raw in raws})
+            self.load_deferred(tags)
+            self._convert_raw_elements(
+                [
+                    elem
+                    for tag in tags
+                    if isinstance(elem := self._dict[tag], RawDataElement)
+                ]
+            )
+
+        values = []
+        for keyword, entry in zip(keywords, entries):
+            if entry is None:
+                values.append(self.get(keyword, default))
+            elif (elem := self._dict.get(entry[0])) is None:
+                values.append(default)
+            else:
+                values.append(elem.value)
+
+        return values
+
     def items(self) -> Set[tuple[BaseTag, _DatasetValue]]:
         """Return the :class:`Dataset` items to simulate :meth:`dict.items`.
 
@@ -923,11 +1020,14 @@ class Dataset:  # noqa: PLW1641
               element's value. Otherwise returns the class attribute's
               value (if present).
         """
-        tag = tag_for_keyword(name)
-        if tag is not None:  # None means `name` isn't a DICOM element keyword
-            tag = Tag(tag)
-            if tag in self._dict:
-                return self[tag].value
+        entry = _keyword_tag_vr(name)
+        if entry is not None:  # None means `name` isn't a DICOM element keyword
+            elem = self._dict.get(entry[0])
+            if elem is not None:
+                if isinstance(elem, RawDataElement):
+                    return self[entry[0]].value
+
+                return elem.value
 
         # no tag or tag not contained in the dataset
         if name == "_dict":
@@ -1107,6 +1207,144 @@ class Dataset:  # noqa: PLW1641
 
         return cast(DataElement, self._dict.get(tag))
 
+    def load_deferred(self, tags: Iterable[TagType] | None = None) -> None:
+        """Read the values of deferred elements into memory.
+
+        .. versionadded:: 3.1
+
+        This is faster than accessing the deferred elements one at a time as
+        the elements are read in order of their position in the file, with
+        elements that are close together read using a single read.
+
+        Examples
+        --------
+
+        Read a dataset with deferred values then load two of them::
+
+            >>> ds = dcmread(path, defer_size="1 KB")
+            >>> ds.load_deferred(["PixelData", 0x00431029])
+
+        Parameters
+        ----------
+        tags : Iterable[int | str | tuple[int, int]], optional
+            The tags of the deferred elements to read, in any form accepted by
+            :func:`~pydicom.tag.Tag`. If not used (default) then read all the
+            deferred elements in the dataset. Tags for elements that aren't in
+            the dataset or that have already been read are ignored.
+        """
+        elements: Iterable[DataElement | RawDataElement] = self._dict.values()
+        if tags is not None:
+            elements = [self._dict[tag] for tag in map(Tag, tags) if tag in self._dict]
+
+        deferred = [
+            elem
+            for elem in elements
+            if isinstance(elem, RawDataElement)
+            and elem.value is None
+            and elem.length != 0
+        ]
+        if not deferred:
+            return
+
+        from pydicom.filereader import read_deferred_data_elements
+
+        src = self.filename or self.buffer
+        if self.filename and self.buffer and not getattr(self.buffer, "closed", False):
+            src = self.buffer
+
+        for elem in read_deferred_data_elements(
+            self.fileobj_type, src, self.timestamp, deferred
+        ):
+            # Convert from the raw element with its value set
+            self._dict[elem.tag] = elem
+            self.__getitem__(elem.tag)
+
+    def convert_all(self, recursive: bool = True) -> None:
+        """Convert all the raw elements in the dataset.
+
+        .. versionadded:: 3.1
+
+        Elements read from a file are normally converted one at a time when
+        first accessed. When most of the elements are going to be used, such
+        as when walking the dataset or converting it to JSON, it's faster to
+        convert them together using
+        :func:`~pydicom.dataelem.convert_raw_data_elements`. Any deferred
+        elements are read first.
+
+        Parameters
+        ----------
+        recursive : bool, optional
+            If ``True`` (default) then also convert the elements in the items
+            of any sequences.
+        """
+        self.load_deferred()
+        self._convert_raw_elements(
+            [elem for elem in self._dict.values() if isinstance(elem, RawDataElement)]
+        )
+
+        if recursive:
+            for elem in self._dict.values():
+                if elem.VR == VR_.SQ:
+                    for item in elem.value:
+                        item.convert_all()
+
+    def _convert_raw_elements(self, raws: list[RawDataElement]) -> None:
+        """Convert the raw elements `raws`, which must already have been read
+        if their values were deferred.
+        """
+        # Converts (0008,0005) 'Specific Character Set' if required
+        character_set = self.original_character_set or self._character_set
+        elements = convert_raw_data_elements(raws, encoding=character_set, ds=self)
+        for raw, elem in zip(raws, elements):
+            tag = elem.tag
+            if tag.is_private or tag in PIXEL_KEYWORDS or elem.VR == VR_.SQ:
+                self[tag] = elem
+            else:
+                self._dict[tag] = elem
+
+            if elem.VR in AMBIGUOUS_VR:
+                from pydicom.filewriter import correct_ambiguous_vr_element
+
+                self[tag] = correct_ambiguous_vr_element(elem, self, raw[6])
+
+    def validate_deferred(self) -> None:
+        """Validate the element values with deferred validation.
+
+        .. versionadded:: 3.1
+
+        When :attr:`Settings.deferred_validation
+        <pydicom.config.Settings.deferred_validation>` is ``True`` the values
+        set for elements aren't validated until the dataset is written by
+        :func:`~pydicom.filewriter.dcmwrite`, which calls this method.
+        The values are validated together for each VR and in accordance with
+        each element's :attr:`~pydicom.dataelem.DataElement.validation_mode`,
+        including those elements in the items of any sequences. Raw elements
+        and elements that haven't been changed since they were validated
+        are skipped.
+
+        Raises
+        ------
+        ValueError
+            If a value is invalid and the element's validation mode is
+            :attr:`~pydicom.config.RAISE`.
+        """
+        pending: dict[str, list[DataElement]] = {}
+        datasets = [self]
+        while datasets:
+            ds = datasets.pop()
+            for elem in ds._dict.values():
+                if elem.is_raw:
+                    continue
+
+                if elem.VR == VR_.SQ:
+                    datasets.extend(elem.value)
+                elif elem._pending_validation:
+                    pending.setdefault(elem.VR, []).append(elem)
+
+        for elements in pending.values():
+            for elem in elements:
+                elem._validate_pending()
+
     def private_block(
         self, group: int, private_creator: str, create: bool = False
     ) -> PrivateBlock:
@@ -1149,7 +1387,7 @@ class Dataset:  # noqa: PLW1641
 
         def new_block(element: int) -> PrivateBlock:
             block = PrivateBlock(key, self, element)
-            self._private_blocks[key] = block
+            self.__dict__.setdefault("_private_blocks", {})[key] = block
             return block
 
         key = (group, private_creator)
@@ -1570,6 +1808,7 @@ class Dataset:  # noqa: PLW1641
     def clear(self) -> None:
         """Delete all the elements from the :class:`Dataset`."""
         self._dict.clear()
+        self._pixel_changed(0x7FE00010)
 
     def pop(self, key: "BaseTag | TagType", *args: Any) -> _DatasetValue:
         """Emulate :meth:`dict.pop` with support for tags and keywords.
@@ -1606,7 +1845,9 @@ class Dataset:  # noqa: PLW1641
         except Exception:
             pass
 
-        return self._dict.pop(cast(BaseTag, key), *args)
+        elem = self._dict.pop(cast(BaseTag, key), *args)
+        self._pixel_changed(key)
+        return elem
 
     def popitem(self) -> tuple[BaseTag, _DatasetValue]:
         """Emulate :meth:`dict.popitem`.
@@ -1615,7 +1856,9 @@ class Dataset:  # noqa: PLW1641
         -------
         tuple of (BaseTag, DataElement)
         """
-        return self._dict.popitem()
+        tag, elem = self._dict.popitem()
+        self._pixel_changed(tag)
+        return tag, elem
 
     def setdefault(self, key: TagType, default: Any | None = None) -> DataElement:
         """Emulate :meth:`dict.setdefault` with support for tags and keywords.
@@ -1738,22 +1981,9 @@ class Dataset:  # noqa: PLW1641
                 f"'{type(self).__name__}' object has no attribute 'convert_pixel_data'"
             )
 
-        # Check if already have converted to a NumPy array
-        # Also check if pixel data has changed. If so, get new NumPy array
-        already_have = True
-        if not hasattr(self, "_pixel_array"):
-            already_have = False
-        elif self._pixel_array is None:
-            already_have = False
-
-        # Checking `_pixel_id` may sometimes give a false result if the pixel
-        #   data memory has been freed (such as with ds.PixelData = None)
-        #   prior to setting a new value; Python may reuse that freed memory
-        #   for the new value and therefore give the same `id()` value
-        if self._pixel_id != get_image_pixel_ids(self):
-            already_have = False
-
-        if already_have:
+        # Check if already have converted to a NumPy array and that none of
+        #   the elements used to decode it have changed since
+        if self._pixel_array is not None and self._pixel_id == self._pixel_stamp():
             return
 
         opts = self._pixel_array_opts.copy()
@@ -1762,7 +1992,7 @@ class Dataset:  # noqa: PLW1641
             # Use 'pydicom.pixels' backend
             opts["decoding_plugin"] = name
             self._pixel_array = pixel_array(self, **opts)
-            self._pixel_id = get_image_pixel_ids(self)
+            self._pixel_id = self._pixel_stamp()
         else:
             # Use 'pydicom.pixel_data_handlers' backend
             if name:
@@ -1770,6 +2000,26 @@ class Dataset:  # noqa: PLW1641
             else:
                 self._convert_pixel_data_without_handler()
 
+    def _pixel_changed(self, tag: int) -> None:
+        """Record that the element with `tag` has been added, changed or
+        removed, if it affects the pixel data.
+        """
+        if tag not in _PIXEL_TAGS:
+            return
+
+        self._pixel_generation += 1
+
+        # Changing the pixel data resets the stored array
+        if tag in PIXEL_KEYWORDS:
+            self._pixel_array = None
+            self._pixel_id = {}
+
+    def _pixel_stamp(self) -> tuple[int, int]:
+        """Return the current generation of the elements affecting the pixel
+        data, which changes whenever any of them is added, changed or removed.
+        """
+        return self._pixel_generation, pydicom.dataelem._pixel_value_generation
+
     def _convert_pixel_data_using_handler(self, name: str) -> None:
         """Convert the pixel data using handler with the given name.
         See :meth:`~Dataset.convert_pixel_data` for more information.
@@ -1892,7 +2142,7 @@ class Dataset:  # noqa: PLW1641
                 self._pixel_array, "YBR_FULL", "RGB"
             )
 
-        self._pixel_id = get_image_pixel_ids(self)
+        self._pixel_id = self._pixel_stamp()
 
     def compress(
         self,
@@ -2727,11 +2977,11 @@ class Dataset:  # noqa: PLW1641
                 object.__setattr__(self, name, value)
             return
 
-        tag = tag_for_keyword(name)
-        if tag is not None:  # successfully mapped name to a tag
-            if tag not in self:
+        entry = _keyword_tag_vr(name)
+        if entry is not None:  # successfully mapped name to a tag
+            tag, vr = entry
+            if tag not in self._dict:
                 # don't have this tag yet->create the data_element instance
-                vr = dictionary_VR(tag)
                 elem = DataElement(tag, vr, value)
             else:
                 # already have this data_element, just changing its value
@@ -2838,11 +3088,7 @@ class Dataset:  # noqa: PLW1641
                     )
                 elem.private_creator = self[private_creator_tag].value
 
-        # Changing pixel data resets the stored array
-        if elem_tag in PIXEL_KEYWORDS:
-            self._pixel_array = None
-            self._pixel_id = {}
-
+        self._pixel_changed(elem_tag)
         self._dict[elem_tag] = elem
 
         if elem.VR == VR_.SQ and isinstance(elem, DataElement):
@@ -3067,6 +3313,7 @@ class Dataset:  # noqa: PLW1641
         ------
         dataelem.DataElement
         """
+        self.convert_all(recursive=False)
         for elem in self:
             yield elem
             if elem.VR == VR_.SQ:
@@ -3112,6 +3359,7 @@ class Dataset:  # noqa: PLW1641
     def _walk(
         self, callback: Callable[["Dataset", DataElement], None], recursive: bool = True
     ) -> None:
+        self.convert_all(recursive=False)
         taglist = sorted(self._dict.keys())
 
         for tag in taglist:
@@ -3359,6 +3607,7 @@ class Dataset:  # noqa: PLW1641
         vr = vr if vr is not None else raw.VR
         value = value if value is not None else raw.value
         self._dict[tag] = raw._replace(VR=vr, value=value)
+        self._pixel_changed(tag)
 
     __repr__ = __str__
 
@@ -3460,6 +3709,12 @@ class FileDataset(Dataset):
             self.filename = filename_or_obj.name
             # This is the appropriate constructor for io.BufferedReader
             self.fileobj_type = open
+        elif isinstance(filename_or_obj, DicomReadAheadIO) and isinstance(
+            filename_or_obj.parent, io.FileIO | io.BufferedReader
+        ):
+            # File opened with read-ahead by dcmread()
+            self.filename = cast(str, filename_or_obj.name)
+            self.fileobj_type = open
         else:
             # Readable buffer with read(), seek() and tell() methods
             self.buffer = filename_or_obj
@@ -3486,7 +3741,7 @@ class FileDataset(Dataset):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
+        for k, v in self.__getstate__().items():
             if k == "buffer":
                 try:
                     setattr(result, k, copy.deepcopy(v, memo))
@@ -4,8 +4,12 @@
 from io import BytesIO
 import os
 from struct import Struct
+from time import perf_counter
 from types import TracebackType
 from typing import TYPE_CHECKING, cast, Any, TypeVar, Protocol
+import zlib
+
+from pydicom import instrumentation
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
@@ -84,6 +88,8 @@ class DicomIO:
         #   instead of wrapping them
         if hasattr(buffer, "read"):
             self.read = buffer.read
+            if instrumentation.enabled:
+                self.read = _instrumented_read(buffer.read)
 
         if hasattr(buffer, "write"):
             self.write = buffer.write
@@ -267,6 +273,22 @@ class DicomIO:
         self.write(self._us_packer(val))
 
 
+def _instrumented_read(read: "Callable[[int], bytes]") -> "Callable[[int], bytes]":
+    """Return `read` wrapped to record the number of bytes read."""
+
+    def wrapper(size: int = -1, /) -> bytes:
+        if not instrumentation.enabled:
+            return read(size)
+
+        start = perf_counter()
+        data = read(size)
+        instrumentation.record("io.read", perf_counter() - start, len(data))
+
+        return data
+
+    return wrapper
+
+
 class DicomFileLike(DicomIO):
     """Wrapper for file-likes to simplify encoding/decoding DICOM datasets.
 
@@ -279,6 +301,519 @@ class DicomFileLike(DicomIO):
     pass
 
 
+class DicomReadAheadIO(DicomIO):
+    """Read-only wrapper for buffer-likes that coalesces small reads into
+    larger blocks.
+
+    Decoding a dataset requires many small reads, such as 8 bytes for each
+    element's tag, VR and length followed by the element's value. When
+    the source is on slow storage, such as a network filesystem, each of
+    these may result in a separate system call or round-trip. Instead
+    ``DicomReadAheadIO`` reads ahead from the wrapped buffer in blocks and
+    serves reads and short seeks from the read block.
+
+    The block size starts at `block_size` and is doubled each time the
+    block is refilled by sequential reads, up to `max_block_size`. Seeking
+    outside the current block resets the block size.
+
+    .. versionadded:: 3.1
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :attr:`Settings.read_ahead_size<pydicom.config.Settings.read_ahead_size>`
+    """
+
+    def __init__(
+        self,
+        buffer: ReadableBuffer,
+        block_size: int | None = None,
+        max_block_size: int | None = None,
+    ) -> None:
+        """Create a new ``DicomReadAheadIO`` instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like object
+            A buffer-like object that implements ``read()``, ``seek()`` and
+            ``tell()`` methods, such as a file opened in ``"rb"`` mode.
+        block_size : int, optional
+            The minimum number of bytes to read from `buffer` at a time,
+            default :attr:`Settings.buffered_read_size
+            <pydicom.config.Settings.buffered_read_size>`.
+        max_block_size : int, optional
+            The maximum number of bytes to read from `buffer` at a time
+            when reading sequentially, default `block_size`.
+        """
+        super().__init__(buffer)
+
+        # Reading and seeking are handled by this class rather than `buffer`
+        for name in ("read", "seek", "tell", "write"):
+            self.__dict__.pop(name, None)
+
+        self._buffer_read = cast(ReadableBuffer, buffer).read
+        self._buffer_seek = buffer.seek
+
+        if block_size is None:
+            from pydicom.config import settings
+
+            block_size = settings.buffered_read_size
+
+        if block_size <= 0:
+            raise ValueError("'block_size' must be greater than 0")
+
+        self.block_size = block_size
+        self.max_block_size = max(max_block_size or block_size, block_size)
+
+        #: The number of bytes read from the wrapped buffer
+        self.bytes_read = 0
+        #: The number of ``read()`` calls made to the wrapped buffer
+        self.nr_reads = 0
+        #: The number of ``seek()`` calls made to the wrapped buffer
+        self.nr_seeks = 0
+
+        # The current block, the position in the block, the size of the next
+        #   block and the position of the wrapped buffer
+        self._block = b""
+        self._pos = 0
+        self._next_size = block_size
+        self._offset = buffer.tell()
+
+    @property
+    def closed(self) -> bool:
+        """Return ``True`` if the wrapped buffer has been closed."""
+        return cast(bool, getattr(self._buffer, "closed", False))
+
+    def _read_buffer(self, size: int) -> bytes:
+        """Return up to `size` bytes read from the wrapped buffer."""
+        start = perf_counter() if instrumentation.enabled else 0.0
+        data = self._buffer_read(size)
+        if start:
+            instrumentation.record("io.read", perf_counter() - start, len(data))
+
+        self.nr_reads += 1
+        self.bytes_read += len(data)
+        self._offset += len(data)
+
+        return data
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Read up to `size` bytes and return them. If `size` is unspecified,
+        all bytes until EOF are returned.
+        """
+        block, pos = self._block, self._pos
+        if 0 <= size <= len(block) - pos:
+            self._pos = pos + size
+            return block[pos : pos + size]
+
+        # Not enough data in the current block
+        data = block[pos:]
+        self._block = b""
+        self._pos = 0
+        if size < 0:
+            return data + self._read_buffer(-1)
+
+        remaining = size - len(data)
+        block_size = self._next_size
+        if remaining >= block_size:
+            # Large reads such as element values bypass the block
+            return data + self._read_buffer(remaining)
+
+        self._block = self._read_buffer(block_size)
+        self._pos = min(remaining, len(self._block))
+        self._next_size = min(2 * block_size, self.max_block_size)
+
+        return data + self._block[: self._pos]
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the position to the given byte `offset`, relative to the
+        position indicated by `whence` and return the new absolute position.
+
+        Seeking within the current block doesn't seek the wrapped buffer.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self.tell()
+        elif whence != os.SEEK_SET:
+            offset = self._buffer_seek(offset, whence)
+            self.nr_seeks += 1
+            self._offset = offset
+            self._block = b""
+            self._pos = 0
+            self._next_size = self.block_size
+
+            return offset
+
+        start = self._offset - len(self._block)
+        if start <= offset <= self._offset:
+            self._pos = offset - start
+            return offset
+
+        self._offset = self._buffer_seek(offset)
+        self.nr_seeks += 1
+        self._block = b""
+        self._pos = 0
+        self._next_size = self.block_size
+
+        return self._offset
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._offset - len(self._block) + self._pos
+
+
+# The minimum and maximum number of bytes inflated by a decompression call
+_MIN_INFLATE_SIZE = 64 * 1024
+_INFLATE_CHUNK_SIZE = 1024 * 1024
+
+
+class DicomInflateIO(DicomIO):
+    """Read-only wrapper for buffer-likes containing raw deflate compressed
+    data that inflates the data as it's read.
+
+    Datasets encoded using *Deflated Explicit VR Little Endian* are compressed
+    after the *File Meta Information*. Rather than inflating the entire
+    dataset before decoding it, ``DicomInflateIO`` reads the compressed data
+    from the wrapped buffer in blocks and inflates only as much as is needed
+    to satisfy each read. This means that when reading stops early, such as
+    with `stop_before_pixels` or `specific_tags`, the rest of the data is
+    never inflated.
+
+    The position, ``tell()`` and ``seek()`` are all in terms of the inflated
+    data. The most recently inflated `history_size` bytes are kept so that
+    short backwards seeks are cheap, seeking backwards past them restarts
+    inflation from the start of the compressed data.
+
+    .. versionadded:: 3.1
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :class:`~pydicom.filebase.DicomDeflateIO`
+    """
+
+    def __init__(
+        self,
+        buffer: ReadableBuffer,
+        block_size: int = 64 * 1024,
+        history_size: int = 1024 * 1024,
+    ) -> None:
+        """Create a new ``DicomInflateIO`` instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like object
+            A buffer-like object that implements ``read()``, ``seek()`` and
+            ``tell()`` methods, positioned at the start of the compressed
+            data.
+        block_size : int, optional
+            The number of compressed bytes to read from `buffer` at a time,
+            default 64 KiB.
+        history_size : int, optional
+            The minimum number of inflated bytes preceding the current
+            position to keep, default 1 MiB.
+        """
+        super().__init__(buffer)
+
+        # Reading and seeking are handled by this class rather than `buffer`
+        for name in ("read", "seek", "tell", "write"):
+            self.__dict__.pop(name, None)
+
+        self._buffer_read = cast(ReadableBuffer, buffer).read
+        self._buffer_seek = buffer.seek
+
+        if block_size <= 0:
+            raise ValueError("'block_size' must be greater than 0")
+
+        if history_size < 0:
+            raise ValueError("'history_size' must be greater than or equal to 0")
+
+        self.block_size = block_size
+        self.history_size = history_size
+
+        #: The number of compressed bytes read from the wrapped buffer
+        self.bytes_read = 0
+        #: The number of times inflation was restarted by a backwards seek
+        self.nr_restarts = 0
+
+        # The offset to the start of the compressed data in `buffer`
+        self._start = buffer.tell()
+        self._pos = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """Reset the inflation state to the start of the compressed data."""
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._eof = False
+        # The most recently inflated data and its offset in the inflated data
+        self._window = bytearray()
+        self._window_start = 0
+
+    @property
+    def closed(self) -> bool:
+        """Return ``True`` if the wrapped buffer has been closed."""
+        return cast(bool, getattr(self._buffer, "closed", False))
+
+    def _inflate(self, size: int) -> bytes:
+        """Return up to `size` bytes of newly inflated data, or an empty
+        :class:`bytes` if there's no more data.
+        """
+        decompressor = self._decompressor
+        while not self._eof:
+            data = decompressor.unconsumed_tail
+            if not data:
+                start = perf_counter() if instrumentation.enabled else 0.0
+                data = self._buffer_read(self.block_size)
+                if start:
+                    instrumentation.record("io.read", perf_counter() - start, len(data))
+
+                self.bytes_read += len(data)
+                if not data:
+                    # Truncated compressed data
+                    self._eof = True
+                    return decompressor.flush()
+
+            inflated = decompressor.decompress(data, size)
+            # Any data after the end of the compressed stream is padding
+            self._eof = decompressor.eof
+            if inflated:
+                return inflated
+
+        return b""
+
+    def _skip(self, offset: int) -> None:
+        """Inflate and discard data until the window starts at `offset`."""
+        end = self._window_start + len(self._window)
+        self._window.clear()
+        while end < offset:
+            data = self._inflate(min(offset - end, _INFLATE_CHUNK_SIZE))
+            if not data:
+                break
+
+            end += len(data)
+
+        self._window_start = end
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Read up to `size` bytes and return them. If `size` is unspecified,
+        all bytes until EOF are returned.
+        """
+        pos, start, window = self._pos, self._window_start, self._window
+        if 0 <= size and start <= pos and pos + size <= start + len(window):
+            self._pos = pos + size
+            return bytes(window[pos - start : pos - start + size])
+
+        if pos < start:
+            # Before the window: restart from the start of the compressed data
+            self._buffer_seek(self._start)
+            self._reset()
+            self.nr_restarts += 1
+            start, window = 0, self._window
+
+        if pos > start + len(window):
+            self._skip(pos)
+            start = self._window_start
+
+        if size < 0 or size > max(self.history_size, _MIN_INFLATE_SIZE):
+            return self._read_large(size)
+
+        end = start + len(window)
+        while end < pos + size:
+            data = self._inflate(max(pos + size - end, _MIN_INFLATE_SIZE))
+            if not data:
+                break
+
+            window += data
+            end += len(data)
+
+        data = bytes(window[pos - start : pos - start + size])
+        self._pos = pos + len(data)
+
+        # Discard inflated data that's no longer needed
+        if (excess := self._pos - start - self.history_size) > self.history_size:
+            del window[:excess]
+            self._window_start = start + excess
+
+        return data
+
+    def _read_large(self, size: int) -> bytes:
+        """Return up to `size` bytes, or all remaining bytes if `size` is
+        negative, without first adding the inflated data to the window.
+        """
+        pos, start = self._pos, self._window_start
+        chunks = [bytes(self._window[pos - start :])] if self._window else []
+        length = len(chunks[0]) if chunks else 0
+        excess = b""
+        while size < 0 or length < size:
+            remaining = _INFLATE_CHUNK_SIZE if size < 0 else size - length
+            data = self._inflate(max(remaining, _MIN_INFLATE_SIZE))
+            if not data:
+                break
+
+            if size >= 0 and len(data) > remaining:
+                data, excess = data[:remaining], data[remaining:]
+
+            chunks.append(data)
+            length += len(data)
+
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        self._pos = pos + len(data)
+
+        # Keep the end of the data as the history for backwards seeks
+        history = data[len(data) - self.history_size :] if self.history_size else b""
+        self._window = bytearray(history)
+        self._window += excess
+        self._window_start = self._pos - len(history)
+
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the position to the given byte `offset`, relative to the
+        position indicated by `whence` and return the new absolute position.
+
+        Seeking relative to the end requires inflating the remaining data.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            self._skip(2**63)
+            offset += self._window_start
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid 'whence' value: {whence}")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._pos = offset
+
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position in the inflated data."""
+        return self._pos
+
+
+class DicomDeflateIO(DicomIO):
+    """Write-only wrapper for buffer-likes that deflates the data as it's
+    written.
+
+    Used to write datasets encoded using *Deflated Explicit VR Little
+    Endian*. Data is compressed in blocks as it's written rather than after
+    the entire dataset has been encoded, and :meth:`finish` must be called
+    after writing to flush the remaining compressed data to the wrapped
+    buffer.
+
+    The position returned by ``tell()`` is the number of uncompressed bytes
+    written, seeking isn't supported.
+
+    .. versionadded:: 3.1
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :class:`~pydicom.filebase.DicomInflateIO`
+    """
+
+    def __init__(
+        self,
+        buffer: WriteableBuffer,
+        block_size: int = 64 * 1024,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> None:
+        """Create a new ``DicomDeflateIO`` instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like object
+            A buffer-like object that implements a ``write()`` method.
+        block_size : int, optional
+            The number of uncompressed bytes to collect before compressing
+            them, default 64 KiB.
+        level : int, optional
+            The compression level to use, default
+            :data:`zlib.Z_DEFAULT_COMPRESSION`.
+        """
+        super().__init__(buffer)
+
+        # Writing is handled by this class rather than `buffer`
+        for name in ("read", "seek", "tell", "write"):
+            self.__dict__.pop(name, None)
+
+        self._buffer_write = cast(WriteableBuffer, buffer).write
+
+        if block_size <= 0:
+            raise ValueError("'block_size' must be greater than 0")
+
+        self.block_size = block_size
+
+        #: The number of compressed bytes written to the wrapped buffer
+        self.bytes_written = 0
+
+        self._compressor = zlib.compressobj(level, wbits=-zlib.MAX_WBITS)
+        self._pending = bytearray()
+        self._pos = 0
+        self._finished = False
+
+    def _write_buffer(self, data: bytes) -> None:
+        """Write compressed `data` to the wrapped buffer."""
+        if data:
+            self._buffer_write(data)
+            self.bytes_written += len(data)
+
+    def finish(self) -> int:
+        """Compress any remaining data, write it to the wrapped buffer and
+        return the total number of compressed bytes written.
+
+        No further data can be written after calling :meth:`finish`.
+        """
+        if not self._finished:
+            self._write_buffer(self._compressor.compress(self._pending))
+            self._write_buffer(self._compressor.flush())
+            self._pending.clear()
+            self._finished = True
+
+        return self.bytes_written
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Seeking isn't supported, other than to the current position."""
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+
+        if whence in (os.SEEK_SET, os.SEEK_CUR) and offset == self._pos:
+            return offset
+
+        raise OSError(f"'{type(self).__name__}' doesn't support seeking")
+
+    def tell(self) -> int:
+        """Return the number of uncompressed bytes written."""
+        return self._pos
+
+    def write(self, b: bytes | bytearray | memoryview, /) -> int:
+        """Compress the bytes-like object `b` and return the number of
+        uncompressed bytes written.
+        """
+        if self._finished:
+            raise ValueError(
+                f"Unable to write to the '{type(self).__name__}' after finish()"
+            )
+
+        pending = self._pending
+        length = len(b) if not isinstance(b, memoryview) else b.nbytes
+        self._pos += length
+        if len(pending) + length < self.block_size:
+            pending += b
+            return length
+
+        # Large writes such as element values are compressed without copying
+        compress = self._compressor.compress
+        if pending:
+            self._write_buffer(compress(pending))
+            pending.clear()
+
+        self._write_buffer(compress(b))
+
+        return length
+
+
 def DicomFile(*args: Any, **kwargs: Any) -> DicomFileLike:
     """Return an opened :class:`~pydicom.filebase.DicomFileLike` from a file-like."""
     return DicomFileLike(open(*args, **kwargs))
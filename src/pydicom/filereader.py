@@ -1,14 +1,14 @@
 # Copyright 2008-2021 pydicom authors. See LICENSE file for details.
 """Read a dicom media file"""
 
-# Need zlib and io.BytesIO for deflate-compressed file
+from functools import partial
 import os
 from struct import Struct, unpack
+from time import perf_counter
 from typing import BinaryIO, Any, cast
-from collections.abc import Callable, MutableSequence, Iterator
-import zlib
+from collections.abc import Callable, Iterable, MutableSequence, Iterator
 
-from pydicom import config
+from pydicom import config, instrumentation
 from pydicom.charset import default_encoding, convert_encodings
 from pydicom.config import logger
 from pydicom.datadict import _dictionary_vr_fast
@@ -20,9 +20,11 @@ from pydicom.dataelem import (
 )
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import ReadableBuffer, DicomBytesIO
+from pydicom.filebase import ReadableBuffer, DicomInflateIO
 from pydicom.fileutil import (
+    FileHandlePool,
     read_undefined_length_value,
+    open_readable,
     path_from_pathlike,
     PathType,
     _unpack_tag,
@@ -337,6 +339,163 @@ def data_element_generator(
                 )
 
 
+# Size of the chunks read by the little endian fast path parser
+_FAST_PATH_CHUNK_SIZE = 65536
+_UNPACK_IMPLICIT = Struct("<HHL").unpack_from
+_UNPACK_EXPLICIT = Struct("<HH2sH").unpack_from
+_UNPACK_LENGTH = Struct("<L").unpack_from
+_DECODED_VR = {vr.encode(default_encoding): str(vr) for vr in VR_}
+
+
+def _little_endian_element_generator(
+    fp: BinaryIO,
+    is_implicit_VR: bool,
+    stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
+    defer_size: int | str | float | None = None,
+    encoding: str | MutableSequence[str] = default_encoding,
+    specific_tags: list[BaseTag | int] | None = None,
+) -> Iterator[RawDataElement | DataElement]:
+    """Create a generator that returns the raw data elements for a little
+    endian encoded dataset.
+
+    This is a faster version of :func:`data_element_generator` that reads the
+    encoded dataset in large chunks and parses the element headers directly
+    from the read buffer, rather than reading each tag, length and value
+    separately. Any element that can't be parsed from the buffer, such as
+    undefined length elements, unknown VRs and truncated headers, is read
+    using :func:`data_element_generator` instead.
+
+    Because the encoded data is read ahead the position of `fp` is only valid
+    once the generator has been exhausted. Parameters are as for
+    :func:`data_element_generator`.
+
+    Yields
+    -------
+    RawDataElement or DataElement
+        Yields DataElement for undefined length UN or SQ, RawDataElement
+        otherwise.
+    """
+    from pydicom.values import convert_string
+
+    fp_read = fp.read
+    fp_seek = fp.seek
+    defer_size = size_in_bytes(defer_size)
+    unpack_implicit = _UNPACK_IMPLICIT
+    unpack_explicit = _UNPACK_EXPLICIT
+    unpack_length = _UNPACK_LENGTH
+    decoded_vr = _DECODED_VR.get
+
+    tag_set: set[int] = {tag for tag in specific_tags} if specific_tags else set()
+    has_tag_set = bool(tag_set)
+    if has_tag_set:
+        tag_set.add(0x00080005)  # Specific Character Set
+
+    # The read buffer and the offset in `fp` to the start of the buffer
+    offset = fp.tell()
+    buffer = b""
+    buffer_length = pos = 0
+    vr: str | None = None
+    while True:
+        if buffer_length - pos < 12:
+            # Refill the buffer, the maximum header length is 12 bytes
+            offset += pos
+            if pos > buffer_length:
+                # The last value was skipped past the end of the buffer
+                fp_seek(offset)
+                buffer = fp_read(_FAST_PATH_CHUNK_SIZE)
+            else:
+                buffer = buffer[pos:] + fp_read(_FAST_PATH_CHUNK_SIZE)
+
+            buffer_length = len(buffer)
+            pos = 0
+            if not buffer_length:
+                return  # at end of file
+
+        # Parse the element header, which may be truncated or use an unknown VR
+        start = pos
+        is_parsed = False
+        if buffer_length - pos >= 8:
+            if is_implicit_VR:
+                group, elem, length = unpack_implicit(buffer, pos)
+                is_parsed = True
+            else:
+                group, elem, raw_vr, length = unpack_explicit(buffer, pos)
+                vr = decoded_vr(raw_vr)
+                if vr in EXPLICIT_VR_LENGTH_32:
+                    if buffer_length - pos >= 12:
+                        length = unpack_length(buffer, pos + 8)[0]
+                        pos += 4
+                        is_parsed = True
+                else:
+                    is_parsed = vr is not None
+
+            pos += 8
+            tag = group << 16 | elem
+            if length == 0xFFFFFFFF or tag == 0xFFFEE00D:
+                is_parsed = False
+
+        if not is_parsed:
+            # Use the general parser for anything unusual
+            fp_seek(offset + start)
+            de_gen = data_element_generator(
+                fp, is_implicit_VR, True, stop_when, defer_size, encoding, specific_tags
+            )
+            element = next(de_gen, None)
+            if element is None:
+                return  # stopped or at end of file
+
+            offset = fp.tell()
+            de_gen.close()
+            buffer = b""
+            buffer_length = pos = 0
+            if element.tag == 0x00080005:
+                encoding = convert_encodings(
+                    convert_string(cast(bytes, element.value) or b"", True)
+                )
+
+            yield element
+            continue
+
+        if stop_when is not None and stop_when(BaseTag(tag), vr, length):
+            # Rewind to the start of the element
+            fp_seek(offset + start)
+            return
+
+        if has_tag_set and tag not in tag_set:
+            # Skip the tag if not in specific tags
+            pos += length
+            continue
+
+        value_tell = offset + pos
+        value: bytes | None
+        if defer_size is not None and length > defer_size and tag != 0x00080005:
+            # Flag as deferred by setting value to None, and skip bytes
+            value = None
+            pos += length
+        elif length == 0:
+            value = cast(bytes | None, empty_value_for_VR(vr, raw=True))
+        elif pos + length <= buffer_length:
+            value = buffer[pos : pos + length]
+            pos += length
+        else:
+            # The value extends past the end of the buffer, read the rest
+            value = buffer[pos:] + fp_read(length - (buffer_length - pos))
+            offset = fp.tell()
+            buffer = b""
+            buffer_length = pos = 0
+
+        # If the tag is (0008,0005) Specific Character Set, then store it
+        if tag == 0x00080005:
+            # *Specific Character String* is b'' for empty value
+            encoding = convert_encodings(
+                convert_string(cast(bytes, value) or b"", True)
+            )
+
+        yield RawDataElement(
+            BaseTag(tag), vr, length, value, value_tell, is_implicit_VR, True
+        )
+
+
 def _is_implicit_vr(
     fp: BinaryIO,
     implicit_vr_is_assumed: bool,
@@ -466,15 +625,23 @@ def read_dataset(
         fp, is_implicit_VR, is_little_endian, stop_when, is_sequence=not at_top_level
     )
     fp.seek(fp_start)
-    de_gen = data_element_generator(
-        fp,
-        is_implicit_VR,
-        is_little_endian,
-        stop_when,
-        defer_size,
-        parent_encoding,
-        specific_tags,
-    )
+    de_gen: Iterator[RawDataElement | DataElement]
+    if bytelength is None and is_little_endian and not config.debugging:
+        # The fast path reads ahead so can only be used when the position
+        #   of `fp` isn't needed until reading has finished
+        de_gen = _little_endian_element_generator(
+            fp, is_implicit_VR, stop_when, defer_size, parent_encoding, specific_tags
+        )
+    else:
+        de_gen = data_element_generator(
+            fp,
+            is_implicit_VR,
+            is_little_endian,
+            stop_when,
+            defer_size,
+            parent_encoding,
+            specific_tags,
+        )
     try:
         if bytelength is None:
             raw_data_elements = {e.tag: e for e in de_gen}
@@ -801,6 +968,30 @@ def _at_pixel_data(tag: BaseTag, vr: str | None, length: int) -> bool:
     return tag in {0x7FE00010, 0x7FE00009, 0x7FE00008}
 
 
+def _stop_after(
+    last_tag: int, stop_when: Callable[[BaseTag, str | None, int], bool] | None
+) -> Callable[[BaseTag, str | None, int], bool]:
+    """Return a `stop_when` callback that also stops after `last_tag`."""
+
+    def func(tag: BaseTag, vr: str | None, length: int) -> bool:
+        if tag > last_tag:
+            return True
+
+        return stop_when is not None and stop_when(tag, vr, length)
+
+    return func
+
+
+def _open_deflated(path: str, mode: str = "rb", *, offset: int) -> DicomInflateIO:
+    """Return the file at `path` opened for reading the deflated dataset
+    that starts at `offset`, used when reading deferred values.
+    """
+    fp = open_readable(path)
+    fp.seek(offset)
+
+    return DicomInflateIO(fp)
+
+
 def read_partial(
     fileobj: BinaryIO,
     stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
@@ -898,18 +1089,15 @@ def read_partial(
         # when written, the entire dataset following
         #     the file metadata was prepared the normal way,
         #     then "deflate" compression applied.
-        #  All that is needed here is to decompress and then
-        #     use as normal in a file-like object
-        zipped = fileobj.read()
-        name = cast(str, getattr(fileobj, "name", None))
-
-        # -MAX_WBITS part is from comp.lang.python answer:
-        # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
-        unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
-        buffer = DicomBytesIO(unzipped)
-        buffer.name = name
-        fileobj = cast(BinaryIO, buffer)  # a file-like object
+        #  The data is inflated as it's read so that reading can stop
+        #     early without inflating the rest of the dataset
+        deflated_offset = fileobj.tell()
+        fileobj = cast(BinaryIO, DicomInflateIO(fileobj))
         is_implicit_VR = False
+        if specific_tags:
+            # Elements are in ascending tag order, so there's no need to
+            #   inflate the data following the last of the specific tags
+            stop_when = _stop_after(max(*specific_tags, 0x00080005), stop_when)
     elif transfer_syntax in pydicom.uid.PrivateTransferSyntaxes:
         # Replace with the registered UID as it has the encoding information
         index = pydicom.uid.PrivateTransferSyntaxes.index(transfer_syntax)
@@ -951,6 +1139,10 @@ def read_partial(
         is_implicit_VR,
         is_little_endian,
     )
+    if isinstance(fileobj, DicomInflateIO) and isinstance(ds.filename, str):
+        # Deferred values are read by inflating the file again
+        ds.fileobj_type = partial(_open_deflated, offset=deflated_offset)
+
     # save the originally read transfer syntax properties in the dataset
     ds.set_original_encoding(is_implicit_VR, is_little_endian, dataset._character_set)
     return ds
@@ -1044,7 +1236,7 @@ def dcmread(
         # caller provided a file name; we own the file handle
         caller_owns_file = False
         logger.debug(f"Reading file '{fp}'")
-        fp = open(fp, "rb")
+        fp = open_readable(fp)
     elif (
         fp is None
         or not hasattr(fp, "read")
@@ -1080,6 +1272,10 @@ def dcmread(
     if stop_before_pixels:
         stop_when = _at_pixel_data
     try:
+        start = perf_counter() if instrumentation.enabled else 0.0
+        if start:
+            fp_start = fp.tell()
+
         dataset = read_partial(
             fp,
             stop_when,
@@ -1087,6 +1283,10 @@ def dcmread(
             force=force,
             specific_tags=specific_tags,
         )
+        if start:
+            instrumentation.record(
+                "dcmread", perf_counter() - start, fp.tell() - fp_start
+            )
     finally:
         if not caller_owns_file:
             fp.close()
@@ -1105,6 +1305,11 @@ def data_element_offset_to_value(is_implicit_VR: bool, VR: str | None) -> int:
     return 8  # tag 4 + 2 VR + 2 length
 
 
+# The pool of open files used when reading deferred element values, by
+#   default files are opened and closed for each read
+deferred_read_pool = FileHandlePool(max_size=0)
+
+
 def read_deferred_data_element(
     fileobj_type: Any,
     filename_or_obj: PathType | BinaryIO,
@@ -1119,6 +1324,13 @@ def read_deferred_data_element(
         This is called internally by pydicom and will normally not be
         needed in user code.
 
+    .. versionchanged:: 3.1
+
+        Deferred values read from a file path use the files kept open by
+        ``deferred_read_pool``, a :class:`~pydicom.fileutil.FileHandlePool`.
+        Set its :attr:`~pydicom.fileutil.FileHandlePool.max_size` to keep files
+        open between reads.
+
     Parameters
     ----------
     fileobj_type : type
@@ -1147,6 +1359,7 @@ def read_deferred_data_element(
     ValueError
         If the VR or tag of `raw_data_elem` does not match the read value.
     """
+    start = perf_counter() if instrumentation.enabled else 0.0
     if config.debugging:
         logger.debug(f"Reading deferred element {raw_data_elem.tag}")
     # If it wasn't read from a file, then return an error
@@ -1155,24 +1368,41 @@ def read_deferred_data_element(
 
     # Check that the file is the same as when originally read
     is_filename = isinstance(filename_or_obj, str)
+    mtime = None
     if isinstance(filename_or_obj, str):
-        if not os.path.exists(filename_or_obj):
+        try:
+            mtime = os.stat(filename_or_obj).st_mtime
+        except OSError:
             raise OSError(
                 f"Deferred read -- original file {filename_or_obj} is missing"
             )
 
-        if timestamp is not None:
-            statinfo = os.stat(filename_or_obj)
-            if statinfo.st_mtime != timestamp:
-                warn_and_log(
-                    "Deferred read warning -- file modification time has changed"
-                )
+        if timestamp is not None and mtime != timestamp:
+            warn_and_log("Deferred read warning -- file modification time has changed")
+
+    if is_filename and fileobj_type is open and raw_data_elem.length != 0xFFFFFFFF:
+        # Read the entire element using the pool of open files
+        elem_start, elem_end = _deferred_span(raw_data_elem)
+        data = deferred_read_pool.read(
+            cast(str, filename_or_obj), elem_start, elem_end - elem_start, mtime
+        )
+        elem = _decode_deferred(data, raw_data_elem)
+        if start:
+            instrumentation.record(
+                "deferred_read", perf_counter() - start, len(elem.value)
+            )
+
+        return elem
 
     # Open the file, position to the right place
-    fp = cast(
-        BinaryIO,
-        fileobj_type(filename_or_obj, "rb") if is_filename else filename_or_obj,
-    )
+    fp: BinaryIO
+    if not is_filename:
+        fp = cast(BinaryIO, filename_or_obj)
+    elif fileobj_type is open:
+        fp = open_readable(filename_or_obj)
+    else:
+        fp = fileobj_type(filename_or_obj, "rb")
+
     is_implicit_VR = raw_data_elem.is_implicit_VR
     is_little_endian = raw_data_elem.is_little_endian
     offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
@@ -1188,6 +1418,183 @@ def read_deferred_data_element(
     elem = cast(RawDataElement, next(elem_gen))
     if is_filename:
         fp.close()
+
+    _check_deferred(elem, raw_data_elem)
+    if start:
+        instrumentation.record(
+            "deferred_read", perf_counter() - start, len(elem.value or b"")
+        )
+
+    # Everything is ok, now this object should act like usual DataElement
+    return elem
+
+
+def read_deferred_data_elements(
+    fileobj_type: Any,
+    filename_or_obj: PathType | BinaryIO,
+    timestamp: float | None,
+    raw_data_elems: Iterable[RawDataElement],
+) -> list[RawDataElement]:
+    """Read the previously deferred values of multiple elements from the file
+    into memory and return them as raw data elements.
+
+    .. versionadded:: 3.1
+
+    The elements are read in order of their position in the file, with
+    elements that are close together read using a single read. Elements
+    separated by no more than :attr:`Settings.buffered_read_size
+    <pydicom.config.Settings.buffered_read_size>` bytes are considered to
+    be close together.
+
+    .. note:
+
+        This is called internally by pydicom and will normally not be
+        needed in user code.
+
+    Parameters
+    ----------
+    fileobj_type : type
+        The type of the original file object.
+    filename_or_obj : str or file-like
+        The filename of the original file if one exists, or the file-like
+        object where the data elements persist.
+    timestamp : float or None
+        The time (as given by stat.st_mtime) the original file has been
+        read, if not a file-like.
+    raw_data_elems : Iterable[dataelem.RawDataElement]
+        The raw data elements with no values set.
+
+    Returns
+    -------
+    list[dataelem.RawDataElement]
+        The data elements with their values set, ordered by their position
+        in the file.
+
+    Raises
+    ------
+    OSError
+        If `filename_or_obj` is ``None``.
+    OSError
+        If `filename_or_obj` is a filename and the corresponding file does
+        not exist.
+    ValueError
+        If the VR or tag of any of `raw_data_elems` does not match the
+        read value.
+    """
+    elements = sorted(raw_data_elems, key=lambda elem: elem.value_tell)
+    if not elements:
+        return []
+
+    if filename_or_obj is None:
+        raise OSError("Deferred read -- original filename not stored. Cannot re-open")
+
+    # Check that the file is the same as when originally read
+    is_filename = isinstance(filename_or_obj, str)
+    mtime = None
+    if isinstance(filename_or_obj, str):
+        try:
+            mtime = os.stat(filename_or_obj).st_mtime
+        except OSError:
+            raise OSError(
+                f"Deferred read -- original file {filename_or_obj} is missing"
+            )
+
+        if timestamp is not None and mtime != timestamp:
+            warn_and_log("Deferred read warning -- file modification time has changed")
+
+    if is_filename and fileobj_type is not open:
+        # Can't read directly from the file, e.g. gzip
+        return [
+            read_deferred_data_element(fileobj_type, filename_or_obj, None, elem)
+            for elem in elements
+        ]
+
+    # Group the elements with a defined length into spans of the file
+    spans: list[tuple[int, int, list[RawDataElement]]] = []
+    undefined_length = []
+    max_gap = config.settings.buffered_read_size
+    for elem in elements:
+        if elem.length == 0xFFFFFFFF:
+            undefined_length.append(elem)
+            continue
+
+        start, end = _deferred_span(elem)
+        if spans and start - spans[-1][1] <= max_gap:
+            spans[-1] = (spans[-1][0], max(end, spans[-1][1]), spans[-1][2] + [elem])
+        else:
+            spans.append((start, end, [elem]))
+
+    result = []
+    for start, end, span_elements in spans:
+        read_start = perf_counter() if instrumentation.enabled else 0.0
+        if is_filename:
+            data = deferred_read_pool.read(
+                cast(str, filename_or_obj), start, end - start, mtime
+            )
+        else:
+            fp = cast(BinaryIO, filename_or_obj)
+            fp.seek(start)
+            data = fp.read(end - start)
+
+        if read_start:
+            instrumentation.record(
+                "deferred_read", perf_counter() - read_start, len(data)
+            )
+
+        for elem in span_elements:
+            result.append(_decode_deferred(data, elem, _deferred_span(elem)[0] - start))
+
+    result.extend(
+        read_deferred_data_element(fileobj_type, filename_or_obj, None, elem)
+        for elem in undefined_length
+    )
+
+    return sorted(result, key=lambda elem: elem.value_tell)
+
+
+def _deferred_span(raw_data_elem: RawDataElement) -> tuple[int, int]:
+    """Return the start and end offsets of a deferred element with a defined
+    length.
+    """
+    offset = data_element_offset_to_value(
+        raw_data_elem.is_implicit_VR, raw_data_elem.VR
+    )
+    start = raw_data_elem.value_tell - offset
+    return start, raw_data_elem.value_tell + raw_data_elem.length
+
+
+def _decode_deferred(
+    data: bytes, raw_data_elem: RawDataElement, pos: int = 0
+) -> RawDataElement:
+    """Return the deferred element `raw_data_elem` decoded from the encoded
+    element starting at offset `pos` in `data`.
+    """
+    is_implicit_VR = raw_data_elem.is_implicit_VR
+    offset = pos + data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
+    if len(data) < offset:
+        raise EOFError(
+            f"Deferred read -- unexpected end of file reading {raw_data_elem.tag}"
+        )
+
+    is_little_endian = raw_data_elem.is_little_endian
+    elem = RawDataElement(
+        _unpack_tag(data[pos : pos + 4], "<" if is_little_endian else ">"),
+        None if is_implicit_VR else data[pos + 4 : pos + 6].decode(default_encoding),
+        raw_data_elem.length,
+        data[offset : offset + raw_data_elem.length],
+        raw_data_elem.value_tell,
+        is_implicit_VR,
+        is_little_endian,
+    )
+    _check_deferred(elem, raw_data_elem)
+
+    return elem
+
+
+def _check_deferred(elem: RawDataElement, raw_data_elem: RawDataElement) -> None:
+    """Raise an exception if the read `elem` doesn't match the deferred
+    `raw_data_elem`.
+    """
     if elem.VR != raw_data_elem.VR:
         raise ValueError(
             f"Deferred read VR {elem.VR} does not match original {raw_data_elem.VR}"
@@ -1198,6 +1605,3 @@ def read_deferred_data_element(
             f"Deferred read tag {elem.tag!r} does not match "
             f"original {raw_data_elem.tag!r}"
         )
-
-    # Everything is ok, now this object should act like usual DataElement
-    return elem
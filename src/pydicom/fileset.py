@@ -1,8 +1,11 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """DICOM File-set handling."""
 
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Iterator, Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor
 import copy
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
@@ -12,13 +15,14 @@ from typing import Optional, Union, Any, cast
 import uuid
 
 from pydicom.charset import default_encoding
-from pydicom.datadict import tag_for_keyword, dictionary_description
+from pydicom.datadict import tag_for_keyword, dictionary_description, dictionary_VR
 from pydicom.dataelem import DataElement
 from pydicom.dataset import Dataset, FileMetaDataset, FileDataset
 from pydicom.filebase import DicomBytesIO, DicomFileLike
 from pydicom.filereader import dcmread
 from pydicom.filewriter import write_dataset, write_data_element, write_file_meta_info
 from pydicom.misc import warn_and_log
+from pydicom.multival import MultiValue
 from pydicom.tag import Tag, BaseTag
 import pydicom.uid as sop
 from pydicom.uid import (
@@ -71,6 +75,25 @@ _FIRST_OFFSET = "OffsetOfTheFirstDirectoryRecordOfTheRootDirectoryEntity"
 _NEXT_OFFSET = "OffsetOfTheNextDirectoryRecord"
 _LOWER_OFFSET = "OffsetOfReferencedLowerLevelDirectoryEntity"
 _LAST_OFFSET = "OffsetOfTheLastDirectoryRecordOfTheRootDirectoryEntity"
+# Directory record elements that are indexed to speed up FileSet.find()
+_INDEXED_KEYWORDS = (
+    "PatientID",
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "SOPInstanceUID",
+    "Modality",
+    "AccessionNumber",
+    "StudyDate",
+    "StudyTime",
+    "SeriesDate",
+    "ContentDate",
+)
+# VRs that support range matching
+_RANGE_VRS = {"DA", "DT", "TM"}
+# VRs that don't support wildcard matching
+_NO_WILDCARD_VRS = {"DA", "DT", "TM", "UI"}
+# Maximum number of threads used to read instances when searching
+_LOAD_WORKERS = 8
 
 
 def generate_filename(
@@ -172,6 +195,89 @@ def is_conformant_file_id(path: Path) -> bool:
     return False
 
 
+def _iter_str(value: Any) -> Iterator[str]:
+    """Yield the :class:`str` form of each item of an element value."""
+    if isinstance(value, MultiValue | list | tuple):
+        yield from (str(v) for v in value)
+    else:
+        yield str(value)
+
+
+def _in_range(value: str, query: str) -> bool:
+    """Return ``True`` if `value` is within the range given by `query`.
+
+    Parameters
+    ----------
+    value : str
+        A DA, DT or TM value.
+    query : str
+        The range to match against, as ``'<lower>-<upper>'``, ``'<lower>-'``
+        or ``'-<upper>'``. Partial upper values match all values that begin
+        with it, so ``'-1015'`` matches ``'101530'``.
+    """
+    lower, _, upper = query.partition("-")
+    if lower and value < lower:
+        return False
+
+    return not upper or value[: len(upper)] <= upper
+
+
+@lru_cache(maxsize=64)
+def _wildcard_regex(query: str) -> re.Pattern:
+    """Return a compiled regex for a query using ``*`` and ``?`` wildcards."""
+    pattern = "".join(
+        ".*" if c == "*" else "." if c == "?" else re.escape(c) for c in query
+    )
+    return re.compile(pattern, re.DOTALL)
+
+
+def _match_value(value: Any, query: Any, vr: str | None) -> bool:
+    """Return ``True`` if an element's `value` matches the `query`.
+
+    Parameters
+    ----------
+    value : Any
+        The element value to be checked.
+    query : Any
+        The value to match against, may be:
+
+        * A single value, which matches if it equals `value`.
+        * A :class:`list` or :class:`tuple` of values, which matches if
+          `value` equals the list or matches any of its items.
+        * For DA, DT and TM elements, a range such as ``'20200101-20201231'``.
+        * For other string VRs, a value using ``*`` to match any sequence of
+          characters and ``?`` to match any single character.
+    vr : str or None
+        The VR of the element, used to determine which types of matching are
+        supported.
+
+    Returns
+    -------
+    bool
+        ``True`` if the value matches, ``False`` otherwise.
+    """
+    if value == query:
+        return True
+
+    if isinstance(query, list | tuple):
+        return any(_match_value(value, q, vr) for q in query)
+
+    if value is None or not isinstance(query, str):
+        return False
+
+    if vr in _RANGE_VRS:
+        if "-" in query:
+            return any(_in_range(v, query) for v in _iter_str(value))
+
+        return False
+
+    if vr not in _NO_WILDCARD_VRS and ("*" in query or "?" in query):
+        regex = _wildcard_regex(query)
+        return any(regex.fullmatch(v) for v in _iter_str(value))
+
+    return False
+
+
 class RecordNode(Iterable["RecordNode"]):
     """Representation of a DICOMDIR's directory record.
 
@@ -751,6 +857,9 @@ class FileInstance:
         self._apply_stage("x")
         self._stage_path: Path | None = None
         self.node = node
+        # Elements read from the referenced instance by FileSet searches
+        self._cache = Dataset()
+        self._cached_tags: set[BaseTag] = set()
 
     def _apply_stage(self, flag: str) -> None:
         """Apply staging to the instance.
@@ -935,6 +1044,43 @@ class FileInstance:
 
         return dcmread(self.path)
 
+    def clear_cache(self) -> None:
+        """Clear the elements cached from the referenced instance by searches
+        using :meth:`FileSet.find(load=True)<pydicom.fileset.FileSet.find>` or
+        :meth:`FileSet.find_values(load=True)
+        <pydicom.fileset.FileSet.find_values>`.
+        """
+        self._cache = Dataset()
+        self._cached_tags = set()
+
+    def _read_elements(self, tags: list[BaseTag]) -> Dataset:
+        """Return a :class:`~pydicom.dataset.Dataset` containing the elements
+        in `tags` from the referenced instance.
+
+        Only the elements that haven't previously been requested are read from
+        the instance, with the result cached for subsequent calls.
+
+        Parameters
+        ----------
+        tags : list of pydicom.tag.BaseTag
+            The tags of the elements to return.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset
+            The cached elements, which will include those in `tags` that are
+            present in the instance.
+        """
+        missing = [tag for tag in tags if tag not in self._cached_tags]
+        if missing:
+            ds = dcmread(self.path, specific_tags=missing)
+            for elem in ds:
+                self._cache[elem.tag] = elem
+
+            self._cached_tags.update(missing)
+
+        return self._cache
+
     @property
     def path(self) -> str:
         """Return the path to the corresponding instance as :class:`str`.
@@ -969,6 +1115,236 @@ class FileInstance:
         return cast(UID, self.ReferencedTransferSyntaxUIDInFile)
 
 
+class _RecordIndex:
+    """Hash and sorted indexes of the directory record element values used to
+    search a :class:`~pydicom.fileset.FileSet`.
+
+    Each instance is indexed by the values of the elements in `keywords`, as
+    returned by :meth:`FileInstance.__getitem__()
+    <pydicom.fileset.FileInstance.__getitem__>` at the time it's added.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Create a new index.
+
+        Parameters
+        ----------
+        keywords : iterable of str
+            The keywords of the elements to be indexed.
+        """
+        self.vrs = {kw: dictionary_VR(kw) for kw in keywords}
+        # {keyword: {value key: {instance: None}}}
+        self._hash: dict[str, dict[Any, dict[FileInstance, None]]] = {}
+        # {keyword: sorted list of str value keys} for the DA, DT, TM elements
+        self._sorted: dict[str, list[str]] = {}
+        # {keyword: instances containing the element}
+        self._present: dict[str, set[FileInstance]] = {}
+        # {instance: (order added, {keyword: value key})}
+        self._entries: dict[FileInstance, tuple[int, dict[str, Any]]] = {}
+        self._count = 0
+        self.clear()
+
+    def add(self, instance: FileInstance) -> None:
+        """Add `instance` to the index (if not already present)."""
+        if instance in self._entries:
+            return
+
+        keys = {}
+        for kw in self.vrs:
+            try:
+                value = instance[kw].value
+            except KeyError:
+                continue
+
+            key = _index_key(value)
+            keys[kw] = key
+            bucket = self._hash[kw].setdefault(key, {})
+            if not bucket and kw in self._sorted and isinstance(key, str):
+                insort(self._sorted[kw], key)
+
+            bucket[instance] = None
+            self._present[kw].add(instance)
+
+        self._entries[instance] = (self._count, keys)
+        self._count += 1
+
+    def clear(self) -> None:
+        """Remove all instances from the index."""
+        self._hash = {kw: {} for kw in self.vrs}
+        self._sorted = {kw: [] for kw, vr in self.vrs.items() if vr in _RANGE_VRS}
+        self._present = {kw: set() for kw in self.vrs}
+        self._entries = {}
+        self._count = 0
+
+    def __contains__(self, keyword: str) -> bool:
+        """Return ``True`` if the element with `keyword` is indexed."""
+        return keyword in self.vrs
+
+    def having(self, keywords: Iterable[str]) -> set[FileInstance]:
+        """Return the indexed instances that contain all the elements in
+        `keywords`, which must all be indexed.
+        """
+        present = sorted((self._present[kw] for kw in keywords), key=len)
+        if not present:
+            return set(self._entries)
+
+        return present[0].intersection(*present[1:])
+
+    def lookup(self, keyword: str, query: Any) -> set[FileInstance] | None:
+        """Return the indexed instances whose `keyword` element matches
+        `query`.
+
+        Parameters
+        ----------
+        keyword : str
+            The keyword of an indexed element.
+        query : Any
+            The value to match against, see :func:`_match_value` for the
+            supported types of matching.
+
+        Returns
+        -------
+        set of FileInstance or None
+            The matching instances, or ``None`` if `query` can't be matched
+            using the index.
+        """
+        index = self._hash[keyword]
+        if isinstance(query, list | tuple):
+            if not all(isinstance(q, str) for q in query):
+                return None
+
+            matches = set()
+            if isinstance(query, list):
+                matches.update(index.get(tuple(query), {}))
+
+            for q in query:
+                matches.update(cast(set[FileInstance], self.lookup(keyword, q)))
+
+            return matches
+
+        if not isinstance(query, str):
+            return None
+
+        matches = set(index.get(query, {}))
+        vr = self.vrs[keyword]
+        if vr in _RANGE_VRS and "-" in query:
+            # Use the sorted index for the str keys
+            keys = self._sorted[keyword]
+            lower, _, upper = query.partition("-")
+            start = bisect_left(keys, lower) if lower else 0
+            end = bisect_right(keys, f"{upper}\U0010ffff") if upper else len(keys)
+            candidates: Iterable[Any] = keys[start:end]
+            # Multi-valued keys aren't in the sorted index
+            multi = (
+                k for k in index if isinstance(k, tuple) and _match_value(k, query, vr)
+            )
+            for key in (*candidates, *multi):
+                matches.update(index[key])
+        elif vr not in _NO_WILDCARD_VRS and ("*" in query or "?" in query):
+            for key, bucket in index.items():
+                if key is not None and _match_value(key, query, vr):
+                    matches.update(bucket)
+
+        return matches
+
+    def remove(self, instance: FileInstance) -> None:
+        """Remove `instance` from the index (if present)."""
+        if instance not in self._entries:
+            return
+
+        _, keys = self._entries.pop(instance)
+        for kw, key in keys.items():
+            self._present[kw].discard(instance)
+            bucket = self._hash[kw][key]
+            del bucket[instance]
+            if bucket:
+                continue
+
+            del self._hash[kw][key]
+            if kw in self._sorted and isinstance(key, str):
+                keys_sorted = self._sorted[kw]
+                del keys_sorted[bisect_left(keys_sorted, key)]
+
+    def sort(self, instances: Iterable[FileInstance]) -> list[FileInstance]:
+        """Return `instances` sorted by the order they were added."""
+        entries = self._entries
+        return sorted(instances, key=lambda ii: entries[ii][0])
+
+    def unique_values(self, keyword: str) -> list[Any]:
+        """Return the unique values of the indexed `keyword` element, ordered
+        by the first instance they were added with.
+        """
+        entries = self._entries
+        buckets = sorted(
+            self._hash[keyword].values(),
+            key=lambda b: min(entries[ii][0] for ii in b),
+        )
+        # Use the earliest instance as the source of the original value
+        return [min(b, key=lambda ii: entries[ii][0])[keyword].value for b in buckets]
+
+
+def _keyword_vr(keyword: str) -> str | None:
+    """Return the VR for the element with `keyword` or ``None`` if unknown."""
+    try:
+        return dictionary_VR(keyword)
+    except (KeyError, ValueError):
+        return None
+
+
+def _query_tags(keys: Iterable[str | int]) -> list[BaseTag]:
+    """Return the tags for the query elements in `keys`, skipping unknown
+    keywords.
+    """
+    tags = []
+    for key in keys:
+        if isinstance(key, str):
+            if (tag := tag_for_keyword(key)) is None:
+                continue
+
+            key = tag
+
+        tags.append(Tag(key))
+
+    return tags
+
+
+def _match_dataset(
+    ds: Dataset | FileInstance, query: dict[str, Any], vrs: dict[str, str | None]
+) -> bool:
+    """Return ``True`` if the elements in `ds` match all the `query` values.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset or pydicom.fileset.FileInstance
+        The dataset or instance to check.
+    query : dict[str, Any]
+        The query to match against, as {keyword: value}.
+    vrs : dict[str, str | None]
+        The VRs of the query elements, as {keyword: VR}.
+    """
+    for kw, val in query.items():
+        try:
+            value = ds[kw].value
+        except KeyError:
+            return False
+
+        if not _match_value(value, val, vrs[kw]):
+            return False
+
+    return True
+
+
+def _index_key(value: Any) -> Any:
+    """Return a hashable key for the element `value` used by the index."""
+    if value is None:
+        return None
+
+    if isinstance(value, MultiValue | list):
+        return tuple(str(v) for v in value)
+
+    return str(value)
+
+
 DSPathType = Dataset | str | os.PathLike
 
 
@@ -1005,6 +1381,8 @@ class FileSet:
         self._ds = Dataset()
         # The File-set's managed SOP Instances as list of FileInstance
         self._instances: list[FileInstance] = []
+        # Index of the managed instances' directory record values
+        self._index = _RecordIndex(_INDEXED_KEYWORDS)
         # Use alphanumeric or numeric File IDs
         self._use_alphanumeric = False
 
@@ -1053,7 +1431,8 @@ class FileSet:
             ds = ds_or_path
 
         key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        found = self._index.lookup("SOPInstanceUID", key) or set()
+        have_instance = self._index.sort(found)
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
@@ -1061,6 +1440,7 @@ class FileSet:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
             self._instances.append(instance)
+            self._index.add(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
@@ -1090,6 +1470,7 @@ class FileSet:
         # Save the dataset to the stage
         self._stage["+"][instance.SOPInstanceUID] = instance
         self._instances.append(instance)
+        self._index.add(instance)
         instance._apply_stage("+")
         ds.save_as(instance.path, enforce_file_format=True)
 
@@ -1189,7 +1570,8 @@ class FileSet:
             )
 
         key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        found = self._index.lookup("SOPInstanceUID", key) or set()
+        have_instance = self._index.sort(found)
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
@@ -1197,6 +1579,7 @@ class FileSet:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
             self._instances.append(instance)
+            self._index.add(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
@@ -1217,6 +1600,7 @@ class FileSet:
         # Save the dataset to the stage
         self._stage["+"][instance.SOPInstanceUID] = instance
         self._instances.append(instance)
+        self._index.add(instance)
         instance._apply_stage("+")
         ds.save_as(instance.path, enforce_file_format=True)
 
@@ -1224,8 +1608,10 @@ class FileSet:
 
     def clear(self) -> None:
         """Clear the File-set."""
+        self.clear_cache()
         self._tree.children = []
         self._instances = []
+        self._index.clear()
         self._root_path = None
         self._ds = Dataset()
         self._id = None
@@ -1242,6 +1628,20 @@ class FileSet:
         self._stage["t"] = TemporaryDirectory()
         self._stage["path"] = Path(self._stage["t"].name)
 
+    def clear_cache(self) -> None:
+        """Clear the elements cached from the File-set's SOP Instances when
+        searching with ``load=True``.
+
+        :meth:`~pydicom.fileset.FileSet.find` and
+        :meth:`~pydicom.fileset.FileSet.find_values` cache the elements read
+        from each instance when `load` is ``True`` so that repeated searches
+        don't need to read them again. The cache for an instance is cleared
+        when it's removed from the File-set, otherwise it's kept until this
+        method or :meth:`~pydicom.fileset.FileSet.clear` is called.
+        """
+        for instance in self._instances:
+            instance.clear_cache()
+
     def copy(self, path: str | os.PathLike, force_implicit: bool = False) -> "FileSet":
         """Copy the File-set to a new root directory and return the copied
         File-set.
@@ -1445,22 +1845,43 @@ class FileSet:
     def find(self, load: bool = False, **kwargs: Any) -> list[FileInstance]:
         """Return matching instances in the File-set
 
+        **Matching**
+
+        * Single value matching, such as ``PatientID='1234567'``.
+        * Multiple value matching using a :class:`list` or :class:`tuple`,
+          such as ``PatientID=['1234567', '7654321']``, which matches if the
+          element value is any of the items (or if it's multi-valued and
+          equal to the list).
+        * Range matching for DA, DT and TM elements, such as
+          ``StudyDate='20200101-20201231'``, ``StudyDate='20200101-'`` or
+          ``StudyDate='-20201231'``.
+        * Wildcard matching for other string elements except UI, where ``*``
+          matches any sequence of characters and ``?`` matches any single
+          character, such as ``StudyDescription='CT*HEAD*'``.
+
+        When searching the directory records, the *Patient ID*, *Study
+        Instance UID*, *Series Instance UID*, *SOP Instance UID*, *Modality*,
+        *Accession Number*, *Study Date*, *Study Time*, *Series Date* and
+        *Content Date* elements are indexed when the File-set is loaded and
+        as instances are added or removed, so queries that use them don't
+        need to check every instance.
+
         **Limitations**
 
-        * Only single value matching is supported so neither
-          ``PatientID=['1234567', '7654321']`` or ``PatientID='1234567',
-          PatientID='7654321'`` will work (although the first example will
-          work if the *Patient ID* is actually multi-valued).
         * Repeating group and private elements cannot be used when searching.
 
         Parameters
         ----------
         load : bool, optional
-            If ``True``, then load the SOP Instances belonging to the
-            File-set and perform the search against their available elements.
-            Otherwise (default) search only the elements available in the
-            corresponding directory records (more efficient, but only a limited
-            number of elements are available).
+            If ``True``, then read the queried elements from the SOP Instances
+            belonging to the File-set and perform the search against them. The
+            read elements are cached so subsequent searches only need to read
+            elements that haven't been previously queried, use
+            :meth:`~pydicom.fileset.FileSet.clear_cache` to free the cached
+            elements. Otherwise (default)
+            search only the elements available in the corresponding directory
+            records (more efficient, but only a limited number of elements
+            are available).
         **kwargs
             Search parameters, as element keyword=value (i.e.
             ``PatientID='1234567', StudyDescription="My study"``.
@@ -1473,34 +1894,50 @@ class FileSet:
         if not kwargs:
             return self._instances[:]
 
-        # Flag whether or not the query elements are in the DICOMDIR records
-        has_elements = False
-
-        def match(ds: Dataset | FileInstance, **kwargs: Any) -> bool:
-            nonlocal has_elements
-            if load:
-                ds = ds.load()
-
-            # Check that all query elements are present
-            if all([kw in ds for kw in kwargs]):
-                has_elements = True
-
-            for kw, val in kwargs.items():
-                try:
-                    assert ds[kw].value == val
-                except (AssertionError, KeyError):
-                    return False
+        vrs = {kw: _keyword_vr(kw) for kw in kwargs}
+
+        if load:
+            tags = _query_tags(kwargs)
+            if len(tags) != len(kwargs):
+                # Unknown keywords can never match
+                return []
+
+            datasets = self._load_elements(self._instances, tags)
+            return [
+                instance
+                for instance, ds in zip(self._instances, datasets)
+                if _match_dataset(ds, kwargs, vrs)
+            ]
+
+        # Use the index to narrow down the candidates
+        candidates: set[FileInstance] | None = None
+        remaining = {}
+        for kw, val in kwargs.items():
+            if kw in self._index and (found := self._index.lookup(kw, val)) is not None:
+                candidates = found if candidates is None else candidates & found
+            else:
+                remaining[kw] = val
 
-            return True
+        instances = self._instances
+        if candidates is not None:
+            instances = self._index.sort(candidates)
 
-        matches = [instance for instance in self if match(instance, **kwargs)]
+        matches = [ii for ii in instances if _match_dataset(ii, remaining, vrs)]
 
-        if not load and not has_elements:
-            warn_and_log(
-                "None of the records in the DICOMDIR dataset contain all "
-                "the query elements, consider using the 'load' parameter "
-                "to expand the search to the corresponding SOP instances"
+        # Check whether or not the query elements are in the DICOMDIR records
+        #   using the index, only checking the records for unindexed elements
+        if not matches:
+            indexed = [kw for kw in kwargs if kw in self._index]
+            unindexed = [kw for kw in kwargs if kw not in self._index]
+            has_elements = any(
+                all(kw in ii for kw in unindexed) for ii in self._index.having(indexed)
             )
+            if not has_elements:
+                warn_and_log(
+                    "None of the records in the DICOMDIR dataset contain all "
+                    "the query elements, consider using the 'load' parameter "
+                    "to expand the search to the corresponding SOP instances"
+                )
 
         return matches
 
@@ -1520,11 +1957,13 @@ class FileSet:
             Search within the given instances. If not used then all available
             instances will be searched.
         load : bool, optional
-            If ``True``, then load the SOP Instances belonging to the
-            File-set and perform the search against their available elements.
-            Otherwise (default) search only the elements available in the
-            corresponding directory records (more efficient, but only a limited
-            number of elements are available).
+            If ``True``, then read the elements from the SOP Instances
+            belonging to the File-set and perform the search against them.
+            The read elements are cached in the same manner as
+            :meth:`~pydicom.fileset.FileSet.find`. Otherwise (default) search
+            only the elements available in the corresponding directory records
+            (more efficient, but only a limited number of elements are
+            available).
 
         Returns
         -------
@@ -1538,13 +1977,28 @@ class FileSet:
         element_list = elements if isinstance(elements, list) else [elements]
         has_element = {element: False for element in element_list}
         results: dict[str | int, list[Any]] = {element: [] for element in element_list}
-        iter_instances = instances or iter(self)
-        instance: Dataset | FileInstance
-        for instance in iter_instances:
-            if load:
-                instance = instance.load()
 
-            for element in element_list:
+        # Indexed elements can be taken directly from the index
+        scanned = element_list
+        if not instances and not load:
+            indexed = [
+                e for e in element_list if isinstance(e, str) and e in self._index
+            ]
+            for element in indexed:
+                results[element] = self._index.unique_values(element)
+                has_element[element] = bool(results[element])
+
+            scanned = [e for e in element_list if e not in indexed]
+
+        iter_instances: Iterable[Dataset | FileInstance] = instances or self._instances
+        if load:
+            iter_instances = self._load_elements(
+                list(cast(list[FileInstance], iter_instances)),
+                _query_tags(element_list),
+            )
+
+        for instance in iter_instances if scanned else []:
+            for element in scanned:
                 if element not in instance:
                     continue
 
@@ -1714,6 +2168,7 @@ class FileSet:
 
         for instance in bad_instances:
             self._instances.remove(instance)
+            self._index.remove(instance)
 
     def _file_id_path(self, node: RecordNode) -> Path | None:
         """Return the *Referenced File ID* from the given node
@@ -1799,6 +2254,7 @@ class FileSet:
             ):
                 node.instance = FileInstance(node)
                 self._instances.append(node.instance)
+                self._index.add(node.instance)
 
             for child in node.children:
                 recurse_node(child)
@@ -1867,6 +2323,35 @@ class FileSet:
 
         return None
 
+    @staticmethod
+    def _load_elements(
+        instances: list[FileInstance], tags: list[BaseTag]
+    ) -> list[Dataset]:
+        """Return the elements in `tags` read from each of the `instances`.
+
+        Parameters
+        ----------
+        instances : list of pydicom.fileset.FileInstance
+            The instances to read the elements from.
+        tags : list of pydicom.tag.BaseTag
+            The tags of the elements to be read.
+
+        Returns
+        -------
+        list of pydicom.dataset.Dataset
+            The elements read from each instance, see
+            :meth:`FileInstance._read_elements()
+            <pydicom.fileset.FileInstance._read_elements>`.
+        """
+        uncached = [ii for ii in instances if not ii._cached_tags.issuperset(tags)]
+        if len(uncached) > 1:
+            # Reading is I/O bound so use threads to read multiple instances
+            workers = min(_LOAD_WORKERS, len(uncached))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda ii: ii._read_elements(tags), uncached))
+
+        return [ii._read_elements(tags) for ii in instances]
+
     def _recordify(self, ds: Dataset) -> Iterator[Dataset]:
         """Yield directory records for a SOP Instance.
 
@@ -1966,6 +2451,8 @@ class FileSet:
         if instance not in self._instances:
             raise ValueError("No such instance in the File-set")
 
+        instance.clear_cache()
+
         # If staged for addition, no longer add
         if instance.SOPInstanceUID in self._stage["+"]:
             leaf = instance.node
@@ -1978,12 +2465,14 @@ class FileSet:
                 pass
             instance._apply_stage("-")
             self._instances.remove(instance)
+            self._index.remove(instance)
 
         # Stage for removal if not already done
         elif instance.SOPInstanceUID not in self._stage["-"]:
             instance._apply_stage("-")
             self._stage["-"][instance.SOPInstanceUID] = instance
             self._instances.remove(instance)
+            self._index.remove(instance)
 
     def __str__(self) -> str:
         """Return a string representation of the FileSet."""
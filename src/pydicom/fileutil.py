@@ -1,17 +1,19 @@
 # Copyright 2008-2024 pydicom authors. See LICENSE file for details.
 """Functions for reading to certain bytes, e.g. delimiters."""
 
+from collections import OrderedDict
 from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from io import BufferedIOBase
 import os
 from struct import pack, unpack
-from typing import BinaryIO, cast
+from threading import Lock
+from typing import Any, BinaryIO, cast
 
 from pydicom.misc import size_in_bytes
 from pydicom.tag import TupleTag, Tag, SequenceDelimiterTag, ItemTag, BaseTag
 from pydicom.datadict import dictionary_description
-from pydicom.filebase import ReadableBuffer, WriteableBuffer
+from pydicom.filebase import DicomReadAheadIO, ReadableBuffer, WriteableBuffer
 
 from pydicom.config import logger, settings
 
@@ -445,6 +447,207 @@ def path_from_pathlike(
         return cast(BinaryIO, file_object)
 
 
+def open_readable(path: PathType) -> BinaryIO:
+    """Return the file at `path` opened in ``"rb"`` mode.
+
+    .. versionadded:: 3.1
+
+    If :attr:`Settings.read_ahead_size<pydicom.config.Settings.read_ahead_size>`
+    is greater than 0 then the opened file is wrapped by a
+    :class:`~pydicom.filebase.DicomReadAheadIO`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the file to open.
+
+    Returns
+    -------
+    file-like
+        The opened file.
+    """
+    if not settings.read_ahead_size:
+        return open(path, "rb")
+
+    return cast(
+        BinaryIO,
+        DicomReadAheadIO(
+            open(path, "rb", buffering=0), max_block_size=settings.read_ahead_size
+        ),
+    )
+
+
+class _PooledFile:
+    """A file held by a :class:`FileHandlePool`."""
+
+    def __init__(self, path: str, mtime: float) -> None:
+        self.file = open(path, "rb", buffering=0)
+        self.mtime = mtime
+        # The number of reads in progress, and whether the file should be
+        #   closed once they've finished
+        self.users = 0
+        self.evicted = False
+
+
+class FileHandlePool:
+    """A thread-safe, bounded pool of files opened for reading.
+
+    .. versionadded:: 3.1
+
+    Files are kept open and keyed by their path and modification time, with
+    the least recently used file closed when the pool is full. If a file has
+    been modified since it was opened then it's reopened.
+
+    Examples
+    --------
+
+    Read from a pooled file and close all the files when done::
+
+        with FileHandlePool(max_size=32) as pool:
+            data = pool.read("path/to/file", offset=128, length=4)
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        """Create a new ``FileHandlePool``.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum number of files to keep open (default ``16``). If
+            ``0`` then files are opened and closed for each read.
+        """
+        self._files: OrderedDict[str, _PooledFile] = OrderedDict()
+        self._lock = Lock()
+        self._max_size = 0
+        self.max_size = max_size
+
+    def __contains__(self, path: PathType) -> bool:
+        """Return ``True`` if the file at `path` is open in the pool."""
+        return os.fsdecode(path) in self._files
+
+    def __enter__(self) -> "FileHandlePool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of open files in the pool."""
+        return len(self._files)
+
+    def close(self) -> None:
+        """Close all the files in the pool."""
+        with self._lock:
+            while self._files:
+                self._release(self._files.popitem(last=False)[1])
+
+    @property
+    def max_size(self) -> int:
+        """Get or set the maximum number of open files in the pool."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError("'max_size' must be greater than or equal to 0")
+
+        with self._lock:
+            self._max_size = max_size
+            while len(self._files) > max_size:
+                self._release(self._files.popitem(last=False)[1])
+
+    def read(
+        self, path: PathType, offset: int, length: int, mtime: float | None = None
+    ) -> bytes:
+        """Return up to `length` bytes read from the file at `path`.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The path to the file to read from.
+        offset : int
+            The offset from the start of the file to read from.
+        length : int
+            The number of bytes to read.
+        mtime : float, optional
+            The file's modification time, as given by :func:`os.stat`, if
+            already known.
+
+        Returns
+        -------
+        bytes
+            The read data, which will be shorter than `length` if the end
+            of the file is reached.
+        """
+        path = os.fsdecode(path)
+        if mtime is None:
+            mtime = os.stat(path).st_mtime
+
+        with self._lock:
+            pooled = self._files.pop(path, None)
+            if pooled and pooled.mtime != mtime:
+                self._release(pooled)
+                pooled = None
+
+            if pooled is None:
+                pooled = _PooledFile(path, mtime)
+
+            pooled.users += 1
+            if self._max_size:
+                self._files[path] = pooled
+                while len(self._files) > self._max_size:
+                    self._release(self._files.popitem(last=False)[1])
+            else:
+                pooled.evicted = True
+
+            if not hasattr(os, "pread"):
+                # Seeking and reading must be done together
+                try:
+                    pooled.file.seek(offset)
+                    return _read_exact(pooled.file, length)
+                finally:
+                    pooled.users -= 1
+                    if pooled.evicted and not pooled.users:
+                        pooled.file.close()
+
+        try:
+            fd = pooled.file.fileno()
+            data = os.pread(fd, length, offset)
+            while 0 < len(data) < length:
+                # Large reads may be split by the OS
+                chunk = os.pread(fd, length - len(data), offset + len(data))
+                if not chunk:
+                    break
+
+                data += chunk
+
+            return data
+        finally:
+            with self._lock:
+                pooled.users -= 1
+                if pooled.evicted and not pooled.users:
+                    pooled.file.close()
+
+    def _release(self, pooled: _PooledFile) -> None:
+        """Close `pooled` once any reads in progress have finished."""
+        pooled.evicted = True
+        if not pooled.users:
+            pooled.file.close()
+
+
+def _read_exact(fp: BinaryIO, length: int) -> bytes:
+    """Return up to `length` bytes read from `fp`, retrying short reads."""
+    data = fp.read(length)
+    while 0 < len(data) < length:
+        chunk = fp.read(length - len(data))
+        if not chunk:
+            break
+
+        data += chunk
+
+    return data
+
+
 def _unpack_tag(b: bytes, endianness: str) -> BaseTag:
     return TupleTag(cast(tuple[int, int], unpack(f"{endianness}HH", b)))
 
@@ -7,7 +7,6 @@ from io import BufferedIOBase
 from struct import pack
 from typing import BinaryIO, Any, cast
 from collections.abc import Callable
-import zlib
 
 from pydicom import config
 from pydicom.charset import default_encoding, convert_encodings, encode_string
@@ -18,7 +17,13 @@ from pydicom.dataelem import (
 )
 from pydicom.dataset import Dataset, validate_file_meta, FileMetaDataset
 from pydicom.errors import BytesLengthException
-from pydicom.filebase import DicomFile, DicomBytesIO, DicomIO, WriteableBuffer
+from pydicom.filebase import (
+    DicomFile,
+    DicomBytesIO,
+    DicomDeflateIO,
+    DicomIO,
+    WriteableBuffer,
+)
 from pydicom.fileutil import (
     path_from_pathlike,
     PathType,
@@ -1420,6 +1425,10 @@ def dcmwrite(
         if "PixelData" in dataset:
             dataset["PixelData"].is_undefined_length = tsyntax.is_compressed
 
+    # Validate any element values set while validation was deferred
+    file_meta.validate_deferred()
+    dataset.validate_deferred()
+
     caller_owns_file = True
     # Open file if not already a file object
     filename = path_from_pathlike(filename)
@@ -1458,17 +1467,13 @@ def dcmwrite(
             # See PS3.5 section A.5
             # When writing, the entire dataset following the file meta data
             #   is encoded normally, then "deflate" compression applied
-            buffer = DicomBytesIO()
-            buffer.is_implicit_VR, buffer.is_little_endian = encoding
+            #   incrementally as the encoded elements are written
+            deflater = DicomDeflateIO(fp)
+            deflater.is_implicit_VR, deflater.is_little_endian = encoding
             with dataset:  # catch exceptions
-                write_dataset(buffer, dataset)
-
-            # Compress the encoded data and write to file
-            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
-            deflated = bytearray(compressor.compress(buffer.getvalue()))
-            deflated += compressor.flush()
-            fp.write(deflated)
-            if len(deflated) % 2:
+                write_dataset(deflater, dataset)
+
+            if deflater.finish() % 2:
                 fp.write(b"\x00")
 
         else:
@@ -0,0 +1,157 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Opt-in collection of counts and timings for pydicom's hot paths.
+
+.. versionadded:: 3.1
+
+Collection is disabled by default and costs a single flag check when
+disabled. When enabled the following are recorded:
+
+* ``"dcmread"``: calls to :func:`~pydicom.filereader.dcmread` and the number
+  of bytes parsed.
+* ``"convert.<VR>"``: conversions of raw elements by
+  :func:`~pydicom.dataelem.convert_raw_data_element`, per VR.
+* ``"deferred_read"``: reads of deferred element values and the number of
+  bytes read.
+* ``"io.read"``: reads made by :class:`~pydicom.filebase.DicomIO` instances
+  created while collection is enabled and the number of bytes read.
+* ``"decode.<plugin>"`` and ``"encode.<plugin>"``: frames decoded and
+  encoded, per plugin, and the number of bytes produced.
+* ``"convert_color_space"`` and ``"lut.<function>"``: calls to
+  :func:`~pydicom.pixels.convert_color_space` and the LUT functions in
+  :mod:`pydicom.pixels.processing`.
+
+Examples
+--------
+
+Collect statistics while decoding a dataset::
+
+    from pydicom import dcmread, instrumentation
+
+    with instrumentation.collect() as stats:
+        ds = dcmread("path/to/file.dcm")
+        ds.decode()
+
+    for name, values in stats.items():
+        print(name, values["count"], values["time"], values["bytes"])
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, TypeVar
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+#: If ``True`` then statistics are being collected, use :func:`enable` and
+#: :func:`disable` to change
+enabled: bool = False
+
+_LOCK = Lock()
+# {name: [count, time in seconds, bytes]}
+_STATS: dict[str, list[Any]] = {}
+
+
+@contextmanager
+def collect() -> Iterator[dict[str, dict[str, Any]]]:
+    """Return a context manager that collects statistics for its block.
+
+    On exit the yielded :class:`dict` is updated with the statistics
+    recorded within the block, in the same format as :func:`snapshot`.
+    Statistics recorded by other threads while the block is running are
+    also included.
+    """
+    global enabled
+
+    previous = enabled
+    before = snapshot()
+    stats: dict[str, dict[str, Any]] = {}
+    enabled = True
+    try:
+        yield stats
+    finally:
+        enabled = previous
+        empty = {"count": 0, "time": 0.0, "bytes": 0}
+        for name, values in snapshot().items():
+            initial = before.get(name, empty)
+            if values["count"] != initial["count"]:
+                stats[name] = {key: values[key] - initial[key] for key in values}
+
+
+def disable() -> None:
+    """Stop collecting statistics."""
+    global enabled
+    enabled = False
+
+
+def enable() -> None:
+    """Start collecting statistics."""
+    global enabled
+    enabled = True
+
+
+def record(name: str, elapsed: float, nr_bytes: int = 0) -> None:
+    """Record a call to an instrumented path.
+
+    Parameters
+    ----------
+    name : str
+        The name of the instrumented path.
+    elapsed : float
+        The time taken by the call, in seconds.
+    nr_bytes : int, optional
+        The number of bytes read or produced by the call.
+    """
+    with _LOCK:
+        if (values := _STATS.get(name)) is None:
+            _STATS[name] = [1, elapsed, nr_bytes]
+        else:
+            values[0] += 1
+            values[1] += elapsed
+            values[2] += nr_bytes
+
+
+def reset() -> None:
+    """Clear the collected statistics."""
+    with _LOCK:
+        _STATS.clear()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return a copy of the statistics collected so far.
+
+    Returns
+    -------
+    dict[str, dict[str, int | float]]
+        The statistics as ``{name: {"count": int, "time": float, "bytes":
+        int}}``, where ``"time"`` is the total time in seconds.
+    """
+    with _LOCK:
+        return {
+            name: {"count": count, "time": elapsed, "bytes": nr_bytes}
+            for name, (count, elapsed, nr_bytes) in _STATS.items()
+        }
+
+
+def timed(name: str) -> Callable[[_F], _F]:
+    """Return a decorator that records calls to the decorated function as
+    `name` while collection is enabled.
+    """
+
+    def decorator(func: _F) -> _F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
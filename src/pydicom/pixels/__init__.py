@@ -20,9 +20,13 @@ from pydicom.pixels.utils import (
     concatenate_packed_frames,
     decompress,
     iter_pixels,
+    get_frame_indices,
     get_packed_frame,
     pack_bits,
     pixel_array,
     set_pixel_data,
+    sparse_pixel_array,
+    SparseFrames,
     unpack_bits,
+    unpack_frames,
 )
@@ -7,10 +7,21 @@ from typing import TYPE_CHECKING, Any, TypedDict
 
 from pydicom.misc import warn_and_log
 from pydicom.pixels.utils import as_pixel_options
-from pydicom.uid import UID
+from pydicom.uid import (
+    UID,
+    DeflatedImageFrameCompression,
+    HTJ2KLossless,
+    HTJ2KLosslessRPCL,
+    JPEG2000Lossless,
+    JPEGLossless,
+    JPEGLosslessSV1,
+    JPEGLSLossless,
+    JPEGXLLossless,
+    RLELossless,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from pydicom.dataset import Dataset
     from pydicom.pixels.decoders.base import DecodeOptions, DecodeFunction
     from pydicom.pixels.encoders.base import EncodeOptions, EncodeFunction
@@ -18,6 +29,19 @@ if TYPE_CHECKING:  # pragma: no cover
 
 Buffer = bytes | bytearray | memoryview
 
+# Transfer syntaxes where every plugin should give identical decoded data
+LOSSLESS_SYNTAXES = (
+    DeflatedImageFrameCompression,
+    HTJ2KLossless,
+    HTJ2KLosslessRPCL,
+    JPEG2000Lossless,
+    JPEGLossless,
+    JPEGLosslessSV1,
+    JPEGLSLossless,
+    JPEGXLLossless,
+    RLELossless,
+)
+
 
 class CoderBase:
     """Base class for Decoder and Encoder."""
@@ -40,6 +64,9 @@ class CoderBase:
         self._unavailable: dict[str, tuple[str, ...]] = {}
         # True for a Decoder class, False for an Encoder class
         self._decoder = decoder
+        # The plugins ordered fastest first, keyed to the
+        #   (bits allocated, samples per pixel) of the pixel data
+        self._rankings: dict[tuple[int, int], tuple[str, ...]] = {}
 
     def add_plugin(self, label: str, import_path: tuple[str, str]) -> None:
         """Add a plugin to the class instance.
@@ -174,6 +201,112 @@ class CoderBase:
 
         return s
 
+    def _rank_plugins(
+        self, runner: "RunnerBase", results: dict[str, tuple[float, Any]], exact: bool
+    ) -> tuple[str, ...]:
+        """Rank the plugins used by ``calibrate()`` and return their names
+        ordered fastest first.
+
+        Parameters
+        ----------
+        runner : RunnerBase
+            The runner for the pixel data used to calibrate the plugins.
+        results : dict[str, tuple[float, Any]]
+            The {plugin name: (time taken, output)} for the plugins that
+            succeeded, where the output is a :class:`~numpy.ndarray` or
+            ``None`` if it can't be checked.
+        exact : bool
+            If ``True`` then the outputs must be equal, otherwise they must
+            only have the same shape and dtype.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The names of the plugins whose output agrees with the largest group
+            of plugins, ordered fastest first.
+        """
+        # Group the plugins by their output and keep the largest group
+        groups: list[list[str]] = []
+        for name, (_, arr) in results.items():
+            for group in groups:
+                ref = results[group[0]][1]
+                if (
+                    arr is None
+                    or ref is None
+                    or (
+                        arr.shape == ref.shape
+                        and arr.dtype == ref.dtype
+                        and (not exact or bool((arr == ref).all()))
+                    )
+                ):
+                    group.append(name)
+                    break
+            else:
+                groups.append([name])
+
+        passed = max(groups, key=len) if groups else []
+        if excluded := [name for name in results if name not in passed]:
+            warn_and_log(
+                f"The output from the {', '.join(excluded)} plugin(s) doesn't "
+                "match the other plugins and has been excluded from the ranking"
+            )
+
+        ranking = tuple(sorted(passed, key=lambda name: results[name][0]))
+        self.set_ranking(
+            runner.get_option("bits_allocated"),
+            runner.get_option("samples_per_pixel"),
+            ranking,
+        )
+
+        return ranking
+
+    @property
+    def rankings(self) -> dict[tuple[int, int], tuple[str, ...]]:
+        """Return the plugin rankings as {(bits allocated, samples per pixel):
+        plugin names}.
+
+        .. versionadded:: 3.1
+
+        When no plugin is specified, the ranked plugins for pixel data with a
+        matching (*Bits Allocated*, *Samples per Pixel*) are tried fastest
+        first, followed by any unranked plugins in the order they were added.
+        Rankings are created by ``calibrate()`` or :meth:`set_ranking`, and
+        may be saved and restored to avoid calibrating again.
+        """
+        return self._rankings.copy()
+
+    def set_ranking(
+        self,
+        bits_allocated: int,
+        samples_per_pixel: int,
+        plugins: "Iterable[str] | None",
+    ) -> None:
+        """Set the order to try the plugins in for pixel data with the given
+        *Bits Allocated* and *Samples per Pixel*.
+
+        .. versionadded:: 3.1
+
+        .. warning::
+
+            This method is not thread-safe.
+
+        Parameters
+        ----------
+        bits_allocated : int
+            The (0028,0100) *Bits Allocated* value of the pixel data.
+        samples_per_pixel : int
+            The (0028,0002) *Samples per Pixel* value of the pixel data.
+        plugins : Iterable[str] | None
+            The names of the plugins to try first, fastest first, or ``None``
+            to remove the ranking. Names of plugins that aren't available
+            are ignored.
+        """
+        key = (bits_allocated, samples_per_pixel)
+        if plugins is None:
+            self._rankings.pop(key, None)
+        else:
+            self._rankings[key] = tuple(plugins)
+
     def remove_plugin(self, label: str) -> None:
         """Remove a plugin.
 
@@ -199,7 +332,7 @@ class CoderBase:
         return self._uid
 
     def _validate_plugins(
-        self, plugin: str = ""
+        self, plugin: str = "", runner: "RunnerBase | None" = None
     ) -> dict[str, "DecodeFunction"] | dict[str, "EncodeFunction"]:
         """Return available plugins.
 
@@ -208,6 +341,9 @@ class CoderBase:
         plugin : str, optional
             If not used (default) then return all available plugins, otherwise
             only return the plugin with a matching name (if it's available).
+        runner : RunnerBase, optional
+            If used then the available plugins are ordered using the
+            ranking for the runner's pixel data (if any).
 
         Returns
         -------
@@ -250,7 +386,19 @@ class CoderBase:
             raise ValueError(msg)
 
         if self._available:
-            return self._available.copy()
+            plugins = self._available.copy()
+            if runner is not None and (
+                ranking := self._rankings.get(
+                    (
+                        runner.get_option("bits_allocated"),
+                        runner.get_option("samples_per_pixel"),
+                    )
+                )
+            ):
+                ranked = {name: plugins[name] for name in ranking if name in plugins}
+                plugins = ranked | plugins
+
+            return plugins
 
         missing = "\n".join([f"\t{s}" for s in self.missing_dependencies])
         if self._decoder:
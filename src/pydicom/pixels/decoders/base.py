@@ -1,11 +1,14 @@
 # Copyright 2008-2024 pydicom authors. See LICENSE file for details.
 """Pixel data decoding."""
 
-from collections.abc import Callable, Iterator, Iterable
+from collections.abc import Callable, Hashable, Iterator, Iterable
 import logging
-from io import BufferedIOBase
+from io import BufferedIOBase, BufferedReader, FileIO
 from math import ceil, floor
+import mmap
+import os
 import sys
+from time import perf_counter
 from typing import Any, BinaryIO, cast, TYPE_CHECKING
 
 try:
@@ -15,8 +18,9 @@ try:
 except ImportError:
     HAVE_NP = False
 
-from pydicom import config
+from pydicom import config, instrumentation
 from pydicom.encaps import get_frame, generate_frames
+from pydicom.filebase import DicomReadAheadIO
 from pydicom.misc import warn_and_log
 from pydicom.pixels.common import (
     Buffer,
@@ -25,14 +29,18 @@ from pydicom.pixels.common import (
     CoderBase,
     PhotometricInterpretation as PI,
     FrameOptions,
+    LOSSLESS_SYNTAXES,
 )
 from pydicom.pixels.processing import convert_color_space
 from pydicom.pixels.utils import (
+    _PIXEL_KEYWORDS,
     _get_jpg_parameters,
+    as_pixel_options,
     concatenate_packed_frames,
     get_j2k_parameters,
     get_packed_frame,
     pack_bits,
+    pixel_cache,
     unpack_bits,
 )
 from pydicom.uid import (
@@ -100,6 +108,10 @@ class DecodeOptions(RunnerOptions, total=False):
     # Use the JPEG 2000 metadata to return an ndarray matched to the expected pixel
     # representation, otherwise return the decoded data as-is (ndarray only)
     apply_j2k_sign_correction: bool
+    # Decode at a reduced resolution by discarding this many resolution levels
+    reduce: int
+    # Decode at the smallest resolution level of at least (rows, columns)
+    target_size: tuple[int, int]
 
     ## Processing options (ndarray only)
     as_rgb: bool  # Make best effort to return RGB output
@@ -404,6 +416,123 @@ def _apply_jls_sign_correction(
     return arr
 
 
+# When cropping natively encoded pixel data read from a file, if skipping over
+#   the unwanted columns means skipping at least this many bytes per row then
+#   each row's column span is read separately, otherwise whole rows are read
+_ROI_ROW_READ_THRESHOLD = 8192
+
+
+def _validate_roi(roi: Any, rows: int, columns: int) -> tuple[slice, slice]:
+    """Return the region of interest `roi` as (row slice, column slice) with
+    explicit start and stop values.
+    """
+    if not (
+        isinstance(roi, tuple)
+        and len(roi) == 2
+        and all(isinstance(s, slice) for s in roi)
+    ):
+        raise TypeError("'roi' must be a tuple of (row slice, column slice)")
+
+    slices = []
+    for item, length, name in zip(roi, (rows, columns), ("row", "column")):
+        start, stop, step = item.indices(length)
+        if step != 1:
+            raise ValueError(f"The 'roi' {name} slice must have a step of 1")
+
+        if stop <= start:
+            raise ValueError(f"The 'roi' {name} slice must contain at least one {name}")
+
+        slices.append(slice(start, stop))
+
+    return slices[0], slices[1]
+
+
+def _crop_to_roi(
+    arr: "np.ndarray", runner: "DecodeRunner", roi: tuple[slice, slice]
+) -> "np.ndarray":
+    """Return a view of the region of interest `roi` for each frame in `arr`."""
+    # Skip over the frames dimension (if present)
+    nr_dims = 2 if runner.samples_per_pixel == 1 else 3
+    return arr[(slice(None),) * (arr.ndim - nr_dims) + roi]
+
+
+def _roi_properties(
+    properties: dict[str, str | int], roi: tuple[slice, slice] | None
+) -> dict[str, str | int]:
+    """Update the rows and columns in `properties` to match the cropped frames."""
+    if roi is not None:
+        properties["rows"] = roi[0].stop - roi[0].start
+        properties["columns"] = roi[1].stop - roi[1].start
+
+    return properties
+
+
+def _pixel_cache_key(
+    decoder: "Decoder",
+    src: "Dataset | Buffer | BinaryIO",
+    raw: bool,
+    decoding_plugin: str,
+    roi: tuple[slice, slice] | None,
+    kwargs: dict[str, Any],
+) -> Hashable | None:
+    """Return the key for arrays decoded from `src` in the pixel cache, or
+    ``None`` if they shouldn't be cached.
+
+    The frame index is added to the returned key by the caller.
+    """
+    from pydicom.dataset import Dataset
+
+    if not pixel_cache.max_bytes:
+        return None
+
+    # Views are already cheap and can't be cached
+    if decoder.is_native and kwargs.get("view_only", False):
+        return None
+
+    options: tuple[tuple[str, Any], ...] = ()
+    if isinstance(src, Dataset):
+        keywords = [kw for kw in _PIXEL_KEYWORDS.values() if kw in src]
+        if not keywords:
+            return None
+
+        options = tuple(sorted(as_pixel_options(src).items()))
+        src = src[keywords[0]].value
+
+    source: Hashable
+    if hasattr(src, "read"):
+        name = getattr(src, "name", None)
+        if not isinstance(name, str) or not os.path.isfile(name):
+            return None
+
+        stat = os.stat(name)
+        source = (
+            os.path.abspath(name),
+            stat.st_mtime_ns,
+            stat.st_size,
+            cast(BinaryIO, src).tell(),
+        )
+    elif isinstance(src, bytes) and decoder.is_encapsulated:
+        source = (len(src), hash(src))
+    else:
+        return None
+
+    key = (
+        decoder.UID,
+        source,
+        options,
+        raw,
+        decoding_plugin,
+        None if roi is None else tuple((s.start, s.stop) for s in roi),
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
 # Allow customization of the image processors
 PROCESSORS: list[ProcessingFunction] = [_process_color_space]
 
@@ -438,6 +567,8 @@ class DecodeRunner(RunnerBase):
         self._undeletable = ("transfer_syntax_uid", "pixel_keyword")
         self._decoders: dict[str, DecodeFunction] = {}
         self._previous: tuple[str, DecodeFunction]
+        # A read-only memory map of the file containing the native pixel data
+        self._mapped: memoryview | None
 
         # The frame currently being decoded
         # Not useful for decoding native with Decoder.as_array(..., index=None)
@@ -564,7 +695,12 @@ class DecodeRunner(RunnerBase):
         for name, func in self._decoders.items():
             try:
                 # Attempt to decode the frame
+                start = perf_counter() if instrumentation.enabled else 0.0
                 frame = func(src, self)
+                if start:
+                    instrumentation.record(
+                        f"decode.{name}", perf_counter() - start, len(frame)
+                    )
 
                 # Decode success, if we were previously successful then
                 #   warn about the change to the new decoder
@@ -637,6 +773,13 @@ class DecodeRunner(RunnerBase):
                 "j2k_precision",
                 j2k_info.get("precision", self.bits_stored),
             )
+            reduce = self.get_option("reduce", 0)
+            levels = j2k_info.get("decomposition_levels", reduce)
+            if reduce > levels:
+                raise ValueError(
+                    f"Unable to decode frame {index} with 'reduce={reduce}' as its "
+                    f"JPEG 2000 codestream only has {levels} decomposition levels"
+                )
         elif self.transfer_syntax in JPEGLSTransferSyntaxes:
             jls_info = _get_jpg_parameters(src)
             self.set_frame_option(
@@ -668,7 +811,7 @@ class DecodeRunner(RunnerBase):
             The data from `src`, may return fewer bytes if the end of `src` is
             reached before ``offset + length``.
         """
-        if self.is_dataset or self.is_buffer:
+        if not hasattr(src, "read"):
             src = cast(Buffer, src)
             return src[offset : offset + length]
 
@@ -679,6 +822,43 @@ class DecodeRunner(RunnerBase):
         src.seek(file_offset)
         return buffer
 
+    def _memory_map(self) -> memoryview | None:
+        """Return a read-only :class:`memoryview` of a memory map of the file
+        containing native pixel data, or ``None`` if it cannot be mapped.
+
+        .. versionadded:: 3.1
+
+        Only used with the `view_only` option so the returned arrays may be
+        views on the file contents rather than copies.
+        """
+        if hasattr(self, "_mapped"):
+            return self._mapped
+
+        self._mapped = None
+        if not (
+            self.is_native
+            and self.is_binary
+            and self.get_option("view_only", False)
+            and self.transfer_syntax != DeflatedExplicitVRLittleEndian
+        ):
+            return None
+
+        # The logical position of a read-ahead buffer matches the file's
+        f = self.src
+        if isinstance(f, DicomReadAheadIO):
+            f = f.parent
+
+        if not isinstance(f, BufferedReader | FileIO):
+            return None
+
+        try:
+            self._mapped = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):
+            # Empty files, unsupported file systems, etc
+            pass
+
+        return self._mapped
+
     def iter_decode(self) -> Iterator[bytes | bytearray]:
         """Yield decoded frames from the encoded pixel data.
 
@@ -1003,6 +1183,76 @@ class DecodeRunner(RunnerBase):
         if hasattr(self, "_previous"):
             del self._previous
 
+    def _set_reduction(self) -> None:
+        """Set the number of resolution levels to discard when decoding JPEG 2000
+        pixel data and update the rows and columns to match the reduced size.
+
+        .. versionadded:: 3.1
+        """
+        reduce = self.get_option("reduce", 0)
+        target_size = self.get_option("target_size", None)
+        if not reduce and target_size is None:
+            return
+
+        if self.transfer_syntax not in JPEG2000TransferSyntaxes:
+            raise ValueError(
+                "Decoding at a reduced resolution is only available for JPEG 2000 "
+                f"and HTJ2K, not '{self.transfer_syntax.name}'"
+            )
+
+        if reduce and target_size is not None:
+            raise ValueError("Only one of 'reduce' or 'target_size' may be used")
+
+        # Use the first frame's codestream to determine the available levels,
+        #   the levels for the other frames are checked as they're decoded
+        src = get_frame(
+            self.src,
+            0,
+            number_of_frames=self.number_of_frames,
+            extended_offsets=self.extended_offsets,
+        )
+        levels = get_j2k_parameters(src).get("decomposition_levels", None)
+        if levels is None:
+            raise ValueError(
+                "Unable to decode at a reduced resolution as the number of "
+                "decomposition levels in the JPEG 2000 codestream could not be found"
+            )
+
+        rows, columns = self.rows, self.columns
+        if target_size is not None:
+            if not (
+                isinstance(target_size, tuple)
+                and len(target_size) == 2
+                and all(isinstance(x, int) and x > 0 for x in target_size)
+            ):
+                raise ValueError(
+                    "'target_size' must be a tuple of (rows, columns) as positive int"
+                )
+
+            # Each level halves the rows and columns, use the smallest level
+            #   that's still at least as large as the target
+            reduce = 0
+            while (
+                reduce < levels
+                and ceil(rows / 2 ** (reduce + 1)) >= target_size[0]
+                and ceil(columns / 2 ** (reduce + 1)) >= target_size[1]
+            ):
+                reduce += 1
+        elif (
+            isinstance(reduce, bool)
+            or not isinstance(reduce, int)
+            or not 0 <= reduce <= levels
+        ):
+            raise ValueError(
+                f"'reduce' must be an int in the range (0, {levels}) for a JPEG 2000 "
+                f"codestream with {levels} decomposition levels"
+            )
+
+        self.del_option("target_size")
+        self.set_option("reduce", reduce)
+        self.set_option("rows", ceil(rows / 2**reduce))
+        self.set_option("columns", ceil(columns / 2**reduce))
+
     def _set_options_ds(self, ds: "Dataset") -> None:
         """Set options using a dataset.
 
@@ -1064,6 +1314,9 @@ class DecodeRunner(RunnerBase):
             self._src = src
             self._src_type = "Buffer"
 
+        if hasattr(self, "_mapped"):
+            del self._mapped
+
     @property
     def src(self) -> Buffer | BinaryIO:
         """Return the buffer-like or file-like containing the encoded pixel data."""
@@ -1120,6 +1373,17 @@ class DecodeRunner(RunnerBase):
                 and self.bits_allocated > 8
             )
 
+        if test == "row_reads":
+            # Natively encoded frames whose rows can be read directly from a file
+            return (
+                self.is_native
+                and self.is_binary
+                and self.bits_allocated >= 8
+                and not self._test_for("be_swap_ow")
+                and self.photometric_interpretation != PI.YBR_FULL_422
+                and (self.samples_per_pixel == 1 or self.planar_configuration == 0)
+            )
+
         if test == "bit_packed":
             return (
                 self.bits_allocated == 1
@@ -1249,6 +1513,7 @@ class Decoder(CoderBase):
         validate: bool = True,
         raw: bool = False,
         decoding_plugin: str = "",
+        roi: tuple[slice, slice] | None = None,
         **kwargs: DecodeOptions,
     ) -> tuple["np.ndarray", dict[str, str | int]]:
         """Return decoded pixel data as :class:`~numpy.ndarray`.
@@ -1327,6 +1592,14 @@ class Decoder(CoderBase):
             available plugins will be tried and the result from the first successful
             one returned. For information on the available plugins for each
             decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+        roi : tuple[slice, slice] | None, optional
+            If used then return only the region of interest given by
+            ``(row_slice, column_slice)`` from each frame, where the slices
+            must have a step of ``1``. For natively encoded pixel data in a
+            file-like `src` only the rows within the region will be read,
+            otherwise each frame will be cropped after decoding.
+
+            .. versionadded:: 3.1
         **kwargs
             Optional keyword parameters for controlling decoding are also
             available, please see the :doc:`decoding options documentation
@@ -1373,7 +1646,7 @@ class Decoder(CoderBase):
         runner.set_decoders(
             cast(
                 dict[str, "DecodeFunction"],
-                self._validate_plugins(decoding_plugin),
+                self._validate_plugins(decoding_plugin, runner),
             ),
         )
 
@@ -1383,11 +1656,20 @@ class Decoder(CoderBase):
         if validate:
             runner.validate()
 
+        runner._set_reduction()
+
+        if roi is not None:
+            roi = _validate_roi(roi, runner.rows, runner.columns)
+
+        key = _pixel_cache_key(self, src, raw, decoding_plugin, roi, kwargs)
+        if key is not None and (cached := pixel_cache.get((key, index))) is not None:
+            return cached
+
         if self.is_native:
-            arr = self._as_array_native(runner, index)
+            arr = self._as_array_native(runner, index, roi)
             as_writeable = not runner.get_option("view_only", False)
         else:
-            arr = self._as_array_encapsulated(runner, index)
+            arr = self._as_array_encapsulated(runner, index, roi)
             as_writeable = True
 
         if runner._test_for("j2k_corrections"):
@@ -1406,17 +1688,28 @@ class Decoder(CoderBase):
             arr, _ = runner.process(arr, index)
 
         arr = arr.copy() if not arr.flags.writeable and as_writeable else arr
+        properties = _roi_properties(runner.pixel_properties(index), roi)
+        if key is not None:
+            pixel_cache.add((key, index), arr, properties)
 
-        return arr, runner.pixel_properties(index)
+        return arr, properties
 
     @staticmethod
-    def _as_array_encapsulated(runner: DecodeRunner, index: int | None) -> "np.ndarray":
+    def _as_array_encapsulated(
+        runner: DecodeRunner,
+        index: int | None,
+        roi: tuple[slice, slice] | None = None,
+    ) -> "np.ndarray":
         """Return compressed and encapsulated pixel data as :class:`~numpy.ndarray`.
 
         .. versionchanged:: 3.1
 
             Add support for encapsulated single bit images (*Bits Allocated* = 1)
 
+        .. versionchanged:: 3.1
+
+            Added the `roi` parameter.
+
         Parameters
         ----------
         runner : pydicom.pixels.decoders.base.DecodeRunner
@@ -1424,6 +1717,9 @@ class Decoder(CoderBase):
         index : int | None
             The index of the frame to be returned, or ``None`` if all frames
             are to be returned.
+        roi : tuple[slice, slice] | None, optional
+            If used then the validated (row slice, column slice) region of
+            interest to crop each decoded frame to.
 
         Returns
         -------
@@ -1460,20 +1756,36 @@ class Decoder(CoderBase):
             frame = frame.astype(runner.pixel_dtype, copy=not frame.flags.writeable)
             runner.set_frame_option(index, "bits_allocated", bits_allocated)
 
-            return runner.reshape(frame, index)
+            if roi is None:
+                return runner.reshape(frame, index)
+
+            # Copy the region so the full frame can be released
+            return _crop_to_roi(runner.reshape(frame, index), runner, roi).copy()
 
         # Return all frames
         # Preallocate the output array, individual frames will be placed into it
         # The output dtype is based off the original input parameters
         number_of_frames = runner.number_of_frames
-        shape = (
-            number_of_frames,
-            runner.rows,
-            runner.columns,
-            runner.samples_per_pixel,
-        )
-        # squeeze() will reduce shape (1, R, C, 1) to (R, C)
-        arr = np.empty(shape, dtype=runner.pixel_dtype).squeeze()
+        if roi is None:
+            shape = (
+                number_of_frames,
+                runner.rows,
+                runner.columns,
+                runner.samples_per_pixel,
+            )
+            # squeeze() will reduce shape (1, R, C, 1) to (R, C)
+            arr = np.empty(shape, dtype=runner.pixel_dtype).squeeze()
+        else:
+            # Only the region needs to be held in memory, but squeeze() may
+            #   remove a region dimension of length 1
+            roi_shape = [roi[0].stop - roi[0].start, roi[1].stop - roi[1].start]
+            if number_of_frames > 1:
+                roi_shape.insert(0, number_of_frames)
+
+            if runner.samples_per_pixel > 1:
+                roi_shape.append(runner.samples_per_pixel)
+
+            arr = np.empty(roi_shape, dtype=runner.pixel_dtype)
 
         frame_generator = runner.iter_decode()
         for idx in range(number_of_frames):
@@ -1486,7 +1798,8 @@ class Decoder(CoderBase):
                 bits_allocated = runner.bits_allocated
 
             dst = None if number_of_frames == 1 else idx
-            arr[dst] = runner.reshape(frame, idx)
+            frame = runner.reshape(frame, idx)
+            arr[dst] = frame if roi is None else _crop_to_roi(frame, runner, roi)
             runner.set_frame_option(idx, "bits_allocated", bits_allocated)
 
         # Check to see if we have any more frames available
@@ -1508,6 +1821,8 @@ class Decoder(CoderBase):
                 # The frame dtype is reconciled to pixel_dtype in concatenate()
                 runner.set_frame_option(idx, "bits_allocated", bits_allocated)
                 frame = runner.reshape(frame, idx)
+                if roi is not None:
+                    frame = _crop_to_roi(frame, runner, roi)
 
                 excess.append(frame)
 
@@ -1531,10 +1846,18 @@ class Decoder(CoderBase):
         return arr
 
     @staticmethod
-    def _as_array_native(runner: DecodeRunner, index: int | None) -> "np.ndarray":
+    def _as_array_native(
+        runner: DecodeRunner,
+        index: int | None,
+        roi: tuple[slice, slice] | None = None,
+    ) -> "np.ndarray":
         """Return natively encoded pixel data from a buffer-like as
         :class:`~numpy.ndarray`.
 
+        .. versionchanged:: 3.1
+
+            Added the `roi` parameter.
+
         Parameters
         ----------
         runner : pydicom.pixels.decoders.base.DecodeRunner
@@ -1542,6 +1865,9 @@ class Decoder(CoderBase):
         index : int | None
             The index of the frame to be returned, or ``None`` if all frames
             are to be returned
+        roi : tuple[slice, slice] | None, optional
+            If used then the validated (row slice, column slice) region of
+            interest to return from each frame.
 
         Returns
         -------
@@ -1549,6 +1875,14 @@ class Decoder(CoderBase):
             A 2D, 3D or 4D array of the expected output dtype containing the pixel
             data. May or may not be writeable.
         """
+        if roi is not None:
+            if runner._test_for("row_reads") and runner._memory_map() is None:
+                return Decoder._as_array_native_roi(runner, index, roi)
+
+            # For buffers and mapped files this is a view and no unnecessary
+            #   copy is made
+            return _crop_to_roi(Decoder._as_array_native(runner, index), runner, roi)
+
         length_bytes = runner.frame_length(unit="bytes")
         length_pixels = int(runner.frame_length(unit="pixels"))
         dtype = runner.pixel_dtype
@@ -1562,6 +1896,11 @@ class Decoder(CoderBase):
             src = memoryview(cast(Buffer, runner.src))
             file_offset = 0
             length_source: int | float = len(src)
+        elif (mapped := runner._memory_map()) is not None:
+            # Read-only views on the mapped file rather than copies
+            src = mapped
+            file_offset = cast(BinaryIO, runner.src).tell()
+            length_source = len(src) - file_offset
         else:
             src = cast(BinaryIO, runner.src)
             # Should be the start of the pixel data element's value
@@ -1693,6 +2032,99 @@ class Decoder(CoderBase):
 
         return runner.reshape(out, index)
 
+    @staticmethod
+    def _as_array_native_roi(
+        runner: DecodeRunner, index: int | None, roi: tuple[slice, slice]
+    ) -> "np.ndarray":
+        """Return a region of interest from natively encoded pixel data in a
+        file-like as :class:`~numpy.ndarray`, reading only the required rows.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        runner : pydicom.pixels.decoders.base.DecodeRunner
+            The runner with the encoded data and decoding options.
+        index : int | None
+            The index of the frame to be returned, or ``None`` if all frames
+            are to be returned
+        roi : tuple[slice, slice]
+            The validated (row slice, column slice) region of interest to return
+            from each frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            A writeable 2D, 3D or 4D array of the expected output dtype containing
+            the region of interest.
+        """
+        number_of_frames = runner.number_of_frames
+        if index is not None and index >= number_of_frames:
+            raise ValueError(
+                f"There is insufficient pixel data to contain {index + 1} frames"
+            )
+
+        indices = (index,) if index is not None else range(number_of_frames)
+        for idx in indices:
+            runner._frame_set_options(idx)
+
+        dtype = runner.pixel_dtype
+        samples_per_pixel = runner.samples_per_pixel
+        pixel_length = dtype.itemsize * samples_per_pixel
+        row_length = runner.columns * pixel_length
+        frame_length = cast(int, runner.frame_length(unit="bytes"))
+
+        rows, columns = roi
+        nr_rows = rows.stop - rows.start
+        nr_columns = columns.stop - columns.start
+        arr = np.empty(
+            (len(indices), nr_rows, nr_columns, samples_per_pixel), dtype=dtype
+        )
+
+        src = cast(BinaryIO, runner.src)
+        file_offset = src.tell()
+        # Either read each row's column span separately, skipping over the
+        #   unwanted columns, or read entire rows and crop afterwards
+        read_spans = (runner.columns - nr_columns) * pixel_length
+        read_spans = read_spans >= _ROI_ROW_READ_THRESHOLD
+        try:
+            for frame, idx in zip(arr, indices):
+                offset = file_offset + idx * frame_length + rows.start * row_length
+                if read_spans:
+                    offset += columns.start * pixel_length
+                    for row in frame:
+                        src.seek(offset)
+                        buffer = src.read(row.nbytes)
+                        if len(buffer) != row.nbytes:
+                            raise ValueError(
+                                "There is insufficient pixel data to contain "
+                                f"{idx + 1} frames"
+                            )
+
+                        row[:] = np.frombuffer(buffer, dtype=dtype).reshape(row.shape)
+                        offset += row_length
+
+                    continue
+
+                src.seek(offset)
+                buffer = src.read(nr_rows * row_length)
+                if len(buffer) != nr_rows * row_length:
+                    raise ValueError(
+                        f"There is insufficient pixel data to contain {idx + 1} frames"
+                    )
+
+                frame[:] = np.frombuffer(buffer, dtype=dtype).reshape(
+                    nr_rows, runner.columns, samples_per_pixel
+                )[:, columns]
+        finally:
+            src.seek(file_offset)
+
+        # Match the shape given by reshape(), keeping any length 1 region dimensions
+        if index is not None or number_of_frames == 1:
+            arr = arr[0]
+
+        return arr if samples_per_pixel > 1 else arr[..., 0]
+
     def as_buffer(
         self,
         src: "Dataset | Buffer | BinaryIO",
@@ -1797,13 +2229,15 @@ class Decoder(CoderBase):
         runner.set_decoders(
             cast(
                 dict[str, "DecodeFunction"],
-                self._validate_plugins(decoding_plugin),
+                self._validate_plugins(decoding_plugin, runner),
             ),
         )
 
         if validate:
             runner.validate()
 
+        runner._set_reduction()
+
         if self.is_native:
             buffer = self._as_buffer_native(runner, index)
         else:
@@ -1971,6 +2405,10 @@ class Decoder(CoderBase):
 
             file_offset = 0
             length_source: int | float = len(src)
+        elif (mapped := runner._memory_map()) is not None:
+            src = mapped
+            file_offset = cast(BinaryIO, runner.src).tell()
+            length_source = len(src) - file_offset
         else:
             src = cast(BinaryIO, runner.src)
             file_offset = src.tell()
@@ -2032,6 +2470,76 @@ class Decoder(CoderBase):
         length_bytes *= runner.number_of_frames
         return runner.get_data(src, file_offset, ceil(length_bytes))
 
+    def calibrate(
+        self,
+        src: "Dataset | Buffer | BinaryIO",
+        *,
+        index: int = 0,
+        nr_runs: int = 3,
+        **kwargs: Any,
+    ) -> tuple[str, ...]:
+        """Rank the available plugins by how quickly they decode a frame of the
+        pixel data in `src`.
+
+        .. versionadded:: 3.1
+
+        The frame at `index` is decoded `nr_runs` times by each available
+        plugin and the fastest time is kept. Plugins that fail to decode the
+        frame, or whose decoded frame doesn't match that of the other plugins,
+        are excluded from the ranking. For lossless transfer syntaxes the
+        decoded frames must be identical, otherwise they must have the same
+        shape and dtype.
+
+        The ranking is stored for the (*Bits Allocated*, *Samples per
+        Pixel*) of `src`, and when no `decoding_plugin` is specified later
+        decoding of matching pixel data tries the ranked plugins fastest first.
+        Use :attr:`rankings` and :meth:`set_ranking` to save and restore the
+        rankings.
+
+        Parameters
+        ----------
+        src : pydicom.dataset.Dataset | bytes | bytearray | memoryview | file-like
+            The encoded pixel data, see :meth:`as_array` for more information.
+        index : int, optional
+            The index of the frame to use, default ``0``.
+        nr_runs : int, optional
+            The number of times to decode the frame with each plugin, default
+            ``3``.
+        **kwargs
+            Required and optional parameters for the decoding plugins, see
+            :meth:`as_array` for more information.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The names of the plugins, ordered fastest first.
+        """
+        if self.is_native:
+            return ()
+
+        runner = DecodeRunner(self.UID)
+        runner.set_source(src)
+        runner.set_options(**kwargs)
+        runner.validate()
+
+        results = {}
+        for name in self._validate_plugins():
+            try:
+                timings = []
+                for _ in range(max(nr_runs, 1)):
+                    start = perf_counter()
+                    arr, _ = self.as_array(
+                        src, index=index, decoding_plugin=name, **kwargs
+                    )
+                    timings.append(perf_counter() - start)
+            except Exception as exc:
+                LOGGER.debug(f"The '{name}' plugin failed to decode the frame: {exc}")
+                continue
+
+            results[name] = (min(timings), arr)
+
+        return self._rank_plugins(runner, results, exact=self.UID in LOSSLESS_SYNTAXES)
+
     def iter_array(
         self,
         src: "Dataset | Buffer | BinaryIO",
@@ -2040,6 +2548,7 @@ class Decoder(CoderBase):
         raw: bool = False,
         validate: bool = True,
         decoding_plugin: str = "",
+        roi: tuple[slice, slice] | None = None,
         **kwargs: Any,
     ) -> Iterator[tuple["np.ndarray", dict[str, str | int]]]:
         """Yield pixel data frames as :class:`~numpy.ndarray`.
@@ -2116,6 +2625,14 @@ class Decoder(CoderBase):
             available plugins will be tried and the result from the first successful
             one yielded. For information on the available plugins for each
             decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+        roi : tuple[slice, slice] | None, optional
+            If used then yield only the region of interest given by
+            ``(row_slice, column_slice)`` from each frame, where the slices
+            must have a step of ``1``. For natively encoded pixel data in a
+            file-like `src` only the rows within the region will be read,
+            otherwise each frame will be cropped after decoding.
+
+            .. versionadded:: 3.1
         **kwargs
             Optional keyword parameters for controlling decoding are also
             available, please see the :doc:`decoding options documentation
@@ -2157,7 +2674,7 @@ class Decoder(CoderBase):
         runner.set_decoders(
             cast(
                 dict[str, "DecodeFunction"],
-                self._validate_plugins(decoding_plugin),
+                self._validate_plugins(decoding_plugin, runner),
             ),
         )
 
@@ -2167,6 +2684,13 @@ class Decoder(CoderBase):
         if validate:
             runner.validate()
 
+        runner._set_reduction()
+
+        if roi is not None:
+            roi = _validate_roi(roi, runner.rows, runner.columns)
+
+        key = _pixel_cache_key(self, src, raw, decoding_plugin, roi, kwargs)
+
         if self.is_native:
             func = self._as_array_native
             as_writeable = not runner.get_option("view_only", False)
@@ -2177,11 +2701,37 @@ class Decoder(CoderBase):
         log_warning = True
         # Encapsulated: all frames, separated out to allow for including excess frames
         if self.is_encapsulated and not indices:
+            # Only skip decoding if all the frames are cached, with any excess
+            #   frames cached after the expected ones
+            nr_cached = 0
+            if key is not None and all(
+                (key, idx) in pixel_cache for idx in range(runner.number_of_frames)
+            ):
+                while (key, nr_cached) in pixel_cache:
+                    if (cached := pixel_cache.get((key, nr_cached))) is None:
+                        break
+
+                    yield cached
+                    nr_cached += 1
+
+                if nr_cached >= runner.number_of_frames:
+                    return
+
             pixel_dtype = runner.pixel_dtype
             pixels_per_frame = cast(int, runner.frame_length("pixels"))
             # iter_decode() yields bytes | bytearray and may yield more frames
             #   than number_of_frames if excess frames exist
             for idx, buffer in enumerate(runner.iter_decode()):
+                if idx < nr_cached:
+                    continue
+
+                if (
+                    key is not None
+                    and (cached := pixel_cache.get((key, idx))) is not None
+                ):
+                    yield cached
+                    continue
+
                 if runner._test_for("bit_packed", idx):
                     arr = cast("np.ndarray", unpack_bits(buffer)[:pixels_per_frame])
                     bits_allocated = 8
@@ -2195,6 +2745,10 @@ class Decoder(CoderBase):
                 runner.set_frame_option(idx, "bits_allocated", bits_allocated)
 
                 arr = runner.reshape(arr, idx)
+                if roi is not None:
+                    # Copy the region so the full frame can be released
+                    arr = _crop_to_roi(arr, runner, roi).copy()
+
                 if runner._test_for("j2k_corrections"):
                     # Performs both sign and shift corrections, if needed
                     arr = _apply_j2k_corrections(arr, runner)
@@ -2209,7 +2763,11 @@ class Decoder(CoderBase):
                 if not raw:
                     arr, _ = runner.process(arr, idx)
 
-                yield arr, runner.pixel_properties(idx)
+                properties = _roi_properties(runner.pixel_properties(idx), roi)
+                if key is not None:
+                    pixel_cache.add((key, idx), arr, properties)
+
+                yield arr, properties
 
             return
 
@@ -2217,7 +2775,11 @@ class Decoder(CoderBase):
         # Encapsulated: specific frames
         indices = indices if indices else range(runner.number_of_frames)
         for idx in indices:
-            arr = func(runner, idx)
+            if key is not None and (cached := pixel_cache.get((key, idx))) is not None:
+                yield cached
+                continue
+
+            arr = func(runner, idx, roi)
             if runner._test_for("j2k_corrections"):
                 arr = _apply_j2k_corrections(arr, runner)
             elif runner._test_for("jls_sign_correction"):
@@ -2230,8 +2792,11 @@ class Decoder(CoderBase):
                 arr, _ = runner.process(arr, idx)
 
             arr = arr.copy() if not arr.flags.writeable and as_writeable else arr
+            properties = _roi_properties(runner.pixel_properties(idx), roi)
+            if key is not None:
+                pixel_cache.add((key, idx), arr, properties)
 
-            yield arr, runner.pixel_properties(idx)
+            yield arr, properties
 
     def iter_buffer(
         self,
@@ -2325,13 +2890,15 @@ class Decoder(CoderBase):
         runner.set_decoders(
             cast(
                 dict[str, "DecodeFunction"],
-                self._validate_plugins(decoding_plugin),
+                self._validate_plugins(decoding_plugin, runner),
             ),
         )
 
         if validate:
             runner.validate()
 
+        runner._set_reduction()
+
         if self.is_encapsulated and not indices:
             for idx, buffer in enumerate(runner.iter_decode()):
                 if runner._test_for("bit_unpacked", idx):
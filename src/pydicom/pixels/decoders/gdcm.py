@@ -76,6 +76,11 @@ def _decode_frame(src: bytes, runner: DecodeRunner) -> bytes:
             "GDCM does not support 'JPEG Extended' for samples with 12-bit precision"
         )
 
+    if runner.get_option("reduce", 0):
+        raise NotImplementedError(
+            "GDCM does not support decoding JPEG 2000 at a reduced resolution"
+        )
+
     if (
         tsyntax == uid.JPEGLSNearLossless
         and runner.pixel_representation == 1
@@ -120,6 +120,17 @@ def _decode_frame(src: bytes, runner: DecodeRunner) -> bytes:
 
     runner.set_frame_option(runner.index, "bits_allocated", bits_allocated)
 
+    if reduce := runner.get_option("reduce", 0):
+        # Discard the highest resolution levels while decoding
+        image.reduce = reduce  # type: ignore[assignment, method-assign]
+        image.load()
+        if image.size != (runner.columns, runner.rows):
+            raise ValueError(
+                f"Pillow decoded the frame with 'reduce={reduce}' as {image.size[1]} "
+                f"x {image.size[0]} pixels instead of the expected {runner.rows} x "
+                f"{runner.columns} pixels"
+            )
+
     # Pillow converts N-bit signed/unsigned data to 8- or 16-bit unsigned data
     #   See Pillow src/libImaging/Jpeg2KDecode.c::j2ku_gray_i
     buffer = bytearray(image.tobytes())  # so the array is writeable
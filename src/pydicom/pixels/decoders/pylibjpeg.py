@@ -85,6 +85,11 @@ def _decode_frame(src: bytes, runner: DecodeRunner) -> bytearray:  # type: ignor
             "with (0028,0100) 'Bits Allocated' = 1"
         )
 
+    if runner.get_option("reduce", 0):
+        raise NotImplementedError(
+            "pylibjpeg does not support decoding JPEG 2000 at a reduced resolution"
+        )
+
     # Currently only one pylibjpeg plugin is available per UID
     #   so decode using the first available decoder
     for _, func in sorted(_DECODERS[tsyntax].items()):
@@ -5,6 +5,7 @@ from collections.abc import Callable, Iterator, Iterable
 import logging
 import math
 import sys
+from time import perf_counter
 from typing import Any, cast, TYPE_CHECKING
 
 try:
@@ -12,13 +13,14 @@ try:
 except ImportError:
     pass
 
-from pydicom import config
+from pydicom import config, instrumentation
 from pydicom.pixels.common import (
     Buffer,
     RunnerBase,
     CoderBase,
     RunnerOptions,
     FrameOptions,
+    LOSSLESS_SYNTAXES,
 )
 from pydicom.pixels.utils import get_packed_frame
 from pydicom.uid import (
@@ -124,7 +126,14 @@ class EncodeRunner(RunnerBase):
         failure_messages = []
         for name, func in self._encoders.items():
             try:
-                return func(self.get_frame(index), self)
+                start = perf_counter() if instrumentation.enabled else 0.0
+                frame = func(self.get_frame(index), self)
+                if start:
+                    instrumentation.record(
+                        f"encode.{name}", perf_counter() - start, len(frame)
+                    )
+
+                return frame
             except Exception as exc:
                 LOGGER.exception(exc)
                 failure_messages.append(f"{name}: {exc}")
@@ -549,6 +558,79 @@ class Encoder(CoderBase):
         """
         super().__init__(uid, decoder=False)
 
+    def calibrate(
+        self,
+        src: "bytes | np.ndarray | Dataset",
+        *,
+        index: int | None = None,
+        nr_runs: int = 3,
+        **kwargs: Any,
+    ) -> tuple[str, ...]:
+        """Rank the available plugins by how quickly they encode a frame of the
+        pixel data in `src`.
+
+        .. versionadded:: 3.1
+
+        The frame at `index` is encoded `nr_runs` times by each available
+        plugin and the fastest time is kept. If a decoder is available for the
+        transfer syntax then each encoded frame is decoded and plugins whose
+        decoded frame doesn't match that of the other plugins are excluded
+        from the ranking, as are plugins that fail to encode the frame. For
+        lossless transfer syntaxes the decoded frames must be identical,
+        otherwise they must have the same shape and dtype.
+
+        The ranking is stored for the (*Bits Allocated*, *Samples per
+        Pixel*) of `src`, and when no `encoding_plugin` is specified later
+        encoding of matching pixel data tries the ranked plugins fastest first.
+        Use :attr:`rankings` and :meth:`set_ranking` to save and restore the
+        rankings.
+
+        Parameters
+        ----------
+        src : bytes, numpy.ndarray or pydicom.dataset.Dataset
+            The pixel data to be encoded, see :meth:`encode` for more
+            information.
+        index : int, optional
+            The index of the frame to use, default the first frame.
+        nr_runs : int, optional
+            The number of times to encode the frame with each plugin, default
+            ``3``.
+        **kwargs
+            Required and optional parameters for the encoding plugins, see
+            :meth:`encode` for more information.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The names of the plugins, ordered fastest first.
+        """
+        runner = EncodeRunner(self.UID)
+        runner.set_source(src)
+        runner.set_options(**kwargs)
+        runner.validate()
+        if runner.number_of_frames > 1 and index is None:
+            index = 0
+
+        results = {}
+        for name in self._validate_plugins():
+            try:
+                timings = []
+                for _ in range(max(nr_runs, 1)):
+                    start = perf_counter()
+                    frame = self.encode(
+                        src, index=index, encoding_plugin=name, **kwargs
+                    )
+                    timings.append(perf_counter() - start)
+
+                arr = _decode_frame(frame, runner)
+            except Exception as exc:
+                LOGGER.debug(f"The '{name}' plugin failed to encode the frame: {exc}")
+                continue
+
+            results[name] = (min(timings), arr)
+
+        return self._rank_plugins(runner, results, exact=self.UID in LOSSLESS_SYNTAXES)
+
     def encode(
         self,
         src: "bytes | np.ndarray | Dataset",
@@ -646,7 +728,7 @@ class Encoder(CoderBase):
         runner.set_encoders(
             cast(
                 dict[str, "EncodeFunction"],
-                self._validate_plugins(encoding_plugin),
+                self._validate_plugins(encoding_plugin, runner),
             ),
         )
 
@@ -753,7 +835,7 @@ class Encoder(CoderBase):
         runner.set_encoders(
             cast(
                 dict[str, "EncodeFunction"],
-                self._validate_plugins(encoding_plugin),
+                self._validate_plugins(encoding_plugin, runner),
             ),
         )
 
@@ -771,6 +853,37 @@ class Encoder(CoderBase):
             yield runner.encode(index)
 
 
+def _decode_frame(src: bytes, runner: EncodeRunner) -> "np.ndarray | None":
+    """Return the encoded frame `src` decoded as an :class:`~numpy.ndarray`,
+    or ``None`` if no decoder is available.
+    """
+    from pydicom.encaps import encapsulate
+    from pydicom.pixels.decoders.base import get_decoder
+
+    try:
+        decoder = get_decoder(runner.transfer_syntax)
+    except NotImplementedError:
+        return None
+
+    if not decoder.is_available:
+        return None
+
+    opts = {
+        "rows": runner.rows,
+        "columns": runner.columns,
+        "samples_per_pixel": runner.samples_per_pixel,
+        "bits_allocated": runner.bits_allocated,
+        "bits_stored": runner.bits_stored,
+        "pixel_representation": runner.pixel_representation,
+        "photometric_interpretation": runner.photometric_interpretation,
+        "number_of_frames": 1,
+    }
+    if runner.samples_per_pixel > 1:
+        opts["planar_configuration"] = runner.planar_configuration
+
+    return decoder.as_array(encapsulate([src]), raw=True, **opts)[0]
+
+
 # UID: [
 #   Photometric Interpretation (the intended value *after* encoding),
 #   Samples per Pixel,
@@ -20,6 +20,7 @@ try:
 except ImportError:
     HAVE_PIL = False
 
+from pydicom import instrumentation
 from pydicom.data import get_palette_files
 from pydicom.misc import warn_and_log
 from pydicom.uid import UID
@@ -39,6 +40,7 @@ _CMS_INTENTS = {
 }
 
 
+@instrumentation.timed("lut.apply_color_lut")
 def apply_color_lut(
     arr: "np.ndarray", ds: "Dataset | None" = None, palette: str | UID | None = None
 ) -> "np.ndarray":
@@ -338,6 +340,7 @@ def apply_icc_profile(
     return arr
 
 
+@instrumentation.timed("lut.apply_modality_lut")
 def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
     """Apply a modality lookup table or rescale operation to `arr`.
 
@@ -424,6 +427,7 @@ def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
     return arr
 
 
+@instrumentation.timed("lut.apply_presentation_lut")
 def apply_presentation_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
     """Apply a Presentation LUT to `arr` and return the P-values.
 
@@ -503,6 +507,7 @@ def apply_presentation_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
 apply_rescale = apply_modality_lut
 
 
+@instrumentation.timed("lut.apply_voi_lut")
 def apply_voi_lut(
     arr: "np.ndarray", ds: "Dataset", index: int = 0, prefer_lut: bool = True
 ) -> "np.ndarray":
@@ -586,6 +591,7 @@ def apply_voi_lut(
     return arr
 
 
+@instrumentation.timed("lut.apply_voi")
 def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
     """Apply a VOI lookup table to `arr`.
 
@@ -687,6 +693,7 @@ def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
     return cast("np.ndarray", lut_data[clipped_iv])
 
 
+@instrumentation.timed("lut.apply_windowing")
 def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
     """Apply a windowing operation to `arr`.
 
@@ -822,6 +829,7 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
     return arr
 
 
+@instrumentation.timed("convert_color_space")
 def convert_color_space(
     arr: "np.ndarray",
     current: str,
@@ -1,7 +1,8 @@
 # Copyright 2008-2024 pydicom authors. See LICENSE file for details.
 """Utilities for pixel data handling."""
 
-from collections.abc import Iterable, Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
 
 try:
     from collections.abc import Buffer  # type: ignore[attr-defined]
@@ -9,10 +10,12 @@ except ImportError:
     from collections.abc import ByteString as Buffer  # Python 3.10, 3.11
 import math
 import importlib
+import itertools
 import logging
 from pathlib import Path
 from struct import pack, unpack, Struct
 from sys import byteorder
+from threading import Lock
 from typing import BinaryIO, Any, cast, TYPE_CHECKING
 from collections.abc import Sequence
 
@@ -26,6 +29,7 @@ except ImportError:
 from pydicom.charset import default_encoding
 from pydicom._dicom_dict import DicomDictionary
 from pydicom.encaps import encapsulate, encapsulate_extended
+from pydicom.fileutil import open_readable
 from pydicom.misc import warn_and_log
 from pydicom.tag import BaseTag
 from pydicom.uid import (
@@ -40,6 +44,7 @@ from pydicom.valuerep import VR
 if TYPE_CHECKING:  # pragma: no cover
     from os import PathLike
     from pydicom.dataset import Dataset
+    from pydicom.pixels.decoders.base import Decoder
 
 
 LOGGER = logging.getLogger(__name__)
@@ -74,6 +79,8 @@ _UNPACK_LUT: dict[int, bytes] = {
 _PACK_LUT: dict[bytes, bytes] = {
     v: k.to_bytes(length=1, byteorder="little") for k, v in _UNPACK_LUT.items()
 }
+# The maximum number of pixels to unpack at once with unpack_frames()
+_UNPACK_BATCH_PIXELS = 2**24
 
 # JPEG/JPEG-LS SOF markers
 _SOF = {
@@ -97,6 +104,188 @@ _APP = {x.to_bytes(length=2, byteorder="big") for x in range(0xFFE0, 0xFFF0)}
 _UNPACK_SHORT = Struct(">H").unpack
 
 
+class PixelCache:
+    """A thread-safe cache of decoded pixel data with a memory budget.
+
+    .. versionadded:: 3.1
+
+    When enabled, the arrays returned by :func:`~pydicom.pixels.pixel_array`,
+    :func:`~pydicom.pixels.iter_pixels`, :attr:`Dataset.pixel_array
+    <pydicom.dataset.Dataset.pixel_array>` and the :meth:`Decoder.as_array()
+    <pydicom.pixels.decoders.base.Decoder.as_array>` and :meth:`Decoder.iter_array()
+    <pydicom.pixels.decoders.base.Decoder.iter_array>` methods are cached using
+    the source of the pixel data, the frame index and the decoding options. The
+    least recently used arrays are discarded when the total size of the cached
+    arrays would exceed the budget.
+
+    The source of the pixel data is identified by:
+
+    * For a file: its path, modification time and size, and the offset to the
+      pixel data.
+    * For a :class:`~pydicom.dataset.Dataset` or :class:`bytes`: the length and
+      hash of the encoded pixel data, so different datasets read from the same
+      file share the cached arrays. Only compressed pixel data is cached as
+      returning uncompressed pixel data from memory is already cheap.
+
+    Pixel data in mutable buffers, and uncompressed pixel data returned using
+    the `view_only` decoding option, are never cached. Each cached array is a
+    read-only copy and a new writeable copy is returned for each hit, so
+    changes to a returned array don't affect the cache.
+
+    The cache used when decoding is ``pydicom.pixels.utils.pixel_cache``, which
+    is disabled by default.
+
+    Examples
+    --------
+
+    Enable the cache with a 2 GiB budget and check how effective it's been::
+
+        from pydicom.pixels import pixel_array
+        from pydicom.pixels.utils import pixel_cache
+
+        pixel_cache.max_bytes = 2 * 1024**3
+        for path in paths * 3:
+            arr = pixel_array(path)
+
+        print(pixel_cache.hits, pixel_cache.misses, pixel_cache.hit_rate)
+    """
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        """Create a new ``PixelCache``.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The maximum total size of the cached arrays in bytes, if ``0``
+            (default) then the cache is disabled.
+        """
+        self._arrays: OrderedDict[
+            Hashable, tuple["np.ndarray", dict[str, str | int]]
+        ] = OrderedDict()
+        self._lock = Lock()
+        self._max_bytes = 0
+        self._nbytes = 0
+        self.max_bytes = max_bytes
+        #: The number of arrays returned from the cache
+        self.hits = 0
+        #: The number of arrays that weren't in the cache
+        self.misses = 0
+        #: The number of arrays discarded to keep within the budget
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return ``True`` if there's a cached array for `key`."""
+        return key in self._arrays
+
+    def __len__(self) -> int:
+        """Return the number of cached arrays."""
+        return len(self._arrays)
+
+    def add(
+        self, key: Hashable, arr: "np.ndarray", properties: dict[str, str | int]
+    ) -> None:
+        """Add a copy of `arr` and its pixel `properties` to the cache.
+
+        Arrays larger than :attr:`max_bytes` aren't cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for the array.
+        arr : numpy.ndarray
+            The decoded pixel data.
+        properties : dict[str, str | int]
+            The :dcm:`Image Pixel<part03/sect_C.7.6.3.html>` module element
+            values that describe `arr`.
+        """
+        if arr.nbytes > self._max_bytes:
+            return
+
+        arr = arr.copy()
+        arr.flags.writeable = False
+        with self._lock:
+            if (previous := self._arrays.pop(key, None)) is not None:
+                self._nbytes -= previous[0].nbytes
+
+            self._arrays[key] = (arr, properties.copy())
+            self._nbytes += arr.nbytes
+            self._evict(self._max_bytes)
+
+    def clear(self) -> None:
+        """Remove all the cached arrays and reset the statistics."""
+        with self._lock:
+            self._arrays.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _evict(self, max_bytes: int) -> None:
+        """Discard the least recently used arrays until the total size is no
+        more than `max_bytes`, must be called while holding the lock.
+        """
+        while self._nbytes > max_bytes:
+            arr, _ = self._arrays.popitem(last=False)[1]
+            self._nbytes -= arr.nbytes
+            self.evictions += 1
+
+    def get(self, key: Hashable) -> tuple["np.ndarray", dict[str, str | int]] | None:
+        """Return a writeable copy of the cached array for `key` and its
+        pixel properties, or ``None`` if it's not in the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for the array.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, dict[str, str | int]] | None
+            The cached array and its properties, or ``None`` if there's no
+            cached array for `key`.
+        """
+        with self._lock:
+            item = self._arrays.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            self._arrays.move_to_end(key)
+            self.hits += 1
+
+        return item[0].copy(), item[1].copy()
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of arrays returned from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def max_bytes(self) -> int:
+        """Get or set the maximum total size of the cached arrays in bytes,
+        with ``0`` to disable the cache.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("'max_bytes' must be greater than or equal to 0")
+
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict(max_bytes)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the total size of the cached arrays in bytes."""
+        return self._nbytes
+
+
+pixel_cache = PixelCache()
+
+
 def _array_common(
     f: BinaryIO, specific_tags: list[BaseTag | int], **kwargs: Any
 ) -> tuple["Dataset", dict[str, Any]]:
@@ -686,6 +875,10 @@ def decompress(
             for arr, image_pixel in frame_generator:
                 frames.append(arr.tobytes())
 
+        # May be smaller than the original if decoded at a reduced resolution
+        ds.Rows = image_pixel["rows"]
+        ds.Columns = image_pixel["columns"]
+
         if ds.PhotometricInterpretation in (PI.YBR_FULL, PI.YBR_FULL_422):
             colorspace_changed = image_pixel["photometric_interpretation"] == PI.RGB
 
@@ -845,6 +1038,138 @@ def get_expected_length(ds: "Dataset", unit: str = "bytes") -> int:
     return length
 
 
+def get_frame_indices(
+    ds: "Dataset",
+    *,
+    segment_number: int | Iterable[int] | None = None,
+    dimension_index_values: Sequence[int | None] | None = None,
+    stack_id: str | None = None,
+    stack_position: int | Iterable[int] | None = None,
+) -> list[int]:
+    """Return the indices of the frames in `ds` that match the given functional
+    group values.
+
+    .. versionadded:: 3.1
+
+    The values for each frame are taken from the frame's item in the
+    (5200,9230) *Per-Frame Functional Groups Sequence*, or from the
+    (5200,9229) *Shared Functional Groups Sequence* if not present. Only frames
+    that match every parameter that's used are returned, and frames without a
+    value for a parameter that's used never match. The indices can then be
+    used with :func:`~pydicom.pixels.pixel_array`,
+    :func:`~pydicom.pixels.iter_pixels` or
+    :func:`~pydicom.pixels.sparse_pixel_array` to decode only the selected
+    frames.
+
+    Examples
+    --------
+
+    Return the frames for the second segment of a Segmentation instance::
+
+        from pydicom import dcmread
+        from pydicom.pixels import get_frame_indices, pixel_array
+
+        ds = dcmread("path/to/seg.dcm")
+        indices = get_frame_indices(ds, segment_number=2)
+        arr = pixel_array(ds, indices=indices)
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The multi-frame dataset containing the functional groups.
+    segment_number : int | Iterable[int] | None, optional
+        Select the frames with one of these (0062,000B) *Referenced Segment
+        Number* values in the *Segment Identification Sequence*.
+    dimension_index_values : Sequence[int | None] | None, optional
+        Select the frames with this (0020,9157) *Dimension Index Values* value
+        in the *Frame Content Sequence*, where ``None`` matches any value for
+        the corresponding dimension.
+    stack_id : str | None, optional
+        Select the frames with this (0020,9056) *Stack ID* value in the *Frame
+        Content Sequence*.
+    stack_position : int | Iterable[int] | None, optional
+        Select the frames with one of these (0020,9057) *In-Stack Position
+        Number* values in the *Frame Content Sequence*.
+
+    Returns
+    -------
+    list[int]
+        The indices of the matching frames in ascending order, starting at 0
+        for the first frame.
+
+    Raises
+    ------
+    AttributeError
+        If `ds` has no *Per-Frame Functional Groups Sequence*.
+    """
+    if "PerFrameFunctionalGroupsSequence" not in ds:
+        raise AttributeError(
+            "Unable to select frames as the dataset has no (5200,9230) "
+            "'Per-Frame Functional Groups Sequence' element"
+        )
+
+    def as_set(value: int | Iterable[int]) -> set[int]:
+        return {value} if isinstance(value, int) else set(value)
+
+    # [(sequence keyword, element keyword, match function)]
+    criteria: list[tuple[str, str, Callable[[Any], bool]]] = []
+    if segment_number is not None:
+        criteria.append(
+            (
+                "SegmentIdentificationSequence",
+                "ReferencedSegmentNumber",
+                as_set(segment_number).__contains__,
+            )
+        )
+
+    if dimension_index_values is not None:
+        expected = list(dimension_index_values)
+
+        def match_dimension(value: Any) -> bool:
+            value = [value] if isinstance(value, int) else list(value)
+            return len(value) == len(expected) and all(
+                x is None or x == y for x, y in zip(expected, value)
+            )
+
+        criteria.append(
+            ("FrameContentSequence", "DimensionIndexValues", match_dimension)
+        )
+
+    if stack_id is not None:
+        criteria.append(("FrameContentSequence", "StackID", stack_id.__eq__))
+
+    if stack_position is not None:
+        criteria.append(
+            (
+                "FrameContentSequence",
+                "InStackPositionNumber",
+                as_set(stack_position).__contains__,
+            )
+        )
+
+    shared = ds.get("SharedFunctionalGroupsSequence")
+    groups = [shared[0]] if shared else []
+
+    def get_value(item: "Dataset", sequence: str, keyword: str) -> Any:
+        for group in [item, *groups]:
+            if seq := group.get(sequence):
+                if (value := seq[0].get(keyword)) is not None:
+                    return value
+
+        return None
+
+    indices = []
+    for idx, item in enumerate(ds.PerFrameFunctionalGroupsSequence):
+        for sequence, keyword, match in criteria:
+            value = get_value(item, sequence, keyword)
+            if value is None or match(value) is not True:
+                break
+        else:
+            indices.append(idx)
+
+    return indices
+
+
 def get_image_pixel_ids(ds: "Dataset") -> dict[str, int]:
     """Return a dict of the pixel data affecting element's :func:`id` values.
 
@@ -913,6 +1238,10 @@ def get_j2k_parameters(codestream: bytes) -> dict[str, Any]:
 
     .. versionadded:: 2.1
 
+    .. versionchanged:: 3.1
+
+        Added the number of decomposition levels as ``"decomposition_levels"``.
+
     Parameters
     ----------
     codestream : bytes
@@ -924,7 +1253,8 @@ def get_j2k_parameters(codestream: bytes) -> dict[str, Any]:
         A dict containing parameters for the first component sample in the
         JPEG 2000 `codestream`, or an empty dict if unable to parse the data.
         Available parameters are ``{"precision": int, "is_signed": bool,
-        "jp2": bool}``.
+        "jp2": bool}``, plus ``{"decomposition_levels": int}`` if the
+        default coding style (COD) marker segment can be parsed.
     """
     offset = 0
     info: dict[str, Any] = {"jp2": False}
@@ -956,18 +1286,30 @@ def get_j2k_parameters(codestream: bytes) -> dict[str, Any]:
 
         # See 15444-1 A.5.1 for format of the SIZ box and contents
         ssiz = codestream[offset + 42]
-        if ssiz & 0x80:
-            info["precision"] = (ssiz & 0x7F) + 1
-            info["is_signed"] = True
-            return info
+        info["precision"] = (ssiz & 0x7F) + 1
+        info["is_signed"] = bool(ssiz & 0x80)
+    except (IndexError, TypeError):
+        return {}
 
-        info["precision"] = ssiz + 1
-        info["is_signed"] = False
-        return info
+    try:
+        # Skip the SOC marker and the SIZ marker segment then look for the COD
+        #   marker segment in the rest of the main header - 15444-1 A.6.1
+        offset += 4 + int.from_bytes(codestream[offset + 4 : offset + 6], "big")
+        while offset < len(codestream):
+            marker = codestream[offset : offset + 2]
+            if marker == b"\xff\x52":
+                info["decomposition_levels"] = codestream[offset + 9]
+                break
+
+            # Stop at the first tile-part (SOT) or if not a marker
+            if marker[0] != 0xFF or marker == b"\xff\x90":
+                break
+
+            offset += 2 + int.from_bytes(codestream[offset + 2 : offset + 4], "big")
     except (IndexError, TypeError):
         pass
 
-    return {}
+    return info
 
 
 def _get_jpg_parameters(src: bytes) -> dict[str, Any]:
@@ -1112,6 +1454,7 @@ def iter_pixels(
     indices: Iterable[int] | None = None,
     raw: bool = False,
     decoding_plugin: str = "",
+    roi: tuple[slice, slice] | None = None,
     **kwargs: Any,
 ) -> Iterator["np.ndarray"]:
     """Yield decoded pixel data frames from `src` as :class:`~numpy.ndarray`.
@@ -1214,6 +1557,12 @@ def iter_pixels(
         available plugins will be tried and the result from the first successful
         one yielded. For information on the available plugins for each
         decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+    roi : tuple[slice, slice] | None, optional
+        If used then yield only the region of interest given by
+        ``(row_slice, column_slice)`` from each frame. For natively encoded
+        pixel data in a file only the rows within the region will be read.
+
+        .. versionadded:: 3.1
     **kwargs
         Optional keyword parameters for controlling decoding are also
         available, please see the :doc:`decoding options documentation
@@ -1258,6 +1607,7 @@ def iter_pixels(
             validate=True,
             raw=raw,
             decoding_plugin=decoding_plugin,
+            roi=roi,
             **opts,
         )
         for arr, _ in iterator:
@@ -1268,7 +1618,7 @@ def iter_pixels(
     f: BinaryIO
     if not hasattr(src, "read"):
         path = Path(src).resolve(strict=True)
-        f = path.open("rb")
+        f = open_readable(path)
     else:
         f = cast(BinaryIO, src)
         file_offset = f.tell()
@@ -1303,6 +1653,7 @@ def iter_pixels(
             validate=True,
             raw=raw,
             decoding_plugin=decoding_plugin,
+            roi=roi,
             **opts,
         )
         for arr, _ in iterator:
@@ -1402,20 +1753,22 @@ def pack_bits(arr: "np.ndarray | bytes | bytearray", pad: bool = True) -> bytes:
     if arr.size == 0:
         return b""
 
-    # Test array
-    if not np.array_equal(arr, arr.astype(bool)):
+    # Test array, avoiding temporary arrays for the usual integer dtypes
+    if arr.dtype.kind in "ui":
+        is_binary = arr.min() >= 0 and arr.max() <= 1
+    elif arr.dtype.kind == "b":
+        is_binary = True
+    else:
+        is_binary = np.array_equal(arr, arr.astype(bool))
+        arr = arr.astype("u1")
+
+    if not is_binary:
         raise ValueError(
             "Only binary arrays (containing ones or zeroes) can be packed."
         )
 
-    if arr.ndim > 1:
-        arr = arr.ravel()
-
-    # The array length must be a multiple of 8, pad the end
-    if arr.shape[0] % 8:
-        arr = np.append(arr, np.zeros(8 - arr.shape[0] % 8))
-
-    arr = np.packbits(arr.astype("u1"), bitorder="little")
+    # packbits() pads the end with zeros if the length isn't a multiple of 8
+    arr = np.packbits(arr.ravel(), bitorder="little")
 
     packed: bytes = arr.tobytes()
     if pad:
@@ -1439,14 +1792,42 @@ def _passes_version_check(package_name: str, minimum_version: tuple[int, ...]) -
     return False
 
 
+def _decode_frames(
+    decoder: "Decoder",
+    src: "Dataset | BinaryIO",
+    index: int | None,
+    indices: list[int] | None,
+    **kwargs: Any,
+) -> "np.ndarray":
+    """Return the frame at `index`, the frames in `indices` or all the frames
+    in `src` as an :class:`~numpy.ndarray`.
+    """
+    if indices is None:
+        return decoder.as_array(src, index=index, **kwargs)[0]
+
+    # Decode each frame into a preallocated array so only the selected
+    #   frames are decoded and held in memory
+    arr: np.ndarray
+    frames = decoder.iter_array(src, indices=indices, **kwargs)
+    for idx, (frame, _) in enumerate(frames):
+        if not idx:
+            arr = np.empty((len(indices), *frame.shape), dtype=frame.dtype)
+
+        arr[idx] = frame
+
+    return arr
+
+
 def pixel_array(
     src: "str | PathLike[str] | BinaryIO | Dataset",
     *,
     ds_out: "Dataset | None" = None,
     specific_tags: list[int] | None = None,
     index: int | None = None,
+    indices: Iterable[int] | None = None,
     raw: bool = False,
     decoding_plugin: str = "",
+    roi: tuple[slice, slice] | None = None,
     **kwargs: Any,
 ) -> "np.ndarray":
     """Return decoded pixel data from `src` as :class:`~numpy.ndarray`.
@@ -1513,6 +1894,21 @@ def pixel_array(
         with open("path/to/dataset.dcm", "rb") as f:
             arr = pixel_array(f, index=2)  # 'index' starts at 0
 
+    Return the top left 64 x 64 pixels of each frame, only reading the required
+    rows from the file if the pixel data is uncompressed::
+
+        from pydicom.pixels import pixel_array
+
+        arr = pixel_array("path/to/dataset.dcm", roi=(slice(64), slice(64)))
+
+    Return only the frames for the first segment of a Segmentation instance::
+
+        from pydicom import dcmread
+        from pydicom.pixels import get_frame_indices, pixel_array
+
+        ds = dcmread("path/to/seg.dcm")
+        arr = pixel_array(ds, indices=get_frame_indices(ds, segment_number=1))
+
     Parameters
     ----------
     src : str | PathLike[str] | file-like | pydicom.dataset.Dataset
@@ -1535,6 +1931,12 @@ def pixel_array(
         If ``None`` (default) then return an array containing all the
         frames in the pixel data, otherwise return only the frame from the
         specified `index`, which starts at 0 for the first frame.
+    indices : Iterable[int] | None, optional
+        If used then return an array containing only the frames specified by
+        `indices`, in the same order, and the other frames won't be decoded.
+        Cannot be used with `index`.
+
+        .. versionadded:: 3.1
     raw : bool, optional
         If ``True`` then return the decoded pixel data after only
         minimal processing (see the processing section above). If ``False``
@@ -1547,6 +1949,12 @@ def pixel_array(
         available plugins will be tried and the result from the first successful
         one returned. For information on the available plugins for each
         decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+    roi : tuple[slice, slice] | None, optional
+        If used then return only the region of interest given by
+        ``(row_slice, column_slice)`` from each frame. For natively encoded
+        pixel data in a file only the rows within the region will be read.
+
+        .. versionadded:: 3.1
     **kwargs
         Optional keyword parameters for controlling decoding, please see the
         :doc:`decoding options documentation</guides/decoding/decoder_options>`
@@ -1562,6 +1970,8 @@ def pixel_array(
         * (frames, rows, columns) for multi-frame, single sample data
         * (frames, rows, columns, samples) for multi-frame, multi-sample data
 
+        When `indices` is used the array always has a frames dimension.
+
         A writeable :class:`~numpy.ndarray` is returned by default. For
         native transfer syntaxes with ``view_only=True`` a read-only
         :class:`~numpy.ndarray` will be returned.
@@ -1569,6 +1979,14 @@ def pixel_array(
     from pydicom.dataset import Dataset
     from pydicom.pixels import get_decoder
 
+    if indices is not None:
+        if index is not None:
+            raise ValueError("Only one of 'index' or 'indices' may be used")
+
+        indices = list(indices)
+        if not indices:
+            raise ValueError("'indices' must contain at least one frame index")
+
     if isinstance(src, Dataset):
         ds: Dataset = src
         file_meta = getattr(ds, "file_meta", {})
@@ -1587,19 +2005,22 @@ def pixel_array(
             )
 
         opts = as_pixel_options(ds, **kwargs)
-        return decoder.as_array(
+        return _decode_frames(
+            decoder,
             ds,
-            index=index,
+            index,
+            indices,
             validate=True,
             raw=raw,
             decoding_plugin=decoding_plugin,
+            roi=roi,
             **opts,
-        )[0]
+        )
 
     f: BinaryIO
     if not hasattr(src, "read"):
         path = Path(src).resolve(strict=True)
-        f = path.open("rb")
+        f = open_readable(path)
     else:
         f = cast(BinaryIO, src)
         file_offset = f.tell()
@@ -1622,13 +2043,16 @@ def pixel_array(
                 f"UID' value of '{tsyntax.name}' is not supported"
             )
 
-        arr, _ = decoder.as_array(
+        arr = _decode_frames(
+            decoder,
             f,
-            index=index,
+            index,
+            indices,
             validate=True,
             raw=raw,
             decoding_plugin=decoding_plugin,
-            **opts,  # type: ignore[arg-type]
+            roi=roi,
+            **opts,
         )
     finally:
         # Close the open file only if we were the ones that opened it
@@ -2123,6 +2547,244 @@ def set_pixel_data(
         ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
 
 
+class SparseFrames:
+    """Multi-frame pixel data where only the non-empty frames are stored.
+
+    .. versionadded:: 3.1
+
+    Frames containing only zeros aren't stored and are returned as a new
+    zero-filled array when accessed. Use :func:`sparse_pixel_array` to decode
+    pixel data as a :class:`SparseFrames`.
+
+    Examples
+    --------
+
+    Access frames by their index in the pixel data or convert to a dense
+    :class:`~numpy.ndarray`::
+
+        from pydicom.pixels import sparse_pixel_array
+
+        sparse = sparse_pixel_array("path/to/seg.dcm")
+        for idx, frame in zip(sparse.indices, sparse.frames):
+            print(idx, frame.sum())
+
+        frame = sparse[10]
+        arr = sparse.to_array()
+
+    Attributes
+    ----------
+    frames : numpy.ndarray
+        The non-empty frames, shaped as (frames, rows, columns) or (frames,
+        rows, columns, samples).
+    indices : tuple[int, ...]
+        The index in the pixel data of each frame in `frames`.
+    nr_frames : int
+        The total number of frames in the pixel data.
+    """
+
+    def __init__(
+        self, frames: "np.ndarray", indices: Iterable[int], nr_frames: int
+    ) -> None:
+        """Create a new :class:`SparseFrames`.
+
+        Parameters
+        ----------
+        frames : numpy.ndarray
+            The non-empty frames, shaped as (frames, rows, columns) or
+            (frames, rows, columns, samples).
+        indices : Iterable[int]
+            The index in the pixel data of each frame in `frames`.
+        nr_frames : int
+            The total number of frames in the pixel data.
+        """
+        self.frames = frames
+        self.indices = tuple(indices)
+        self.nr_frames = nr_frames
+
+        if len(self.indices) != len(frames):
+            raise ValueError(
+                f"The number of 'indices' ({len(self.indices)}) doesn't match "
+                f"the number of 'frames' ({len(frames)})"
+            )
+
+        if any(idx < 0 or idx >= nr_frames for idx in self.indices):
+            raise ValueError(
+                f"The 'indices' must be in the range [0, {nr_frames}) for pixel "
+                f"data with {nr_frames} frames"
+            )
+
+        self._lookup = {idx: ii for ii, idx in enumerate(self.indices)}
+
+    def __array__(
+        self, dtype: "np.dtype | None" = None, copy: bool | None = None
+    ) -> "np.ndarray":
+        """Return the dense array, for use with :func:`numpy.asarray`."""
+        arr = self.to_array()
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    @property
+    def dtype(self) -> "np.dtype":
+        """Return the :class:`~numpy.dtype` of the frames."""
+        return self.frames.dtype
+
+    def __getitem__(self, index: int) -> "np.ndarray":
+        """Return the frame at `index` in the pixel data."""
+        if not -self.nr_frames <= index < self.nr_frames:
+            raise IndexError(
+                f"Frame index {index} is out of range for pixel data with "
+                f"{self.nr_frames} frames"
+            )
+
+        if (idx := self._lookup.get(index % self.nr_frames)) is not None:
+            return self.frames[idx]
+
+        return np.zeros(self.frames.shape[1:], dtype=self.frames.dtype)
+
+    def __len__(self) -> int:
+        """Return the total number of frames in the pixel data."""
+        return self.nr_frames
+
+    def __repr__(self) -> str:
+        """Return a string representation of the class."""
+        return (
+            f"<SparseFrames: {len(self.indices)} of {self.nr_frames} frames, "
+            f"shape {self.shape}, dtype '{self.dtype}'>"
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Return the shape of the dense array."""
+        return (self.nr_frames, *self.frames.shape[1:])
+
+    def to_array(self) -> "np.ndarray":
+        """Return the pixel data as a dense :class:`~numpy.ndarray` shaped as
+        (frames, rows, columns) or (frames, rows, columns, samples).
+        """
+        arr = np.zeros(self.shape, dtype=self.frames.dtype)
+        arr[list(self.indices)] = self.frames
+
+        return arr
+
+
+def sparse_pixel_array(
+    src: "str | PathLike[str] | BinaryIO | Dataset",
+    *,
+    ds_out: "Dataset | None" = None,
+    specific_tags: list[BaseTag | int] | None = None,
+    indices: Iterable[int] | None = None,
+    raw: bool = False,
+    decoding_plugin: str = "",
+    **kwargs: Any,
+) -> SparseFrames:
+    """Return decoded pixel data from `src` as :class:`SparseFrames`, keeping
+    only the frames that contain non-zero pixels.
+
+    .. versionadded:: 3.1
+
+    .. warning::
+
+        This function requires `NumPy <https://numpy.org/>`_ and may require
+        the installation of additional packages to perform the actual pixel
+        data decompression. See the :doc:`pixel data decompression documentation
+        </guides/user/image_data_handlers>` for more information.
+
+    Frames are decoded one at a time, so memory usage is proportional to the
+    number of non-empty frames rather than the total number of frames, which
+    is suited to multi-frame objects that are mostly empty, such as
+    Segmentations. The same processing as :func:`~pydicom.pixels.iter_pixels`
+    is performed on each frame.
+
+    Examples
+    --------
+
+    Decode the non-empty frames for the first segment of a Segmentation
+    instance::
+
+        from pydicom import dcmread
+        from pydicom.pixels import get_frame_indices, sparse_pixel_array
+
+        ds = dcmread("path/to/seg.dcm")
+        indices = get_frame_indices(ds, segment_number=1)
+        sparse = sparse_pixel_array(ds, indices=indices)
+
+    Parameters
+    ----------
+    src : str | PathLike[str] | file-like | pydicom.dataset.Dataset
+
+        * :class:`str` | :class:`os.PathLike`: the path to a DICOM dataset
+          containing pixel data, or
+        * file-like: a `file-like object
+          <https://docs.python.org/3/glossary.html#term-file-object>`_ in
+          'rb' mode containing the dataset.
+        * :class:`~pydicom.dataset.Dataset`: a dataset instance
+    ds_out : pydicom.dataset.Dataset, optional
+        A :class:`~pydicom.dataset.Dataset` that will be updated with the
+        non-retired group ``0x0028`` image pixel module elements and the group
+        ``0x0002`` file meta information elements from the dataset in `src`.
+        **Only available when `src` is a path or file-like.**
+    specific_tags : list[int | pydicom.tag.BaseTag], optional
+        A list of additional tags from the dataset in `src` to be added to the
+        `ds_out` dataset.
+    indices : Iterable[int] | None, optional
+        If ``None`` (default) then decode all the frames in the pixel data,
+        otherwise only decode the frames specified by `indices`.
+    raw : bool, optional
+        If ``True`` then decode the pixel data after only minimal processing,
+        see :func:`~pydicom.pixels.iter_pixels` for more information.
+    decoding_plugin : str, optional
+        The name of the decoding plugin to use when decoding compressed
+        pixel data. If no `decoding_plugin` is specified (default) then all
+        available plugins will be tried and the result from the first successful
+        one used. For information on the available plugins for each
+        decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+    **kwargs
+        Optional keyword parameters for controlling decoding, please see the
+        :doc:`decoding options documentation</guides/decoding/decoder_options>`
+        for more information.
+
+    Returns
+    -------
+    SparseFrames
+        The non-empty frames and their indices in the pixel data.
+    """
+    from pydicom.dataset import Dataset
+
+    if indices is not None:
+        indices = list(indices)
+        if not indices:
+            raise ValueError("'indices' must contain at least one frame index")
+
+    # Needed to get the total number of frames when `src` is a path or file-like
+    ds = src if isinstance(src, Dataset) else ds_out
+    if ds is None:
+        ds = Dataset()
+
+    iterator = iter_pixels(
+        src,
+        ds_out=ds,
+        specific_tags=specific_tags,
+        indices=indices,
+        raw=raw,
+        decoding_plugin=decoding_plugin,
+        **kwargs,
+    )
+
+    frames = []
+    kept = []
+    # Exhaust `iterator` first so the file is closed (if required)
+    for arr, idx in zip(iterator, indices or itertools.count()):
+        if arr.any():
+            frames.append(arr)
+            kept.append(idx)
+
+    if frames:
+        stacked = np.stack(frames)
+    else:
+        stacked = np.empty((0, *arr.shape), dtype=arr.dtype)
+
+    return SparseFrames(stacked, kept, int(get_nr_frames(ds, warn=False)))
+
+
 def unpack_bits(src: bytes, as_array: bool = True) -> "np.ndarray | bytes":
     """Unpack the bit-packed data in `src`.
 
@@ -2385,62 +3047,174 @@ def concatenate_packed_frames(
         return pack_bits(out, pad=pad)
 
     # Efficient implementation using NumPy to shift bits between bytes
-
-    # Pre-allocate an output array
-    total_bytes = math.ceil(len(frames) * frame_length / 8)
+    nr_frames = len(frames)
+    total_bytes = math.ceil(nr_frames * frame_length / 8)
     if pad and total_bytes % 2 == 1:
         total_bytes += 1
-    out_arr = np.zeros(total_bytes, dtype=np.uint8)
-
-    # Temporary buffer re-used in the loop
-    tmp = np.empty(bytes_per_frame, dtype=np.uint8)
 
-    for idx, frame in enumerate(frames):
-        pixel_start = idx * frame_length
+    # Mask out any bits at the end of each frame that aren't part of it
+    src = np.frombuffer(bytearray().join(frames), dtype=np.uint8)
+    src = src.reshape(nr_frames, bytes_per_frame)
+    src[:, -1] &= (1 << frame_length % 8) - 1
+
+    # The bit offset of each frame repeats every `period` frames, which
+    #   together span `stride` bytes of the output
+    period = 8 // math.gcd(frame_length, 8)
+    stride = period * frame_length // 8
+    if stride <= bytes_per_frame:
+        # Frames are too short to shift as groups, so unpack and repack them
+        unpacked = np.unpackbits(src, axis=1, count=frame_length, bitorder="little")
+        out_arr = np.zeros(total_bytes, dtype=np.uint8)
+        packed = np.packbits(unpacked.ravel(), bitorder="little")
+        out_arr[: len(packed)] = packed
+
+        return cast(bytes, out_arr.tobytes())
+
+    # Shift all the frames with the same bit offset at once, the frames in each
+    #   group are `stride` bytes apart in the output and don't overlap
+    out_arr = np.zeros((math.ceil(nr_frames / period) + 1) * stride, dtype=np.uint8)
+    for offset in range(min(period, nr_frames)):
+        pixel_start = offset * frame_length
         bit_offset = pixel_start % 8
+        group = src[offset::period]
+
+        first_byte_index = pixel_start // 8
+        dst = out_arr[first_byte_index : first_byte_index + len(group) * stride]
+        dst = dst.reshape(len(group), stride)
+        if not bit_offset:
+            dst[:, :bytes_per_frame] |= group
+            continue
+
+        # The bits of each input byte are split between two output bytes
+        dst[:, :bytes_per_frame] |= group << bit_offset
+        dst[:, 1 : bytes_per_frame + 1] |= group >> (8 - bit_offset)
+
+    out_arr = out_arr[:total_bytes]
+
+    return cast(bytes, out_arr.tobytes())
+
+
+def unpack_frames(
+    src: Buffer,
+    frame_length: int,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    start_offset: int = 0,
+    out: "np.ndarray | None" = None,
+) -> "np.ndarray":
+    """Unpack a range of frames from a bit-packed buffer.
+
+    .. versionadded:: 3.1
+
+    This should only be used for natively-encoded single bit data (*Bits
+    Allocated* = 1) in a "bit-packed" representation (one byte containing 8
+    pixels). Frames that don't start on a byte boundary are unpacked together
+    with the other frames rather than being shifted one at a time, and when
+    unpacking into an existing array large ranges are unpacked in batches to
+    limit the memory used.
+
+    See :dcm:`Chapter 5, 8.1.1<part05/chapter_8.html#sect_8.1.1>`, particularly
+    the note about multi-frame images with *Bits Allocated* = 1.
+
+    Parameters
+    ----------
+    src : bytes | bytearray | memoryview
+        The natively encoded bit-packed representation of a full *Pixel Data*
+        element value, potentially including multiple frames.
+    frame_length : int
+        Number of pixels in each frame.
+    start : int, optional
+        Non-negative, zero-based index of the first frame to unpack (default
+        ``0``).
+    stop : int | None, optional
+        The index of the frame after the last frame to unpack, default the
+        number of complete frames in `src`.
+    start_offset : int, optional
+        Position of the first byte of ``src`` relative to the start of the
+        pixel data. This allows for unpacking frames from a truncated input
+        buffer containing the desired frames (default ``0``).
+    out : numpy.ndarray | None, optional
+        A C-contiguous array with a ``uint8`` or ``bool`` dtype and
+        ``(stop - start) * frame_length`` elements to unpack the frames into.
+        If not used then a new array will be returned.
 
-        # Index of the byte containing the first pixel of this frame
-        first_byte_index = math.floor(pixel_start / 8)
+    Returns
+    -------
+    numpy.ndarray
+        The unpacked frames as an array of ``uint8`` shaped as ``(stop - start,
+        frame_length)``, or `out` if used.
+    """
+    if not HAVE_NP:
+        raise ImportError("NumPy is required to unpack frames.")
 
-        # Input frames may be padded. Reading the whole buffer may take us
-        # beyond the end of the output array later, so only read the necessary
-        # bytes
-        frame_array = np.frombuffer(
-            frame,
-            count=bytes_per_frame,
-            dtype=np.uint8,
+    if frame_length < 1:
+        raise ValueError("'frame_length' must be greater than 0")
+
+    if stop is None:
+        stop = (len(src) + start_offset) * 8 // frame_length
+
+    if start < 0 or stop < start:
+        raise ValueError(
+            "'start' must be non-negative and no larger than 'stop', got "
+            f"'start' {start} and 'stop' {stop}"
         )
 
-        if bit_offset != 0:
-            # Need to shift bits between bytes
+    nr_frames = stop - start
+    if out is not None and (
+        out.dtype not in (np.uint8, np.bool_)
+        or out.size != nr_frames * frame_length
+        or not out.flags.c_contiguous
+        or not out.flags.writeable
+    ):
+        raise ValueError(
+            "'out' must be a writeable C-contiguous array with a 'uint8' or "
+            f"'bool' dtype and {nr_frames * frame_length} elements"
+        )
 
-            # Combine most significant bytes of this frame's first byte with
-            # least significant bits of the previous frame's last byte
-            out_arr[first_byte_index] |= frame_array[0] << bit_offset
+    byte_start = start * frame_length // 8 - start_offset
+    byte_end = math.ceil(stop * frame_length / 8) - start_offset
+    if nr_frames and byte_start < 0:
+        raise IndexError(
+            f"Requested frame with index {start} lies before the provided "
+            f"'src' given the 'start_offset' of {start_offset}"
+        )
+    if byte_end > len(src):
+        raise IndexError(
+            f"Length of 'src' ({len(src)}) bytes is insufficient to contain "
+            f"frame with index {stop - 1} with given 'frame_length' "
+            f"({frame_length} pixels)"
+        )
 
-            # Write the most significant bits from remaining bytes to the
-            # output
-            np.left_shift(
-                frame_array[1:],
-                bit_offset,
-                out=out_arr[first_byte_index + 1 : first_byte_index + len(frame_array)],
-            )
+    buffer = np.frombuffer(src, dtype=np.uint8)
+    if out is None:
+        bit_offset = start * frame_length % 8
+        unpacked = np.unpackbits(
+            buffer[max(byte_start, 0) : byte_end],
+            count=bit_offset + nr_frames * frame_length,
+            bitorder="little",
+        )
+        return unpacked[bit_offset:].reshape(nr_frames, frame_length)
+
+    # Unpack in batches to limit the memory used by the intermediate arrays,
+    #   a bool array is 1 byte per item with values 0 or 1, so can be viewed
+    #   as uint8
+    dst = out.reshape(nr_frames, frame_length).view(np.uint8)
+    batch_size = max(_UNPACK_BATCH_PIXELS // frame_length, 1)
+    for idx in range(start, stop, batch_size):
+        count = min(batch_size, stop - idx)
+        pixel_start = idx * frame_length
+        bit_offset = pixel_start % 8
+        byte_start = pixel_start // 8 - start_offset
+        byte_end = math.ceil((pixel_start + count * frame_length) / 8) - start_offset
 
-            # Combine (logical OR) the least significant bits
-            if frame_length % 8 - (8 - bit_offset) > 0:
-                n_bytes = len(frame_array)
-            else:
-                n_bytes = len(frame_array) - 1
-            np.right_shift(frame_array, 8 - bit_offset, out=tmp)
-            np.bitwise_or(
-                out_arr[first_byte_index + 1 : first_byte_index + 1 + n_bytes],
-                tmp[:n_bytes],
-                out=out_arr[first_byte_index + 1 : first_byte_index + 1 + n_bytes],
-            )
-        else:
-            # No shifting needed, just write straight to the output array
-            out_arr[first_byte_index : first_byte_index + len(frame_array)] = (
-                frame_array
-            )
+        unpacked = np.unpackbits(
+            buffer[byte_start:byte_end],
+            count=bit_offset + count * frame_length,
+            bitorder="little",
+        )
+        dst[idx - start : idx - start + count] = unpacked[bit_offset:].reshape(
+            count, frame_length
+        )
 
-    return cast(bytes, out_arr.tobytes())
+    return out
@@ -5,6 +5,7 @@ import datetime
 import math
 from decimal import Decimal
 from enum import Enum, unique
+from functools import lru_cache
 import re
 from math import floor, isfinite, log10
 from typing import Optional, Any, cast
@@ -168,7 +169,7 @@ def validate_regex(vr: str, value: Any) -> tuple[bool, str]:
         else:
             regex = BYTE_VR_REGEXES[vr]
             newline = 10  # newline character
-        if not re.match(regex, value) or value and value[-1] == newline:
+        if not regex.match(value) or value[-1] == newline:
             return False, f"Invalid value for VR {vr}: {value!r}."
     return True, ""
 
@@ -401,6 +402,30 @@ VALIDATORS = {
 }
 
 
+# VRs with validators that are worth caching the results of, excludes UR as
+#   its values may be very long
+_CACHED_VALIDATION_VRS = {
+    "AE",
+    "AS",
+    "CS",
+    "DA",
+    "DS",
+    "DT",
+    "IS",
+    "PN",
+    "TM",
+    "UI",
+}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_validation(
+    validator: Callable[[str, Any], tuple[bool, str]], vr: str, value: str | bytes
+) -> tuple[bool, str]:
+    """Return the cached validation result for `value`."""
+    return validator(vr, value)
+
+
 def validate_value(
     vr: str,
     value: Any,
@@ -434,7 +459,11 @@ def validate_value(
     if value is not None:
         validator = validator or VALIDATORS.get(vr)
         if validator is not None:
-            is_valid, msg = validator(vr, value)
+            if vr in _CACHED_VALIDATION_VRS and isinstance(value, (str, bytes)):
+                is_valid, msg = _cached_validation(validator, vr, value)
+            else:
+                is_valid, msg = validator(vr, value)
+
             if not is_valid:
                 if validation_mode == config.RAISE:
                     raise ValueError(msg)
@@ -601,6 +630,11 @@ EXPLICIT_VR_LENGTH_32 = STANDARD_VR - EXPLICIT_VR_LENGTH_16
 BUFFERABLE_VRS = (BYTES_VR | {VR.OB_OW}) - {VR.UN}
 
 
+def _is_digits(value: str) -> bool:
+    """Return ``True`` if `value` only contains the ASCII digits 0-9."""
+    return value.isascii() and value.isdigit()
+
+
 class _DateTimeBase:
     """Base class for DT, DA and TM element sub-classes."""
 
@@ -701,6 +735,7 @@ class DT(_DateTimeBase, datetime.datetime):
     _regex_dt = re.compile(r"((\d{4,14})(\.(\d{1,6}))?)([+-]\d{4})?")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _utc_offset(value: str) -> datetime.timezone:
         """Return the UTC Offset suffix as a :class:`datetime.timezone`.
 
@@ -722,6 +757,45 @@ class DT(_DateTimeBase, datetime.datetime):
 
         return datetime.timezone(datetime.timedelta(seconds=offset), name=value)
 
+    @classmethod
+    def _from_full_string(cls, val: str) -> Optional["DT"]:
+        """Return a **DT** for a value in the common fully specified
+        'YYYYMMDDHHMMSS[.F{1-6}][&ZZXX]' form without using a regex, or
+        ``None`` if `val` isn't in that form.
+        """
+        offset = None
+        if len(val) > 18 and val[-5] in "+-":
+            val, offset = val[:-5], val[-5:]
+            if not _is_digits(offset[1:]):
+                return None
+
+        fraction = ""
+        if len(val) != 14:
+            if not 16 <= len(val) <= 21 or val[14] != ".":
+                return None
+
+            fraction = val[15:]
+
+        if not _is_digits(val[:14]) or (fraction and not _is_digits(fraction)):
+            return None
+
+        second = int(val[12:14])
+        if second == 60:
+            # Leap seconds are handled by the regex parser
+            return None
+
+        return super().__new__(
+            cls,
+            int(val[0:4]),
+            int(val[4:6]),
+            int(val[6:8]),
+            int(val[8:10]),
+            int(val[10:12]),
+            second,
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            cls._utc_offset(offset) if offset else None,
+        )
+
     def __new__(  # type: ignore[misc]
         cls: type["DT"], *args: Any, **kwargs: Any
     ) -> Optional["DT"]:
@@ -745,6 +819,10 @@ class DT(_DateTimeBase, datetime.datetime):
             if val.strip() == "":
                 return None
 
+            dt = cls._from_full_string(val)
+            if dt is not None:
+                return dt
+
             match = cls._regex_dt.match(val)
             if not match or len(val) > 26:
                 raise ValueError(
@@ -854,6 +932,17 @@ class TM(_DateTimeBase, datetime.time):
             if val.strip() == "":
                 return None  # empty time
 
+            # Fast path for the common fully specified 'HHMMSS[.F{1-6}]' form
+            if (
+                (len(val) == 6 or (8 <= len(val) <= 13 and val[6] == "."))
+                and _is_digits(val[:6])
+                and (len(val) == 6 or _is_digits(val[7:]))
+            ):
+                hour, minute, second = int(val[0:2]), int(val[2:4]), int(val[4:6])
+                if hour < 24 and minute < 60 and second < 60:
+                    microsecond = int(val[7:].ljust(6, "0")) if len(val) > 6 else 0
+                    return super().__new__(cls, hour, minute, second, microsecond)
+
             match = cls._RE_TIME.match(val)
             if not match:
                 raise ValueError(
@@ -1419,15 +1508,29 @@ class IS(int):
         return f"'{super().__repr__()}'"
 
 
+# The encodings shared by PersonName instances, {encodings: encodings}
+_SHARED_ENCODINGS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
 def _verify_encodings(encodings: str | Sequence[str] | None) -> tuple[str, ...] | None:
     """Checks the encoding to ensure proper format"""
     if encodings is None:
         return None
 
     if isinstance(encodings, str):
-        return (encodings,)
+        encodings = (encodings,)
+    else:
+        encodings = tuple(encodings)
 
-    return tuple(encodings)
+    # Use the same tuple for equal encodings to reduce memory use
+    shared = _SHARED_ENCODINGS.get(encodings)
+    if shared is None:
+        if len(_SHARED_ENCODINGS) >= 256:
+            return encodings
+
+        shared = _SHARED_ENCODINGS.setdefault(encodings, encodings)
+
+    return shared
 
 
 def _decode_personname(
@@ -1575,10 +1678,14 @@ class PersonName:
             "middle_name",
             "name_prefix",
             "name_suffix",
-            "ideographic",
-            "phonetic",
         ]
-        return {c: getattr(self, c, "") for c in parts}
+        # Split the alphabetic component once rather than for each part
+        groups = self.alphabetic.split("^")
+        d = {c: groups[idx] if idx < len(groups) else "" for idx, c in enumerate(parts)}
+        d["ideographic"] = self.ideographic
+        d["phonetic"] = self.phonetic
+
+        return d
 
     @property
     def components(self) -> tuple[str, ...]:
@@ -3,15 +3,18 @@
 data elements to proper python types
 """
 
+from collections import OrderedDict
+from functools import wraps
 import re
 from io import BytesIO
 from struct import unpack, calcsize
+from threading import Lock
 from typing import Union, cast, Any, TypeVar
-from collections.abc import MutableSequence, Callable
+from collections.abc import Hashable, MutableSequence, Callable
 
 # don't import datetime_conversion directly
 from pydicom import config
-from pydicom.charset import default_encoding, decode_bytes
+from pydicom.charset import ESC, default_encoding, decode_bytes
 from pydicom.config import logger, have_numpy
 from pydicom.dataelem import empty_value_for_VR, RawDataElement
 from pydicom.errors import BytesLengthException
@@ -42,6 +45,163 @@ from pydicom.valuerep import PersonName
 _T = TypeVar("_T")
 
 
+class ValueCache:
+    """A thread-safe, bounded cache of decoded element values.
+
+    .. versionadded:: 3.1
+
+    When enabled, the decoded values of **AE**, **AS**, **CS**, **LO**,
+    **PN**, **SH**, **UC** and **UI** elements, and of **DA**, **DT** and **TM**
+    elements if :attr:`~pydicom.config.datetime_conversion` is ``False``, are
+    cached using their encoded value and character set, so elements with the
+    same encoded value share the same :class:`str`,
+    :class:`~pydicom.uid.UID` or :class:`~pydicom.valuerep.PersonName`
+    instance. The least recently used value is discarded when the cache is
+    full. Multi-valued elements aren't cached, and any warnings emitted while
+    validating a value are only emitted when it's first decoded.
+
+    The cache used when converting raw elements is
+    ``pydicom.values.value_cache``, which is disabled by default. The
+    :class:`~pydicom.valuerep.DA`, :class:`~pydicom.valuerep.DT` and
+    :class:`~pydicom.valuerep.TM` values created when
+    :attr:`~pydicom.config.datetime_conversion` is ``True`` are cached
+    separately by ``pydicom.values.datetime_cache``, which holds up to 4096
+    values by default.
+
+    Examples
+    --------
+
+    Enable the cache and check how effective it's been::
+
+        from pydicom.values import value_cache
+
+        value_cache.max_size = 100_000
+        datasets = [dcmread(path) for path in paths]
+        for ds in datasets:
+            ds.convert_all()
+
+        print(value_cache.hits, value_cache.misses, value_cache.hit_rate)
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """Create a new ``ValueCache``.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum number of values to cache, if ``0`` (default) then
+            the cache is disabled.
+        """
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._max_size = 0
+        self.max_size = max_size
+        #: The number of values returned from the cache
+        self.hits = 0
+        #: The number of values decoded and added to the cache
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Remove all the cached values and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, calling `func` to create it
+        if it's not in the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for the value.
+        func : Callable[[], Any]
+            A callable that returns the value for `key`. Values that are
+            :class:`~pydicom.multival.MultiValue` aren't cached.
+
+        Returns
+        -------
+        Any
+            The value for `key`.
+        """
+        with self._lock:
+            value = self._values.get(key, _MISSING)
+            if value is not _MISSING:
+                self._values.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = func()
+        if isinstance(value, MultiValue):
+            return value
+
+        with self._lock:
+            self.misses += 1
+            if self._max_size:
+                # Another thread may have added `key`, keep the existing value
+                value = self._values.setdefault(key, value)
+                self._values.move_to_end(key)
+                while len(self._values) > self._max_size:
+                    self._values.popitem(last=False)
+
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of values returned from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def max_size(self) -> int:
+        """Get or set the maximum number of cached values, with ``0`` to
+        disable the cache.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError("'max_size' must be greater than or equal to 0")
+
+        with self._lock:
+            self._max_size = max_size
+            while len(self._values) > max_size:
+                self._values.popitem(last=False)
+
+
+_MISSING = object()
+
+value_cache = ValueCache()
+
+# The DA, DT and TM values created when `config.datetime_conversion` is True
+datetime_cache = ValueCache(max_size=4096)
+
+
+def _cached(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Return `func` wrapped to use ``value_cache`` when it's enabled."""
+
+    @wraps(func)
+    def wrapper(byte_string: bytes, *args: Any, **kwargs: Any) -> Any:
+        if not value_cache._max_size or kwargs:
+            return func(byte_string, *args, **kwargs)
+
+        # The arguments are the encodings and the VR or the endianness
+        key = (
+            func,
+            byte_string,
+            *(tuple(x) if isinstance(x, MutableSequence) else x for x in args),
+        )
+        return value_cache.get(key, lambda: func(byte_string, *args))
+
+    return wrapper
+
+
 def multi_string(
     val: str, valtype: Callable[[str], _T] | None = None
 ) -> _T | MutableSequence[_T]:
@@ -100,6 +260,7 @@ def convert_tag(byte_string: bytes, is_little_endian: bool, offset: int = 0) ->
     return TupleTag(value)
 
 
+@_cached
 def convert_AE_string(
     byte_string: bytes, is_little_endian: bool, struct_format: str | None = None
 ) -> str | MutableSequence[str]:
@@ -169,7 +330,8 @@ def convert_ATvalue(
 
 
 def _DA_from_str(value: str) -> DA:
-    return DA(value.rstrip())
+    value = value.rstrip()
+    return cast(DA, datetime_cache.get((DA, value), lambda: DA(value)))
 
 
 def convert_DA_string(
@@ -281,7 +443,7 @@ def _DT_from_str(value: str) -> DT:
     if length < 4 or length > 26:
         logger.warning(f"Expected length between 4 and 26, got length {length}")
 
-    return DT(value)
+    return cast(DT, datetime_cache.get((DT, value), lambda: DT(value)))
 
 
 def convert_DT_string(
@@ -464,6 +626,7 @@ def convert_OVvalue(
     return convert_OBvalue(byte_string, is_little_endian)
 
 
+@_cached
 def convert_PN(
     byte_string: bytes, encodings: list[str] | None = None
 ) -> PersonName | MutableSequence[PersonName]:
@@ -484,7 +647,11 @@ def convert_PN(
 
     encodings = encodings or [default_encoding]
 
-    def get_valtype(x: str) -> PersonName:
+    def get_valtype(x: str | bytes) -> PersonName:
+        if isinstance(x, bytes):
+            # The encoded value is decoded on demand
+            return PersonName(x, encodings)
+
         person_name = PersonName(x, encodings)
         # Using an already decoded string in PersonName constructor leaves
         # the original string as undefined, let's set it through encode
@@ -492,13 +659,26 @@ def convert_PN(
         return person_name.decode()
 
     stripped_string = byte_string.rstrip(b"\x00 ")
-    decoded_value = decode_bytes(stripped_string, encodings, TEXT_VR_DELIMS)
-    value_split = decoded_value.split("\\")
+    value_split: list[str] | list[bytes]
+    if stripped_string.isascii() and ESC not in stripped_string:
+        # The value can be split without decoding it first as there are no
+        # multi-byte characters that may contain the delimiters
+        value_split = stripped_string.split(b"\\")
+    else:
+        decoded_value = decode_bytes(stripped_string, encodings, TEXT_VR_DELIMS)
+        value_split = decoded_value.split("\\")
+        if len(value_split) == 1:
+            # Keep the original encoded value rather than re-encoding it
+            person_name = PersonName(value_split[0], encodings)
+            person_name.original_string = stripped_string
+            return person_name
+
     if len(value_split) == 1:
         return get_valtype(value_split[0])
     return MultiValue(get_valtype, value_split)
 
 
+@_cached
 def convert_string(
     byte_string: bytes, is_little_endian: bool, struct_format: str | None = None
 ) -> str | MutableSequence[str]:
@@ -524,6 +704,7 @@ def convert_string(
     return multi_string(byte_string.decode(default_encoding))
 
 
+@_cached
 def convert_text(
     byte_string: bytes, encodings: list[str] | None = None, vr: str | None = None
 ) -> str | MutableSequence[str]:
@@ -630,7 +811,7 @@ def _TM_from_str(value: str) -> TM:
     if (length < 2 or length > 16) and length != 0:
         logger.warning(f"Expected length between 2 and 16, got length {length}")
 
-    return TM(value)
+    return cast(TM, datetime_cache.get((TM, value), lambda: TM(value)))
 
 
 def convert_TM_string(
@@ -665,6 +846,7 @@ def convert_TM_string(
     return convert_string(byte_string, is_little_endian)
 
 
+@_cached
 def convert_UI(
     byte_string: bytes, is_little_endian: bool, struct_format: str | None = None
 ) -> pydicom.uid.UID | MutableSequence[pydicom.uid.UID]:
@@ -116,3 +116,11 @@ def use_str_as_empty_text_VR_value():
 def disable_value_validation():
     with config.disable_value_validation():
         yield
+
+
+@pytest.fixture
+def deferred_validation():
+    old_value = config.settings.deferred_validation
+    config.settings.deferred_validation = True
+    yield
+    config.settings.deferred_validation = old_value
@@ -671,3 +671,43 @@ class TestCoderBase:
         )
         with pytest.raises(RuntimeError, match=msg):
             coder._validate_plugins("foo")
+
+    def test_set_ranking(self):
+        """Tests for set_ranking() and rankings"""
+        coder = CoderBase(RLELossless, decoder=True)
+        assert coder.rankings == {}
+
+        coder.set_ranking(8, 1, ["foo", "bar"])
+        coder.set_ranking(16, 3, ("bar",))
+        assert coder.rankings == {(8, 1): ("foo", "bar"), (16, 3): ("bar",)}
+
+        # Returns a copy
+        coder.rankings[(8, 1)] = ("baz",)
+        assert coder.rankings[(8, 1)] == ("foo", "bar")
+
+        coder.set_ranking(8, 1, None)
+        assert coder.rankings == {(16, 3): ("bar",)}
+        coder.set_ranking(8, 1, None)
+        assert coder.rankings == {(16, 3): ("bar",)}
+
+    def test_validate_plugins_ranked(self):
+        """Test _validate_plugins() orders the plugins using the ranking"""
+        coder = CoderBase(RLELossless, decoder=True)
+        coder._available = {"foo": 0, "bar": 1, "baz": 2}
+
+        runner = RunnerBase(RLELossless)
+        runner.set_option("bits_allocated", 8)
+        runner.set_option("samples_per_pixel", 1)
+        assert list(coder._validate_plugins(runner=runner)) == ["foo", "bar", "baz"]
+
+        # Unavailable plugins are ignored, unranked plugins are tried last
+        coder.set_ranking(8, 1, ["baz", "qux", "bar"])
+        plugins = coder._validate_plugins(runner=runner)
+        assert plugins == {"baz": 2, "bar": 1, "foo": 0}
+        assert list(plugins) == ["baz", "bar", "foo"]
+        assert list(coder._validate_plugins()) == ["foo", "bar", "baz"]
+        assert coder._validate_plugins("foo", runner) == {"foo": 0}
+
+        # Different pixel data uses a different ranking
+        runner.set_option("samples_per_pixel", 3)
+        assert list(coder._validate_plugins(runner=runner)) == ["foo", "bar", "baz"]
@@ -4,14 +4,17 @@ import importlib
 from io import BytesIO
 import logging
 from math import ceil
+import mmap
 from struct import pack, unpack
 from sys import byteorder
+import time
 
 import pytest
 
 from pydicom import config, dcmread
 from pydicom.dataset import Dataset
 from pydicom.encaps import get_frame, generate_frames, encapsulate
+from pydicom.filebase import DicomReadAheadIO
 from pydicom.pixels import get_decoder
 from pydicom.pixels.common import PhotometricInterpretation as PI
 from pydicom.pixels.decoders import ExplicitVRLittleEndianDecoder
@@ -23,7 +26,12 @@ from pydicom.pixels.decoders.base import (
     _process_color_space,
 )
 from pydicom.pixels.processing import convert_color_space
-from pydicom.pixels.utils import get_packed_frame, pack_bits
+from pydicom.pixels.utils import (
+    as_pixel_options,
+    get_packed_frame,
+    pack_bits,
+    pixel_cache,
+)
 
 from pydicom.uid import (
     ExplicitVRLittleEndian,
@@ -34,6 +42,7 @@ from pydicom.uid import (
     RLELossless,
     SMPTEST211030PCMDigitalAudio,
     JPEG2000,
+    JPEG2000Lossless,
     JPEGLSLossless,
 )
 
@@ -51,10 +60,12 @@ from .pixels_reference import (
     RLE_16_1_1F,
     RLE_16_1_10F,
     EXPL_16_1_10F,
+    EXPL_16_1_1F,
     EXPL_8_3_1F_YBR,
     EXPL_8_3_1F_YBR422,
     EXPL_1_1_1F,
     EXPB_8_1_1F,
+    J2KR_16_16_1_1_1F_M2,
 )
 
 
@@ -459,6 +470,118 @@ class TestDecodeRunner:
         with pytest.raises(RuntimeError, match=msg):
             runner.decode(0)
 
+    def test_set_reduction(self):
+        """Test _set_reduction()"""
+        # 64 x 64 with 5 decomposition levels
+        ds = J2KR_16_16_1_1_1F_M2.ds
+        runner = DecodeRunner(JPEG2000Lossless)
+        runner.set_source(ds)
+        runner._set_reduction()
+        assert runner.get_option("reduce") is None
+        assert (runner.rows, runner.columns) == (64, 64)
+
+        runner.set_option("reduce", 3)
+        runner._set_reduction()
+        assert runner.get_option("reduce") == 3
+        assert (runner.rows, runner.columns) == (8, 8)
+
+        runner = DecodeRunner(JPEG2000Lossless)
+        runner.set_source(ds)
+        runner.set_option("columns", 33)
+        runner.set_option("reduce", 1)
+        runner._set_reduction()
+        assert (runner.rows, runner.columns) == (32, 17)
+
+        # The largest reduction that isn't smaller than the target
+        for target_size, reduce in [
+            ((64, 64), 0),
+            ((33, 1), 0),
+            ((32, 20), 1),
+            ((1, 16), 2),
+            ((1, 1), 5),
+        ]:
+            runner = DecodeRunner(JPEG2000Lossless)
+            runner.set_source(ds)
+            runner.set_option("target_size", target_size)
+            runner._set_reduction()
+            assert runner.get_option("reduce") == reduce
+            assert runner.get_option("target_size") is None
+            assert runner.rows == 64 // 2**reduce
+
+    def test_set_reduction_raises(self):
+        """Test _set_reduction() raises if the options are invalid."""
+        runner = DecodeRunner(RLELossless)
+        runner.set_source(RLE_16_1_1F.ds)
+        runner.set_option("reduce", 1)
+        msg = (
+            "Decoding at a reduced resolution is only available for JPEG 2000 and "
+            "HTJ2K, not 'RLE Lossless'"
+        )
+        with pytest.raises(ValueError, match=msg):
+            runner._set_reduction()
+
+        ds = J2KR_16_16_1_1_1F_M2.ds
+        runner = DecodeRunner(JPEG2000Lossless)
+        runner.set_source(ds)
+        runner.set_options(reduce=1, target_size=(8, 8))
+        msg = "Only one of 'reduce' or 'target_size' may be used"
+        with pytest.raises(ValueError, match=msg):
+            runner._set_reduction()
+
+        msg = (
+            r"'reduce' must be an int in the range \(0, 5\) for a JPEG 2000 "
+            "codestream with 5 decomposition levels"
+        )
+        for reduce in [-1, 6, 1.0, True]:
+            runner.del_option("target_size")
+            runner.set_option("reduce", reduce)
+            with pytest.raises(ValueError, match=msg):
+                runner._set_reduction()
+
+        runner.del_option("reduce")
+        msg = r"'target_size' must be a tuple of \(rows, columns\) as positive int"
+        for target_size in [8, (8,), (0, 8), [8, 8], (8.0, 8)]:
+            runner.set_option("target_size", target_size)
+            with pytest.raises(ValueError, match=msg):
+                runner._set_reduction()
+
+        # No COD marker segment
+        runner = DecodeRunner(JPEG2000Lossless)
+        runner.set_source(ds)
+        runner._src = encapsulate([b"\xff\x4f\xff\x51" + b"\x00" * 39])
+        runner.set_option("reduce", 1)
+        msg = (
+            "Unable to decode at a reduced resolution as the number of decomposition "
+            "levels in the JPEG 2000 codestream could not be found"
+        )
+        with pytest.raises(ValueError, match=msg):
+            runner._set_reduction()
+
+    def test_reduce_frame_levels_raises(self):
+        """Test decoding a frame with too few decomposition levels raises."""
+        ds = dcmread(J2KR_16_16_1_1_1F_M2.path)
+        frame = get_frame(ds.PixelData, 0)
+        # Change the number of decomposition levels from 5 to 1
+        offset = frame.index(b"\xff\x52") + 9
+        assert frame[offset] == 5
+        reduced = frame[:offset] + b"\x01" + frame[offset + 1 :]
+        ds.PixelData = encapsulate([frame, reduced])
+        ds.NumberOfFrames = 2
+
+        runner = DecodeRunner(JPEG2000Lossless)
+        runner.set_source(ds)
+        runner.set_option("reduce", 2)
+        runner._set_reduction()
+        runner.set_decoders({"foo": lambda src, runner: b"\x00" * 512})
+        assert len(runner.decode(0)) == 512
+
+        msg = (
+            "Unable to decode frame 1 with 'reduce=2' as its JPEG 2000 codestream "
+            "only has 1 decomposition levels"
+        )
+        with pytest.raises(ValueError, match=msg):
+            runner.decode(1)
+
     @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
     def test_iter_decode(self, caplog):
         """Test iter_decode()"""
@@ -628,6 +751,59 @@ class TestDecodeRunner:
         assert d["bits_stored"] == 8
         assert "planar_configuration" not in d
 
+    def test_memory_map(self, tmp_path):
+        """Test _memory_map()"""
+        path = tmp_path / "pixels.bin"
+        path.write_bytes(b"\x00\x01\x02\x03")
+
+        runner = DecodeRunner(ExplicitVRLittleEndian)
+        with open(path, "rb") as f:
+            runner.set_source(f)
+            # Only mapped when using `view_only`
+            assert runner._memory_map() is None
+            runner.set_source(f)
+            runner.set_option("view_only", True)
+            mapped = runner._memory_map()
+            assert isinstance(mapped, memoryview)
+            assert isinstance(mapped.obj, mmap.mmap)
+            assert mapped.readonly
+            assert mapped == b"\x00\x01\x02\x03"
+            assert runner._memory_map() is mapped
+
+            # Unbuffered and read-ahead files are mapped
+            with open(path, "rb", buffering=0) as g:
+                runner.set_source(g)
+                assert runner._memory_map() == b"\x00\x01\x02\x03"
+
+                runner.set_source(DicomReadAheadIO(g))
+                assert runner._memory_map() == b"\x00\x01\x02\x03"
+
+        # Not a file on disk
+        runner.set_source(BytesIO(b"\x00\x01"))
+        assert runner._memory_map() is None
+
+        # Not native
+        runner = DecodeRunner(RLELossless)
+        runner.set_option("view_only", True)
+        with open(path, "rb") as f:
+            runner.set_source(f)
+            assert runner._memory_map() is None
+
+        # Deflated
+        runner = DecodeRunner(DeflatedExplicitVRLittleEndian)
+        runner.set_option("view_only", True)
+        with open(path, "rb") as f:
+            runner.set_source(f)
+            assert runner._memory_map() is None
+
+        # Empty files can't be mapped
+        path.write_bytes(b"")
+        runner = DecodeRunner(ExplicitVRLittleEndian)
+        runner.set_option("view_only", True)
+        with open(path, "rb") as f:
+            runner.set_source(f)
+            assert runner._memory_map() is None
+
 
 @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
 class TestDecodeRunner_Reshape:
@@ -1057,6 +1233,52 @@ class TestDecoder:
         with pytest.raises(ValueError, match=msg):
             decoder._validate_plugins("foo")
 
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_calibrate(self, caplog):
+        """Test calibrate() ranks the plugins"""
+        from pydicom.pixels.decoders.native import _decode_frame
+
+        def slow(src, runner):
+            time.sleep(0.01)
+            return _decode_frame(src, runner)
+
+        def wrong(src, runner):
+            return bytearray(len(_decode_frame(src, runner)))
+
+        def fails(src, runner):
+            raise ValueError("Bad frame")
+
+        decoder = Decoder(RLELossless)
+        decoder._available = {
+            "slow": slow,
+            "wrong": wrong,
+            "fails": fails,
+            "fast": _decode_frame,
+        }
+        reference = RLE_16_1_1F
+        msg = (
+            r"The output from the wrong plugin\(s\) doesn't match the other "
+            "plugins and has been excluded from the ranking"
+        )
+        with caplog.at_level(logging.DEBUG, logger="pydicom"):
+            with pytest.warns(UserWarning, match=msg):
+                ranking = decoder.calibrate(reference.ds, nr_runs=2)
+
+        assert ranking == ("fast", "slow")
+        assert decoder.rankings == {(16, 1): ("fast", "slow")}
+        assert "The 'fails' plugin failed to decode the frame" in caplog.text
+
+        runner = DecodeRunner(RLELossless)
+        runner.set_source(reference.ds)
+        plugins = decoder._validate_plugins(runner=runner)
+        assert list(plugins) == ["fast", "slow", "wrong", "fails"]
+
+    def test_calibrate_native(self):
+        """Test calibrate() with native pixel data"""
+        decoder = ExplicitVRLittleEndianDecoder
+        assert decoder.calibrate(EXPL_16_1_10F.ds) == ()
+        assert decoder.rankings == {}
+
 
 @pytest.fixture()
 def enable_logging():
@@ -1242,6 +1464,113 @@ class TestDecoder_Array:
         assert arr.dtype == reference.dtype
         assert not arr.flags.writeable  # read-only
 
+    def test_native_view_only_mapped(self, tmp_path):
+        """Test as_array(view_only=True) with a file maps the pixel data"""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        ds = dcmread(EXPL_16_1_1F.path)
+        frame = ds.pixel_array
+        ref = np.stack([frame, frame + 1, frame + 2])
+        ds.PixelData = ref.tobytes()
+        ds.NumberOfFrames = 3
+        path = tmp_path / "mapped.dcm"
+        ds.save_as(path)
+        offset = dcmread(path)["PixelData"].file_tell
+
+        def root(arr):
+            while isinstance(arr, np.ndarray):
+                arr = arr.base
+
+            return arr
+
+        opts = {
+            "rows": ds.Rows,
+            "columns": ds.Columns,
+            "samples_per_pixel": ds.SamplesPerPixel,
+            "photometric_interpretation": ds.PhotometricInterpretation,
+            "pixel_representation": ds.PixelRepresentation,
+            "bits_allocated": ds.BitsAllocated,
+            "bits_stored": ds.BitsStored,
+            "number_of_frames": 3,
+            "pixel_keyword": "PixelData",
+        }
+        with open(path, "rb") as f:
+            f.seek(offset)
+            arr, _ = decoder.as_array(f, view_only=True, **opts)
+            assert f.tell() == offset
+            assert not arr.flags.writeable
+            assert isinstance(root(arr).obj, mmap.mmap)
+            assert np.array_equal(arr, ref)
+
+            arr, _ = decoder.as_array(f, view_only=True, index=2, **opts)
+            assert isinstance(root(arr).obj, mmap.mmap)
+            assert np.array_equal(arr, ref[2])
+
+            frames = decoder.iter_array(f, view_only=True, indices=[2, 0], **opts)
+            for arr, idx in zip(frames, [2, 0]):
+                assert isinstance(root(arr[0]).obj, mmap.mmap)
+                assert np.array_equal(arr[0], ref[idx])
+
+            roi = (slice(10, 20), slice(30, 40))
+            arr, meta = decoder.as_array(f, view_only=True, roi=roi, **opts)
+            assert isinstance(root(arr).obj, mmap.mmap)
+            assert np.array_equal(arr, ref[:, 10:20, 30:40])
+            assert meta["rows"] == 10
+
+            msg = "There is insufficient pixel data to contain 4 frames"
+            with pytest.raises(ValueError, match=msg):
+                decoder.as_array(f, view_only=True, index=3, **opts)
+
+            # Without `view_only` the pixel data is read into a new buffer
+            arr, _ = decoder.as_array(f, **opts)
+            assert arr.flags.writeable
+            assert np.array_equal(arr, ref)
+
+            arr, _ = decoder.as_array(f, view_only=True, **opts)
+
+        # The view remains valid after the file is closed
+        assert np.array_equal(arr, ref)
+
+    def test_pixel_cache(self, monkeypatch):
+        """Test arrays and frames are cached when the pixel cache is enabled"""
+        decoder = get_decoder(RLELossless)
+        ds = RLE_16_1_1F.ds
+        frame = get_frame(ds.PixelData, 0)
+        src = encapsulate([frame, frame, frame])
+        opts = as_pixel_options(ds, number_of_frames=3, pixel_keyword="PixelData")
+        ref = decoder.as_array(src, **opts)[0]
+
+        pixel_cache.clear()
+        pixel_cache.max_bytes = ref.nbytes * 3
+        try:
+            arr, meta = decoder.as_array(src, **opts)
+            arr, meta = decoder.as_array(src, **opts)
+            assert np.array_equal(arr, ref)
+            assert meta["number_of_frames"] == 3
+            assert (1, 1) == (pixel_cache.hits, pixel_cache.misses)
+
+            # Frames are cached by index
+            arr, meta = decoder.as_array(src, index=1, **opts)
+            assert np.array_equal(arr, ref[1])
+            assert meta["number_of_frames"] == 1
+            frames = [arr for arr, _ in decoder.iter_array(src, **opts)]
+            assert (2, 4) == (pixel_cache.hits, pixel_cache.misses)
+            assert len(pixel_cache) == 4
+
+            # All frames cached: no decoding required
+            def raise_error(*args, **kwargs):
+                raise RuntimeError("Decoded a cached frame")
+
+            monkeypatch.setattr(DecodeRunner, "decode", raise_error)
+            monkeypatch.setattr(DecodeRunner, "iter_decode", raise_error)
+            frames = [arr for arr, _ in decoder.iter_array(src, **opts)]
+            assert np.array_equal(np.stack(frames), ref)
+            frames = [arr for arr, _ in decoder.iter_array(src, indices=[2], **opts)]
+            assert np.array_equal(frames[0], ref[2])
+            assert (6, 4) == (pixel_cache.hits, pixel_cache.misses)
+        finally:
+            pixel_cache.max_bytes = 0
+            pixel_cache.clear()
+
     def test_native_excess_frames(self):
         """Test returning excess frame data"""
         decoder = get_decoder(ExplicitVRLittleEndian)
@@ -1769,6 +2098,216 @@ class TestDecoder_Array:
         for _, meta in decoder.iter_array(ds):
             assert meta["planar_configuration"] == 0
 
+    def test_roi_raises(self):
+        """Test an invalid `roi` raises an exception."""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        ds = EXPL_16_1_1F.ds
+
+        msg = r"'roi' must be a tuple of \(row slice, column slice\)"
+        for roi in [slice(0, 2), (slice(0, 2),), (0, 2), [slice(0, 2), slice(0, 2)]]:
+            with pytest.raises(TypeError, match=msg):
+                decoder.as_array(ds, roi=roi)
+
+            with pytest.raises(TypeError, match=msg):
+                next(decoder.iter_array(ds, roi=roi))
+
+        msg = "The 'roi' row slice must have a step of 1"
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, roi=(slice(0, 10, 2), slice(None)))
+
+        msg = "The 'roi' column slice must contain at least one column"
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, roi=(slice(None), slice(64, None)))
+
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, roi=(slice(None), slice(10, 5)))
+
+    def test_roi_native(self):
+        """Test `roi` with native pixel data in a buffer."""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        ds = EXPL_16_1_1F.ds
+        ref = decoder.as_array(ds)[0]
+
+        roi = (slice(10, 20), slice(-5, None))
+        arr, meta = decoder.as_array(ds, roi=roi)
+        assert arr.shape == (10, 5)
+        assert arr.flags.writeable
+        assert np.array_equal(arr, ref[roi])
+        assert meta["rows"] == 10
+        assert meta["columns"] == 5
+
+        # Length 1 dimensions are kept
+        arr, meta = decoder.as_array(ds, index=0, roi=(slice(3, 4), slice(None)))
+        assert arr.shape == (1, 64)
+        assert np.array_equal(arr, ref[3:4])
+        assert meta["rows"] == 1
+        assert meta["columns"] == 64
+
+        # A view on the original buffer
+        arr, _ = decoder.as_array(ds, view_only=True, roi=roi)
+        assert not arr.flags.writeable
+        assert np.array_equal(arr, ref[roi])
+
+    def test_roi_native_binary(self, monkeypatch):
+        """Test `roi` with native pixel data in a file-like."""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        ds = dcmread(EXPL_16_1_1F.path)
+        frame = decoder.as_array(ds)[0]
+        ref = np.stack([frame, frame + 1, frame + 2])
+        ds.PixelData = BytesIO(ref.tobytes())
+        ds.NumberOfFrames = 3
+
+        roi = (slice(10, 20), slice(30, 40))
+        # Read whole rows, then read only the column span in each row
+        for threshold in [8192, 0]:
+            monkeypatch.setattr(
+                "pydicom.pixels.decoders.base._ROI_ROW_READ_THRESHOLD", threshold
+            )
+            ds.PixelData.seek(0)
+            arr, meta = decoder.as_array(ds, roi=roi)
+            assert arr.shape == (3, 10, 10)
+            assert arr.flags.writeable
+            assert np.array_equal(arr, ref[(slice(None), *roi)])
+            assert meta["rows"] == 10
+            assert meta["columns"] == 10
+            assert ds.PixelData.tell() == 0
+
+            arr, _ = decoder.as_array(ds, index=2, roi=roi)
+            assert arr.shape == (10, 10)
+            assert np.array_equal(arr, ref[2][roi])
+
+            frames = decoder.iter_array(ds, indices=[2, 0], roi=roi)
+            for (arr, _), index in zip(frames, [2, 0]):
+                assert np.array_equal(arr, ref[index][roi])
+
+        msg = "There is insufficient pixel data to contain 3 frames"
+        ds.PixelData = BytesIO(ref.tobytes()[:-1])
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, roi=(slice(None), slice(None)))
+
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, index=2, roi=(slice(63, 64), slice(63, 64)))
+
+        msg = "There is insufficient pixel data to contain 4 frames"
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, index=3, roi=roi)
+
+    def test_roi_native_rgb(self):
+        """Test `roi` with multi-sample native pixel data in a file-like."""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        ds = dcmread(EXPL_16_1_1F.path)
+        ref = np.arange(64 * 64 * 3, dtype="u1").reshape(64, 64, 3)
+        ds.BitsAllocated = ds.BitsStored = 8
+        ds.HighBit = 7
+        ds.PixelRepresentation = 0
+        ds.SamplesPerPixel = 3
+        ds.PhotometricInterpretation = "RGB"
+        ds.PlanarConfiguration = 0
+        ds.PixelData = BytesIO(ref.tobytes())
+
+        roi = (slice(None, 5), slice(2, 3))
+        arr, _ = decoder.as_array(ds, roi=roi)
+        assert arr.shape == (5, 1, 3)
+        assert np.array_equal(arr, ref[roi])
+
+        # Planar configuration 1 is cropped after reading the frame
+        ds.PlanarConfiguration = 1
+        ds.PixelData = BytesIO(ref.transpose(2, 0, 1).tobytes())
+        arr, _ = decoder.as_array(ds, roi=roi)
+        assert arr.shape == (5, 1, 3)
+        assert np.array_equal(arr, ref[roi])
+
+    def test_roi_encapsulated(self):
+        """Test `roi` with encapsulated pixel data."""
+        decoder = get_decoder(RLELossless)
+        ds = dcmread(RLE_16_1_1F.path)
+        frame = decoder.as_array(ds)[0]
+
+        roi = (slice(10, 20), slice(5, 6))
+        arr, meta = decoder.as_array(ds, roi=roi)
+        assert arr.shape == (10, 1)
+        assert arr.flags.c_contiguous
+        assert np.array_equal(arr, frame[roi])
+        assert meta["rows"] == 10
+        assert meta["columns"] == 1
+
+        arr, _ = decoder.as_array(ds, index=0, roi=roi)
+        assert arr.shape == (10, 1)
+        assert arr.flags.c_contiguous
+        assert np.array_equal(arr, frame[roi])
+
+        # Multi-frame
+        ds.PixelData = encapsulate([get_frame(ds.PixelData, 0)] * 3)
+        ds.NumberOfFrames = 3
+        arr, meta = decoder.as_array(ds, roi=roi)
+        assert arr.shape == (3, 10, 1)
+        assert np.array_equal(arr, np.stack([frame[roi]] * 3))
+        assert meta["rows"] == 10
+
+        for arr, meta in decoder.iter_array(ds, roi=roi):
+            assert arr.shape == (10, 1)
+            assert arr.flags.c_contiguous
+            assert np.array_equal(arr, frame[roi])
+            assert meta["rows"] == 10
+            assert meta["columns"] == 1
+
+        for arr, _ in decoder.iter_array(ds, indices=[1], roi=roi):
+            assert np.array_equal(arr, frame[roi])
+
+    def test_reduce(self):
+        """Test decoding JPEG 2000 at a reduced resolution."""
+
+        def reduced(src, runner):
+            # A plugin that supports decoding at a reduced resolution
+            assert runner.get_option("reduce") == 2
+            runner.set_frame_option(runner.index, "bits_allocated", 16)
+            return np.arange(16 * 16, dtype="<i2").tobytes()
+
+        decoder = Decoder(JPEG2000Lossless)
+        decoder._available = {"reduced": reduced}
+        ds = J2KR_16_16_1_1_1F_M2.ds
+        ref = np.arange(16 * 16, dtype="<i2").reshape(16, 16)
+        for kwargs in [{"reduce": 2}, {"target_size": (16, 10)}]:
+            arr, meta = decoder.as_array(ds, **kwargs)
+            assert np.array_equal(arr, ref)
+            assert (meta["rows"], meta["columns"]) == (16, 16)
+
+            arr, meta = next(decoder.iter_array(ds, **kwargs))
+            assert np.array_equal(arr, ref)
+            assert (meta["rows"], meta["columns"]) == (16, 16)
+
+            buffer, meta = decoder.as_buffer(ds, **kwargs)
+            assert buffer == ref.tobytes()
+            assert (meta[0]["rows"], meta[0]["columns"]) == (16, 16)
+
+        # With a region of interest of the reduced frame
+        arr, meta = decoder.as_array(ds, reduce=2, roi=(slice(8, None), slice(None)))
+        assert np.array_equal(arr, ref[8:])
+        assert (meta["rows"], meta["columns"]) == (8, 16)
+
+        msg = (
+            r"'reduce' must be an int in the range \(0, 5\) for a JPEG 2000 "
+            "codestream with 5 decomposition levels"
+        )
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(ds, reduce=6)
+
+    def test_roi_encapsulated_excess_frames(self):
+        """Test `roi` with excess frames in the encapsulated pixel data."""
+        decoder = get_decoder(RLELossless)
+        ds = dcmread(RLE_16_1_1F.path)
+        frame = decoder.as_array(ds)[0]
+        ds.PixelData = encapsulate([get_frame(ds.PixelData, 0)] * 3)
+        ds.NumberOfFrames = 2
+
+        roi = (slice(None, 2), slice(None, 2))
+        with pytest.warns(UserWarning, match="3 frames have been found"):
+            arr, meta = decoder.as_array(ds, roi=roi)
+
+        assert arr.shape == (3, 2, 2)
+        assert np.array_equal(arr, np.stack([frame[roi]] * 3))
+        assert meta["number_of_frames"] == 3
+
 
 @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
 class TestDecoder_Buffer:
@@ -1806,6 +2345,21 @@ class TestDecoder_Buffer:
         assert buffer.obj is reference.ds.PixelData
         assert meta_a == meta_b[0]
 
+        # File-like source is mapped
+        with open(reference.path, "rb") as f:
+            f.seek(reference.ds["PixelData"].file_tell)
+            buffer, _ = decoder.as_buffer(
+                f,
+                **as_pixel_options(reference.ds),
+                pixel_keyword="PixelData",
+                view_only=True,
+                raw=True,
+            )
+
+        assert isinstance(buffer, memoryview)
+        assert isinstance(buffer.obj, mmap.mmap)
+        assert arr.tobytes() == buffer
+
         # mutable source buffer
         # Also tests buffer-like `src`
         src = bytearray()
@@ -31,6 +31,7 @@ from pydicom.uid import (
 from .pixels_reference import (
     PIXEL_REFERENCE,
     J2KR_08_08_3_0_1F_YBR_RCT,
+    J2KI_16_16_1_1_1F_M2,
     JPGB_08_08_3_0_1F_RGB,  # has RGB component IDs
     JPGB_08_08_3_0_1F_YBR_FULL,  # has JFIF APP marker
     J2KR_16_10_1_0_1F_M1,
@@ -287,6 +288,33 @@ class TestOpenJpegDecoder:
             assert arr.dtype == reference.dtype
             assert arr.flags.writeable
 
+    def test_reduce(self):
+        """Test decoding at a reduced resolution."""
+        reference = J2KI_16_16_1_1_1F_M2
+        decoder = get_decoder(JPEG2000)
+        full, meta = decoder.as_array(reference.ds, decoding_plugin="pillow")
+        assert (meta["rows"], meta["columns"]) == (1024, 256)
+
+        arr, meta = decoder.as_array(reference.ds, reduce=2, decoding_plugin="pillow")
+        assert arr.shape == (256, 64)
+        assert arr.dtype == full.dtype
+        assert arr.flags.writeable
+        assert (meta["rows"], meta["columns"]) == (256, 64)
+
+        # Lowest resolution level that's at least as large as the target
+        for target_size, shape in [((256, 60), (256, 64)), ((257, 10), (512, 128))]:
+            arr, meta = decoder.as_array(
+                reference.ds, target_size=target_size, decoding_plugin="pillow"
+            )
+            assert arr.shape == shape
+            assert (meta["rows"], meta["columns"]) == shape
+
+        for arr, meta in decoder.iter_array(
+            reference.ds, reduce=5, decoding_plugin="pillow"
+        ):
+            assert arr.shape == (32, 8)
+            assert (meta["rows"], meta["columns"]) == (32, 8)
+
     @pytest.mark.parametrize("path", [J2KR_1_1_3F.path, J2KR_1_1_3F_NONALIGNED.path])
     def test_j2k_singlebit_as_buffer(self, path):
         """Test retrieving buffers from single bit J2K."""
@@ -504,6 +504,19 @@ class TestOpenJpegDecoder:
             arr[328:338, 106].tolist()
         )
 
+    def test_reduce_raises(self):
+        """Test decoding at a reduced resolution raises an exception."""
+        decoder = get_decoder(JPEG2000Lossless)
+        msg = (
+            "Unable to decode as exceptions were raised by all available plugins:\n"
+            "  pylibjpeg: pylibjpeg does not support decoding JPEG 2000 at a "
+            "reduced resolution"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            decoder.as_array(
+                J2KR_16_13_1_1_1F_M2_MISMATCH.ds, reduce=1, decoding_plugin="pylibjpeg"
+            )
+
 
 @pytest.mark.skipif(SKIP_RLE, reason="Test is missing dependencies")
 class TestRleDecoder:
@@ -2,6 +2,7 @@
 
 import importlib
 import logging
+import time
 
 import pytest
 
@@ -1584,6 +1585,50 @@ class TestEncoder:
         assert {} == enc._unavailable
         assert enc._decoder is False
 
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_calibrate(self, caplog):
+        """Test calibrate() ranks the plugins"""
+        from pydicom.pixels.encoders.native import _encode_rle_frame
+
+        def slow(src, runner):
+            time.sleep(0.01)
+            return _encode_rle_frame(src, runner)
+
+        def wrong(src, runner):
+            return _encode_rle_frame(bytes(len(src)), runner)
+
+        def fails(src, runner):
+            raise ValueError("Bad frame")
+
+        enc = Encoder(RLELossless)
+        enc._available = {
+            "slow": slow,
+            "wrong": wrong,
+            "fails": fails,
+            "fast": _encode_rle_frame,
+        }
+        msg = (
+            r"The output from the wrong plugin\(s\) doesn't match the other "
+            "plugins and has been excluded from the ranking"
+        )
+        with caplog.at_level(logging.DEBUG, logger="pydicom"):
+            with pytest.warns(UserWarning, match=msg):
+                ranking = enc.calibrate(self.arr, nr_runs=2, **self.kwargs)
+
+        assert ranking == ("fast", "slow")
+        assert enc.rankings == {(16, 1): ("fast", "slow")}
+        assert "The 'fails' plugin failed to encode the frame" in caplog.text
+
+        runner = EncodeRunner(RLELossless)
+        runner.set_source(self.ds)
+        plugins = enc._validate_plugins(runner=runner)
+        assert list(plugins) == ["fast", "slow", "wrong", "fails"]
+
+        # Multi-frame pixel data uses the first frame
+        enc._available = {"fast": _encode_rle_frame}
+        self.kwargs["number_of_frames"] = 2
+        assert enc.calibrate(self.bytes * 2, **self.kwargs) == ("fast",)
+
     def test_logging(self, enable_logging, caplog):
         """Test that the logging works during encode"""
         with caplog.at_level(logging.DEBUG, logger="pydicom"):
@@ -10,6 +10,7 @@ import random
 import re
 from struct import pack, unpack
 from sys import byteorder
+from threading import Thread
 
 import pytest
 
@@ -38,11 +39,17 @@ from pydicom.pixels.utils import (
     pixel_dtype,
     get_expected_length,
     get_j2k_parameters,
+    get_frame_indices,
     get_nr_frames,
     get_packed_frame,
     pack_bits,
+    PixelCache,
+    pixel_cache,
     set_pixel_data,
+    sparse_pixel_array,
+    SparseFrames,
     unpack_bits,
+    unpack_frames,
     expand_ybr422,
     compress,
     decompress,
@@ -90,6 +97,7 @@ from .pixels_reference import (
     JLSL_08_08_3_0_1F_ILV2,
     JLSN_08_01_1_0_1F,
     J2KR_08_08_3_0_1F_YBR_RCT,
+    J2KI_16_16_1_1_1F_M2,
     J2KR_1_1_3F,
     J2KR_1_1_3F_NONALIGNED,
     EXPL_1_1_3F,
@@ -171,6 +179,83 @@ class TestPixelArray:
             assert arr.shape == (64, 64)
             EXPL_16_1_10F.test(arr, index=index)
 
+    def test_indices(self):
+        """Test the `indices` kwarg."""
+        arr = pixel_array(EXPL_16_1_10F.path, indices=[9, 0, 4])
+        assert arr.shape == (3, 64, 64)
+        for idx, index in enumerate((9, 0, 4)):
+            EXPL_16_1_10F.test(arr[idx], index=index)
+
+        arr = pixel_array(EXPL_16_1_10F.ds, indices=range(1, 10, 4))
+        assert arr.shape == (3, 64, 64)
+        for idx, index in enumerate((1, 5, 9)):
+            EXPL_16_1_10F.test(arr[idx], index=index)
+
+        arr = pixel_array(RLE_16_1_10F.ds, indices=[2])
+        assert arr.shape == (1, 64, 64)
+        RLE_16_1_10F.test(arr[0], index=2)
+
+    def test_indices_raises(self):
+        """Test invalid `indices` raise an exception."""
+        msg = "Only one of 'index' or 'indices' may be used"
+        with pytest.raises(ValueError, match=msg):
+            pixel_array(EXPL_16_1_10F.ds, index=0, indices=[0])
+
+        msg = "'indices' must contain at least one frame index"
+        with pytest.raises(ValueError, match=msg):
+            pixel_array(EXPL_16_1_10F.ds, indices=[])
+
+    def test_roi(self):
+        """Test the `roi` kwarg."""
+        roi = (slice(10, 20), slice(-8, None))
+        for reference in [EXPL_16_1_1F, RLE_16_1_1F]:
+            ref = pixel_array(reference.ds)
+            arr = pixel_array(reference.path, roi=roi)
+            assert arr.shape == (10, 8)
+            assert np.array_equal(arr, ref[roi])
+
+            with open(reference.path, "rb") as f:
+                arr = pixel_array(f, index=0, roi=roi)
+                assert f.tell() == 0
+
+            assert np.array_equal(arr, ref[roi])
+            assert np.array_equal(pixel_array(reference.ds, roi=roi), ref[roi])
+
+    def test_roi_indices(self, tmp_path):
+        """Test the `roi` kwarg with `indices`."""
+        ds = dcmread(EXPL_16_1_1F.path)
+        frame = ds.pixel_array
+        ds.PixelData = np.stack([frame, frame + 1, frame + 2]).tobytes()
+        ds.NumberOfFrames = 3
+        ds.save_as(tmp_path / "roi.dcm")
+
+        roi = (slice(None, 1), slice(1, 3))
+        arr = pixel_array(tmp_path / "roi.dcm", indices=[2, 0], roi=roi)
+        assert arr.shape == (2, 1, 2)
+        assert np.array_equal(arr[0], frame[roi] + 2)
+        assert np.array_equal(arr[1], frame[roi])
+
+    def test_view_only_mapped(self, tmp_path):
+        """Test `view_only` returns read-only views on the mapped file."""
+        ds = dcmread(EXPL_16_1_1F.path)
+        frame = ds.pixel_array
+        ref = np.stack([frame, frame + 1, frame + 2])
+        ds.PixelData = ref.tobytes()
+        ds.NumberOfFrames = 3
+        path = tmp_path / "mapped.dcm"
+        ds.save_as(path)
+
+        arr = pixel_array(path, view_only=True)
+        assert not arr.flags.writeable
+        assert not arr.flags.owndata
+        assert np.array_equal(arr, ref)
+
+        arr = pixel_array(path, index=1, view_only=True)
+        assert not arr.flags.writeable
+        assert np.array_equal(arr, ref[1])
+
+        assert pixel_array(path).flags.writeable
+
     def test_raw(self):
         """Test the `raw` kwarg."""
         rgb = pixel_array(EXPL_8_3_1F_YBR422.path, raw=False)
@@ -393,6 +478,17 @@ class TestIterPixels:
         for index, frame in enumerate(iter_pixels(IMPL_16_1_1F.path)):
             IMPL_16_1_1F.test(frame, index=index)
 
+    def test_read_ahead(self):
+        """Test iterating with read-ahead enabled."""
+        config.settings.read_ahead_size = 65536
+        try:
+            for index, frame in enumerate(iter_pixels(EXPL_16_1_10F.path)):
+                EXPL_16_1_10F.test(frame, index=index)
+
+            assert 9 == index
+        finally:
+            config.settings.read_ahead_size = 0
+
     def test_ds_out(self):
         """Test the `ds_out` kwarg works as intended"""
         p = EXPL_16_1_10F.path
@@ -444,6 +540,30 @@ class TestIterPixels:
 
         assert count == 3
 
+    def test_roi(self):
+        """Test the `roi` kwarg."""
+        roi = (slice(5, 6), slice(None, 40))
+        for reference in [EXPL_16_1_1F, RLE_16_1_1F]:
+            ref = pixel_array(reference.ds)
+            for src in [reference.path, reference.ds]:
+                frames = list(iter_pixels(src, roi=roi))
+                assert len(frames) == 1
+                assert frames[0].shape == (1, 40)
+                assert np.array_equal(frames[0], ref[roi])
+
+    def test_view_only_mapped(self, tmp_path):
+        """Test `view_only` yields read-only views on the mapped file."""
+        ds = dcmread(EXPL_16_1_1F.path)
+        frame = ds.pixel_array
+        ds.PixelData = np.stack([frame, frame + 1, frame + 2]).tobytes()
+        ds.NumberOfFrames = 3
+        ds.save_as(tmp_path / "mapped.dcm")
+
+        frames = iter_pixels(tmp_path / "mapped.dcm", view_only=True)
+        for idx, arr in enumerate(frames):
+            assert not arr.flags.writeable
+            assert np.array_equal(arr, frame + idx)
+
     def test_raw(self):
         """Test the `raw` kwarg."""
         processed = iter_pixels(EXPL_8_3_1F_YBR422.path, raw=False)
@@ -506,6 +626,431 @@ def test_version_check_debugging(caplog):
         assert "No module named 'foo'" in caplog.text
 
 
+def create_segmentation(nr_frames=12, rows=5, columns=7):
+    """Return a binary segmentation-like dataset with 2 segments and its
+    pixel data, only every third frame is non-empty.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.66.4"
+    ds.file_meta.MediaStorageSOPInstanceUID = "1.2.3.4"
+    ds.SOPClassUID = ds.file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+
+    arr = np.zeros((nr_frames, rows, columns), dtype="u1")
+    for idx in range(0, nr_frames, 3):
+        arr[idx, idx % rows, idx % columns :] = 1
+
+    ds.set_pixel_data(arr, "MONOCHROME2", 1)
+
+    item = Dataset()
+    item.FrameContentSequence = [Dataset()]
+    item.FrameContentSequence[0].StackID = "1"
+    ds.SharedFunctionalGroupsSequence = [item]
+
+    ds.PerFrameFunctionalGroupsSequence = []
+    for idx in range(nr_frames):
+        item = Dataset()
+        item.SegmentIdentificationSequence = [Dataset()]
+        item.SegmentIdentificationSequence[0].ReferencedSegmentNumber = idx % 2 + 1
+        item.FrameContentSequence = [Dataset()]
+        content = item.FrameContentSequence[0]
+        content.DimensionIndexValues = [idx % 2 + 1, idx // 2 + 1]
+        content.InStackPositionNumber = idx // 2 + 1
+        ds.PerFrameFunctionalGroupsSequence.append(item)
+
+    return ds, arr
+
+
+class TestGetFrameIndices:
+    """Tests for get_frame_indices()"""
+
+    def test_segment_number(self):
+        """Test selecting frames by segment number."""
+        ds, _ = create_segmentation()
+        assert get_frame_indices(ds, segment_number=1) == [0, 2, 4, 6, 8, 10]
+        assert get_frame_indices(ds, segment_number=2) == [1, 3, 5, 7, 9, 11]
+        assert get_frame_indices(ds, segment_number=[1, 2]) == list(range(12))
+        assert get_frame_indices(ds, segment_number=3) == []
+
+    def test_dimension_index_values(self):
+        """Test selecting frames by dimension index values."""
+        ds, _ = create_segmentation()
+        assert get_frame_indices(ds, dimension_index_values=[2, 3]) == [5]
+        assert get_frame_indices(ds, dimension_index_values=[None, 3]) == [4, 5]
+        assert get_frame_indices(ds, dimension_index_values=[1, None]) == [
+            0,
+            2,
+            4,
+            6,
+            8,
+            10,
+        ]
+        assert get_frame_indices(ds, dimension_index_values=[1]) == []
+
+        # Single value
+        for item in ds.PerFrameFunctionalGroupsSequence:
+            values = item.FrameContentSequence[0].DimensionIndexValues
+            item.FrameContentSequence[0].DimensionIndexValues = values[1]
+
+        assert get_frame_indices(ds, dimension_index_values=[3]) == [4, 5]
+
+    def test_stack(self):
+        """Test selecting frames by stack ID and position."""
+        ds, _ = create_segmentation()
+        # Stack ID from the shared functional groups
+        assert get_frame_indices(ds, stack_id="1") == list(range(12))
+        assert get_frame_indices(ds, stack_id="2") == []
+        assert get_frame_indices(ds, stack_position=2) == [2, 3]
+        assert get_frame_indices(ds, stack_position=range(5, 8)) == [8, 9, 10, 11]
+
+        # Per-frame values take precedence
+        item = ds.PerFrameFunctionalGroupsSequence[3]
+        item.FrameContentSequence[0].StackID = "2"
+        assert get_frame_indices(ds, stack_id="2") == [3]
+
+    def test_combined(self):
+        """Test frames must match every parameter used."""
+        ds, _ = create_segmentation()
+        indices = get_frame_indices(
+            ds, segment_number=2, stack_id="1", stack_position=[1, 2, 3]
+        )
+        assert indices == [1, 3, 5]
+        assert get_frame_indices(ds) == list(range(12))
+
+    def test_missing_values(self):
+        """Test frames without a value never match."""
+        ds, _ = create_segmentation()
+        del ds.SharedFunctionalGroupsSequence
+        del ds.PerFrameFunctionalGroupsSequence[0].SegmentIdentificationSequence
+        del ds.PerFrameFunctionalGroupsSequence[2].SegmentIdentificationSequence[0][
+            "ReferencedSegmentNumber"
+        ]
+        assert get_frame_indices(ds, segment_number=1) == [4, 6, 8, 10]
+        assert get_frame_indices(ds, stack_id="1") == []
+
+    def test_no_per_frame_groups_raises(self):
+        """Test a dataset without per-frame functional groups raises."""
+        msg = (
+            r"Unable to select frames as the dataset has no \(5200,9230\) "
+            "'Per-Frame Functional Groups Sequence' element"
+        )
+        with pytest.raises(AttributeError, match=msg):
+            get_frame_indices(Dataset(), segment_number=1)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestSparsePixelArray:
+    """Tests for sparse_pixel_array() and SparseFrames"""
+
+    def test_dataset(self):
+        """Test decoding from a dataset."""
+        ds, arr = create_segmentation()
+        sparse = sparse_pixel_array(ds)
+        assert isinstance(sparse, SparseFrames)
+        assert sparse.indices == (0, 3, 6, 9)
+        assert sparse.frames.shape == (4, 5, 7)
+        assert sparse.nr_frames == 12
+        assert len(sparse) == 12
+        assert sparse.shape == (12, 5, 7)
+        assert sparse.dtype == np.uint8
+        assert np.array_equal(sparse.to_array(), arr)
+        assert np.array_equal(np.asarray(sparse), arr)
+        assert np.asarray(sparse, dtype=bool).dtype == bool
+
+    def test_indices(self):
+        """Test decoding selected frames."""
+        ds, arr = create_segmentation()
+        indices = get_frame_indices(ds, segment_number=2)
+        sparse = sparse_pixel_array(ds, indices=indices)
+        assert sparse.indices == (3, 9)
+        assert sparse.nr_frames == 12
+        assert np.array_equal(sparse.frames, arr[[3, 9]])
+
+        sparse = sparse_pixel_array(ds, indices=[9, 1, 0])
+        assert sparse.indices == (9, 0)
+        assert np.array_equal(sparse.frames, arr[[9, 0]])
+
+        msg = "'indices' must contain at least one frame index"
+        with pytest.raises(ValueError, match=msg):
+            sparse_pixel_array(ds, indices=[])
+
+    def test_all_empty(self):
+        """Test decoding only empty frames."""
+        ds, arr = create_segmentation()
+        sparse = sparse_pixel_array(ds, indices=[1, 2])
+        assert sparse.indices == ()
+        assert sparse.frames.shape == (0, 5, 7)
+        assert sparse.shape == (12, 5, 7)
+        assert not sparse.to_array().any()
+
+    def test_file(self, tmp_path):
+        """Test decoding from a file-like and path."""
+        ds, arr = create_segmentation()
+        ds.compress(RLELossless, arr, encoding_plugin="pydicom")
+        path = tmp_path / "seg.dcm"
+        ds.save_as(path, enforce_file_format=True)
+
+        ds_out = Dataset()
+        sparse = sparse_pixel_array(path, ds_out=ds_out)
+        assert sparse.indices == (0, 3, 6, 9)
+        assert sparse.nr_frames == 12
+        assert np.array_equal(sparse.to_array(), arr)
+        assert ds_out.NumberOfFrames == 12
+
+        with open(path, "rb") as f:
+            sparse = sparse_pixel_array(f, indices=[0, 1, 3])
+            assert not f.closed
+
+        assert sparse.indices == (0, 3)
+        assert sparse.nr_frames == 12
+
+    def test_getitem(self):
+        """Test accessing frames by index."""
+        ds, arr = create_segmentation()
+        sparse = sparse_pixel_array(ds)
+        for idx in range(-12, 12):
+            assert np.array_equal(sparse[idx], arr[idx])
+
+        # Empty frames are new arrays
+        sparse[1][0, 0] = 1
+        assert not sparse[1].any()
+
+        msg = "Frame index 12 is out of range for pixel data with 12 frames"
+        with pytest.raises(IndexError, match=msg):
+            sparse[12]
+
+        msg = "Frame index -13 is out of range for pixel data with 12 frames"
+        with pytest.raises(IndexError, match=msg):
+            sparse[-13]
+
+    def test_init_raises(self):
+        """Test creating SparseFrames with invalid values raises."""
+        frames = np.ones((2, 3, 3), dtype="u1")
+        msg = (
+            r"The number of 'indices' \(1\) doesn't match the number of "
+            r"'frames' \(2\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            SparseFrames(frames, [0], 4)
+
+        msg = r"The 'indices' must be in the range \[0, 4\) for pixel data with 4"
+        with pytest.raises(ValueError, match=msg):
+            SparseFrames(frames, [0, 4], 4)
+
+        with pytest.raises(ValueError, match=msg):
+            SparseFrames(frames, [-1, 3], 4)
+
+    def test_repr(self):
+        """Test SparseFrames.__repr__()"""
+        sparse = SparseFrames(np.ones((2, 3, 3), dtype="u1"), [0, 3], 4)
+        assert repr(sparse) == (
+            "<SparseFrames: 2 of 4 frames, shape (4, 3, 3), dtype 'uint8'>"
+        )
+
+
+@pytest.fixture
+def enable_pixel_cache():
+    pixel_cache.clear()
+    pixel_cache.max_bytes = 2**24
+    yield pixel_cache
+    pixel_cache.max_bytes = 0
+    pixel_cache.clear()
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestPixelCache:
+    """Tests for PixelCache"""
+
+    def test_init(self):
+        """Test creating a new cache"""
+        cache = PixelCache()
+        assert cache.max_bytes == 0
+        assert cache.nbytes == 0
+        assert len(cache) == 0
+        assert (0, 0, 0, 0.0) == (
+            cache.hits,
+            cache.misses,
+            cache.evictions,
+            cache.hit_rate,
+        )
+
+        msg = "'max_bytes' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            PixelCache(-1)
+
+    def test_add_get(self):
+        """Test adding and getting arrays"""
+        cache = PixelCache(100)
+        arr = np.arange(10, dtype="u1")
+        cache.add("a", arr, {"rows": 1})
+        assert "a" in cache
+        assert cache.nbytes == 10
+        assert cache.get("b") is None
+
+        # The cached array is a copy and each hit returns a writeable copy
+        arr[0] = 255
+        cached, properties = cache.get("a")
+        assert cached.flags.writeable
+        assert np.array_equal(cached, np.arange(10))
+        assert properties == {"rows": 1}
+        cached[0] = 255
+        properties["rows"] = 2
+        cached, properties = cache.get("a")
+        assert cached[0] == 0
+        assert properties == {"rows": 1}
+        assert (2, 1, 2 / 3) == (cache.hits, cache.misses, cache.hit_rate)
+
+        # Replacing an existing array
+        cache.add("a", np.arange(20, dtype="u1"), {})
+        assert len(cache) == 1
+        assert cache.nbytes == 20
+
+    def test_eviction(self):
+        """Test the least recently used arrays are evicted"""
+        cache = PixelCache(30)
+        for key in range(3):
+            cache.add(key, np.full(10, key, dtype="u1"), {})
+
+        assert cache.nbytes == 30
+        cache.get(0)
+        cache.add(3, np.full(10, 3, dtype="u1"), {})
+        assert 1 not in cache
+        assert [0, 2, 3] == sorted(cache._arrays)
+        assert cache.nbytes == 30
+        assert cache.evictions == 1
+
+        # Arrays larger than the budget aren't cached
+        cache.add(4, np.zeros(31, dtype="u1"), {})
+        assert 4 not in cache
+        assert len(cache) == 3
+
+    def test_disabled(self):
+        """Test arrays aren't cached when disabled"""
+        cache = PixelCache()
+        cache.add("a", np.zeros(1, dtype="u1"), {})
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+    def test_max_bytes(self):
+        """Test changing the budget evicts arrays"""
+        cache = PixelCache(30)
+        for key in range(3):
+            cache.add(key, np.zeros(10, dtype="u1"), {})
+
+        cache.max_bytes = 15
+        assert len(cache) == 1
+        assert 2 in cache
+        assert cache.nbytes == 10
+        assert cache.evictions == 2
+
+        msg = "'max_bytes' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            cache.max_bytes = -1
+
+    def test_clear(self):
+        """Test clearing the cache"""
+        cache = PixelCache(30)
+        cache.add("a", np.zeros(10, dtype="u1"), {})
+        cache.get("a")
+        cache.get("b")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+        assert (0, 0, 0) == (cache.hits, cache.misses, cache.evictions)
+
+    def test_threads(self):
+        """Test using the cache from multiple threads"""
+        cache = PixelCache(100)
+
+        def func():
+            for ii in range(1000):
+                if cache.get(ii % 20) is None:
+                    cache.add(ii % 20, np.zeros(10, dtype="u1"), {})
+
+        threads = [Thread(target=func) for _ in range(4)]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 10
+        assert cache.nbytes == 100
+        assert cache.hits + cache.misses == 4000
+
+    def test_pixel_array_path(self, enable_pixel_cache, tmp_path):
+        """Test pixel_array() with a path uses the cache"""
+        path = tmp_path / "rle.dcm"
+        path.write_bytes(open(RLE_16_1_1F.path, "rb").read())
+        ref = pixel_array(RLE_16_1_1F.ds)
+        pixel_cache.clear()
+
+        arr = pixel_array(path)
+        assert (0, 1) == (pixel_cache.hits, pixel_cache.misses)
+        arr[0, 0] = -1
+        arr = pixel_array(path)
+        assert (1, 1) == (pixel_cache.hits, pixel_cache.misses)
+        assert arr.flags.writeable
+        assert np.array_equal(arr, ref)
+
+        # Different options are cached separately
+        roi = (slice(0, 10), slice(0, 10))
+        assert np.array_equal(pixel_array(path, roi=roi), ref[roi])
+        assert np.array_equal(pixel_array(path, roi=roi), ref[roi])
+        assert (2, 2) == (pixel_cache.hits, pixel_cache.misses)
+
+        # Frames yielded by iter_pixels() are cached by index
+        for _ in range(2):
+            frames = list(iter_pixels(path))
+            assert np.array_equal(frames[0], ref)
+
+        assert (3, 3) == (pixel_cache.hits, pixel_cache.misses)
+
+        # A modified file isn't a hit
+        mtime = path.stat().st_mtime_ns
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+        pixel_array(path)
+        assert (3, 4) == (pixel_cache.hits, pixel_cache.misses)
+
+    def test_dataset(self, enable_pixel_cache):
+        """Test datasets with the same pixel data share cached arrays"""
+        ds = dcmread(RLE_16_1_1F.path)
+        ref = ds.pixel_array
+        assert (0, 1) == (pixel_cache.hits, pixel_cache.misses)
+
+        ds = dcmread(RLE_16_1_1F.path)
+        assert np.array_equal(ds.pixel_array, ref)
+        assert (1, 1) == (pixel_cache.hits, pixel_cache.misses)
+
+        # Changing the pixel data or the Image Pixel module isn't a hit
+        frame = get_frame(ds.PixelData, 0)
+        ds.PixelData = encapsulate([frame[:-1] + b"\x00"])
+        ds.pixel_array
+        ds = dcmread(RLE_16_1_1F.path)
+        ds.PhotometricInterpretation = "MONOCHROME1"
+        ds.pixel_array
+        assert (1, 3) == (pixel_cache.hits, pixel_cache.misses)
+
+    def test_not_cached(self, enable_pixel_cache):
+        """Test sources that aren't cached"""
+        # Native pixel data in memory
+        pixel_array(EXPL_16_1_1F.ds)
+        # Native pixel data with `view_only`
+        pixel_array(EXPL_16_1_1F.path, view_only=True)
+        # File-likes that aren't files on disk
+        with open(RLE_16_1_1F.path, "rb") as f:
+            pixel_array(BytesIO(f.read()))
+
+        assert len(pixel_cache) == 0
+        assert (0, 0) == (pixel_cache.hits, pixel_cache.misses)
+
+        # Native pixel data in a file is cached
+        pixel_array(EXPL_16_1_1F.path)
+        assert len(pixel_cache) == 1
+
+
 class TestGetJpgParameters:
     """Tests for _get_jpg_parameters()"""
 
@@ -1234,6 +1779,31 @@ class TestGetJ2KParameters:
         assert info["precision"] == 8
         assert info["is_signed"] is False
         assert info["jp2"] is True
+        assert info["decomposition_levels"] == 5
+
+    def test_decomposition_levels(self):
+        """Test getting the number of decomposition levels."""
+        # SOC, SIZ, COM, COD, SOT
+        base = b"\xff\x4f\xff\x51\x00\x29" + b"\x00" * 36 + b"\x0f" + b"\x00" * 2
+        com = b"\xff\x64\x00\x04\x00\x01"
+        cod = b"\xff\x52\x00\x0c\x00\x00\x00\x01\x00\x03\x04\x04\x00\x01"
+        sot = b"\xff\x90\x00\x0a"
+        info = get_j2k_parameters(base + com + cod + sot)
+        assert info["precision"] == 16
+        assert info["decomposition_levels"] == 3
+
+        # COD must be in the main header
+        info = get_j2k_parameters(base + com + sot + cod)
+        assert "decomposition_levels" not in info
+
+        # Truncated COD
+        info = get_j2k_parameters(base + com + cod[:8])
+        assert info["precision"] == 16
+        assert "decomposition_levels" not in info
+
+        ds = J2KI_16_16_1_1_1F_M2.ds
+        info = get_j2k_parameters(get_frame(ds.PixelData, 0))
+        assert info["decomposition_levels"] == 5
 
 
 class TestGetNrFrames:
@@ -1377,6 +1947,28 @@ class TestPackBits:
         ):
             pack_bits(np.asarray([0, 0, 2, 0, 0, 0, 0, 0]))
 
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+    def test_non_binary_input_dtypes(self):
+        """Test non-binary input raises exception for each type of dtype."""
+        msg = r"Only binary arrays \(containing ones or"
+        with pytest.raises(ValueError, match=msg):
+            pack_bits(np.asarray([0, -1, 1], dtype="i2"))
+
+        with pytest.raises(ValueError, match=msg):
+            pack_bits(np.asarray([0, 255, 1], dtype="u1"))
+
+        with pytest.raises(ValueError, match=msg):
+            pack_bits(np.asarray([0, 0.5, 1], dtype="f4"))
+
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+    def test_input_dtypes(self):
+        """Test packing arrays with bool, int and float dtypes."""
+        ref = [1, 0, 1, 1, 0, 0, 0, 1, 1, 1]
+        for dtype in ("?", "u1", "i1", "u2", "i4", "u8", "f4", "f8"):
+            arr = np.asarray(ref, dtype=dtype)
+            assert b"\x8d\x03" == pack_bits(arr)
+            assert b"\x8d\x03" == pack_bits(arr.reshape(2, 5))
+
     @pytest.mark.skipif(HAVE_NP, reason="Numpy is available")
     def test_non_binary_input_no_numpy(self):
         """Test non-binary input raises exception."""
@@ -1614,6 +2206,32 @@ class TestConcatenatePackedFrames:
 
         assert concatenated == ref
 
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+    @pytest.mark.parametrize("pixels_per_frame", [1, 3, 7, 12, 17, 63, 255 * 5])
+    @pytest.mark.parametrize("n_frames", [1, 2, 9, 100])
+    def test_many_frames(self, pixels_per_frame, n_frames):
+        """Test concatenating many frames with a range of bit offsets."""
+        rng = np.random.default_rng(0)
+        arr = rng.integers(0, 2, (n_frames, pixels_per_frame), dtype="u1")
+        packed_frames = [pack_bits(frame, pad=False) for frame in arr]
+        for pad in (True, False):
+            concatenated = concatenate_packed_frames(
+                packed_frames, pixels_per_frame, pad=pad
+            )
+            assert concatenated == pack_bits(arr, pad=pad)
+
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+    def test_unused_bits_ignored(self):
+        """Test bits past the end of each frame are ignored."""
+        arr = np.asarray([[1, 0, 1], [1, 1, 0], [0, 1, 1]], dtype="u1")
+        packed_frames = [bytes([x[0] | 0b11111000]) for x in map(pack_bits, arr)]
+        concatenated = concatenate_packed_frames(packed_frames, 3, pad=False)
+        assert concatenated == pack_bits(arr, pad=False)
+
+        packed_frames = [b"\xff\xff"] * 4
+        concatenated = concatenate_packed_frames(packed_frames, 12, pad=False)
+        assert concatenated == b"\xff" * 6
+
     def test_wrong_frame_lengths(self):
 
         frames = [
@@ -1626,6 +2244,141 @@ class TestConcatenatePackedFrames:
             concatenate_packed_frames(frames, frame_length=16)
 
 
+@pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+class TestUnpackFrames:
+    """Tests for unpack_frames()."""
+
+    @pytest.mark.parametrize("pixels_per_frame", range(1, 25))
+    def test_unpack_frames(self, pixels_per_frame):
+        """Test unpacking every possible range of frames."""
+        n_frames = len(REFERENCE_BINARY_PIXELS) // pixels_per_frame
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        ref = np.asarray(
+            REFERENCE_BINARY_PIXELS[: n_frames * pixels_per_frame], dtype="u1"
+        ).reshape(n_frames, pixels_per_frame)
+
+        arr = unpack_frames(packed_data, pixels_per_frame, stop=n_frames)
+        assert arr.dtype == np.uint8
+        assert np.array_equal(arr, ref)
+
+        for start in range(n_frames):
+            for stop in range(start, n_frames + 1):
+                arr = unpack_frames(packed_data, pixels_per_frame, start, stop)
+                assert arr.shape == (stop - start, pixels_per_frame)
+                assert np.array_equal(arr, ref[start:stop])
+
+    def test_default_stop(self):
+        """Test the default `stop` is the number of complete frames."""
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS), pad=False)
+        assert unpack_frames(packed_data, 8).shape == (6, 8)
+        assert unpack_frames(packed_data, 10).shape == (4, 10)
+        assert unpack_frames(packed_data, 10, 1).shape == (3, 10)
+        assert unpack_frames(packed_data, 49).shape == (0, 49)
+
+    def test_out(self):
+        """Test unpacking into an existing array."""
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        ref = np.asarray(REFERENCE_BINARY_PIXELS[5:45], dtype="u1")
+
+        out = np.zeros((4, 2, 5), dtype=bool)
+        dst = out[1:3]
+        assert unpack_frames(packed_data, 10, 1, 3, out=dst) is dst
+        assert np.array_equal(out[1:3].ravel(), ref[5:25])
+        assert not out[0].any()
+        assert not out[3].any()
+
+        out = np.zeros(40, dtype="u1")
+        assert unpack_frames(packed_data, 5, 1, 9, out=out) is out
+        assert np.array_equal(out, ref)
+
+    def test_out_invalid_raises(self):
+        """Test an invalid `out` array raises an exception."""
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        msg = (
+            "'out' must be a writeable C-contiguous array with a 'uint8' or "
+            "'bool' dtype and 20 elements"
+        )
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, 0, 2, out=np.empty(20, dtype="u2"))
+
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, 0, 2, out=np.empty(21, dtype="u1"))
+
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, 0, 2, out=np.empty(40, dtype="u1")[::2])
+
+        out = np.empty(20, dtype="u1")
+        out.flags.writeable = False
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, 0, 2, out=out)
+
+    def test_invalid_range_raises(self):
+        """Test invalid frame ranges raise exceptions."""
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        msg = "'frame_length' must be greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 0)
+
+        msg = (
+            "'start' must be non-negative and no larger than 'stop', got "
+            "'start' -1 and 'stop' 2"
+        )
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, -1, 2)
+
+        msg = (
+            "'start' must be non-negative and no larger than 'stop', got "
+            "'start' 3 and 'stop' 2"
+        )
+        with pytest.raises(ValueError, match=msg):
+            unpack_frames(packed_data, 10, 3, 2)
+
+        msg = (
+            r"Length of 'src' \(6\) bytes is insufficient to contain frame with "
+            r"index 4 with given 'frame_length' \(10 pixels\)"
+        )
+        with pytest.raises(IndexError, match=msg):
+            unpack_frames(packed_data, 10, 0, 5)
+
+    def test_start_offset(self):
+        """Test using a non-zero `start_offset`."""
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        ref = unpack_frames(packed_data, 12, 2, 4)
+        for start_offset in range(1, 4):
+            arr = unpack_frames(
+                packed_data[start_offset:], 12, 2, 4, start_offset=start_offset
+            )
+            assert np.array_equal(arr, ref)
+
+        arr = unpack_frames(packed_data[3:], 12, 2, start_offset=3)
+        assert np.array_equal(arr, ref)
+
+        msg = (
+            "Requested frame with index 2 lies before the provided 'src' given "
+            "the 'start_offset' of 4"
+        )
+        with pytest.raises(IndexError, match=msg):
+            unpack_frames(packed_data[4:], 12, 2, 4, start_offset=4)
+
+    def test_batches(self, monkeypatch):
+        """Test unpacking the frames in batches."""
+        monkeypatch.setattr("pydicom.pixels.utils._UNPACK_BATCH_PIXELS", 30)
+        packed_data = pack_bits(bytes(REFERENCE_BINARY_PIXELS))
+        ref = np.asarray(REFERENCE_BINARY_PIXELS, dtype="u1")
+        for pixels_per_frame in (7, 12, 47):
+            n_frames = len(ref) // pixels_per_frame
+            out = np.empty(n_frames * pixels_per_frame, dtype=bool)
+            unpack_frames(packed_data, pixels_per_frame, stop=n_frames, out=out)
+            assert np.array_equal(out, ref[: n_frames * pixels_per_frame])
+
+    def test_functional(self):
+        """Test against a real dataset."""
+        ds = EXPL_1_1_3F_NONALIGNED.ds
+        frame_length = ds.Rows * ds.Columns
+        arr = unpack_frames(ds.PixelData, frame_length, stop=ds.NumberOfFrames)
+        assert np.array_equal(arr.reshape(ds.pixel_array.shape), ds.pixel_array)
+
+
 @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
 class TestExpandYBR422:
     """Tests for expand_ybr422()."""
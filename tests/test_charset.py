@@ -537,3 +537,81 @@ class TestCharset:
         ):
             encoded = pydicom.charset.encode_string("あaｱア", ["shift_jis"])
             assert b"?a??" == encoded
+
+    def test_decode_escaped_cached(self):
+        """Test values with escape sequences are decoded once."""
+        pydicom.charset._decode_escaped.cache_clear()
+        encodings = ["iso8859", "iso2022_jp"]
+        value = b"Yamada^Tarou=\x1b$B;3ED\x1b(B^\x1b$BB@O:\x1b(B="
+        decoded = pydicom.charset.decode_bytes(value, encodings, {0x5E})
+        assert "Yamada^Tarou=山田^太郎=" == decoded
+        assert decoded == pydicom.charset.decode_bytes(value, encodings, {0x5E})
+        info = pydicom.charset._decode_escaped.cache_info()
+        assert (1, 1) == (info.hits, info.misses)
+
+    def test_decode_escaped_delimiters(self):
+        """Test the first delimiter resets the encoding."""
+        encodings = ["latin_1", "iso_ir_126"]
+        value = b"\x1b-F\xc4\xe9\x0d\xc4\xe9\x0a\xc4"
+        decoded = pydicom.charset.decode_bytes(value, encodings, {0x0A, 0x0D})
+        assert "Δι\rÄé\nÄ" == decoded
+
+    def test_decode_escaped_invalid_not_cached(self, allow_reading_invalid_values):
+        """Test values that fail decoding warn every time."""
+        value = b"\x1b\x2d\x46\xc4\xe9\xef"
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Found unknown escape sequence"):
+                decoded = pydicom.charset.decode_bytes(value, ["latin_1"], set())
+
+            assert "\x1b-FÄéï" == decoded
+
+    def test_decode_values(self):
+        """Test decoding multiple values."""
+        encodings = ["iso8859", "euc_kr"]
+        values = [b"\x1b$)C\xfb\xf3", b"Hong", b"\x1b$)C\xfb\xf3"]
+        decoded = pydicom.charset.decode_values(values, encodings, set())
+        assert ["洪", "Hong", "洪"] == decoded
+        assert decoded[0] is decoded[2]
+        assert [] == pydicom.charset.decode_values([], encodings, set())
+
+    def test_decode_elements(self):
+        """Test decoding multiple elements."""
+        elements = [
+            DataElement(
+                0x00100010,
+                "PN",
+                b"Hong^Gildong=\x1b$)C\xfb\xf3^\x1b$)C\xd1\xce\xd4\xd7",
+            ),
+            DataElement(0x00104000, "LT", b"\x1b$)C\xfb\xf3"),
+            DataElement(0x00081030, "LO", [b"\x1b$)C\xfb\xf3", "Gildong"]),
+            DataElement(0x00100020, "LO", "Hong"),
+            DataElement(0x00081050, "PN", ""),
+        ]
+        pydicom.charset.decode_elements(elements, ["", "ISO 2022 IR 149"])
+        assert "Hong^Gildong=洪^吉洞" == elements[0].value
+        assert "洪" == elements[1].value
+        assert ["洪", "Gildong"] == elements[2].value
+        assert "Hong" == elements[3].value
+        assert "" == elements[4].value
+
+    def test_encode_escaped_cached(self):
+        """Test values that need escape sequences are encoded once."""
+        pydicom.charset._encode_escaped.cache_clear()
+        encodings = ["iso8859", "iso2022_jp"]
+        encoded = pydicom.charset.encode_string("山田", encodings)
+        assert b"\x1b$B;3ED\x1b(B" == encoded
+        assert encoded == pydicom.charset.encode_string("山田", encodings)
+        info = pydicom.charset._encode_escaped.cache_info()
+        assert (1, 1) == (info.hits, info.misses)
+
+        # Values that can be encoded with the first encoding aren't cached
+        assert b"Yamada" == pydicom.charset.encode_string("Yamada", encodings)
+        assert 1 == pydicom.charset._encode_escaped.cache_info().currsize
+
+    def test_encode_invalid_not_cached(self):
+        """Test values that fail encoding warn every time."""
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Failed to encode value"):
+                encoded = pydicom.charset.encode_string("山", ["latin_1", "iso8859_2"])
+
+            assert b"?" == encoded
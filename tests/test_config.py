@@ -153,3 +153,13 @@ class TestSettings:
         msg = r"VR lookup failed for the raw element with tag \(8888,0002\)"
         with pytest.raises(KeyError, match=msg):
             convert_raw_data_element(raw)
+
+    def test_read_ahead_size(self):
+        assert 0 == config.settings.read_ahead_size
+        config.settings.read_ahead_size = 1024
+        assert 1024 == config.settings.read_ahead_size
+        config.settings.read_ahead_size = 0
+
+        msg = "The read ahead size must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            config.settings.read_ahead_size = -1
@@ -6,6 +6,7 @@ import copy
 import datetime
 import math
 import io
+import pickle
 import platform
 import re
 import struct
@@ -15,12 +16,13 @@ import pytest
 
 from pydicom import filewriter, config, dcmread
 from pydicom.charset import default_encoding
-from pydicom.data import get_testdata_file
+from pydicom.data import get_charset_files, get_testdata_file
 from pydicom.datadict import add_private_dict_entry
 from pydicom.dataelem import (
     DataElement,
     RawDataElement,
     convert_raw_data_element,
+    convert_raw_data_elements,
 )
 from pydicom.dataset import Dataset
 from pydicom.errors import BytesLengthException
@@ -38,6 +40,7 @@ from pydicom.uid import UID
 from pydicom.valuerep import (
     BUFFERABLE_VRS,
     DSfloat,
+    _cached_validation,
     validate_value,
     STR_VR,
     ALLOW_BACKSLASH,
@@ -304,6 +307,46 @@ class TestDataElement:
         dd.descripWidth = 0
         assert DataElement(0x00100010, "PN", "ANON") == dd
 
+    def test_pickle(self):
+        """Test pickling an element using slots."""
+        elem = DataElement(0x00100010, "PN", "ANON", file_value_tell=10)
+        elem.showVR = False
+        elem.private_creator = "FOO"
+        elem2 = pickle.loads(pickle.dumps(elem))
+        assert elem == elem2
+        assert elem2.file_tell == 10
+        assert elem2.private_creator == "FOO"
+        assert not elem2.showVR
+        assert DataElement.showVR
+
+    def test_setstate_instance_dict(self):
+        """Test restoring the state of an element pickled without slots."""
+        elem = DataElement.__new__(DataElement)
+        elem.__setstate__(
+            {
+                "tag": BaseTag(0x00100010),
+                "VR": "PN",
+                "validation_mode": 0,
+                "_value": "ANON",
+                "file_tell": None,
+                "is_undefined_length": False,
+                "private_creator": None,
+                "showVR": False,
+            }
+        )
+        assert elem == DataElement(0x00100010, "PN", "ANON")
+        assert not elem.showVR
+
+    def test_deepcopy_slots(self):
+        """Test deepcopy copies the slot and instance attributes."""
+        elem = DataElement(0x00100010, "PN", "ANON", file_value_tell=10)
+        elem.descripWidth = 10
+        elem2 = copy.deepcopy(elem)
+        assert elem == elem2
+        assert elem2.file_tell == 10
+        assert elem2.descripWidth == 10
+        assert elem.value is not elem2.value
+
     def test_inequality_standard(self):
         """Test DataElement.__ne__ for standard element"""
         dd = DataElement(0x00100010, "PN", "ANON")
@@ -961,6 +1004,107 @@ class TestConvertRawDataElementHooks:
         assert elem.value == "AB:CD:EF"
 
 
+def _elem_attrs(elem):
+    """Return the attributes of a converted element for comparison."""
+    return (
+        elem.tag,
+        elem.VR,
+        elem.value,
+        elem.file_tell,
+        elem.is_undefined_length,
+        elem.validation_mode,
+        elem.private_creator,
+    )
+
+
+class TestConvertRawDataElements:
+    """Tests for convert_raw_data_elements()"""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            get_testdata_file("CT_small.dcm"),
+            get_testdata_file("MR_small_implicit.dcm"),
+            get_testdata_file("MR_small_bigendian.dcm"),
+            get_testdata_file("rtplan.dcm"),
+            get_testdata_file("reportsi_with_empty_number_tags.dcm"),
+            get_charset_files("chrH31.dcm")[0],
+        ],
+    )
+    def test_matches_single(self, path):
+        """Test the elements match those from convert_raw_data_element()"""
+        ds = dcmread(path)
+        encoding = ds._character_set
+        raws = [elem for elem in ds._dict.values() if isinstance(elem, RawDataElement)]
+        elements = convert_raw_data_elements(raws, encoding=encoding, ds=ds)
+        assert len(elements) == len(raws)
+        for raw, elem in zip(raws, elements):
+            assert isinstance(elem, DataElement)
+            ref = convert_raw_data_element(raw, encoding=encoding, ds=ds)
+            assert _elem_attrs(ref) == _elem_attrs(elem)
+
+    def test_empty(self):
+        """Test converting nothing"""
+        assert convert_raw_data_elements([]) == []
+
+    def test_empty_values(self):
+        """Test elements with no value"""
+        raws = [
+            RawDataElement(Tag(0x00100010), "PN", 0, b"", 0, False, True),
+            RawDataElement(Tag(0x00280010), "US", 0, b"", 0, False, True),
+            RawDataElement(Tag(0x00200032), "DS", 0, b"", 0, False, True),
+        ]
+        elements = convert_raw_data_elements(raws)
+        assert [elem.value for elem in elements] == ["", None, None]
+
+    def test_implicit_vr(self):
+        """Test the VR is looked up for implicit VR elements"""
+        raws = [
+            RawDataElement(Tag(0x00280010), None, 2, b"\x02\x00", 0, True, True),
+            RawDataElement(Tag(0x00100020), None, 4, b"1234", 8, True, True),
+        ]
+        rows, patient_id = convert_raw_data_elements(raws)
+        assert ("US", 2, 0) == (rows.VR, rows.value, rows.file_tell)
+        assert ("LO", "1234", 8) == (
+            patient_id.VR,
+            patient_id.value,
+            patient_id.file_tell,
+        )
+
+    def test_conversion_failure(self, monkeypatch):
+        """Test a failed conversion is handled by convert_raw_data_element()"""
+        raws = [
+            RawDataElement(Tag(0x00280010), "US", 2, b"\x02\x00", 0, False, True),
+            RawDataElement(Tag(0x00280011), "US", 3, b"\x02\x00\x00", 0, False, True),
+        ]
+        msg = "Expected total bytes to be an even multiple of bytes per value"
+        with pytest.raises(BytesLengthException, match=msg):
+            convert_raw_data_elements(raws)
+
+        monkeypatch.setattr(config, "convert_wrong_length_to_UN", True)
+        msg = "Setting VR to 'UN'"
+        with pytest.warns(UserWarning, match=msg):
+            rows, columns = convert_raw_data_elements(raws)
+
+        assert ("US", 2) == (rows.VR, rows.value)
+        assert b"\x02\x00\x00" == columns.value
+        with pytest.warns(UserWarning, match=msg):
+            ref = convert_raw_data_element(raws[1])
+
+        assert _elem_attrs(ref) == _elem_attrs(columns)
+
+    def test_hooks(self, reset_hooks):
+        """Test changed hooks are used"""
+
+        def func(raw, data, **kwargs):
+            data["VR"] = "LO"
+
+        hooks.register_callback("raw_element_vr", func)
+        raw = RawDataElement(Tag(0x00280010), "US", 4, b"1234", 0, False, True)
+        (elem,) = convert_raw_data_elements([raw])
+        assert ("LO", "1234") == (elem.VR, elem.value)
+
+
 class TestDataElementValidation:
     @staticmethod
     def check_invalid_vr(vr, value, check_warn=True):
@@ -980,6 +1124,18 @@ class TestDataElementValidation:
         DataElement(0x00410001, vr, value, validation_mode=config.RAISE)
         validate_value(vr, value, config.RAISE)
 
+    def test_cached_validation(self):
+        """Test the validation results are cached"""
+        info = _cached_validation.cache_info()
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Invalid value for VR CS: 'ct'"):
+                validate_value("CS", "ct", config.WARN)
+
+        validate_value("CS", b"CT", config.RAISE)
+        validate_value("UR", "http://example.com", config.RAISE)
+        assert _cached_validation.cache_info().hits > info.hits
+        assert _cached_validation.cache_info().currsize <= info.currsize + 2
+
     @pytest.mark.parametrize(
         "vr, length",
         (
@@ -1479,6 +1635,90 @@ class TestDataElementValidation:
                 DataElement(0x00410001, vr, value, validation_mode=config.RAISE)
 
 
+class TestDeferredValidation:
+    """Tests for DataElement with deferred validation"""
+
+    def test_default(self):
+        """Test validation isn't deferred by default"""
+        assert not config.settings.deferred_validation
+        elem = DataElement(0x00080060, "CS", "CT", validation_mode=config.RAISE)
+        assert not elem._pending_validation
+
+    def test_set_value(self, deferred_validation):
+        """Test validation is deferred when setting a value"""
+        elem = DataElement(0x00080060, "CS", "ct", validation_mode=config.RAISE)
+        assert elem._pending_validation
+        assert "ct" == elem.value
+
+        msg = (
+            r"Invalid value for \(0008,0060\) 'Modality': Invalid value for VR "
+            r"CS: 'ct'"
+        )
+        with pytest.raises(ValueError, match=msg):
+            elem._validate_pending()
+
+        assert elem._pending_validation
+        elem.value = "CT"
+        elem._validate_pending()
+        assert not elem._pending_validation
+
+    def test_warn(self, deferred_validation):
+        """Test deferred validation with the WARN mode"""
+        elem = DataElement(0x00080060, "CS", "ct", validation_mode=config.WARN)
+        with pytest.warns(UserWarning, match="Invalid value for VR CS: 'ct'"):
+            elem._validate_pending()
+
+        assert not elem._pending_validation
+
+    def test_ignore(self, deferred_validation):
+        """Test elements with the IGNORE mode aren't flagged"""
+        elem = DataElement(0x00080060, "CS", "ct", validation_mode=config.IGNORE)
+        assert not elem._pending_validation
+
+    @pytest.mark.parametrize(
+        "vr, value, msg",
+        (
+            ("DS", 1 / 3, r"The value length \(18\) exceeds the maximum length"),
+            ("IS", "1234567890123", r"The value length \(13\) exceeds the maximum"),
+            ("PN", "A=B=C=D", "The number of PN components length"),
+            ("UI", "1.02", "Invalid value for VR UI: '1.02'"),
+            ("US", [1, -1], "a value for a tag with VR US must be between 0 and"),
+        ),
+    )
+    def test_converted_values(self, deferred_validation, vr, value, msg):
+        """Test validating values converted when set"""
+        elem = DataElement(0x00410001, vr, value, validation_mode=config.RAISE)
+        assert elem._pending_validation
+        with pytest.raises(ValueError, match=msg):
+            elem._validate_pending()
+
+    def test_lut_descriptor(self, deferred_validation):
+        """Test the first LUT Descriptor value is validated as US"""
+        elem = DataElement(0x00283002, "SS", [40000, -1, 16])
+        elem._validate_pending()
+        elem = DataElement(0x00283002, "SS", [-1, 0, 16])
+        with pytest.warns(UserWarning, match="VR US must be between 0 and 65535"):
+            elem._validate_pending()
+
+    def test_converted_from_raw(self, deferred_validation):
+        """Test elements read from a file aren't flagged"""
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        ds.convert_all()
+        assert not any(elem._pending_validation for elem in ds)
+        assert not ds["PatientName"]._pending_validation
+
+    def test_pickle(self, deferred_validation):
+        """Test pickling keeps the pending state"""
+        elem = DataElement(0x00080060, "CS", "ct")
+        assert pickle.loads(pickle.dumps(elem))._pending_validation
+
+        state = elem.__getstate__()
+        del state["_pending_validation"]
+        elem2 = DataElement.__new__(DataElement)
+        elem2.__setstate__(state)
+        assert not elem2._pending_validation
+
+
 class TestBufferedDataElement:
     """Tests setting a DataElement value to a buffer"""
 
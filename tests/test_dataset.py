@@ -37,7 +37,7 @@ from pydicom.dataset import (
 )
 from pydicom.encaps import encapsulate
 from pydicom.errors import BytesLengthException
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomInflateIO
 from pydicom.pixels.utils import get_image_pixel_ids
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag
@@ -404,6 +404,62 @@ class TestDataset:
         ds = Dataset({Tag(test_tag): test_elem})
         assert ds[test_tag] == ds.get(test_tag)
 
+    def test_get_many(self):
+        """Test Dataset.get_many()"""
+        assert [] == self.ds.get_many([])
+        assert ["unit001", None, None] == self.ds.get_many(
+            ["TreatmentMachineName", "PatientName", "NotAMember"]
+        )
+        assert ["not-there", "unit001", "unit001"] == self.ds.get_many(
+            iter(["PatientName", "TreatmentMachineName", "TreatmentMachineName"]),
+            "not-there",
+        )
+        self.ds.foo = "bar"
+        assert ["bar", "unit001"] == self.ds.get_many(["foo", "TreatmentMachineName"])
+
+    def test_get_many_raw(self):
+        """Test Dataset.get_many() converts raw elements."""
+        ds = Dataset()
+        ds[0x00100010] = RawDataElement(
+            Tag(0x00100010), "PN", 4, b"test", 0, True, True
+        )
+        ds[0x00100020] = RawDataElement(
+            Tag(0x00100020), None, 4, b"1234", 0, True, True
+        )
+        ds[0x00280106] = RawDataElement(
+            Tag(0x00280106), "US or SS", 2, b"\x01\x00", 0, True, True
+        )
+        ds[0x00280103] = RawDataElement(
+            Tag(0x00280103), "US", 2, b"\x00\x00", 0, True, True
+        )
+        ds[0x00100030] = RawDataElement(
+            Tag(0x00100030), "DA", 8, b"20000101", 0, True, True
+        )
+        values = ds.get_many(
+            ["PatientID", "PatientName", "PatientID", "SmallestImagePixelValue"]
+        )
+        assert ["1234", "test", "1234", 1] == values
+        assert isinstance(ds._dict[0x00100010], DataElement)
+        assert "LO" == ds["PatientID"].VR
+        assert "US" == ds["SmallestImagePixelValue"].VR
+        # Elements that weren't requested aren't converted
+        assert isinstance(ds._dict[0x00100030], RawDataElement)
+
+    def test_keyword_access(self):
+        """Test getting and setting elements using keywords."""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        assert "PN" == ds["PatientName"].VR
+        assert "CITIZEN^Jan" == ds.PatientName
+        ds.PatientName = "CITIZEN^John"
+        assert "CITIZEN^John" == ds.PatientName
+        ds[0x00100020] = RawDataElement(
+            Tag(0x00100020), None, 4, b"1234", 0, True, True
+        )
+        assert "1234" == ds.PatientID
+        with pytest.raises(AttributeError):
+            ds.PatientSex
+
     def test__setitem__(self):
         """Dataset: if set an item, it must be a DataElement instance."""
         ds = Dataset()
@@ -1143,6 +1199,68 @@ class TestDataset:
         ds2 = pickle.loads(s)["ds"]
         assert ds2[0x000B0010].value == "Foo"
 
+    def test_lazy_state(self):
+        """Test the rarely used state is only added when changed."""
+        ds = Dataset()
+        assert "_private_blocks" not in ds.__dict__
+        assert "_pixel_array_opts" not in ds.__dict__
+        assert ds._pixel_array is None
+        assert ds._pixel_id == {}
+        assert ds._pixel_array_opts == {"use_pdh": False}
+
+        ds.private_block(0x000B, "Foo", create=True)
+        assert 1 == len(ds._private_blocks)
+        assert 0 == len(Dataset._private_blocks)
+        assert 0 == len(Dataset()._private_blocks)
+
+    def test_slots_pickle(self):
+        """Test pickling a dataset restores the slot and instance attributes."""
+        ds = Dataset()
+        ds.PatientName = "Foo"
+        ds.set_original_encoding(False, True, "ISO_IR 100")
+        ds.is_undefined_length_sequence_item = True
+        ds.foo = "bar"
+
+        ds2 = pickle.loads(pickle.dumps(ds))
+        assert ds == ds2
+        assert ds2.original_encoding == (False, True)
+        assert ds2.original_character_set == "ISO_IR 100"
+        assert ds2.is_undefined_length_sequence_item
+        assert ds2.foo == "bar"
+
+    def test_setstate_instance_dict(self):
+        """Test restoring the state of a dataset pickled without slots."""
+        ds = Dataset.__new__(Dataset)
+        ds.__setstate__(
+            {
+                "_parent_encoding": "iso8859",
+                "_dict": {},
+                "_private_blocks": {},
+                "_pixel_array": None,
+                "_pixel_array_opts": {"use_pdh": False},
+                "_pixel_id": {},
+                "_read_charset": "iso8859",
+                "_read_implicit": None,
+                "_read_little": None,
+                "_is_implicit_VR": None,
+                "_is_little_endian": None,
+                "_pixel_rep": None,
+                "is_undefined_length_sequence_item": False,
+            }
+        )
+        ds.PatientName = "Foo"
+        assert ds.PatientName == "Foo"
+        assert "_pixel_id" in ds.__dict__
+
+    def test_delattr_slot(self):
+        """Test deleting a slot attribute."""
+        ds = Dataset()
+        del ds.is_undefined_length_sequence_item
+        assert not hasattr(ds, "is_undefined_length_sequence_item")
+        msg = "is_undefined_length_sequence_item"
+        with pytest.raises(AttributeError, match=msg):
+            del ds.is_undefined_length_sequence_item
+
     def test_private_creator_from_raw_ds(self):
         # regression test for #1078
         ct_filename = get_testdata_file("CT_small.dcm")
@@ -1598,6 +1716,104 @@ class TestDataset:
         assert "FIXED" == ds.BeamSequence[1].PatientID
         assert "Other^Name" == ds.BeamSequence[1].PatientName
 
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "CT_small.dcm",
+            "MR_small_implicit.dcm",
+            "MR_small_bigendian.dcm",
+            "rtplan.dcm",
+            "nested_priv_SQ.dcm",
+        ],
+    )
+    def test_convert_all(self, name):
+        """Test Dataset.convert_all() matches converting each element"""
+
+        def convert_each(ds):
+            for tag in list(ds._dict):
+                if ds[tag].VR == VR.SQ:
+                    for item in ds[tag].value:
+                        convert_each(item)
+
+        def attrs(ds):
+            for elem in ds._dict.values():
+                assert isinstance(elem, DataElement)
+                yield elem.tag, elem.VR, elem.private_creator, elem.value
+                if elem.VR == VR.SQ:
+                    for item in elem.value:
+                        yield from attrs(item)
+
+        path = get_testdata_file(name)
+        ref = dcmread(path)
+        convert_each(ref)
+        ds = dcmread(path)
+        ds.convert_all()
+        assert list(attrs(ref)) == list(attrs(ds))
+
+    def test_convert_all_not_recursive(self):
+        """Test Dataset.convert_all() with recursive=False"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        ds.convert_all(recursive=False)
+        assert all(isinstance(elem, DataElement) for elem in ds._dict.values())
+        item = ds._dict[Tag("BeamSequence")].value[0]
+        assert isinstance(item._dict[Tag("BeamName")], RawDataElement)
+
+    def test_convert_all_deferred(self):
+        """Test Dataset.convert_all() reads deferred elements"""
+        path = get_testdata_file("MR_small.dcm")
+        ds = dcmread(path, defer_size=256)
+        assert ds._dict[Tag("PixelData")].value is None
+        ds.convert_all()
+        assert ds.PixelData == dcmread(path).PixelData
+
+    def test_convert_all_charset(self):
+        """Test Dataset.convert_all() uses the character set"""
+        ds = Dataset()
+        ds.SpecificCharacterSet = "ISO_IR 192"
+        ds.PatientName = "Wang^XiaoDong=王^小東"
+        fp = DicomBytesIO()
+        ds.save_as(fp, implicit_vr=False)
+        ds = dcmread(fp, force=True)
+        ds.convert_all()
+        assert ds._dict[Tag("PatientName")].value == "Wang^XiaoDong=王^小東"
+
+    def test_walk_iterall_convert(self):
+        """Test walk() and iterall() convert the raw elements"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        ds.walk(lambda ds, elem: None, recursive=False)
+        assert all(isinstance(elem, DataElement) for elem in ds._dict.values())
+
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        assert len(list(ds.iterall())) > 0
+        item = ds._dict[Tag("BeamSequence")].value[0]
+        assert isinstance(item._dict[Tag("BeamName")], DataElement)
+
+    def test_validate_deferred(self, deferred_validation):
+        """Test validate_deferred() validates the flagged elements"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        item = ds.BeamSequence[0]
+        item.BeamName = "a" * 65
+        assert item["BeamName"]._pending_validation
+        with pytest.warns(UserWarning, match="The value length"):
+            ds.validate_deferred()
+
+        assert not item["BeamName"]._pending_validation
+
+        with config.strict_reading():
+            ds.PatientID = "Foo"
+            ds.SOPInstanceUID = "1.02"
+
+        with pytest.raises(ValueError, match="Invalid value for VR UI"):
+            ds.validate_deferred()
+
+        ds.SOPInstanceUID = "1.2"
+        ds.validate_deferred()
+        assert not ds["SOPInstanceUID"]._pending_validation
+        assert not ds["PatientID"]._pending_validation
+
+        # Raw elements are skipped and not converted
+        assert isinstance(ds._dict[Tag("PatientName")], RawDataElement)
+
     def test_update_with_dataset(self):
         """Regression test for #779"""
         ds = Dataset()
@@ -2530,11 +2746,10 @@ class TestFileDataset:
         assert ds.buffer is buffer
         assert ds.fileobj_type == io.BytesIO
 
-        # Deflated datasets get inflated to a DicomBytesIO() buffer
+        # Deflated datasets are inflated by a DicomInflateIO() buffer
         ds = dcmread(get_testdata_file("image_dfl.dcm"))
         assert ds.filename.endswith("image_dfl.dcm")
-        assert isinstance(ds.buffer, DicomBytesIO)
-        assert ds.fileobj_type == DicomBytesIO
+        assert isinstance(ds.buffer, DicomInflateIO)
 
 
 class TestDatasetOverlayArray:
@@ -95,6 +95,19 @@ class TestDict:
         ds.TestOne = 42
         ds.TestTwo = ["1", "2", "3"]
 
+    def test_add_entries_keyword_access(self):
+        """Test new entries can be used after a keyword has been looked up"""
+        ds = Dataset()
+        ds.TestThree = 42
+        assert "TestThree" not in ds
+        assert 42 == ds.TestThree
+        del ds.TestThree
+
+        add_dict_entries({0x10021003: ("UL", "1", "Test Three", "", "TestThree")})
+        ds.TestThree = 42
+        assert "UL" == ds["TestThree"].VR
+        assert 42 == ds[0x10021003].value
+
     def test_add_entries_raises_for_private_tags(self):
         new_dict_items = {
             0x10021001: ("UL", "1", "Test One", "", "TestOne"),
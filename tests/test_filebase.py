@@ -2,11 +2,23 @@
 """Test for filebase.py"""
 
 from io import BytesIO
+import os
+import random
+import zlib
 
 import pytest
 
+from pydicom import config
 from pydicom.data import get_testdata_file
-from pydicom.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom.filebase import (
+    DicomIO,
+    DicomFileLike,
+    DicomFile,
+    DicomBytesIO,
+    DicomDeflateIO,
+    DicomInflateIO,
+    DicomReadAheadIO,
+)
 from pydicom.tag import Tag
 
 
@@ -287,6 +299,294 @@ class TestDicomBytesIO:
         assert fp.getvalue() == b"\x00\x01\x00\x02"
 
 
+class TestDicomReadAheadIO:
+    """Test filebase.DicomReadAheadIO class"""
+
+    def test_init(self):
+        """Test __init__"""
+        buffer = BytesIO(b"\x00\x01\x02\x03")
+        buffer.seek(1)
+        fp = DicomReadAheadIO(buffer, block_size=2)
+        assert fp.parent is buffer
+        assert 2 == fp.block_size
+        assert 2 == fp.max_block_size
+        assert 1 == fp.tell()
+        assert not fp.closed
+
+        fp = DicomReadAheadIO(buffer, block_size=2, max_block_size=8)
+        assert 8 == fp.max_block_size
+
+        fp = DicomReadAheadIO(buffer)
+        assert config.settings.buffered_read_size == fp.block_size
+
+        with pytest.raises(ValueError, match="'block_size' must be greater than 0"):
+            DicomReadAheadIO(buffer, block_size=-1)
+
+    def test_read(self):
+        """Test reads are coalesced into blocks"""
+        data = bytes(range(256))
+        fp = DicomReadAheadIO(BytesIO(data), block_size=16)
+        assert data[:4] == fp.read(4)
+        assert data[4:12] == fp.read(8)
+        assert 12 == fp.tell()
+        assert 1 == fp.nr_reads
+        assert 16 == fp.bytes_read
+
+        # Spanning the end of the block
+        assert data[12:20] == fp.read(8)
+        assert 2 == fp.nr_reads
+        assert 32 == fp.bytes_read
+
+        # Large reads aren't buffered
+        assert data[20:120] == fp.read(100)
+        assert 3 == fp.nr_reads
+        assert data[120:] == fp.read()
+        assert b"" == fp.read(4)
+        assert 256 == fp.tell()
+
+    def test_block_size_increases(self):
+        """Test the block size increases for sequential reads"""
+        data = bytes(range(256)) * 4
+        fp = DicomReadAheadIO(BytesIO(data), block_size=16, max_block_size=64)
+        read = b""
+        totals = []
+        while data := fp.read(8):
+            read += data
+            if fp.bytes_read not in totals:
+                totals.append(fp.bytes_read)
+
+        assert bytes(range(256)) * 4 == read
+        assert [16, 48, 112, 176, 240] == totals[:5]
+
+        # Seeking outside the block resets the size
+        fp.seek(0)
+        fp.read(8)
+        assert 1024 + 16 == fp.bytes_read
+
+    def test_seek(self):
+        """Test seeking"""
+        data = bytes(range(256))
+        fp = DicomReadAheadIO(BytesIO(data), block_size=64)
+        fp.read(4)
+
+        # Within the block
+        assert 40 == fp.seek(40)
+        assert data[40:44] == fp.read(4)
+        assert 2 == fp.seek(2)
+        assert data[2:4] == fp.read(2)
+        assert 10 == fp.seek(6, os.SEEK_CUR)
+        assert data[10:12] == fp.read(2)
+        assert 0 == fp.nr_seeks
+        assert 1 == fp.nr_reads
+
+        # Outside the block
+        assert 128 == fp.seek(128)
+        assert data[128:132] == fp.read(4)
+        assert 1 == fp.nr_seeks
+        assert 2 == fp.nr_reads
+
+        assert 246 == fp.seek(-10, os.SEEK_END)
+        assert data[246:] == fp.read(20)
+        assert 2 == fp.nr_seeks
+        assert 256 == fp.tell()
+
+    def test_read_exact(self):
+        """Test DicomIO methods use the read-ahead"""
+        fp = DicomReadAheadIO(BytesIO(b"\x00\x01\x02\x03\x04\x05"))
+        fp.is_little_endian = True
+        assert 0x0100 == fp.read_US()
+        assert 0x05040302 == fp.read_UL()
+        with pytest.raises(EOFError):
+            fp.read_exact(4)
+
+    def test_write_raises(self):
+        """Test writing isn't supported"""
+        fp = DicomReadAheadIO(BytesIO())
+        with pytest.raises(TypeError, match="object has no write"):
+            fp.write(b"\x00")
+
+    def test_close(self):
+        """Test closing the read-ahead closes the buffer"""
+        with DicomReadAheadIO(open(TEST_FILE, "rb", buffering=0)) as fp:
+            assert fp.read(4) == b"\x49\x49\x2a\x00"
+            assert not fp.closed
+
+        assert fp.closed
+        assert fp.parent.closed
+
+
+def deflate(data):
+    """Return `data` compressed using raw deflate."""
+    return zlib.compress(data, wbits=-zlib.MAX_WBITS)
+
+
+class TestDicomInflateIO:
+    """Test filebase.DicomInflateIO class"""
+
+    def test_init(self):
+        """Test __init__"""
+        buffer = BytesIO(b"\x00" + deflate(b"\x01\x02\x03"))
+        buffer.seek(1)
+        fp = DicomInflateIO(buffer, block_size=2, history_size=8)
+        assert fp.parent is buffer
+        assert 2 == fp.block_size
+        assert 8 == fp.history_size
+        assert 0 == fp.tell()
+        assert 0 == fp.bytes_read
+        assert not fp.closed
+
+        fp = DicomInflateIO(buffer)
+        assert 64 * 1024 == fp.block_size
+
+        with pytest.raises(ValueError, match="'block_size' must be greater than 0"):
+            DicomInflateIO(buffer, block_size=0)
+
+        msg = "'history_size' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            DicomInflateIO(buffer, history_size=-1)
+
+    def test_read(self):
+        """Test reading inflates the data"""
+        data = bytes(range(256)) * 1024
+        # Padding after the compressed data is ignored
+        buffer = BytesIO(b"\x00\x01" + deflate(data) + b"\x00")
+        buffer.seek(2)
+        fp = DicomInflateIO(buffer, block_size=64)
+        assert data[:4] == fp.read(4)
+        assert data[4:12] == fp.read(8)
+        assert 12 == fp.tell()
+        # Only the compressed data needed has been read
+        assert fp.bytes_read < len(buffer.getvalue())
+
+        assert data[12:100000] == fp.read(100000 - 12)
+        assert data[100000:] == fp.read()
+        assert b"" == fp.read(4)
+        assert len(data) == fp.tell()
+
+    def test_seek(self):
+        """Test seeking"""
+        data = bytes(range(256)) * 1024
+        fp = DicomInflateIO(BytesIO(deflate(data)), history_size=1024)
+        fp.read(4)
+
+        # Within the inflated data
+        assert 40 == fp.seek(40)
+        assert data[40:44] == fp.read(4)
+        assert 10 == fp.seek(-34, os.SEEK_CUR)
+        assert data[10:12] == fp.read(2)
+        assert 0 == fp.nr_restarts
+
+        # Forwards past the inflated data
+        assert 200000 == fp.seek(200000)
+        assert data[200000:200004] == fp.read(4)
+        assert 0 == fp.nr_restarts
+
+        # Backwards past the kept history restarts inflation
+        assert 2 == fp.seek(2)
+        assert data[2:10] == fp.read(8)
+        assert 1 == fp.nr_restarts
+
+        assert len(data) - 10 == fp.seek(-10, os.SEEK_END)
+        assert data[-10:] == fp.read(20)
+        assert len(data) == fp.tell()
+
+        with pytest.raises(ValueError, match="Negative seek position -1"):
+            fp.seek(-1)
+
+        with pytest.raises(ValueError, match="Invalid 'whence' value: 3"):
+            fp.seek(0, 3)
+
+    def test_truncated(self):
+        """Test reading truncated compressed data"""
+        data = bytes(range(256)) * 16
+        fp = DicomInflateIO(BytesIO(deflate(data)[:-10]))
+        assert data.startswith(fp.read())
+
+    def test_read_exact(self):
+        """Test DicomIO methods use the inflated data"""
+        fp = DicomInflateIO(BytesIO(deflate(b"\x00\x01\x02\x03\x04\x05")))
+        fp.is_little_endian = True
+        assert 0x0100 == fp.read_US()
+        assert 0x05040302 == fp.read_UL()
+        with pytest.raises(EOFError):
+            fp.read_exact(4)
+
+    def test_write_raises(self):
+        """Test writing isn't supported"""
+        fp = DicomInflateIO(BytesIO())
+        with pytest.raises(TypeError, match="object has no write"):
+            fp.write(b"\x00")
+
+
+class TestDicomDeflateIO:
+    """Test filebase.DicomDeflateIO class"""
+
+    def test_init(self):
+        """Test __init__"""
+        buffer = BytesIO()
+        fp = DicomDeflateIO(buffer, block_size=16, level=9)
+        assert fp.parent is buffer
+        assert 16 == fp.block_size
+        assert 0 == fp.tell()
+        assert 0 == fp.bytes_written
+
+        with pytest.raises(ValueError, match="'block_size' must be greater than 0"):
+            DicomDeflateIO(buffer, block_size=0)
+
+    def test_write(self):
+        """Test writing deflates the data"""
+        data = random.Random(0).randbytes(256 * 1024)
+        buffer = BytesIO()
+        fp = DicomDeflateIO(buffer, block_size=1024)
+        for idx in range(0, len(data), 1000):
+            assert len(data[idx : idx + 1000]) == fp.write(data[idx : idx + 1000])
+
+        assert len(data) == fp.tell()
+        # Data is compressed as it's written
+        assert 0 < fp.bytes_written
+        assert fp.bytes_written == len(buffer.getvalue())
+
+        assert 4 == fp.write(memoryview(b"\x00\x01\x02\x03"))
+        length = fp.finish()
+        assert len(buffer.getvalue()) == length == fp.bytes_written
+        # Finishing again does nothing
+        assert length == fp.finish()
+        assert data + b"\x00\x01\x02\x03" == zlib.decompress(
+            buffer.getvalue(), wbits=-zlib.MAX_WBITS
+        )
+
+        msg = "Unable to write to the 'DicomDeflateIO' after finish()"
+        with pytest.raises(ValueError, match=msg):
+            fp.write(b"\x00")
+
+    def test_write_tag(self):
+        """Test DicomIO methods use the compressor"""
+        buffer = BytesIO()
+        fp = DicomDeflateIO(buffer)
+        fp.is_little_endian = True
+        fp.write_tag(0x00100020)
+        fp.write_US(1)
+        fp.finish()
+        assert b"\x10\x00\x20\x00\x01\x00" == zlib.decompress(
+            buffer.getvalue(), wbits=-zlib.MAX_WBITS
+        )
+
+    def test_seek_raises(self):
+        """Test seeking isn't supported"""
+        fp = DicomDeflateIO(BytesIO())
+        fp.write(b"\x00\x01")
+        assert 2 == fp.seek(2)
+        assert 2 == fp.seek(0, os.SEEK_CUR)
+        with pytest.raises(OSError, match="'DicomDeflateIO' doesn't support seeking"):
+            fp.seek(0)
+
+    def test_read_raises(self):
+        """Test reading isn't supported"""
+        fp = DicomDeflateIO(BytesIO())
+        with pytest.raises(TypeError, match="object has no read"):
+            fp.read(1)
+
+
 class TestDicomFile:
     """Test filebase.DicomFile() function"""
 
@@ -8,7 +8,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from struct import unpack
+from struct import pack, unpack
 import sys
 import tempfile
 import time
@@ -25,10 +25,14 @@ from pydicom.filereader import (
     read_dataset,
     data_element_generator,
     read_file_meta_info,
+    read_deferred_data_element,
+    read_deferred_data_elements,
+    _little_endian_element_generator,
+    _FAST_PATH_CHUNK_SIZE,
 )
-from pydicom.dataelem import DataElement, convert_raw_data_element
+from pydicom.dataelem import DataElement, RawDataElement, convert_raw_data_element
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomInflateIO, DicomReadAheadIO
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag
@@ -286,9 +290,39 @@ class TestReader:
         # If we can read anything else, the decompression must have been ok.
         ds = dcmread(deflate_name)
         assert "WSD" == ds.ConversionType
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
         assert ds.filename == deflate_name
 
+    def test_deflate_stop_early(self):
+        """Test reading a deflated dataset inflates only the data needed"""
+        ds = dcmread(deflate_name)
+        ds.PixelData = os.urandom(1024 * 1024)
+        ds["PixelData"].VR = "OB"
+        fp = BytesIO()
+        ds.save_as(fp)
+        length = len(fp.getvalue())
+
+        fp.seek(0)
+        ds = dcmread(fp)
+        assert ds.PixelData == ds.PixelData
+        assert ds.buffer.bytes_read == length - 0x14E
+
+        fp.seek(0)
+        ds = dcmread(fp, stop_before_pixels=True)
+        assert "WSD" == ds.ConversionType
+        assert "PixelData" not in ds
+        assert ds.buffer.bytes_read < length // 4
+
+        fp.seek(0)
+        ds = dcmread(fp, specific_tags=["ConversionType"])
+        assert "WSD" == ds.ConversionType
+        assert ds.buffer.bytes_read < length // 4
+
+        # Deferred values are read from the inflated buffer
+        fp.seek(0)
+        ds = dcmread(fp, defer_size=1024)
+        assert 1024 * 1024 == len(ds.PixelData)
+
     def test_sequence_with_implicit_vr(self):
         """Test that reading a UN sequence with unknown length and implicit VR
         in a dataset with explicit VR is read regardless of the value of
@@ -1633,6 +1667,157 @@ class TestDeferredRead:
         with pytest.raises(OSError):
             ds.PixelData
 
+    def test_read_ahead(self):
+        """Test deferred reads with read-ahead enabled."""
+        ref = dcmread(ct_name)
+        config.settings.read_ahead_size = 65536
+        try:
+            ds = dcmread(ct_name, defer_size=2000)
+            assert ct_name == ds.filename
+            assert ds.fileobj_type is open
+            assert ds.buffer is None
+            assert ds.get_item("PixelData", keep_deferred=True).value is None
+            assert ref.PixelData == ds.PixelData
+            assert ref == ds
+        finally:
+            config.settings.read_ahead_size = 0
+
+    def test_file_handle_pool(self):
+        """Test deferred reads using the file handle pool."""
+        from pydicom.filereader import deferred_read_pool
+
+        ref = dcmread(ct_name)
+        ds = dcmread(ct_name, defer_size=1024)
+        deferred_read_pool.max_size = 4
+        try:
+            assert ref.PixelData == ds.PixelData
+            assert ct_name in deferred_read_pool
+            private_block = ds.private_block(0x43, "GEMS_PARM_01")
+            assert ref[0x00431029].value == private_block[0x29].value
+            assert 1 == len(deferred_read_pool)
+        finally:
+            deferred_read_pool.max_size = 0
+
+        assert 0 == len(deferred_read_pool)
+
+    def test_deferred_mismatch_raises(self, tmp_path):
+        """Test deferred reads raise if the element has changed."""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.EncapsulatedDocument = b"\x03" * 2048
+        ds.save_as(tmp_path / "foo.dcm", implicit_vr=False, little_endian=True)
+
+        deferred = dcmread(tmp_path / "foo.dcm", defer_size=1024, force=True)
+        ds.save_as(tmp_path / "foo.dcm", implicit_vr=True, little_endian=True)
+        mtime = deferred.timestamp + 10
+        os.utime(deferred.filename, (mtime, mtime))
+
+        elem = deferred.get_item("EncapsulatedDocument", keep_deferred=True)
+        with pytest.warns(UserWarning, match="file modification time has changed"):
+            with pytest.raises(ValueError, match="Deferred read VR .* does not match"):
+                read_deferred_data_element(
+                    open, deferred.filename, deferred.timestamp, elem
+                )
+
+    def test_load_deferred(self):
+        """Test Dataset.load_deferred() reads all deferred elements."""
+        ref = dcmread(ct_name)
+        ds = dcmread(ct_name, defer_size=1024)
+        deferred = [
+            elem.tag
+            for elem in ds._dict.values()
+            if isinstance(elem, RawDataElement) and elem.value is None
+        ]
+        assert 0x7FE00010 in deferred
+        assert 0x00431029 in deferred
+
+        ds.load_deferred()
+        for tag in deferred:
+            assert not isinstance(ds._dict[tag], RawDataElement)
+            assert ref[tag].value == ds[tag].value
+
+        # Already loaded
+        ds.load_deferred()
+
+    def test_load_deferred_tags(self):
+        """Test Dataset.load_deferred() with `tags`."""
+        ref = dcmread(ct_name)
+        ds = dcmread(ct_name, defer_size=1024)
+        ds.load_deferred(["PixelData", 0x00100010, 0x00990010])
+        assert not isinstance(ds._dict[0x7FE00010], RawDataElement)
+        assert ref.PixelData == ds._dict[0x7FE00010].value
+        assert ds.get_item(0x00431029, keep_deferred=True).value is None
+
+    def test_load_deferred_coalesced(self):
+        """Test elements close together are read using one read."""
+        ds = Dataset()
+        ds.add_new(0x00090010, "LO", "Private")
+        ds.add_new(0x00091010, "OB", b"\x01" * 2000)
+        ds.add_new(0x00091011, "OB", b"\x02" * 2000)
+        # Not deferred, but too far apart to read together
+        for idx in range(10):
+            ds.add_new(0x00091020 + idx, "LT", f"{idx:02d}" * 500)
+
+        ds.add_new(0x00091030, "OB", b"\x03" * 2000)
+        buffer = DicomBytesIO()
+        ds.save_as(buffer, implicit_vr=False, little_endian=True)
+
+        fp = DicomReadAheadIO(BytesIO(buffer.getvalue()), block_size=16)
+        deferred = dcmread(fp, defer_size=1024, force=True)
+        nr_reads = fp.nr_reads
+        deferred.load_deferred()
+        assert 2 == fp.nr_reads - nr_reads
+        for tag in (0x00091010, 0x00091011, 0x00091030):
+            assert ds[tag].value == deferred[tag].value
+
+        assert ds == deferred
+
+    def test_load_deferred_file_changed(self, tmp_path):
+        """Test Dataset.load_deferred() warns once if the file has changed."""
+        p = tmp_path / "foo.dcm"
+        shutil.copy(ct_name, p)
+        ds = dcmread(p, defer_size=1024)
+        os.utime(p, (ds.timestamp + 10, ds.timestamp + 10))
+        with pytest.warns(UserWarning) as record:
+            ds.load_deferred()
+
+        assert 1 == len(record)
+
+        p.unlink()
+        ds = dcmread(ct_name, defer_size=1024)
+        ds.filename = os.fspath(p)
+        with pytest.raises(OSError, match="is missing"):
+            ds.load_deferred()
+
+    def test_read_deferred_data_elements(self):
+        """Test read_deferred_data_elements()"""
+        ds = dcmread(ct_name, defer_size=1024)
+        elements = [
+            ds.get_item(0x7FE00010, keep_deferred=True),
+            ds.get_item(0x00431029, keep_deferred=True),
+        ]
+        assert [] == read_deferred_data_elements(open, ct_name, None, [])
+        result = read_deferred_data_elements(open, ct_name, None, elements)
+        assert [0x00431029, 0x7FE00010] == [elem.tag for elem in result]
+        assert 32768 == len(result[1].value)
+        assert 2068 == len(result[0].value)
+
+        msg = "Deferred read -- original filename not stored"
+        with pytest.raises(OSError, match=msg):
+            read_deferred_data_elements(open, None, None, elements)
+
+        with gzip.open(gzip_name) as f:
+            ds = dcmread(f, defer_size=1)
+
+        elements = [
+            elem
+            for elem in ds._dict.values()
+            if isinstance(elem, RawDataElement) and elem.value is None and elem.length
+        ]
+        result = read_deferred_data_elements(gzip.open, gzip_name, None, elements)
+        assert len(elements) == len(result)
+        assert all(elem.value is not None for elem in result)
+
     def test_values_identical(self, enable_debugging, caplog):
         """Deferred values exactly matches normal read."""
         ds_norm = dcmread(ct_name)
@@ -1687,7 +1872,8 @@ class TestDeferredRead:
         """Deferred values work with file-like objects."""
         path = get_testdata_file("image_dfl.dcm")
         ds = pydicom.dcmread(path, defer_size=1024)
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
+        assert ds.buffer.closed
         assert 262144 == len(ds.PixelData)
 
 
@@ -1812,6 +1998,159 @@ class TestDataElementGenerator:
         assert elem == convert_raw_data_element(next(gen), encoding="ISO_IR 100")
 
 
+def _encode_elem(tag, vr, value, implicit=False):
+    """Return a little endian encoded element."""
+    group, elem = tag >> 16, tag & 0xFFFF
+    if implicit:
+        return pack("<HHL", group, elem, len(value)) + value
+
+    if vr in ("OB", "OW", "SQ", "UN", "UT"):
+        return pack("<HH2sHL", group, elem, vr.encode(), 0, len(value)) + value
+
+    return pack("<HH2sH", group, elem, vr.encode(), len(value)) + value
+
+
+class TestLittleEndianElementGenerator:
+    """Test filereader._little_endian_element_generator"""
+
+    def compare(self, data, implicit=False, **kwargs):
+        """Check the fast and general parsers give the same results."""
+
+        def parse(func):
+            fp = BytesIO(data)
+            elements = [
+                (e.tag, e.VR, e.value, getattr(e, "value_tell", None)) for e in func(fp)
+            ]
+            return elements, fp.tell()
+
+        fast = parse(
+            lambda fp: _little_endian_element_generator(fp, implicit, **kwargs)
+        )
+        slow = parse(lambda fp: data_element_generator(fp, implicit, True, **kwargs))
+        assert slow == fast
+        return fast
+
+    @pytest.mark.parametrize("implicit", [True, False])
+    def test_chunk_boundary(self, implicit):
+        """Test values and headers that span the read chunk boundary."""
+        data = b"".join(
+            _encode_elem(0x00090000 + idx, "LO", b"A" * (idx % 64), implicit)
+            for idx in range(1, 6000)
+        )
+        assert len(data) > 2 * _FAST_PATH_CHUNK_SIZE
+        # A value larger than a chunk starting part way through a chunk
+        data += _encode_elem(0x00110010, "OB", b"\x01" * 100000, implicit)
+        data += _encode_elem(0x00110011, "LO", b"END ", implicit)
+        elements, tell = self.compare(data, implicit)
+        assert 6001 == len(elements)
+        assert b"\x01" * 100000 == elements[-2][2]
+        assert (0x00110011, None if implicit else "LO", b"END ") == elements[-1][:3]
+        assert len(data) - 4 == elements[-1][3]
+        assert len(data) == tell
+
+        # Header split across the boundary
+        for offset in range(-12, 1):
+            prefix = _encode_elem(
+                0x00090001, "OB", b"\x00" * (_FAST_PATH_CHUNK_SIZE + offset), implicit
+            )
+            elements, _ = self.compare(prefix + data[:200], implicit)
+            assert 0x00090001 == elements[0][0]
+
+    def test_fallback(self):
+        """Test the general parser is used for unusual elements."""
+        # Unknown VR that looks like implicit VR
+        data = _encode_elem(0x00100010, "PN", b"Citizen^Jan ")
+        data += pack("<HHL", 0x0010, 0x0020, 4) + b"1234"
+        # Unknown VR
+        data += pack("<HH2sH", 0x0010, 0x0021, b"XX", 2) + b"AB"
+        # Undefined length sequence and item
+        item = _encode_elem(0x00100030, "DA", b"20010101")
+        data += pack("<HH2sHL", 0x0010, 0x1002, b"SQ", 0, 0xFFFFFFFF)
+        data += pack("<HHL", 0xFFFE, 0xE000, 0xFFFFFFFF) + item
+        data += pack("<HHL", 0xFFFE, 0xE00D, 0)
+        data += pack("<HHL", 0xFFFE, 0xE0DD, 0)
+        # Undefined length OB
+        data += pack("<HH2sHL", 0x0011, 0x0010, b"OB", 0, 0xFFFFFFFF)
+        data += b"\x00\x01\x02\x03" + pack("<HHL", 0xFFFE, 0xE0DD, 0)
+        data += _encode_elem(0x00110011, "LO", b"END ")
+        elements, _ = self.compare(data)
+        tags = [e[0] for e in elements]
+        assert [
+            0x00100010,
+            0x00100020,
+            0x00100021,
+            0x00101002,
+            0x00110010,
+            0x00110011,
+        ] == tags
+        assert b"1234" == elements[1][2]
+        assert "XX" == elements[2][1]
+        assert "20010101" == elements[3][2][0].PatientBirthDate
+        assert b"\x00\x01\x02\x03" == elements[4][2]
+
+        # Item delimiter ends the dataset after reading the delimiter
+        data = item + pack("<HHL", 0xFFFE, 0xE00D, 0) + item
+        elements, tell = self.compare(data)
+        assert 1 == len(elements)
+        assert len(item) + 8 == tell
+
+        # Truncated header and value at the end of the data
+        elements, tell = self.compare(item + b"\x10\x00\x10\x00OB")
+        assert 1 == len(elements)
+        elements, tell = self.compare(item + b"\x10\x00\x10\x00PN\x04\x00AB")
+        assert b"AB" == elements[1][2]
+
+    def test_stop_when(self):
+        """Test stop_when rewinds to the start of the element."""
+        data = _encode_elem(0x00100010, "PN", b"Citizen^Jan ")
+        start = len(data)
+        data += _encode_elem(0x7FE00010, "OB", b"\x00" * 100)
+
+        def stop_when(tag, vr, length):
+            return tag == 0x7FE00010
+
+        elements, tell = self.compare(data, stop_when=stop_when)
+        assert 1 == len(elements)
+        assert start == tell
+
+        ds = read_dataset(BytesIO(data), False, True, stop_when=stop_when)
+        assert 0x7FE00010 not in ds
+
+    def test_defer_size(self):
+        """Test deferred values past the end of the buffer."""
+        data = _encode_elem(0x00100010, "PN", b"Citizen^Jan ")
+        data += _encode_elem(0x00110010, "OB", b"\x02" * (3 * _FAST_PATH_CHUNK_SIZE))
+        data += _encode_elem(0x00110011, "LO", b"END ")
+        elements, tell = self.compare(data, defer_size=1024)
+        assert 3 == len(elements)
+        assert elements[1][2] is None
+        assert b"END " == elements[2][2]
+        assert len(data) == tell
+
+    def test_defer_size_read(self, tmp_path):
+        """Test deferred values read with the fast path can be read later."""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.EncapsulatedDocument = b"\x03" * (3 * _FAST_PATH_CHUNK_SIZE)
+        ds.DocumentTitle = "Title"
+        ds.save_as(tmp_path / "foo.dcm", implicit_vr=False, little_endian=True)
+
+        ds = dcmread(tmp_path / "foo.dcm", defer_size=1024, force=True)
+        assert ds.get_item("EncapsulatedDocument", keep_deferred=True).value is None
+        assert "Title" == ds.DocumentTitle
+        assert b"\x03" * (3 * _FAST_PATH_CHUNK_SIZE) == ds.EncapsulatedDocument
+
+    def test_specific_tags(self):
+        """Test reading only specific tags."""
+        data = _encode_elem(0x00080005, "CS", b"ISO_IR 192")
+        data += _encode_elem(0x00100010, "PN", b"Citizen^Jan ")
+        data += _encode_elem(0x00110010, "OB", b"\x02" * (3 * _FAST_PATH_CHUNK_SIZE))
+        data += _encode_elem(0x00110011, "LO", b"END ")
+        elements, tell = self.compare(data, specific_tags=[0x00110011])
+        assert [0x00080005, 0x00110011] == [e[0] for e in elements]
+        assert len(data) == tell
+
+
 def test_read_file_meta_info():
     """Test read_file_meta_info()"""
     ds = read_file_meta_info(rtplan_name)
@@ -1,6 +1,7 @@
 import os
 import platform
 import sys
+import warnings
 from pathlib import Path
 import shutil
 from tempfile import TemporaryDirectory
@@ -2019,6 +2020,105 @@ class TestFileSet_Load:
         sop_instances = [ii.SOPInstanceUID for ii in matches]
         assert 17 == len(list(set(sop_instances)))
 
+    def test_find_multi_value(self, dicomdir):
+        """Test FileSet.find() with multiple value matching."""
+        fs = FileSet(dicomdir)
+        assert 31 == len(fs.find(PatientID=["77654033", "98890234"]))
+        assert 7 == len(fs.find(PatientID=("77654033", "unknown")))
+        assert [] == fs.find(PatientID=["unknown"])
+        matches = fs.find(Modality=["CT", "MR"], PatientID="98890234")
+        assert 24 == len(matches)
+        assert all(ii.Modality in ("CT", "MR") for ii in matches)
+
+    def test_find_range(self, dicomdir):
+        """Test FileSet.find() with range matching."""
+        fs = FileSet(dicomdir)
+        assert 10 == len(fs.find(StudyDate="20010101-20011231"))
+        assert 14 == len(fs.find(StudyDate="-20011231"))
+        assert 27 == len(fs.find(StudyDate="20000101-"))
+        assert 31 == len(fs.find(StudyDate="-"))
+        assert [] == fs.find(StudyDate="20040101-")
+        # Partial upper value
+        assert 14 == len(fs.find(StudyDate="-2001"))
+
+    def test_find_wildcard(self, dicomdir):
+        """Test FileSet.find() with wildcard matching."""
+        fs = FileSet(dicomdir)
+        assert 31 == len(fs.find(PatientID="*"))
+        assert 7 == len(fs.find(PatientID="776540??"))
+        assert [] == fs.find(PatientID="776540?")
+        assert 20 == len(fs.find(Modality="?R"))
+        matches = fs.find(StudyDescription="*Brain*")
+        assert matches
+        assert all("Brain" in ii.StudyDescription for ii in matches)
+        # Not supported for UI
+        assert [] == fs.find(StudyInstanceUID="*")
+
+    def test_find_combined(self, dicomdir):
+        """Test FileSet.find() combining indexed and unindexed elements."""
+        fs = FileSet(dicomdir)
+        instances = list(fs)
+        uid = "1.3.6.1.4.1.5962.1.1.0.0.0.1196530851.28319.0.1"
+        queries = [
+            ({"PatientID": "98890234", "StudyDate": "20030505"}, range(14, 31)),
+            ({"StudyDate": "19950903-20010101", "Modality": "*"}, range(14)),
+            (
+                {"StudyTime": "-05", "Modality": ["CT", "CR"]},
+                [0, 1, 2, 7, 8, 9, 10, 11, 12, 13],
+            ),
+            ({"StudyInstanceUID": uid}, range(3, 7)),
+            ({"StudyInstanceUID": uid, "StudyDescription": "Carotids"}, []),
+            ({"PatientID": "77654033", "PatientName": "Doe^Archibald"}, range(7)),
+        ]
+        for query, indices in queries:
+            assert [instances[idx] for idx in indices] == fs.find(**query)
+
+    def test_find_index_add_remove(self, dicomdir, ct):
+        """Test searching after adding and removing instances."""
+        fs = FileSet(dicomdir)
+        assert [] == fs.find(PatientID=ct.PatientID)
+        instance = fs.add(ct)
+        assert [instance] == fs.find(PatientID=ct.PatientID)
+        assert [instance] == fs.find(SOPInstanceUID=ct.SOPInstanceUID)
+        assert [instance] == fs.find(StudyDate=f"{ct.StudyDate}-")
+        assert ct.PatientID in fs.find_values("PatientID")
+        assert ct.StudyDate in fs.find_values("StudyDate")
+        assert instance is fs.add(ct)
+
+        fs.remove(instance)
+        assert [] == fs.find(PatientID=ct.PatientID)
+        assert [] == fs.find(StudyDate=f"{ct.StudyDate}-")
+        assert ct.PatientID not in fs.find_values("PatientID")
+        assert ct.StudyDate not in fs.find_values("StudyDate")
+
+        instance = fs.add(ct)
+        assert [instance] == fs.find(StudyDate=f"{ct.StudyDate}-")
+        assert instance == fs.find(PatientID="*")[-1]
+
+        fs.clear()
+        assert [] == list(fs)
+        msg = r"None of the records in the DICOMDIR dataset contain \['PatientID'\]"
+        with pytest.warns(UserWarning, match=msg):
+            assert [] == fs.find_values("PatientID")
+
+    def test_find_missing_element_warns(self, dicomdir):
+        """Test FileSet.find() warns if no record has all the elements."""
+        fs = FileSet(dicomdir)
+        msg = (
+            r"None of the records in the DICOMDIR dataset contain all "
+            r"the query elements"
+        )
+        with pytest.warns(UserWarning, match=msg):
+            assert [] == fs.find(SeriesDate="20010101", PatientID="77654033")
+
+        with pytest.warns(UserWarning, match=msg):
+            assert [] == fs.find(Rows=512, PatientID="77654033")
+
+        # Elements present but no matching values doesn't warn
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert [] == fs.find(PatientID="unknown", StudyDescription="Brain")
+
     def test_find_load(self, private):
         """Test FileSet.find(load=True)."""
         fs = FileSet(private)
@@ -2034,6 +2134,38 @@ class TestFileSet_Load:
         results = fs.find(load=True, PhotometricInterpretation="MONOCHROME1")
         assert 3 == len(results)
 
+    def test_find_load_cache(self, private):
+        """Test FileSet.find(load=True) only reads uncached elements."""
+        fs = FileSet(private)
+        results = fs.find(load=True, PhotometricInterpretation="MONOCHROME*")
+        assert 31 == len(results)
+        instance = results[0]
+        assert {Tag("PhotometricInterpretation")} == instance._cached_tags
+        assert "PixelData" not in instance._cache
+        assert "Rows" not in instance._cache
+
+        fs.find(load=True, Rows=512, PhotometricInterpretation="MONOCHROME1")
+        assert Tag("Rows") in instance._cached_tags
+        assert "Rows" in instance._cache
+
+        fs.clear_cache()
+        assert not instance._cached_tags
+        assert "Rows" not in instance._cache
+
+        fs.find_values("Rows", load=True)
+        assert "Rows" in instance._cache
+        fs.remove(instance)
+        assert "Rows" not in instance._cache
+
+    def test_find_load_unknown_keyword(self, private):
+        """Test FileSet.find(load=True) with an unknown keyword."""
+        fs = FileSet(private)
+        assert [] == fs.find(load=True, Foo="x")
+        assert [] == fs.find(load=True, Foo="x", PatientID="77654033")
+        msg = r"Invalid value 'Foo' used with the 'in' operator"
+        with pytest.warns(UserWarning, match=msg):
+            assert {"Foo": []} == fs.find_values(["Foo"], load=True)
+
     def test_find_values(self, private):
         """Test searching the FileSet for element values."""
         fs = FileSet(private)
@@ -1,7 +1,9 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """Test suite for util functions"""
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, RawIOBase
+import os
 from pathlib import Path
 import platform
 import tempfile
@@ -10,6 +12,7 @@ import pytest
 
 from pydicom.config import settings
 from pydicom.fileutil import (
+    FileHandlePool,
     path_from_pathlike,
     check_buffer,
     reset_buffer_position,
@@ -57,6 +60,99 @@ def reset_buffered_read_size():
     settings.buffered_read_size = original
 
 
+class TestFileHandlePool:
+    """Tests for FileHandlePool"""
+
+    @pytest.fixture
+    def paths(self, tmp_path):
+        paths = []
+        for idx in range(4):
+            paths.append(tmp_path / f"{idx}.bin")
+            paths[-1].write_bytes(bytes([idx]) * 8 + bytes(range(256)))
+
+        return paths
+
+    def test_read(self, paths):
+        """Test reading from pooled files"""
+        pool = FileHandlePool(max_size=2)
+        assert 2 == pool.max_size
+        assert b"\x00\x00\x00\x01" == pool.read(paths[0], 6, 4)
+        assert paths[0] in pool
+        assert 1 == len(pool)
+
+        assert b"\x00\x01" == pool.read(os.fspath(paths[0]), 8, 2)
+        assert 1 == len(pool)
+
+        # Reads past the end of the file are short
+        assert b"\xfe\xff" == pool.read(paths[0], 262, 10)
+        assert b"" == pool.read(paths[0], 300, 10)
+        pool.close()
+
+    def test_eviction(self, paths):
+        """Test the least recently used file is closed"""
+        with FileHandlePool(max_size=2) as pool:
+            pool.read(paths[0], 0, 1)
+            pool.read(paths[1], 0, 1)
+            pool.read(paths[0], 0, 1)
+            assert b"\x02" == pool.read(paths[2], 0, 1)
+            assert paths[0] in pool
+            assert paths[1] not in pool
+            assert paths[2] in pool
+
+            pool.max_size = 1
+            assert 1 == len(pool)
+            assert paths[2] in pool
+
+            pool.max_size = 0
+            assert b"\x03" == pool.read(paths[3], 0, 1)
+            assert 0 == len(pool)
+
+        msg = "'max_size' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            pool.max_size = -1
+
+    def test_modified(self, paths):
+        """Test a modified file is reopened"""
+        with FileHandlePool() as pool:
+            assert b"\x00" == pool.read(paths[0], 0, 1)
+            mtime = os.stat(paths[0]).st_mtime
+            paths[0].write_bytes(b"\x01\x02")
+            os.utime(paths[0], (mtime + 10, mtime + 10))
+            assert b"\x01\x02" == pool.read(paths[0], 0, 2)
+
+    def test_close(self, paths):
+        """Test closing the pool"""
+        with FileHandlePool() as pool:
+            for path in paths:
+                pool.read(path, 0, 1)
+
+            assert 4 == len(pool)
+
+        assert 0 == len(pool)
+        # Can still be used after closing
+        assert b"\x01" == pool.read(paths[1], 0, 1)
+        pool.close()
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test reading a missing file raises"""
+        with FileHandlePool() as pool:
+            with pytest.raises(FileNotFoundError):
+                pool.read(tmp_path / "missing.bin", 0, 1)
+
+    def test_threads(self, paths):
+        """Test reading from multiple threads"""
+
+        def read(idx):
+            path = paths[idx % 4]
+            return pool.read(path, 8 + idx % 256, 1)
+
+        with FileHandlePool(max_size=2) as pool:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                result = list(executor.map(read, range(1000)))
+
+        assert [bytes([idx % 256]) for idx in range(1000)] == result
+
+
 class TestBufferFunctions:
     """Test for the buffer functions"""
 
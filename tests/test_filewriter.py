@@ -327,6 +327,26 @@ class TestWriteFile:
 
         assert unzipped_rewritten == unzipped_original
 
+    def test_write_deflated_sequences(self):
+        """Test writing nested sequences and buffered values when deflating"""
+        ds = dcmread(deflate_name)
+        item = Dataset()
+        item.BeamSequence = [Dataset(), Dataset()]
+        item.BeamSequence[0].PatientName = "Citizen^Jan"
+        ds.ReferencedImageSequence = [item]
+        ds.PixelData = BytesIO(ds.PixelData)
+        ds.save_as(self.file_out)
+
+        self.file_out.seek(0x14E)
+        assert len(self.file_out.read()) % 2 == 0
+
+        self.file_out.seek(0)
+        ds = dcmread(self.file_out)
+        seq = ds.ReferencedImageSequence[0].BeamSequence
+        assert "Citizen^Jan" == seq[0].PatientName
+        assert 2 == len(seq)
+        assert dcmread(deflate_name).PixelData == ds.PixelData
+
     def test_write_dataset_without_encoding(self):
         """Test that write_dataset() raises if encoding not set."""
         msg = (
@@ -1510,6 +1530,29 @@ class TestDCMWrite:
         fp.seek(0)
         assert fp.getvalue() == b"\x00\x10\x00\x10\x00\x00\x00\x04\x46\x6f\x6f\x20"
 
+    def test_deferred_validation(self, deferred_validation):
+        """Test values with deferred validation are validated when writing."""
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.ImplementationVersionName = "X" * 17
+        ds.BeamSequence = [Dataset()]
+        with config.strict_reading():
+            ds.BeamSequence[0].Modality = "ct"
+
+        msg = (
+            r"Invalid value for \(0008,0060\) 'Modality': Invalid value for VR "
+            r"CS: 'ct'"
+        )
+        fp = DicomBytesIO()
+        with pytest.warns(UserWarning, match=r"The value length \(17\)"):
+            with pytest.raises(ValueError, match=msg):
+                dcmwrite(fp, ds, implicit_vr=True)
+
+        assert fp.tell() == 0
+        ds.BeamSequence[0].Modality = "CT"
+        dcmwrite(fp, ds, implicit_vr=True)
+        assert fp.tell() > 0
+
     def test_bad_filename(self):
         """Test that TypeError is raised for a bad filename."""
         ds = dcmread(ct_name)
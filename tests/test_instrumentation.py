@@ -0,0 +1,205 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Tests for the instrumentation module"""
+
+from io import BytesIO
+from struct import pack
+
+import pytest
+
+from pydicom import dcmread, instrumentation
+from pydicom.data import get_testdata_file
+from pydicom.dataset import Dataset
+from pydicom.filebase import DicomBytesIO, DicomReadAheadIO
+from pydicom.filereader import read_dataset
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    """Tests for the instrumentation functions"""
+
+    def test_disabled(self):
+        """Test nothing is collected by default"""
+        assert not instrumentation.enabled
+        ds = dcmread(CT_SMALL)
+        ds.decode()
+        assert {} == instrumentation.snapshot()
+
+    def test_enable_disable(self):
+        """Test enabling and disabling collection"""
+        instrumentation.enable()
+        assert instrumentation.enabled
+        dcmread(CT_SMALL)
+        instrumentation.disable()
+        assert not instrumentation.enabled
+        dcmread(CT_SMALL)
+
+        stats = instrumentation.snapshot()
+        assert 1 == stats["dcmread"]["count"]
+        assert stats["dcmread"]["bytes"] > 0
+        assert stats["dcmread"]["time"] > 0
+
+        instrumentation.reset()
+        assert {} == instrumentation.snapshot()
+
+    def test_record(self):
+        """Test record() and snapshot()"""
+        instrumentation.record("foo", 0.5, 10)
+        instrumentation.record("foo", 0.25)
+        instrumentation.record("bar", 1.0, 2)
+        assert {
+            "foo": {"count": 2, "time": 0.75, "bytes": 10},
+            "bar": {"count": 1, "time": 1.0, "bytes": 2},
+        } == instrumentation.snapshot()
+
+    def test_collect(self):
+        """Test collect() scopes collection to the block"""
+        instrumentation.record("foo", 1.0, 2)
+        with instrumentation.collect() as stats:
+            assert instrumentation.enabled
+            instrumentation.record("foo", 0.5, 1)
+            instrumentation.record("bar", 0.25)
+            assert {} == stats
+
+        assert not instrumentation.enabled
+        assert {
+            "foo": {"count": 1, "time": 0.5, "bytes": 1},
+            "bar": {"count": 1, "time": 0.25, "bytes": 0},
+        } == stats
+
+        # Nested blocks don't disable collection on exit
+        instrumentation.enable()
+        with instrumentation.collect():
+            pass
+
+        assert instrumentation.enabled
+
+    def test_timed(self):
+        """Test the timed() decorator"""
+
+        @instrumentation.timed("foo")
+        def func(a, b=1):
+            """Docstring"""
+            return a + b
+
+        assert "Docstring" == func.__doc__
+        assert 3 == func(2)
+        assert {} == instrumentation.snapshot()
+
+        with instrumentation.collect() as stats:
+            assert 4 == func(2, b=2)
+
+        assert 1 == stats["foo"]["count"]
+
+
+class TestInstrumentedPaths:
+    """Tests for the instrumented code paths"""
+
+    def test_convert(self):
+        """Test raw element conversions are recorded per VR"""
+        ds = dcmread(CT_SMALL)
+        with instrumentation.collect() as stats:
+            ds.PatientName
+            ds.Rows
+            ds.Columns
+
+        assert 1 == stats["convert.PN"]["count"]
+        assert 2 == stats["convert.US"]["count"]
+
+    def test_dcmread(self):
+        """Test dcmread() is recorded"""
+        with instrumentation.collect() as stats:
+            dcmread(CT_SMALL)
+
+        with open(CT_SMALL, "rb") as f:
+            assert len(f.read()) == stats["dcmread"]["bytes"]
+
+    def test_deferred_read(self):
+        """Test deferred reads are recorded"""
+        ds = dcmread(CT_SMALL, defer_size=1024)
+        with instrumentation.collect() as stats:
+            ds.PixelData
+
+        assert 1 == stats["deferred_read"]["count"]
+        assert 32768 == stats["deferred_read"]["bytes"]
+
+        ds = dcmread(CT_SMALL, defer_size=1024)
+        with instrumentation.collect() as stats:
+            ds.load_deferred()
+
+        assert 32768 + 2068 <= stats["deferred_read"]["bytes"]
+
+    def test_io_read(self):
+        """Test reads by DicomIO are recorded"""
+        data = pack("<HHL", 0x0010, 0x0010, 4) + b"ABCD"
+        fp = DicomBytesIO(data)
+        fp.read(4)
+        assert {} == instrumentation.snapshot()
+
+        with instrumentation.collect() as stats:
+            fp = DicomBytesIO(data)
+            ds = read_dataset(fp, True, True)
+
+        assert "ABCD" == ds.PatientName
+        assert stats["io.read"]["bytes"] >= len(data)
+
+        with instrumentation.collect() as stats:
+            fp = DicomReadAheadIO(BytesIO(data), block_size=4)
+            fp.read(12)
+
+        assert 1 == stats["io.read"]["count"]
+        assert 12 == stats["io.read"]["bytes"]
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_decode(self):
+        """Test frame decoding is recorded per plugin"""
+        ds = dcmread(get_testdata_file("MR_small_RLE.dcm"))
+        with instrumentation.collect() as stats:
+            ds.pixel_array
+
+        assert 1 == stats["decode.pydicom"]["count"]
+        assert 64 * 64 * 2 == stats["decode.pydicom"]["bytes"]
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_encode(self):
+        """Test frame encoding is recorded per plugin"""
+        from pydicom.pixels.encoders import RLELosslessEncoder
+
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        with instrumentation.collect() as stats:
+            RLELosslessEncoder.encode(ds, encoding_plugin="pydicom")
+
+        assert 1 == stats["encode.pydicom"]["count"]
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_processing(self):
+        """Test colour conversion and LUTs are recorded"""
+        from pydicom.pixels import apply_modality_lut, convert_color_space
+
+        ds = Dataset()
+        ds.RescaleSlope = 2
+        ds.RescaleIntercept = 1
+        arr = np.ones((4, 4, 3), dtype="u1")
+        with instrumentation.collect() as stats:
+            apply_modality_lut(arr, ds)
+            convert_color_space(arr, "RGB", "YBR_FULL")
+
+        assert 1 == stats["lut.apply_modality_lut"]["count"]
+        assert 1 == stats["convert_color_space"]["count"]
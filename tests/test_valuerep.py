@@ -68,6 +68,30 @@ class TestTM:
         assert loaded_tm.original_string == tm.original_string
         assert str(loaded_tm) == str(tm)
 
+    @pytest.mark.parametrize(
+        "value, expected",
+        (
+            ("010203", time(1, 2, 3)),
+            ("010203.1", time(1, 2, 3, 100000)),
+            ("235959.123456", time(23, 59, 59, 123456)),
+            # Not fully specified or out of range, uses the regex
+            ("0102", time(1, 2)),
+            ("010203.", time(1, 2, 3)),
+        ),
+    )
+    def test_new_str_full(self, value, expected):
+        """Test converting fully and partially specified values."""
+        tm = pydicom.valuerep.TM(value)
+        assert tm == expected
+        assert str(tm) == value
+
+    @pytest.mark.parametrize("value", ("240000", "006000", "01020a", "010203.1a"))
+    def test_new_str_full_invalid(self, value):
+        """Test converting invalid fully specified values."""
+        msg = f"Unable to convert non-conformant value '{value}' to 'TM' object"
+        with pytest.raises(ValueError, match=msg):
+            pydicom.valuerep.TM(value)
+
     def test_pickling_tm_from_time(self):
         tm = pydicom.valuerep.TM(time(21, 22, 23))
         assert tm.original_string == "212223"
@@ -247,6 +271,41 @@ class TestDT:
         with pytest.raises(ValueError, match=msg):
             pydicom.valuerep.DT("a2000,00,00")
 
+    @pytest.mark.parametrize(
+        "value, expected",
+        (
+            ("20010203040506", datetime(2001, 2, 3, 4, 5, 6)),
+            ("20010203040506.1", datetime(2001, 2, 3, 4, 5, 6, 100000)),
+            ("20010203040506.123456", datetime(2001, 2, 3, 4, 5, 6, 123456)),
+            (
+                "20010203040506+0130",
+                datetime(2001, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=1.5))),
+            ),
+            (
+                "20010203040506.000001-1000",
+                datetime(2001, 2, 3, 4, 5, 6, 1, tzinfo=timezone(timedelta(hours=-10))),
+            ),
+            # Not fully specified, uses the regex
+            ("200102030405", datetime(2001, 2, 3, 4, 5)),
+            ("2001+0100", datetime(2001, 1, 1, tzinfo=timezone(timedelta(hours=1)))),
+        ),
+    )
+    def test_new_str_full(self, value, expected):
+        """Test converting fully and partially specified values."""
+        dt = pydicom.valuerep.DT(value)
+        assert dt == expected
+        assert dt.tzinfo == expected.tzinfo
+        assert str(dt) == value
+
+    def test_new_str_full_invalid(self):
+        """Test converting invalid fully specified values."""
+        with pytest.raises(ValueError, match="month must be in 1..12"):
+            pydicom.valuerep.DT("20011303040506")
+
+        msg = r"Unable to convert non-conformant value 'a0010203040506'"
+        with pytest.raises(ValueError, match=msg):
+            pydicom.valuerep.DT("a0010203040506")
+
     def test_str_and_repr(self):
         dt = datetime(1911, 12, 13, 21, 21, 23)
         assert str(pydicom.valuerep.DT(dt)) == "19111213212123"
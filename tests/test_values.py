@@ -2,9 +2,12 @@
 """Tests for dataset.py"""
 
 import logging
+from threading import Thread
 
 import pytest
 
+from pydicom import config, dcmread
+from pydicom.data import get_testdata_file
 from pydicom.tag import Tag
 from pydicom.uid import UID
 from pydicom.values import (
@@ -13,13 +16,19 @@ from pydicom.values import (
     convert_tag,
     convert_ATvalue,
     convert_DA_string,
+    convert_DT_string,
+    convert_TM_string,
     convert_text,
     convert_single_string,
     convert_AE_string,
     convert_PN,
+    convert_UI,
     multi_string,
+    datetime_cache,
+    value_cache,
+    ValueCache,
 )
-from pydicom.valuerep import VR
+from pydicom.valuerep import DA, DT, TM, VR
 
 
 class TestConvertTag:
@@ -223,6 +232,68 @@ class TestConvertDA:
         assert convert_DA_string(bytestring, True) == ""
 
 
+@pytest.fixture
+def datetime_conversion():
+    original = config.datetime_conversion
+    config.datetime_conversion = True
+    datetime_cache.clear()
+    yield datetime_cache
+    config.datetime_conversion = original
+    datetime_cache.clear()
+
+
+class TestDateTimeCache:
+    """Tests for caching DA, DT and TM values"""
+
+    def test_default(self):
+        """Test the default cache"""
+        assert datetime_cache.max_size == 4096
+
+    @pytest.mark.parametrize(
+        "func, value, cls",
+        (
+            (convert_DA_string, b"20010203", DA),
+            (convert_DT_string, b"20010203040506.123456+0100", DT),
+            (convert_TM_string, b"040506.123456", TM),
+        ),
+    )
+    def test_shared(self, datetime_conversion, func, value, cls):
+        """Test the same object is returned for the same value"""
+        out = func(value, True)
+        assert isinstance(out, cls)
+        assert out is func(value + b" ", True)
+        assert str(out) == value.decode()
+        assert datetime_cache.misses == 1
+        assert datetime_cache.hits == 1
+
+    def test_multi_value(self, datetime_conversion):
+        """Test the items of multi-valued elements are cached"""
+        out = convert_DA_string(b"20010203\\20010203", True)
+        assert out[0] is out[1]
+        assert datetime_cache.misses == 1
+        assert datetime_cache.hits == 1
+
+    def test_disabled(self, datetime_conversion):
+        """Test disabling the cache"""
+        datetime_cache.max_size = 0
+        try:
+            out = convert_TM_string(b"040506", True)
+            assert out == convert_TM_string(b"040506", True)
+            assert out is not convert_TM_string(b"040506", True)
+            assert len(datetime_cache) == 0
+        finally:
+            datetime_cache.max_size = 4096
+
+    def test_invalid(self, datetime_conversion):
+        """Test invalid values aren't cached"""
+        msg = "Unable to convert non-conformant value"
+        for _ in range(2):
+            with pytest.raises(ValueError, match=msg):
+                convert_TM_string(b"250000", True)
+
+        assert len(datetime_cache) == 0
+
+
 class TestConvertValue:
     def test_convert_value_raises(self):
         """Test convert_value raises exception if unsupported VR"""
@@ -279,6 +350,38 @@ class TestConvertPN:
             bytestring, encodings
         )
 
+    def test_lazy_decoding(self):
+        """Test ASCII values are only decoded when needed."""
+        pn = convert_PN(b"Yamada^Tarou=", ["latin_1", "iso2022_jp"])
+        assert pn._components is None
+        assert b"Yamada^Tarou=" == pn.original_string
+        assert "Tarou" == pn.given_name
+        assert ("Yamada^Tarou",) == pn._components
+        # The original value is written back unchanged
+        assert b"Yamada^Tarou=" == pn.encode(["latin_1", "iso2022_jp"])
+
+        values = convert_PN(b"Yamada^Tarou\\Sato^Hanako  ", ["latin_1"])
+        assert all(pn._components is None for pn in values)
+        assert [b"Yamada^Tarou", b"Sato^Hanako"] == [
+            pn.original_string for pn in values
+        ]
+        assert ["Yamada^Tarou", "Sato^Hanako"] == values
+
+    def test_original_string(self):
+        """Test the original value is kept when decoded."""
+        bytestring = b"Yamada^Tarou=\x1b$B;3ED\x1b(B^\x1b$BB@O:\x1b(B="
+        pn = convert_PN(bytestring, ["latin_1", "iso2022_jp"])
+        assert "Yamada^Tarou=山田^太郎" == pn
+        assert bytestring == pn.original_string
+        assert bytestring == pn.encode(["latin_1", "iso2022_jp"])
+
+    def test_shared_encodings(self):
+        """Test the encodings are shared between values."""
+        a = convert_PN(b"Yamada^Tarou", ["latin_1", "iso2022_jp"])
+        b = convert_PN(b"Sato^Hanako", ["latin_1", "iso2022_jp"])
+        assert ("latin_1", "iso2022_jp") == a.encodings
+        assert a.encodings is b.encodings
+
 
 def test_all_converters():
     """Test that the VR decoder functions are complete"""
@@ -303,3 +406,133 @@ def test_multistring():
     # Test single item
     value = multi_string("aasdf \x00  \x00\x00   ")
     assert value == "aasdf"
+
+
+@pytest.fixture
+def enable_value_cache():
+    value_cache.clear()
+    value_cache.max_size = 100
+    yield value_cache
+    value_cache.max_size = 0
+    value_cache.clear()
+
+
+class TestValueCache:
+    """Tests for ValueCache"""
+
+    def test_init(self):
+        """Test creating a new cache"""
+        cache = ValueCache()
+        assert cache.max_size == 0
+        assert len(cache) == 0
+        assert (0, 0, 0.0) == (cache.hits, cache.misses, cache.hit_rate)
+
+        msg = "'max_size' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            ValueCache(-1)
+
+    def test_get(self):
+        """Test getting values"""
+        cache = ValueCache(2)
+        assert "a" == cache.get(1, lambda: "a")
+        assert "a" == cache.get(1, lambda: "b")
+        assert (1, 1, 0.5) == (cache.hits, cache.misses, cache.hit_rate)
+        assert "c" == cache.get(2, lambda: "c")
+        assert "d" == cache.get(3, lambda: "d")
+        assert len(cache) == 2
+        # Least recently used value discarded
+        assert "e" == cache.get(1, lambda: "e")
+        assert "d" == cache.get(3, lambda: "f")
+
+    def test_get_multivalue(self):
+        """Test multi-valued values aren't cached"""
+        cache = ValueCache(2)
+        value = convert_UI(b"1.2\\3.4", True)
+        assert cache.get(1, lambda: value) is value
+        assert len(cache) == 0
+        assert (0, 0) == (cache.hits, cache.misses)
+
+    def test_disabled(self):
+        """Test values aren't cached when disabled"""
+        cache = ValueCache()
+        assert "a" == cache.get(1, lambda: "a")
+        assert "b" == cache.get(1, lambda: "b")
+        assert len(cache) == 0
+
+    def test_max_size(self):
+        """Test changing the maximum size discards values"""
+        cache = ValueCache(3)
+        for key in range(3):
+            cache.get(key, lambda: str(key))
+
+        cache.max_size = 1
+        assert len(cache) == 1
+        assert "2" == cache.get(2, lambda: "x")
+
+        msg = "'max_size' must be greater than or equal to 0"
+        with pytest.raises(ValueError, match=msg):
+            cache.max_size = -1
+
+    def test_clear(self):
+        """Test clearing the cache"""
+        cache = ValueCache(3)
+        cache.get(1, lambda: "a")
+        cache.get(1, lambda: "a")
+        cache.clear()
+        assert len(cache) == 0
+        assert (0, 0) == (cache.hits, cache.misses)
+
+    def test_threads(self):
+        """Test using the cache from multiple threads"""
+        cache = ValueCache(10)
+
+        def func():
+            for ii in range(1000):
+                cache.get(ii % 20, lambda: str(ii % 20))
+
+        threads = [Thread(target=func) for _ in range(4)]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 10
+        assert cache.hits + cache.misses == 4000
+
+    def test_converters(self, enable_value_cache):
+        """Test the converters return shared values"""
+        uid = convert_UI(b"1.2.840.10008.1.2\x00", True)
+        assert uid is convert_UI(b"1.2.840.10008.1.2\x00", True)
+        assert isinstance(uid, UID)
+
+        pn = convert_PN(b"Yamada^Tarou", ["iso8859"])
+        assert pn is convert_PN(b"Yamada^Tarou", ["iso8859"])
+        assert pn is not convert_PN(b"Yamada^Tarou", ["iso_ir_126"])
+
+        text = convert_text(b"Foo ", ["iso8859"], "LO")
+        assert text is convert_text(b"Foo ", ["iso8859"], "LO")
+        assert "Foo" == text
+
+        assert convert_AE_string(b" AE ", True) is convert_AE_string(b" AE ", True)
+        assert value_cache.hits == 4
+        assert value_cache.misses == 5
+
+        # Multi-valued and keyword arguments aren't cached
+        value = convert_text(b"Foo\\Bar", ["iso8859"], "LO")
+        assert ["Foo", "Bar"] == value
+        assert value is not convert_text(b"Foo\\Bar", ["iso8859"], "LO")
+        assert "Foo" == convert_text(b"Foo", encodings=["iso8859"])
+        assert len(value_cache) == 5
+
+    def test_datasets(self, enable_value_cache):
+        """Test values are shared between datasets"""
+        path = get_testdata_file("CT_small.dcm")
+        ds = dcmread(path)
+        ds.convert_all()
+        ds2 = dcmread(path)
+        assert ds.SOPClassUID is ds2.SOPClassUID
+        assert ds.PatientName is ds2.PatientName
+        assert ds.Modality is ds2.Modality
+        assert ds.SOPClassUID == ds2.SOPClassUID
+        assert value_cache.hits >= 3